@@ -19,12 +19,16 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
 
+from swarm_attack.llm_cache import LLMResponseCache, get_response_cache
 from swarm_attack.llm_clients import (
+    AsyncClaudeCliRunner,
     ClaudeCliRunner,
     ClaudeInvocationError,
     ClaudeTimeoutError,
+    StreamProgress,
 )
-from swarm_attack.models import CheckpointData
+from swarm_attack.models import CheckpointData, ClaudeResult
+from swarm_attack.progress_logger import ProgressLogger
 from swarm_attack.utils.fs import FileSystemError, file_exists, read_file
 
 if TYPE_CHECKING:
@@ -162,6 +166,11 @@ class BaseAgent(ABC):
     # Agent name used in logs and checkpoints (override in subclasses)
     name: str = "base_agent"
 
+    # Opt in to the LLM response cache (llm_cache in config.yaml). Only for
+    # agents whose prompts are read-only and deterministic; never for agents
+    # that edit files or run commands.
+    cache_llm_responses: bool = False
+
     @classmethod
     def get_tools(cls) -> list[str]:
         """Get the default tools for this agent type.
@@ -202,11 +211,64 @@ class BaseAgent(ABC):
 
     @property
     def llm(self) -> ClaudeCliRunner:
-        """Get the LLM runner (lazy initialization)."""
+        """
+        Get the LLM runner (lazy initialization).
+
+        Defaults to AsyncClaudeCliRunner, whose blocking run() shares the
+        process-wide CLI concurrency pool with async callers.
+        """
         if self._llm is None:
-            self._llm = ClaudeCliRunner(config=self.config, logger=self._logger)
+            self._llm = AsyncClaudeCliRunner(
+                config=self.config,
+                logger=self._logger,
+                response_cache=self._response_cache(),
+            )
         return self._llm
 
+    def _run_llm(self, prompt: str, **kwargs: Any) -> ClaudeResult:
+        """
+        Run a prompt, streaming it when claude.stream_progress is on.
+
+        Streamed runs log each new turn with its running cost to
+        .swarm/progress.txt via ProgressLogger.log_llm_progress.
+
+        Args:
+            prompt: The prompt to send to Claude.
+            **kwargs: Arguments for the runner's run()/run_streaming().
+
+        Returns:
+            ClaudeResult with response and metadata.
+        """
+        claude_config = getattr(self.config, "claude", None)
+        if getattr(claude_config, "stream_progress", False) is not True:
+            return self.llm.run(prompt, **kwargs)
+
+        progress_logger = ProgressLogger(self.config.swarm_path)
+        logged_turns = 0
+
+        def on_progress(progress: StreamProgress) -> None:
+            nonlocal logged_turns
+            if progress.num_turns <= logged_turns:
+                return
+            logged_turns = progress.num_turns
+            try:
+                progress_logger.log_llm_progress(
+                    self.name,
+                    progress.num_turns,
+                    progress.cost_usd,
+                    output_tokens=progress.output_tokens,
+                )
+            except OSError:
+                pass  # Progress reporting must not abort the run
+
+        return self.llm.run_streaming(prompt, on_progress=on_progress, **kwargs)
+
+    def _response_cache(self) -> Optional[LLMResponseCache]:
+        """Get the response cache if this agent opts in and it is enabled."""
+        if not self.cache_llm_responses:
+            return None
+        return get_response_cache(self.config, self._logger)
+
     @property
     def state_store(self) -> Optional[StateStore]:
         """Get the state store."""
@@ -523,7 +585,7 @@ class BaseAgent(ABC):
         elif hasattr(self.config, "repo_root") and isinstance(getattr(self.config, "repo_root", None), (str, Path)):
             swarm_dir = Path(self.config.repo_root) / ".swarm"
 
-        bus = get_event_bus(swarm_dir)
+        bus = get_event_bus(swarm_dir, config=self.config)
         bus.emit(event)
 
         self._log(
@@ -548,7 +548,7 @@ class CoderAgent(BaseAgent):
                 return issue
         return None
 
-    def _check_tests_pass(self, test_path: Path) -> bool:
+    def _check_tests_pass(self, test_path: Path, cwd: Optional[Path] = None) -> bool:
         """
         Check if tests at the given path pass.
 
@@ -557,23 +557,35 @@ class CoderAgent(BaseAgent):
 
         Args:
             test_path: Path to the test file.
+            cwd: Checkout to run pytest in. Defaults to config.repo_root.
 
         Returns:
             True if tests exist and pass, False otherwise.
         """
         import subprocess
 
+        from swarm_attack.testing.pytest_results import run_pytest
+
         try:
             # Run pytest on the specific test file with quick timeout
-            result = subprocess.run(
+            report = run_pytest(
                 ["python", "-m", "pytest", str(test_path), "-v", "--tb=no", "-q"],
-                capture_output=True,
-                text=True,
+                cwd=cwd or Path(self.config.repo_root),
                 timeout=60,  # 60 second timeout for pre-check
-                cwd=str(self.config.repo_root),
             )
             # Return True only if pytest exits with code 0 (all tests pass)
-            return result.returncode == 0
+            if report.exit_code == 0:
+                return True
+            if report.structured:
+                summary = report.summary()
+                self._log("coder_precheck_tests_fail", {
+                    "test_path": str(test_path),
+                    "tests_passed": summary["tests_passed"],
+                    "tests_failed": summary["tests_failed"],
+                    "errors": summary["errors"],
+                    "failed_tests": [f["nodeid"] for f in report.failures()[:10]],
+                })
+            return False
         except subprocess.TimeoutExpired:
             self._log("coder_precheck_timeout", {
                 "message": "Pre-implementation test check timed out",
@@ -1985,7 +1997,7 @@ Start your response IMMEDIATELY with `# FILE:` followed by the first file path.
             # PRE-IMPLEMENTATION CHECK: If tests already exist and pass, skip implementation
             # This prevents wasting compute on already-implemented issues
             if retry_number == 0 and test_content:  # Only on first attempt with existing tests
-                tests_pass = self._check_tests_pass(test_path)
+                tests_pass = self._check_tests_pass(test_path, cwd=base_path)
                 if tests_pass:
                     self._log("coder_already_implemented", {
                         "message": "Tests already pass - implementation complete",
@@ -2185,7 +2197,7 @@ Start your response IMMEDIATELY with `# FILE:` followed by the first file path.
                     "feature_id": feature_id,
                     "issue_number": issue_number,
                 })
-            result = self.llm.run(
+            result = self._run_llm(
                 prompt,
                 allowed_tools=["Read", "Glob", "Grep"],  # Enable codebase exploration
                 max_turns=max_turns,
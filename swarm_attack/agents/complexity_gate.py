@@ -70,6 +70,7 @@ class ComplexityGateAgent(BaseAgent):
     """
 
     name = "complexity_gate"
+    cache_llm_responses = True
 
     # Thresholds (tunable based on observed coder performance)
     MAX_ACCEPTANCE_CRITERIA = 10
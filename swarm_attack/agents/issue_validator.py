@@ -47,6 +47,7 @@ class IssueValidatorAgent(BaseAgent):
     """
 
     name = "issue_validator"
+    cache_llm_responses = True
 
     def __init__(
         self,
@@ -84,6 +85,7 @@ class IssueValidatorAgent(BaseAgent):
                 logger=self.logger,
                 checkpoint_callback=lambda: self.checkpoint("pre_codex_call"),
                 skip_auth_classification=skip_auth,
+                response_cache=self._response_cache(),
             )
         return self._codex
 
@@ -42,6 +42,7 @@ class SpecCriticAgent(BaseAgent):
     """
 
     name = "spec_critic"
+    cache_llm_responses = True
 
     def __init__(
         self,
@@ -79,6 +80,7 @@ class SpecCriticAgent(BaseAgent):
                 logger=self.logger,
                 checkpoint_callback=lambda: self.checkpoint("pre_codex_call"),
                 skip_auth_classification=skip_auth,
+                response_cache=self._response_cache(),
             )
         return self._codex
 
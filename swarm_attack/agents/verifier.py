@@ -5,6 +5,10 @@ This agent runs tests to verify that the implementation from CoderAgent
 works correctly. It runs pytest on the generated test files and reports
 results.
 
+Results are read from a JUnit XML report pytest writes alongside its
+output (see swarm_attack.testing.pytest_results); the text parsers are
+only a fallback for when no report was produced.
+
 The agent can optionally use LLM for intelligent failure analysis when
 tests fail (enabled via analyze_failures=True in context).
 """
@@ -15,10 +19,30 @@ import json
 import os
 import re
 import subprocess
+import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
 from swarm_attack.agents.base import AgentResult, BaseAgent, SkillNotFoundError
+from swarm_attack.testing.impact import (
+    CoverageImpactMap,
+    ImpactSelection,
+    changed_files,
+    coverage_args,
+    get_impact_map,
+    read_test_coverage,
+)
+from swarm_attack.testing.pytest_results import (
+    PytestReport,
+    run_pytest,
+    unrecognized_option,
+)
+from swarm_attack.testing.result_cache import PytestResultCache, get_result_cache
+from swarm_attack.testing.sharding import (
+    ShardedPytestExecutor,
+    get_sharded_executor,
+    merge_reports,
+)
 from swarm_attack.utils.fs import file_exists
 
 if TYPE_CHECKING:
@@ -52,36 +76,74 @@ class VerifierAgent(BaseAgent):
         state_store: Optional[StateStore] = None,
         memory_store: Optional["MemoryStore"] = None,
         pattern_detector: Optional["PatternDetector"] = None,
+        result_cache: Optional[PytestResultCache] = None,
+        impact_map: Optional[CoverageImpactMap] = None,
+        sharded_executor: Optional[ShardedPytestExecutor] = None,
     ) -> None:
         """Initialize the Verifier agent."""
         super().__init__(config, logger, llm_runner, state_store)
         self._test_timeout = config.tests.timeout_seconds
         self._memory_store = memory_store
         self._pattern_detector = pattern_detector
-
-    def _get_default_test_path(self, feature_id: str, issue_number: int) -> Path:
+        # Reuses results of runs against an unchanged tree (test_cache in config.yaml)
+        self._result_cache = result_cache or get_result_cache(config, logger)
+        # Picks the regression tests affected by a change (test_impact in config.yaml)
+        self._impact_map = impact_map or get_impact_map(config, logger)
+        # Spreads large runs across worker processes (test_sharding in config.yaml)
+        self._sharded_executor = sharded_executor or get_sharded_executor(config, logger)
+
+    def _get_default_test_path(
+        self, feature_id: str, issue_number: int, root: Optional[Path] = None
+    ) -> Path:
         """Get the default path for generated tests."""
-        tests_dir = Path(self.config.repo_root) / "tests" / "generated" / feature_id
+        tests_dir = Path(root or self.config.repo_root) / "tests" / "generated" / feature_id
         return tests_dir / f"test_issue_{issue_number}.py"
 
+    def _in_worktree(self, path: Path, worktree: Path) -> Path:
+        """Map an absolute path under the main checkout into a worktree."""
+        if path == worktree or worktree in path.parents:
+            return path
+        try:
+            return worktree / path.relative_to(Path(self.config.repo_root).resolve())
+        except ValueError:
+            return path
+
     def _run_pytest(
         self,
         test_path: Optional[Path] = None,
         timeout: Optional[int] = None,
         run_all: bool = False,
         test_files: Optional[list[Path]] = None,
-    ) -> tuple[int, str]:
+        cwd: Optional[Path] = None,
+        coverage_file: Optional[Path] = None,
+    ) -> PytestReport:
         """
         Run pytest on the specified test file or full test suite.
 
+        If the same command already ran against an identical working tree
+        and environment, the cached result is returned without running
+        pytest.
+
         Args:
             test_path: Path to the test file to run. Ignored if run_all=True or test_files provided.
             timeout: Optional timeout in seconds.
             run_all: If True, run full test suite for regression detection.
             test_files: Optional list of specific test files to run for regression check.
+            cwd: Directory to run in; defaults to the repo root. Issue worktrees
+                pass their own path so tests import the worktree's code.
+            coverage_file: If given, record per-test coverage there with
+                pytest-cov. Such runs are never served from the cache. If
+                the pytest that runs the tests doesn't know pytest-cov's
+                options, impact selection is turned off and the run is
+                repeated without coverage.
+
+        Full-suite and large targeted runs are split across worker
+        processes when a sharded executor is configured; the merged result
+        has the same shape as a single-process run.
 
         Returns:
-            Tuple of (exit_code, combined_output).
+            PytestReport with the exit code and combined output; structured
+            when pytest wrote its JUnit report.
 
         Raises:
             TimeoutError: If pytest times out.
@@ -89,49 +151,193 @@ class VerifierAgent(BaseAgent):
         """
         timeout = timeout or self._test_timeout
 
-        # Build pytest command
+        # Build pytest command; shard_options is set for runs that may be sharded
+        shard_options: Optional[list[str]] = None
+        shard_targets: Optional[list[str]] = None
         if test_files:
             # Run specific test files (for targeted regression check of DONE issues only)
-            cmd = ["pytest", "-v", "--tb=short"] + [str(f) for f in test_files]
+            shard_options = ["-v", "--tb=short"]
+            shard_targets = [str(f) for f in test_files]
+            cmd = ["pytest", *shard_options, *shard_targets]
         elif run_all:
             # Run full test suite for regression detection
-            cmd = ["pytest", "-v", "--tb=short", "-q"]
+            shard_options = ["-v", "--tb=short", "-q"]
+            cmd = ["pytest", *shard_options]
         else:
             # Run specific test file
             cmd = ["pytest", str(test_path), "-v", "--tb=short"]
 
+        # Include repo root in PYTHONPATH so feature packages (e.g., external_dashboard/)
+        # can be imported during tests. This is necessary because code may be written
+        # to feature-specific directories rather than the main package.
+        env = os.environ.copy()
+        existing_pythonpath = env.get("PYTHONPATH", "")
+        repo_root_str = str(cwd or self.config.repo_root)
+        if existing_pythonpath:
+            env["PYTHONPATH"] = f"{repo_root_str}:{existing_pythonpath}"
+        else:
+            env["PYTHONPATH"] = repo_root_str
+
+        cache = self._result_cache
+        executor = self._sharded_executor
+        if coverage_file is not None:
+            extra_args, extra_env = coverage_args(coverage_file)
+            cmd += extra_args
+            env.update(extra_env)
+            cache = None
+            # Built-in shards would each write their own coverage data
+            shard_options = None
+        shard = (
+            shard_options is not None
+            and executor is not None
+            and executor.should_shard(shard_targets)
+        )
+
+        run_cwd = Path(cwd or self.config.repo_root)
+        cache_key = cache.make_key(cmd, run_cwd) if cache else None
+        report = cache.get(cache_key) if cache_key else None
+        if report is not None:
+            self._log("verifier_tests_cached", {"cmd": cmd[:6], "key": cache_key[:12]})
+        else:
+            try:
+                if shard:
+                    report = executor.run(shard_options, shard_targets, run_cwd, timeout, env)
+                else:
+                    report = run_pytest(cmd, cwd=run_cwd, timeout=timeout, env=env)
+                    if executor is not None:
+                        executor.record(report)
+            except subprocess.TimeoutExpired as e:
+                raise TimeoutError(f"Test timed out after {timeout} seconds") from e
+            if cache_key:
+                cache.put(cache_key, report)
+
+        if coverage_file is not None and unrecognized_option(report, "--cov"):
+            # The pytest on PATH doesn't have pytest-cov
+            self._log("verifier_coverage_unavailable", {"cmd": cmd[:6]}, level="warning")
+            self._impact_map = None
+            return self._run_pytest(test_path, timeout, run_all, test_files, cwd)
+
+        return report
+
+    @staticmethod
+    def _as_report(result: PytestReport | tuple[int, str]) -> PytestReport:
+        """
+        Normalize a _run_pytest result.
+
+        Overrides and test doubles may still return (exit_code, output);
+        those become an unstructured report parsed from the text.
+        """
+        if isinstance(result, PytestReport):
+            return result
+        exit_code, output = result
+        return PytestReport(exit_code=exit_code, output=output)
+
+    @staticmethod
+    def _impact_name(test_file: Path, run_cwd: Path) -> str:
+        """Name a test file the way the impact map does (relative to run_cwd)."""
         try:
-            # Include repo root in PYTHONPATH so feature packages (e.g., external_dashboard/)
-            # can be imported during tests. This is necessary because code may be written
-            # to feature-specific directories rather than the main package.
-            env = os.environ.copy()
-            existing_pythonpath = env.get("PYTHONPATH", "")
-            repo_root_str = str(self.config.repo_root)
-            if existing_pythonpath:
-                env["PYTHONPATH"] = f"{repo_root_str}:{existing_pythonpath}"
-            else:
-                env["PYTHONPATH"] = repo_root_str
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=self.config.repo_root,
-                env=env,
-            )
+            return test_file.resolve().relative_to(run_cwd.resolve()).as_posix()
+        except ValueError:
+            return str(test_file)
 
-            # Combine stdout and stderr
-            output = result.stdout
-            if result.stderr:
-                output += "\n" + result.stderr
+    def _run_with_coverage(self, run_cwd: Path, **kwargs: Any) -> PytestReport:
+        """
+        Run pytest recording per-test coverage into the impact map.
 
-            return result.returncode, output
+        Coverage is only stored if every test passed.
+        """
+        with tempfile.TemporaryDirectory(prefix="swarm-cov-") as tmp:
+            data_file = Path(tmp) / ".coverage"
+            report = self._as_report(self._run_pytest(coverage_file=data_file, **kwargs))
+            # _run_pytest drops the map if pytest-cov turned out to be missing
+            if report.exit_code == 0 and self._impact_map is not None:
+                self._impact_map.record(read_test_coverage(data_file, run_cwd))
+        return report
+
+    def _run_issue_tests(
+        self,
+        test_path: Path,
+        run_cwd: Path,
+        pytest_kwargs: dict[str, Any],
+    ) -> PytestReport:
+        """
+        Run the issue's own tests, recording their coverage when selecting by impact.
 
-        except subprocess.TimeoutExpired as e:
-            raise TimeoutError(f"Test timed out after {timeout} seconds") from e
+        The issue's test file is new or changed, so this is where its
+        coverage is first recorded or refreshed; later regression checks
+        can then select it without an instrumented run of their own.
+        """
+        if self._impact_map is None:
+            return self._as_report(self._run_pytest(test_path, **pytest_kwargs))
+        return self._run_with_coverage(run_cwd, test_path=test_path, **pytest_kwargs)
 
-    def _parse_pytest_failures(self, output: str) -> list[dict[str, Any]]:
+    def _select_regression_files(
+        self,
+        test_files: list[Path],
+        run_cwd: Path,
+        context: dict[str, Any],
+    ) -> tuple[list[Path], Optional[ImpactSelection]]:
+        """
+        Narrow regression test files to those affected by the current change.
+
+        Args:
+            test_files: Candidate regression test files.
+            run_cwd: Directory the tests run in.
+            context: Verifier context; ``changed_files`` overrides the
+                files git reports as changed in run_cwd.
+
+        Returns:
+            Tuple of (files to run, selection details). Without an impact
+            map every candidate is returned and selection is None.
+        """
+        if self._impact_map is None:
+            return test_files, None
+
+        by_name = {self._impact_name(f, run_cwd): f for f in test_files}
+
+        changed = context.get("changed_files")
+        changed_set = set(changed) if changed is not None else changed_files(run_cwd)
+        selection = self._impact_map.select(list(by_name), changed_set)
+        self._log("verifier_regression_impact", {
+            **selection.to_dict(),
+            "changed_files": len(changed_set) if changed_set is not None else None,
+        })
+        return [by_name[name] for name in selection.selected], selection
+
+    def _run_regression_files(
+        self,
+        test_files: list[Path],
+        run_cwd: Path,
+        selection: Optional[ImpactSelection],
+        pytest_kwargs: dict[str, Any],
+    ) -> PytestReport:
+        """
+        Run targeted regression tests, recording coverage when it is missing.
+
+        Only selected files with no recorded coverage are instrumented, in a
+        run of their own; the rest run as usual, so they can still be
+        sharded and served from the result cache. The two reports are
+        merged into one.
+        """
+        unmapped = set(selection.unmapped) if selection is not None else set()
+        instrumented = [f for f in test_files if self._impact_name(f, run_cwd) in unmapped]
+        if not instrumented:
+            return self._as_report(self._run_pytest(test_files=test_files, **pytest_kwargs))
+
+        plain = [f for f in test_files if f not in instrumented]
+        reports = []
+        if plain:
+            reports.append(self._as_report(self._run_pytest(test_files=plain, **pytest_kwargs)))
+        reports.append(
+            self._run_with_coverage(run_cwd, test_files=instrumented, **pytest_kwargs)
+        )
+        if len(reports) == 1:
+            return reports[0]
+        return merge_reports(reports, sum(r.duration_seconds for r in reports))
+
+    def _parse_pytest_failures(
+        self, output: str, report: Optional[PytestReport] = None
+    ) -> list[dict[str, Any]]:
         """
         Parse pytest output for detailed failure information.
 
@@ -141,6 +347,8 @@ class VerifierAgent(BaseAgent):
 
         Args:
             output: Raw pytest output.
+            report: Report of the run, if any; a structured one is used
+                instead of parsing the output.
 
         Returns:
             List of failure dictionaries:
@@ -150,7 +358,12 @@ class VerifierAgent(BaseAgent):
                 - line: Line number where assertion failed
                 - error: Full error message
                 - short_message: Brief description of the failure
+            Failures read from a structured report also carry the pytest
+            nodeid and a traceback excerpt.
         """
+        if report is not None and report.structured:
+            return report.failures()
+
         failures = []
 
         if not output.strip():
@@ -209,12 +422,16 @@ class VerifierAgent(BaseAgent):
 
         return failures
 
-    def _parse_pytest_output(self, output: str) -> dict[str, Any]:
+    def _parse_pytest_output(
+        self, output: str, report: Optional[PytestReport] = None
+    ) -> dict[str, Any]:
         """
         Parse pytest output for test counts and duration.
 
         Args:
             output: Raw pytest output.
+            report: Report of the run, if any; a structured one is used
+                instead of parsing the output.
 
         Returns:
             Dictionary with parsed results:
@@ -225,6 +442,9 @@ class VerifierAgent(BaseAgent):
                 - skipped: Number of skipped tests
                 - duration_seconds: Test duration
         """
+        if report is not None and report.structured:
+            return report.summary()
+
         result = {
             "tests_passed": 0,
             "tests_failed": 0,
@@ -622,7 +842,11 @@ class VerifierAgent(BaseAgent):
                 - implementation_files: Optional list of files created by CoderAgent
                 - check_regressions: Whether to run full test suite (default: True)
                 - regression_test_files: Optional list of test file paths to use for regression
-                                         (only tests from DONE issues, not BLOCKED)
+                                         (only tests from DONE issues, not BLOCKED). With
+                                         test_impact enabled, only those affected by the
+                                         change are run.
+                - changed_files: Optional files changed by this issue, relative to the
+                                 repo root (defaults to what git reports)
                 - analyze_failures: Whether to use LLM for failure analysis (default: False)
 
         Returns:
@@ -653,12 +877,21 @@ class VerifierAgent(BaseAgent):
         })
         self.checkpoint("started")
 
+        # In an issue worktree, tests and code live there rather than in repo_root
+        worktree_path = context.get("worktree_path")
+        worktree = Path(worktree_path).resolve() if worktree_path else None
+        pytest_kwargs: dict[str, Any] = {"cwd": worktree} if worktree else {}
+        if worktree and regression_test_files is not None:
+            regression_test_files = [
+                self._in_worktree(Path(f), worktree) for f in regression_test_files
+            ]
+
         # Determine test file path
         test_path_str = context.get("test_path")
         if test_path_str:
             test_path = Path(test_path_str)
         else:
-            test_path = self._get_default_test_path(feature_id, issue_number)
+            test_path = self._get_default_test_path(feature_id, issue_number, worktree)
 
         # Check if test file exists
         if not file_exists(test_path):
@@ -726,7 +959,9 @@ class VerifierAgent(BaseAgent):
 
         # Step 1: Run issue-specific tests
         try:
-            exit_code, output = self._run_pytest(test_path)
+            issue_report = self._run_issue_tests(
+                test_path, worktree or Path(self.config.repo_root), pytest_kwargs
+            )
         except TimeoutError as e:
             error = str(e)
             self._log("verifier_error", {"error": error}, level="error")
@@ -742,12 +977,16 @@ class VerifierAgent(BaseAgent):
 
         self.checkpoint("issue_tests_complete")
 
+        exit_code, output = issue_report.exit_code, issue_report.output
+
         # Parse the issue test output
-        parsed = self._parse_pytest_output(output)
+        parsed = self._parse_pytest_output(output, issue_report)
         issue_tests_passed = exit_code == 0 and parsed["tests_failed"] == 0
 
         # Parse detailed failure information for CoderAgent on retry
-        issue_failures = self._parse_pytest_failures(output) if not issue_tests_passed else []
+        issue_failures = (
+            self._parse_pytest_failures(output, issue_report) if not issue_tests_passed else []
+        )
 
         # Build initial result output
         result_output = {
@@ -762,6 +1001,8 @@ class VerifierAgent(BaseAgent):
             # NEW: Structured failure data for CoderAgent retry
             "failures": issue_failures,
         }
+        if issue_report.structured:
+            result_output["slowest_tests"] = issue_report.slowest()
 
         # Step 2: Run regression check if issue tests passed and enabled
         regression_passed = True
@@ -778,8 +1019,27 @@ class VerifierAgent(BaseAgent):
                 # Empty list means no DONE issues yet - skip regression check
                 # None means fall back to running all tests
                 regression_skipped = False
+                impact_selection: Optional[ImpactSelection] = None
+                run_cwd = worktree or Path(self.config.repo_root)
+                if regression_test_files:
+                    regression_test_files, impact_selection = self._select_regression_files(
+                        [Path(f) for f in regression_test_files], run_cwd, context
+                    )
 
-                if regression_test_files is not None and len(regression_test_files) == 0:
+                if impact_selection is not None and not regression_test_files:
+                    # Nothing the change touched is covered by earlier tests
+                    self._log("verifier_regression_skip", {
+                        "reason": "No regression tests affected by changed files",
+                    })
+                    regression_passed = True
+                    regression_skipped = True
+                    result_output["regression_check"] = {
+                        "skipped": True,
+                        "reason": "No affected tests",
+                        "passed": True,
+                        "impact": impact_selection.to_dict(),
+                    }
+                elif regression_test_files is not None and len(regression_test_files) == 0:
                     # No DONE issues yet - skip regression check entirely
                     self._log("verifier_regression_skip", {
                         "reason": "No DONE issues to check regression against",
@@ -793,20 +1053,27 @@ class VerifierAgent(BaseAgent):
                     }
                 elif regression_test_files is not None:
                     # Run targeted regression on DONE issues only
-                    regression_exit_code, regression_output = self._run_pytest(
-                        test_files=[Path(f) for f in regression_test_files]
+                    regression_report = self._run_regression_files(
+                        [Path(f) for f in regression_test_files],
+                        run_cwd,
+                        impact_selection,
+                        pytest_kwargs,
                     )
                 else:
                     # Fall back to running all tests
-                    regression_exit_code, regression_output = self._run_pytest(run_all=True)
+                    regression_report = self._as_report(
+                        self._run_pytest(run_all=True, **pytest_kwargs)
+                    )
 
                 # Only parse results if we actually ran tests
                 if not regression_skipped:
-                    regression_parsed = self._parse_pytest_output(regression_output)
+                    regression_exit_code = regression_report.exit_code
+                    regression_output = regression_report.output
+                    regression_parsed = self._parse_pytest_output(regression_output, regression_report)
                     regression_passed = regression_exit_code == 0 and regression_parsed["tests_failed"] == 0
 
                     # Parse regression failures for debugging
-                    regression_failures = self._parse_pytest_failures(regression_output) if not regression_passed else []
+                    regression_failures = self._parse_pytest_failures(regression_output, regression_report) if not regression_passed else []
 
                     result_output["regression_check"] = {
                         "tests_run": regression_parsed["tests_run"],
@@ -817,6 +1084,10 @@ class VerifierAgent(BaseAgent):
                         # NEW: Structured regression failure data
                         "failures": regression_failures,
                     }
+                    if regression_report.structured:
+                        result_output["regression_check"]["slowest_tests"] = regression_report.slowest()
+                    if impact_selection is not None:
+                        result_output["regression_check"]["impact"] = impact_selection.to_dict()
 
                     if not regression_passed:
                         result_output["regression_output"] = regression_output
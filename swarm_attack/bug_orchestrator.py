@@ -48,7 +48,7 @@ from swarm_attack.bug_state_store import BugStateStore
 from swarm_attack.debate_retry import DebateRetryHandler
 from swarm_attack.events.bus import get_event_bus
 from swarm_attack.events.types import EventType, SwarmEvent
-from swarm_attack.memory.store import MemoryStore
+from swarm_attack.memory.store import MemoryStore, default_store_path
 
 if TYPE_CHECKING:
     from swarm_attack.config import SwarmConfig
@@ -110,7 +110,11 @@ class BugOrchestrator:
 
         # Memory store for cross-session learning (create default if not provided)
         # Use explicit None check to support empty mock stores in tests
-        self._memory_store = memory_store if memory_store is not None else MemoryStore.load()
+        self._memory_store = (
+            memory_store
+            if memory_store is not None
+            else MemoryStore.load(default_store_path(config))
+        )
 
         # Initialize state store
         bugs_path = Path(config.repo_root) / ".swarm" / "bugs"
@@ -212,7 +216,7 @@ class BugOrchestrator:
             The emitted SwarmEvent.
         """
         bugs_path = Path(self.config.repo_root) / ".swarm"
-        bus = get_event_bus(bugs_path)
+        bus = get_event_bus(bugs_path, config=self.config)
 
         event = SwarmEvent(
             event_type=event_type,
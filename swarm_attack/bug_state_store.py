@@ -7,16 +7,20 @@ This module handles:
 - State versioning and migration
 - Phase transition history logging
 - Human-readable markdown reports
+- A phase catalog for listing bugs without parsing every state file
 """
 
 from __future__ import annotations
 
 import json
+import os
 import shutil
+import threading
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from filelock import FileLock, Timeout
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from swarm_attack.bug_models import (
     BugNotFoundError,
@@ -32,6 +36,83 @@ if TYPE_CHECKING:
 # State file version for migrations
 STATE_VERSION = 1
 
+# Catalog layout version; catalogs with another version are rebuilt
+CATALOG_VERSION = 1
+
+# Maximum length of a catalog entry's title
+CATALOG_TITLE_LENGTH = 80
+
+
+@dataclass
+class BugCatalogEntry:
+    """
+    Summary of one bug as recorded in the catalog.
+
+    ``mtime_ns`` and ``size`` describe the state.json the entry was built
+    from; an entry whose file no longer matches is rebuilt on the next read.
+    """
+
+    bug_id: str
+    phase: Optional[str] = None  # None if state.json is unreadable
+    updated_at: str = ""
+    cost_usd: float = 0.0
+    title: str = ""
+    mtime_ns: int = 0
+    size: int = 0
+
+    @classmethod
+    def from_state_file(cls, bug_id: str, state_path: Path, st: os.stat_result) -> BugCatalogEntry:
+        """Build an entry by reading the summary fields of a state file."""
+        entry = cls(bug_id=bug_id, mtime_ns=st.st_mtime_ns, size=st.st_size)
+        try:
+            data = json.loads(state_path.read_text())
+        except (OSError, ValueError):
+            return entry
+        if not isinstance(data, dict):
+            return entry
+
+        try:
+            entry.phase = BugPhase(data.get("phase")).value
+        except ValueError:
+            pass
+        entry.updated_at = str(data.get("updated_at") or "")
+        costs = data.get("costs")
+        if isinstance(costs, list):
+            entry.cost_usd = sum(
+                float(c.get("cost_usd", 0.0)) for c in costs
+                if isinstance(c, dict) and isinstance(c.get("cost_usd", 0.0), (int, float))
+            )
+        report = data.get("report")
+        if isinstance(report, dict):
+            description = str(report.get("description") or "").strip()
+            entry.title = description.split("\n", 1)[0][:CATALOG_TITLE_LENGTH]
+        return entry
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dict for JSON serialization."""
+        return {
+            "bug_id": self.bug_id,
+            "phase": self.phase,
+            "updated_at": self.updated_at,
+            "cost_usd": self.cost_usd,
+            "title": self.title,
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BugCatalogEntry:
+        """Create from dict."""
+        return cls(
+            bug_id=data["bug_id"],
+            phase=data.get("phase"),
+            updated_at=data.get("updated_at", ""),
+            cost_usd=float(data.get("cost_usd", 0.0)),
+            title=data.get("title", ""),
+            mtime_ns=int(data.get("mtime_ns", 0)),
+            size=int(data.get("size", 0)),
+        )
+
 
 class BugStateStore:
     """
@@ -51,6 +132,11 @@ class BugStateStore:
     ├── test-cases.py          # Generated test code (written after PLANNED)
     └── history/
         └── phase_transitions.jsonl  # Append-only transition log
+    .swarm/bugs/catalog.json        # bug_id -> phase/updated_at/cost/title
+
+    The catalog is updated by save(), delete() and append_transition(),
+    and is validated against each state file's mtime and size on read, so
+    edits made outside the store are picked up without a full rescan.
     """
 
     def __init__(
@@ -67,6 +153,10 @@ class BugStateStore:
         """
         self.base_path = base_path or Path(".swarm/bugs")
         self._logger = logger
+        self._catalog: dict[str, BugCatalogEntry] = {}
+        # mtime_ns of catalog.json when last loaded or saved
+        self._catalog_mtime: Optional[int] = None
+        self._catalog_lock = threading.Lock()
 
     def _log(
         self,
@@ -170,6 +260,8 @@ class BugStateStore:
                 if backup_path.exists():
                     backup_path.unlink()
 
+                self._update_catalog(state.bug_id)
+
                 self._log("bug_state_saved", {
                     "bug_id": state.bug_id,
                     "phase": state.phase.value,
@@ -265,37 +357,21 @@ class BugStateStore:
         """
         List all bug IDs, optionally filtered by phase.
 
+        Answered from the catalog, so only state files that changed since
+        they were last cataloged are read.
+
         Args:
             phase: Optional phase filter.
 
         Returns:
             List of bug ID strings.
         """
-        if not self.base_path.exists():
-            return []
-
-        bug_ids = []
-        for bug_dir in self.base_path.iterdir():
-            if not bug_dir.is_dir():
-                continue
-
-            state_path = bug_dir / "state.json"
-            if not state_path.exists():
-                continue
-
-            bug_id = bug_dir.name
-
-            if phase is not None:
-                try:
-                    state = self.load(bug_id)
-                    if state.phase != phase:
-                        continue
-                except (BugNotFoundError, StateCorruptionError):
-                    continue
-
-            bug_ids.append(bug_id)
-
-        return sorted(bug_ids)
+        entries = self.catalog()
+        if phase is not None:
+            return sorted(
+                bug_id for bug_id, entry in entries.items() if entry.phase == phase.value
+            )
+        return sorted(entries)
 
     def delete(self, bug_id: str) -> None:
         """
@@ -312,6 +388,7 @@ class BugStateStore:
             raise BugNotFoundError(f"Bug '{bug_id}' not found")
 
         shutil.rmtree(bug_dir)
+        self._update_catalog(bug_id)
         self._log("bug_deleted", {"bug_id": bug_id})
 
     def append_transition(self, bug_id: str, transition: PhaseTransition) -> None:
@@ -328,6 +405,8 @@ class BugStateStore:
         with open(transitions_path, "a") as f:
             f.write(json.dumps(transition.to_dict()) + "\n")
 
+        self._update_catalog(bug_id)
+
     def get_transitions(self, bug_id: str) -> list[PhaseTransition]:
         """
         Get all phase transitions for a bug.
@@ -352,6 +431,128 @@ class BugStateStore:
 
         return transitions
 
+    # =========================================================================
+    # Phase Catalog
+    # =========================================================================
+
+    def _catalog_path(self) -> Path:
+        """Get the path to the catalog file."""
+        return self.base_path / "catalog.json"
+
+    def _load_catalog(self) -> None:
+        """Load the persisted catalog unless the in-memory copy is current."""
+        path = self._catalog_path()
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            self._catalog = {}
+            self._catalog_mtime = None
+            return
+        if mtime == self._catalog_mtime:
+            return
+
+        try:
+            data = json.loads(path.read_text())
+            if data.get("version") != CATALOG_VERSION:
+                raise ValueError(f"Unsupported catalog version: {data.get('version')}")
+            self._catalog = {
+                bug_id: BugCatalogEntry.from_dict(entry)
+                for bug_id, entry in data["bugs"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self._catalog = {}
+        self._catalog_mtime = mtime
+
+    def _save_catalog(self) -> None:
+        """Atomically write the catalog. Failures only cost a later rescan."""
+        path = self._catalog_path()
+        temp_path = path.with_suffix(".tmp")
+        try:
+            temp_path.write_text(json.dumps({
+                "version": CATALOG_VERSION,
+                "bugs": {
+                    bug_id: entry.to_dict()
+                    for bug_id, entry in sorted(self._catalog.items())
+                },
+            }))
+            temp_path.replace(path)
+            self._catalog_mtime = path.stat().st_mtime_ns
+        except OSError:
+            self._catalog_mtime = None
+
+    def _sync_entry(self, bug_id: str) -> bool:
+        """
+        Bring one catalog entry in line with its state file.
+
+        Returns:
+            True if the catalog changed.
+        """
+        state_path = self._state_path(bug_id)
+        try:
+            st = state_path.stat()
+        except OSError:
+            return self._catalog.pop(bug_id, None) is not None
+
+        entry = self._catalog.get(bug_id)
+        if entry is not None and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+            return False
+        self._catalog[bug_id] = BugCatalogEntry.from_state_file(bug_id, state_path, st)
+        return True
+
+    def _with_catalog(self, sync: Callable[[], bool], persist: bool = True) -> None:
+        """
+        Load the catalog, apply ``sync`` and save if it reported changes.
+
+        Runs under the catalog file lock. If the lock cannot be taken, or
+        ``persist`` is False, the in-memory catalog is still synced, just
+        not persisted.
+        """
+        with self._catalog_lock:
+            if not self.base_path.exists():
+                self._catalog = {}
+                return
+            if not persist:
+                # catalog.json is replaced atomically, so reading needs no lock
+                self._load_catalog()
+                sync()
+                return
+            try:
+                with FileLock(self._catalog_path().with_suffix(".json.lock"), timeout=10):
+                    self._load_catalog()
+                    if sync():
+                        self._save_catalog()
+            except Timeout:
+                sync()
+
+    def _update_catalog(self, bug_id: str) -> None:
+        """Record the current state of one bug in the catalog."""
+        self._with_catalog(lambda: self._sync_entry(bug_id))
+
+    def catalog(self, persist: bool = True) -> dict[str, BugCatalogEntry]:
+        """
+        Get catalog entries for every bug with a state file.
+
+        Entries whose state file changed, appeared or disappeared since
+        they were recorded are refreshed first.
+
+        Args:
+            persist: Write refreshed entries back to catalog.json. Read-only
+                callers pass False so no catalog or lock file is created.
+
+        Returns:
+            Dict of bug ID to BugCatalogEntry.
+        """
+        def sync() -> bool:
+            bug_ids = {path.parent.name for path in self.base_path.glob("*/state.json")}
+            changed = False
+            for bug_id in set(self._catalog) | bug_ids:
+                changed = self._sync_entry(bug_id) or changed
+            return changed
+
+        self._with_catalog(sync, persist=persist)
+        with self._catalog_lock:
+            return dict(self._catalog)
+
     # =========================================================================
     # Human-Readable Report Generation
     # =========================================================================
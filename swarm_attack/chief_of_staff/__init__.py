@@ -45,6 +45,12 @@ from swarm_attack.chief_of_staff.state_gatherer import (
     InterruptedSession,
 )
 
+# Cost accounting
+from swarm_attack.chief_of_staff.cost_ledger import (
+    CostLedger,
+    DailyCost,
+)
+
 # Daily logging
 from swarm_attack.chief_of_staff.daily_log import (
     DailyLogManager,
@@ -107,6 +113,9 @@ __all__ = [
     "TestState",  # Backward compatibility alias
     "GitHubState",
     "InterruptedSession",
+    # Cost accounting
+    "CostLedger",
+    "DailyCost",
     # Daily logging
     "DailyLogManager",
     "DailyLog",
@@ -25,8 +25,10 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import threading
 import time
 import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -59,7 +61,9 @@ class ExecutionStrategy(Enum):
     Values:
         SEQUENTIAL: Execute goals in order, stop on any block/failure.
         CONTINUE_ON_BLOCK: Skip blocked goals and continue with ready ones.
-        PARALLEL_SAFE: Execute independent goals in parallel when safe.
+        PARALLEL_SAFE: Execute independent goals in parallel when safe. Goals
+            that modify the working tree (feature and bug goals) still run
+            one at a time; spec and manual goals run alongside them.
     """
 
     SEQUENTIAL = "sequential"
@@ -271,6 +275,9 @@ class AutopilotRunner:
         # Blocking checkpoint UX (Self-Healing Jarvis)
         self.checkpoint_ux = CheckpointUX()
 
+        # Serializes progress updates from concurrently executing goals
+        self._progress_lock = threading.Lock()
+
     @staticmethod
     def _parse_duration(duration: str) -> int:
         """Parse duration string to minutes.
@@ -665,8 +672,9 @@ class AutopilotRunner:
             GoalExecutionResult with execution outcome
         """
         # Update progress tracker with current goal at start (if session active)
-        if self.progress_tracker.get_current() is not None:
-            self.progress_tracker.update(current_goal=goal.description)
+        with self._progress_lock:
+            if self.progress_tracker.get_current() is not None:
+                self.progress_tracker.update(current_goal=goal.description)
 
         # Route based on linked artifact type
         # Priority: feature > bug > spec > generic
@@ -680,14 +688,15 @@ class AutopilotRunner:
             result = self._execute_generic_goal(goal)
 
         # Update progress tracker after completion
-        current = self.progress_tracker.get_current()
-        if current is not None:
-            new_completed = current.goals_completed + (1 if result.success else 0)
-            new_cost = current.cost_usd + result.cost_usd
-            self.progress_tracker.update(
-                goals_completed=new_completed,
-                cost_usd=new_cost,
-            )
+        with self._progress_lock:
+            current = self.progress_tracker.get_current()
+            if current is not None:
+                new_completed = current.goals_completed + (1 if result.success else 0)
+                new_cost = current.cost_usd + result.cost_usd
+                self.progress_tracker.update(
+                    goals_completed=new_completed,
+                    cost_usd=new_cost,
+                )
 
         return result
 
@@ -809,6 +818,167 @@ class AutopilotRunner:
 
         return (goals_completed, total_cost, blocked)
 
+    @staticmethod
+    def _goal_lane(goal: DailyGoal) -> Optional[str]:
+        """Get the resource a goal needs exclusive use of while it runs.
+
+        Feature and bug goals edit (and commit in) the shared working tree,
+        and spec goals share the orchestrator's spec agents, so goals in the
+        same lane never run concurrently. Manual goals need nothing.
+
+        Args:
+            goal: DailyGoal to classify.
+
+        Returns:
+            Lane name, or None if the goal can run alongside anything.
+        """
+        if (goal.linked_feature and goal.linked_issue) or goal.linked_bug:
+            return "workspace"
+        if goal.linked_spec:
+            return "spec"
+        return None
+
+    def _execute_goals_parallel_safe(
+        self,
+        goals: list[DailyGoal],
+        budget_usd: float,
+        session: AutopilotSession,
+    ) -> tuple[int, float, set[str]]:
+        """Execute goals concurrently using the parallel-safe strategy.
+
+        Works like continue-on-block, but dispatches up to
+        config.autopilot.max_parallel_goals ready goals at once on worker
+        threads, one per lane (see _goal_lane()).
+
+        Budget is reserved before launch: each goal holds its estimated cost
+        (get_effective_cost) against budget_usd while in flight, and the
+        reservation is swapped for result.cost_usd when it finishes. A goal
+        whose estimate does not fit is deferred until running goals free up
+        budget; the very first goal only needs min_execution_budget, as in
+        the sequential strategies.
+
+        Callbacks, cost totals, checkpoint daily cost and goal status are
+        all updated on the calling thread as goals finish.
+
+        Args:
+            goals: List of DailyGoal objects to execute.
+            budget_usd: Maximum budget for this execution run.
+            session: AutopilotSession for context and state tracking.
+
+        Returns:
+            Tuple of (goals_completed, total_cost, blocked_goal_ids), as for
+            _execute_goals_continue_on_block().
+        """
+        if not goals:
+            return (0, 0.0, set())
+
+        graph = DependencyGraph.from_goals(goals)
+        max_parallel = max(1, int(self.config.autopilot.max_parallel_goals))
+
+        completed: set[str] = set()
+        blocked: set[str] = set()
+        goals_completed = 0
+        total_cost = 0.0
+        reserved = 0.0
+        # future -> (goal, reserved estimate)
+        in_flight: dict[Future, tuple[DailyGoal, float]] = {}
+        stop_launching = False
+
+        with ThreadPoolExecutor(max_workers=max_parallel) as pool:
+            while True:
+                running_ids = {g.goal_id for g, _ in in_flight.values()}
+                busy_lanes = {self._goal_lane(g) for g, _ in in_flight.values()}
+
+                for goal in graph.get_ready_goals(completed, blocked):
+                    if stop_launching or len(in_flight) >= max_parallel:
+                        break
+                    if goal.goal_id in running_ids:
+                        continue
+                    lane = self._goal_lane(goal)
+                    if lane is not None and lane in busy_lanes:
+                        continue
+
+                    # Pre-flight validation sees reserved budget as spent
+                    preflight_context = self._build_preflight_context(
+                        session_budget=budget_usd,
+                        spent_usd=total_cost + reserved,
+                        completed_goals=completed,
+                        blocked_goals=blocked,
+                    )
+                    preflight_result = self._run_preflight(goal, preflight_context)
+
+                    if preflight_result:
+                        if not preflight_result.passed:
+                            goal.status = GoalStatus.BLOCKED
+                            goal.is_hiccup = True
+                            blocked.add(goal.goal_id)
+                            continue
+
+                        if preflight_result.requires_checkpoint:
+                            goal.status = GoalStatus.BLOCKED
+                            goal.is_hiccup = True
+                            blocked.add(goal.goal_id)
+                            self._preflight_checkpoint_triggered = True
+                            stop_launching = True
+                            break
+
+                    # Reserve the estimate against what is left
+                    available = budget_usd - total_cost - reserved
+                    if available < self.config.min_execution_budget:
+                        stop_launching = True
+                        break
+                    estimate = get_effective_cost(goal)
+                    if in_flight and estimate > available:
+                        # Wait for running goals to settle their reservations
+                        break
+
+                    if self.on_goal_start:
+                        self.on_goal_start(goal)
+
+                    reserved += estimate
+                    future = pool.submit(self._execute_goal, goal)
+                    in_flight[future] = (goal, estimate)
+                    running_ids.add(goal.goal_id)
+                    busy_lanes.add(lane)
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    goal, estimate = in_flight.pop(future)
+                    reserved -= estimate
+
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = GoalExecutionResult(
+                            success=False,
+                            cost_usd=0.0,
+                            duration_seconds=0,
+                            error=str(e),
+                            output="",
+                        )
+
+                    # Reconcile the reservation with the actual cost
+                    total_cost += result.cost_usd
+                    session.total_cost_usd = total_cost
+                    self.checkpoint_system.update_daily_cost(result.cost_usd)
+
+                    if result.success:
+                        goal.status = GoalStatus.COMPLETE
+                        completed.add(goal.goal_id)
+                        goals_completed += 1
+                    else:
+                        goal.status = GoalStatus.BLOCKED
+                        goal.is_hiccup = True
+                        blocked.add(goal.goal_id)
+
+                    if self.on_goal_complete:
+                        self.on_goal_complete(goal, result)
+
+        return (goals_completed, total_cost, blocked)
+
     def _run_checkpoint_check(self, goal: DailyGoal) -> Any:
         """Run checkpoint check, handling both sync and async implementations.
 
@@ -896,12 +1066,14 @@ class AutopilotRunner:
         # Import ExecutionStrategy for comparison if needed
         from swarm_attack.chief_of_staff.autopilot_runner import ExecutionStrategy as ES
 
-        # Use continue-on-block strategy if configured
-        if execution_strategy == ES.CONTINUE_ON_BLOCK:
+        # Use continue-on-block or parallel-safe strategy if configured
+        if execution_strategy in (ES.CONTINUE_ON_BLOCK, ES.PARALLEL_SAFE):
             self._preflight_checkpoint_triggered = False
-            goals_completed, total_cost, blocked = self._execute_goals_continue_on_block(
-                goals, budget_usd, session
-            )
+            if execution_strategy == ES.PARALLEL_SAFE:
+                execute = self._execute_goals_parallel_safe
+            else:
+                execute = self._execute_goals_continue_on_block
+            goals_completed, total_cost, blocked = execute(goals, budget_usd, session)
 
             # Finalize session
             duration = int(time.time() - start_time)
@@ -120,6 +120,7 @@ class AutopilotConfig:
     pause_on_high_risk: bool = True
     persist_on_checkpoint: bool = True
     execution_strategy: Any = None  # ExecutionStrategy enum, defaults to CONTINUE_ON_BLOCK
+    max_parallel_goals: int = 3  # Concurrent goals under the PARALLEL_SAFE strategy
 
     # Jarvis MVP: Risk thresholds
     risk_checkpoint_threshold: float = 0.5  # Score > this requires checkpoint
@@ -160,6 +161,7 @@ class AutopilotConfig:
             pause_on_high_risk=data.get("pause_on_high_risk", True),
             persist_on_checkpoint=data.get("persist_on_checkpoint", True),
             execution_strategy=execution_strategy,
+            max_parallel_goals=data.get("max_parallel_goals", 3),
             risk_checkpoint_threshold=data.get("risk_checkpoint_threshold", 0.5),
             risk_block_threshold=data.get("risk_block_threshold", 0.8),
             auto_approve_low_risk=data.get("auto_approve_low_risk", True),
@@ -183,6 +185,7 @@ class AutopilotConfig:
             "pause_on_high_risk": self.pause_on_high_risk,
             "persist_on_checkpoint": self.persist_on_checkpoint,
             "execution_strategy": exec_strategy_value,
+            "max_parallel_goals": self.max_parallel_goals,
             "risk_checkpoint_threshold": self.risk_checkpoint_threshold,
             "risk_block_threshold": self.risk_block_threshold,
             "auto_approve_low_risk": self.auto_approve_low_risk,
@@ -0,0 +1,312 @@
+"""Rolling cost ledger with daily rollups for Chief of Staff budgeting.
+
+The ledger sums cost-bearing events from ``.swarm/events/*.jsonl`` into
+per-day totals, with per-feature and per-agent breakdowns, and persists
+them compactly in ``.swarm/cache/costs/ledger.json`` (derived data, kept
+out of version control like the other caches). It also records how many
+bytes of each event log it has consumed, so a refresh reads only lines
+appended since the last one; today/week/range queries then touch one
+rollup per day instead of every event ever written.
+
+A log that shrinks or is replaced (different inode) makes its previously
+counted bytes unknowable, so the whole ledger is rebuilt from the logs
+that exist at that point.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+from swarm_attack.utils.fs import FileSystemError, ensure_dir, safe_write
+
+# Bump when the ledger layout changes; older ledgers are rebuilt.
+COST_LEDGER_VERSION = 1
+
+
+def event_cost(event: dict[str, Any]) -> float:
+    """Extract the USD cost from an event record, or 0.0 if it has none.
+
+    Understands the ``cost``/``cost_usd`` fields written by EventLogger and
+    the ``payload.cost_usd`` field of SwarmEvent records.
+    """
+    for source in (event, event.get("payload")):
+        if not isinstance(source, dict):
+            continue
+        for key in ("cost_usd", "cost"):
+            value = source.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return float(value)
+    return 0.0
+
+
+def event_date(event: dict[str, Any]) -> Optional[date]:
+    """Get the calendar date of an event's timestamp, or None if unusable."""
+    timestamp = event.get("timestamp") or event.get("ts")
+    if not isinstance(timestamp, str) or not timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).date()
+    except ValueError:
+        return None
+
+
+@dataclass
+class DailyCost:
+    """Cost rollup for a single day."""
+
+    total: float = 0.0
+    features: dict[str, float] = field(default_factory=dict)
+    agents: dict[str, float] = field(default_factory=dict)
+
+    def add(self, cost: float, feature_id: str = "", agent: str = "") -> None:
+        """Add one event's cost to the rollup."""
+        self.total += cost
+        if feature_id:
+            self.features[feature_id] = self.features.get(feature_id, 0.0) + cost
+        if agent:
+            self.agents[agent] = self.agents.get(agent, 0.0) + cost
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dict for JSON serialization."""
+        return {"total": self.total, "features": self.features, "agents": self.agents}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DailyCost:
+        """Create from dict."""
+        return cls(
+            total=float(data.get("total", 0.0)),
+            features=dict(data.get("features", {})),
+            agents=dict(data.get("agents", {})),
+        )
+
+
+class CostLedger:
+    """Incrementally maintained per-day cost rollups.
+
+    Queries refresh the ledger first, so they always reflect events on
+    disk. Refreshes from several processes are serialized with a file lock.
+    """
+
+    def __init__(self, swarm_dir: Path) -> None:
+        """
+        Initialize the ledger.
+
+        Args:
+            swarm_dir: Path to the .swarm directory.
+        """
+        swarm_dir = Path(swarm_dir)
+        self.events_dir = swarm_dir / "events"
+        self.path = swarm_dir / "cache" / "costs" / "ledger.json"
+        self._lock_path = self.path.with_suffix(".lock")
+        self._lock = threading.Lock()
+
+        self._days: dict[str, DailyCost] = {}
+        # log file name -> {"size": bytes consumed, "inode": inode}
+        self._sources: dict[str, dict[str, int]] = {}
+        # mtime_ns of the ledger file when last loaded or saved
+        self._loaded_mtime: Optional[int] = None
+
+    # Persistence
+
+    def _reset(self) -> None:
+        self._days = {}
+        self._sources = {}
+
+    def _load(self) -> None:
+        """Load the persisted ledger unless the in-memory copy is current."""
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except OSError:
+            self._reset()
+            self._loaded_mtime = None
+            return
+        if mtime == self._loaded_mtime:
+            return
+
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get("version") != COST_LEDGER_VERSION:
+                raise ValueError(f"Unsupported cost ledger version: {data.get('version')}")
+            self._days = {
+                day: DailyCost.from_dict(rollup) for day, rollup in data["days"].items()
+            }
+            self._sources = {
+                name: {"size": int(src["size"]), "inode": int(src["inode"])}
+                for name, src in data["sources"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self._reset()
+        self._loaded_mtime = mtime
+
+    def _save(self) -> None:
+        """Atomically write the ledger. Failures only cost a later rescan."""
+        try:
+            safe_write(self.path, json.dumps({
+                "version": COST_LEDGER_VERSION,
+                "days": {day: rollup.to_dict() for day, rollup in sorted(self._days.items())},
+                "sources": self._sources,
+            }))
+            self._loaded_mtime = self.path.stat().st_mtime_ns
+        except (OSError, FileSystemError):
+            self._loaded_mtime = None
+
+    # Catch-up
+
+    def _consume(self, log_path: Path, start: int) -> int:
+        """
+        Add costs from complete lines after ``start``.
+
+        Returns:
+            Offset just past the last complete line read.
+        """
+        # Per-feature logs written by EventLogger carry no feature_id field
+        default_feature = "" if log_path.stem.startswith("events-") else log_path.stem
+        offset = start
+        with log_path.open("rb") as f:
+            f.seek(start)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # Line still being written; pick it up next time
+                offset += len(raw)
+                try:
+                    event = json.loads(raw)
+                except ValueError:
+                    continue
+                if not isinstance(event, dict):
+                    continue
+                cost = event_cost(event)
+                day = event_date(event)
+                if not cost or day is None:
+                    continue
+                self._days.setdefault(day.isoformat(), DailyCost()).add(
+                    cost,
+                    feature_id=event.get("feature_id") or default_feature,
+                    agent=event.get("agent") or event.get("source_agent") or "",
+                )
+        return offset
+
+    def _catch_up(self) -> bool:
+        """
+        Fold newly appended event lines into the rollups.
+
+        Returns:
+            True if the ledger changed.
+        """
+        try:
+            logs = sorted(self.events_dir.glob("*.jsonl"))
+        except OSError:
+            return False
+
+        stats: dict[str, tuple[Path, os.stat_result]] = {}
+        for log_path in logs:
+            try:
+                stats[log_path.name] = (log_path, log_path.stat())
+            except OSError:
+                continue
+
+        for name, (_, st) in stats.items():
+            known = self._sources.get(name)
+            if known and (known["inode"] != st.st_ino or st.st_size < known["size"]):
+                self._reset()
+                break
+
+        changed = False
+        for name, (log_path, st) in stats.items():
+            known = self._sources.get(name, {"size": 0, "inode": st.st_ino})
+            if st.st_size <= known["size"]:
+                continue
+            try:
+                offset = self._consume(log_path, known["size"])
+            except OSError:
+                continue
+            if offset != known["size"] or name not in self._sources:
+                self._sources[name] = {"size": offset, "inode": st.st_ino}
+                changed = True
+        return changed
+
+    def refresh(self) -> None:
+        """Bring the ledger up to date with the event logs."""
+        with self._lock:
+            try:
+                ensure_dir(self.path.parent)
+                lock_file = open(self._lock_path, "w")
+            except (OSError, FileSystemError):
+                # Read-only tree: keep an in-memory ledger for this process
+                self._catch_up()
+                return
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                self._load()
+                if self._catch_up():
+                    self._save()
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                lock_file.close()
+
+    def rebuild(self) -> None:
+        """Discard the rollups and recompute them from every event log."""
+        with self._lock:
+            self._reset()
+            self._loaded_mtime = None
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+        self.refresh()
+
+    # Queries
+
+    def _rollups(self, start: date, end: date) -> list[DailyCost]:
+        """Rollups for each day from ``start`` to ``end`` inclusive."""
+        self.refresh()
+        rollups = []
+        with self._lock:
+            day = start
+            while day <= end:
+                rollup = self._days.get(day.isoformat())
+                if rollup is not None:
+                    rollups.append(rollup)
+                day += timedelta(days=1)
+        return rollups
+
+    def total(self, start: date, end: date) -> float:
+        """Total cost from ``start`` to ``end`` inclusive."""
+        return sum((rollup.total for rollup in self._rollups(start, end)), 0.0)
+
+    def day(self, on: date) -> DailyCost:
+        """Rollup for a single day (empty if nothing was spent)."""
+        rollups = self._rollups(on, on)
+        return rollups[0] if rollups else DailyCost()
+
+    def today(self) -> float:
+        """Total cost today."""
+        today = datetime.now().date()
+        return self.total(today, today)
+
+    def week(self) -> float:
+        """Total cost from seven days ago through today."""
+        today = datetime.now().date()
+        return self.total(today - timedelta(days=7), today)
+
+    def by_feature(self, start: date, end: date) -> dict[str, float]:
+        """Cost per feature from ``start`` to ``end`` inclusive."""
+        totals: dict[str, float] = {}
+        for rollup in self._rollups(start, end):
+            for feature_id, cost in rollup.features.items():
+                totals[feature_id] = totals.get(feature_id, 0.0) + cost
+        return totals
+
+    def by_agent(self, start: date, end: date) -> dict[str, float]:
+        """Cost per agent from ``start`` to ``end`` inclusive."""
+        totals: dict[str, float] = {}
+        for rollup in self._rollups(start, end):
+            for agent, cost in rollup.agents.items():
+                totals[agent] = totals.get(agent, 0.0) + cost
+        return totals
@@ -2,13 +2,26 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
+
+from swarm_attack.chief_of_staff.cost_ledger import CostLedger
+from swarm_attack.utils.fs import FileSystemError, ensure_dir, safe_write
+
+# Directories never walked when fingerprinting test files.
+_SKIP_DIRS = {".git", ".swarm", ".claude", "node_modules", "__pycache__", ".venv", "venv", ".tox"}
+
+# Files whose changes can alter what pytest collects besides the tests themselves.
+_PYTEST_CONFIG_FILES = ("pyproject.toml", "pytest.ini", "setup.cfg", "tox.ini")
 
 
 @dataclass
@@ -122,16 +135,31 @@ class RepoStateSnapshot:
 
 
 class StateGatherer:
-    """Aggregates state from all repository data sources."""
+    """Aggregates state from all repository data sources.
+
+    ``gather()`` runs the independent gatherers on a thread pool and reuses
+    a section's previous result while its change signature (file and
+    directory mtimes, git HEAD) is unchanged. Git working-tree state and
+    GitHub are always queried fresh. When ``cache_dir`` is given, the test
+    collection result is also persisted there so separate processes skip
+    ``pytest --collect-only`` until a test file changes.
+    """
     
-    def __init__(self, config: Any) -> None:
+    def __init__(self, config: Any, cache_dir: Optional[Path] = None) -> None:
         """Initialize with configuration.
         
         Args:
             config: SwarmConfig instance with project settings.
+            cache_dir: Optional directory for persisting the test
+                collection cache between processes.
         """
         self.config = config
         self._root = Path.cwd()
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        # section -> (signature, result)
+        self._cache: dict[str, tuple[str, Any]] = {}
+        self._cache_lock = threading.Lock()
+        self._cost_ledger: Optional[CostLedger] = None
     
     def gather(self, include_github: bool = False) -> RepoStateSnapshot:
         """Gather complete repository state snapshot.
@@ -142,33 +170,217 @@ class StateGatherer:
         Returns:
             Complete RepoStateSnapshot with all gathered state.
         """
-        git_state = self.gather_git_state()
-        features = self.gather_features()
-        bugs = self.gather_bugs()
-        prds = self.gather_prds()
-        specs = self.gather_specs()
-        tests = self.gather_tests()
-        interrupted = self.gather_interrupted_sessions()
-        cost_today, cost_weekly = self.calculate_costs()
-        
-        github_state = None
+        sections: dict[str, Callable[[], Any]] = {
+            "git": self.gather_git_state,
+            "features": lambda: self._cached(
+                "features", self._features_signature, self.gather_features
+            ),
+            "bugs": lambda: self._cached(
+                "bugs", self._bugs_signature, self.gather_bugs
+            ),
+            "prds": lambda: self._cached(
+                "prds", self._prds_signature, self.gather_prds
+            ),
+            "specs": lambda: self._cached(
+                "specs", self._specs_signature, self.gather_specs
+            ),
+            "tests": self._gather_tests_cached,
+            "interrupted": lambda: self._cached(
+                "interrupted", self._sessions_signature, self.gather_interrupted_sessions
+            ),
+            "costs": lambda: self._cached(
+                "costs", self._costs_signature, self.calculate_costs
+            ),
+        }
         if include_github:
-            github_state = self.gather_github()
+            sections["github"] = self.gather_github
+        
+        with ThreadPoolExecutor(max_workers=len(sections)) as pool:
+            futures = {name: pool.submit(fn) for name, fn in sections.items()}
+            results = {name: future.result() for name, future in futures.items()}
+        
+        cost_today, cost_weekly = results["costs"]
         
         return RepoStateSnapshot(
-            git=git_state,
-            features=features,
-            bugs=bugs,
-            prds=prds,
-            specs=specs,
-            tests=tests,
-            github=github_state,
-            interrupted_sessions=interrupted,
+            git=results["git"],
+            features=results["features"],
+            bugs=results["bugs"],
+            prds=results["prds"],
+            specs=results["specs"],
+            tests=results["tests"],
+            github=results.get("github"),
+            interrupted_sessions=results["interrupted"],
             cost_today=cost_today,
             cost_weekly=cost_weekly,
             timestamp=datetime.now(),
         )
     
+    def clear_cache(self) -> None:
+        """Forget cached sections, including the persisted test collection."""
+        with self._cache_lock:
+            self._cache.clear()
+        if self._cache_dir:
+            try:
+                (self._cache_dir / "tests.json").unlink()
+            except OSError:
+                pass
+    
+    def _cached(
+        self,
+        section: str,
+        signature_fn: Callable[[], Optional[str]],
+        compute: Callable[[], Any],
+    ) -> Any:
+        """Return a section's cached result, recomputing if its signature changed.
+        
+        Args:
+            section: Cache key for the section.
+            signature_fn: Returns the section's change signature, or None
+                if it cannot be determined (the section is then not cached).
+            compute: Gatherer producing the section's result.
+            
+        Returns:
+            The cached or freshly computed result.
+        """
+        signature = signature_fn()
+        if signature is not None:
+            with self._cache_lock:
+                cached = self._cache.get(section)
+            if cached and cached[0] == signature:
+                return cached[1]
+        
+        result = compute()
+        if signature is not None:
+            with self._cache_lock:
+                self._cache[section] = (signature, result)
+        return result
+    
+    def _gather_tests_cached(self) -> SuiteMetrics:
+        """Gather test metrics, reusing in-memory or persisted results.
+        
+        Returns:
+            SuiteMetrics for the current test files.
+        """
+        signature = self._tests_signature()
+        if signature is None:
+            return self.gather_tests()
+        
+        with self._cache_lock:
+            cached = self._cache.get("tests")
+        if cached and cached[0] == signature:
+            return cached[1]
+        
+        result = self._load_persisted_tests(signature)
+        if result is None:
+            result = self.gather_tests()
+            self._persist_tests(signature, result)
+        with self._cache_lock:
+            self._cache["tests"] = (signature, result)
+        return result
+    
+    def _load_persisted_tests(self, signature: str) -> Optional[SuiteMetrics]:
+        """Load persisted test metrics if they match the signature."""
+        if not self._cache_dir:
+            return None
+        try:
+            data = json.loads((self._cache_dir / "tests.json").read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+        if data.get("signature") != signature:
+            return None
+        return SuiteMetrics(
+            total_tests=data.get("total_tests", 0),
+            test_files=data.get("test_files", []),
+        )
+    
+    def _persist_tests(self, signature: str, metrics: SuiteMetrics) -> None:
+        """Persist test metrics for other processes."""
+        if not self._cache_dir:
+            return
+        try:
+            ensure_dir(self._cache_dir)
+            safe_write(self._cache_dir / "tests.json", json.dumps({
+                "signature": signature,
+                "total_tests": metrics.total_tests,
+                "test_files": metrics.test_files,
+            }))
+        except (OSError, TypeError, FileSystemError):
+            # Caching is best-effort
+            pass
+    
+    @staticmethod
+    def _digest(items: list[Any]) -> str:
+        """Hash signature components into a compact string."""
+        return hashlib.sha256(repr(items).encode()).hexdigest()
+    
+    def _stat_signature(self, paths: list[Path]) -> list[tuple[str, int, int]]:
+        """Return (path, mtime_ns, size) for each existing path."""
+        items = []
+        for path in paths:
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            items.append((str(path), st.st_mtime_ns, st.st_size))
+        return items
+    
+    def _glob_signature(self, directory: Path, pattern: str) -> Optional[str]:
+        """Signature of a directory and the files matching a glob inside it."""
+        try:
+            files = sorted(directory.glob(pattern)) if directory.is_dir() else []
+        except OSError:
+            return None
+        return self._digest(self._stat_signature([directory, *files]))
+    
+    def _features_signature(self) -> Optional[str]:
+        return self._glob_signature(self._root / ".swarm" / "state", "*.json")
+    
+    def _bugs_signature(self) -> Optional[str]:
+        return self._glob_signature(self._root / ".swarm" / "bugs", "*/state.json")
+    
+    def _prds_signature(self) -> Optional[str]:
+        return self._glob_signature(self._root / ".claude" / "prds", "*.md")
+    
+    def _specs_signature(self) -> Optional[str]:
+        # Subdirectory mtimes change when spec-draft/spec-final appear
+        return self._glob_signature(self._root / "specs", "*")
+    
+    def _sessions_signature(self) -> Optional[str]:
+        return self._glob_signature(self._root / ".swarm" / "sessions", "**/*.json")
+    
+    def _costs_signature(self) -> Optional[str]:
+        # Today/weekly windows move with the date even if no events change
+        signature = self._glob_signature(self._root / ".swarm" / "events", "*.jsonl")
+        if signature is None:
+            return None
+        return self._digest([signature, datetime.now().date().isoformat()])
+    
+    def _tests_signature(self) -> Optional[str]:
+        """Signature of everything that affects pytest collection.
+        
+        Covers test-file and conftest mtimes, pytest config files and git
+        HEAD, so edits, additions, deletions and commits invalidate it.
+        """
+        try:
+            head = self._run_git_command(["git", "rev-parse", "HEAD"]).strip()
+        except (subprocess.SubprocessError, OSError):
+            head = ""
+        
+        paths = [self._root / name for name in _PYTEST_CONFIG_FILES]
+        try:
+            for dirpath, dirnames, filenames in os.walk(self._root):
+                dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+                for name in filenames:
+                    if name == "conftest.py" or (
+                        name.endswith(".py")
+                        and (name.startswith("test_") or name.endswith("_test.py"))
+                    ):
+                        paths.append(Path(dirpath) / name)
+        except OSError:
+            return None
+        paths.sort()
+        return self._digest([head, self._stat_signature(paths)])
+    
     def gather_git_state(self) -> GitState:
         """Gather git repository state.
         
@@ -288,29 +500,29 @@ class StateGatherer:
         return features
     
     def gather_bugs(self) -> list[BugSummary]:
-        """Gather bug states from .swarm/bugs/*/state.json.
+        """Gather bug summaries from the bug store's phase catalog.
+        
+        The catalog is read without being persisted, so gathering never
+        writes into .swarm/bugs.
         
         Returns:
             List of BugSummary objects.
         """
-        bugs = []
-        bugs_dir = self._root / ".swarm" / "bugs"
+        from swarm_attack.bug_state_store import BugStateStore
         
         try:
-            for state_file in bugs_dir.glob("*/state.json"):
-                try:
-                    data = json.loads(state_file.read_text())
-                    bugs.append(BugSummary(
-                        bug_id=data.get("bug_id", state_file.parent.name),
-                        phase=data.get("phase", "UNKNOWN"),
-                        description=data.get("description", ""),
-                    ))
-                except (json.JSONDecodeError, OSError):
-                    continue
+            entries = BugStateStore(self._root / ".swarm" / "bugs").catalog(persist=False)
         except (FileNotFoundError, OSError):
-            pass
+            return []
         
-        return bugs
+        return [
+            BugSummary(
+                bug_id=entry.bug_id,
+                phase=entry.phase or "UNKNOWN",
+                description=entry.title,
+            )
+            for entry in entries.values()
+        ]
     
     def gather_prds(self) -> list[PRDSummary]:
         """Gather PRDs from .claude/prds/*.md.
@@ -532,45 +744,19 @@ class StateGatherer:
         return sessions
     
     def calculate_costs(self) -> tuple[float, float]:
-        """Calculate today's and weekly costs.
+        """Calculate today's and weekly costs from the cost ledger.
+        
+        The ledger folds in only event lines appended since its last
+        refresh, so this stays cheap as event history grows.
         
         Returns:
             Tuple of (today_cost, weekly_cost).
         """
-        today_cost = 0.0
-        weekly_cost = 0.0
-        
-        events_dir = self._root / ".swarm" / "events"
-        today = datetime.now().date()
-        week_ago = today - timedelta(days=7)
+        swarm_dir = self._root / ".swarm"
+        if self._cost_ledger is None or self._cost_ledger.events_dir != swarm_dir / "events":
+            self._cost_ledger = CostLedger(swarm_dir)
         
         try:
-            for event_file in events_dir.glob("*.jsonl"):
-                try:
-                    with open(event_file) as f:
-                        for line in f:
-                            try:
-                                event = json.loads(line)
-                                cost = event.get("cost", 0.0)
-                                timestamp = event.get("timestamp", "")
-                                
-                                if isinstance(timestamp, str) and timestamp:
-                                    try:
-                                        event_date = datetime.fromisoformat(
-                                            timestamp.replace("Z", "+00:00")
-                                        ).date()
-                                        
-                                        if event_date == today:
-                                            today_cost += cost
-                                        if event_date >= week_ago:
-                                            weekly_cost += cost
-                                    except ValueError:
-                                        pass
-                            except json.JSONDecodeError:
-                                continue
-                except OSError:
-                    continue
-        except (FileNotFoundError, OSError):
-            pass
-        
-        return today_cost, weekly_cost
\ No newline at end of file
+            return self._cost_ledger.today(), self._cost_ledger.week()
+        except OSError:
+            return 0.0, 0.0
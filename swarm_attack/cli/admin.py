@@ -715,3 +715,129 @@ def unblock(
         console.print(f"  Use --phase to manually specify target phase:")
         console.print(f"    swarm-attack unblock {feature_id} --phase PRD_READY")
         console.print(f"    swarm-attack unblock {feature_id} --phase SPEC_NEEDS_APPROVAL")
+
+
+# =============================================================================
+# Logs Command
+# =============================================================================
+
+
+@app.command()
+def logs(
+    feature_id: str = typer.Argument(
+        ...,
+        help="Feature whose logs to search.",
+    ),
+    since: Optional[str] = typer.Option(
+        None,
+        "--since",
+        help="First date to include (YYYY-MM-DD).",
+    ),
+    until: Optional[str] = typer.Option(
+        None,
+        "--until",
+        help="Last date to include (YYYY-MM-DD).",
+    ),
+    session_id: Optional[str] = typer.Option(
+        None,
+        "--session",
+        "-s",
+        help="Only entries from this session.",
+    ),
+    event_type: Optional[str] = typer.Option(
+        None,
+        "--event-type",
+        "-e",
+        help="Only entries of this event type.",
+    ),
+    level: Optional[str] = typer.Option(
+        None,
+        "--level",
+        "-l",
+        help="Only entries at this level (debug, info, warn, error).",
+    ),
+    limit: int = typer.Option(
+        50,
+        "--limit",
+        "-n",
+        help="Maximum number of entries to show.",
+    ),
+    oldest_first: bool = typer.Option(
+        False,
+        "--oldest-first",
+        help="Show entries in write order instead of newest first.",
+    ),
+    as_json: bool = typer.Option(
+        False,
+        "--json",
+        help="Print raw JSONL entries.",
+    ),
+) -> None:
+    """
+    Search a feature's logs across days.
+
+    Uses per-segment session and event-type indexes, so lookups over
+    long-running features only read matching lines.
+
+    Examples:
+        swarm-attack admin logs my-feature --session sess_001 --oldest-first
+        swarm-attack admin logs my-feature --event-type error --since 2025-01-01
+    """
+    import json
+    from datetime import date
+
+    from swarm_attack.logger import SwarmLogger
+
+    for value, flag in ((since, "--since"), (until, "--until")):
+        if value is None:
+            continue
+        try:
+            date.fromisoformat(value)
+        except ValueError:
+            console.print(f"[red]Error:[/red] {flag} must be a date (YYYY-MM-DD), got '{value}'.")
+            raise typer.Exit(1)
+
+    config = get_config_or_default()
+    logger = SwarmLogger(feature_id, config)
+    entries = logger.query(
+        since=since,
+        until=until,
+        level=level,
+        event_type=event_type,
+        session_id=session_id,
+        limit=limit,
+        newest_first=not oldest_first,
+    )
+
+    if as_json:
+        for entry in entries:
+            typer.echo(json.dumps(entry, default=str))
+        return
+
+    if not entries:
+        console.print(f"[dim]No log entries found for '{feature_id}'.[/dim]")
+        return
+
+    table = Table(title=f"Logs: {feature_id}")
+    table.add_column("Timestamp", style="dim")
+    table.add_column("Level")
+    table.add_column("Event", style="cyan")
+    table.add_column("Session")
+    table.add_column("Data")
+
+    level_styles = {"error": "red", "warn": "yellow", "debug": "dim"}
+    for entry in entries:
+        entry_level = str(entry.get("level", ""))
+        style = level_styles.get(entry_level)
+        data = json.dumps(entry.get("data", {}), default=str)
+        if len(data) > 80:
+            data = data[:77] + "..."
+        table.add_row(
+            str(entry.get("timestamp", "")),
+            f"[{style}]{entry_level}[/{style}]" if style else entry_level,
+            str(entry.get("event_type", "")),
+            str(entry.get("session_id", "")),
+            data,
+        )
+
+    console.print(table)
@@ -15,7 +15,7 @@ Commands:
 from __future__ import annotations
 
 import subprocess
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 import typer
 from rich.console import Console
@@ -215,6 +215,16 @@ def analyze_all(
         "--create-bugs",
         help="Create BugState entries for discovered bugs",
     ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Only re-check changed files with mypy/ruff, reusing cached findings",
+    ),
+    since: Optional[str] = typer.Option(
+        None,
+        "--since",
+        help="Git ref: re-check files changed since it (implies --incremental)",
+    ),
 ) -> None:
     """
     Run all static analysis detectors (pytest, mypy, ruff).
@@ -223,13 +233,19 @@ def analyze_all(
     Use --create-bugs to create Bug Bash entries for each bug found.
     """
     try:
-        detector = StaticBugDetector()
+        config = get_config_or_default()
+        detector = StaticBugDetector(
+            cache_dir=config.swarm_path / "cache" / "static_analysis"
+        )
 
         console.print("[cyan]Running all static analysis tools...[/cyan]")
         console.print()
 
         with console.status("[yellow]Analyzing...[/yellow]"):
-            result = detector.detect_all(path)
+            if incremental or since:
+                result = detector.detect_all(path, incremental=True, since=since)
+            else:
+                result = detector.detect_all(path)
 
         # Display bugs by severity
         _display_bugs_by_severity(result.bugs, console)
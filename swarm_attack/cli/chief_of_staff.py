@@ -54,7 +54,10 @@ def _get_state_gatherer() -> StateGatherer:
     # StateGatherer takes a config, but can work with a minimal one
     class MinimalConfig:
         pass
-    return StateGatherer(MinimalConfig())
+    project_dir_str = get_project_dir()
+    project_dir = Path(project_dir_str) if project_dir_str else Path.cwd()
+    cache_dir = project_dir / ".swarm" / "cache" / "state"
+    return StateGatherer(MinimalConfig(), cache_dir=cache_dir)
 
 
 def _get_progress_tracker():
@@ -35,6 +35,7 @@ from swarm_attack.models import FeaturePhase, TaskStage
 if TYPE_CHECKING:
     from swarm_attack.config import SwarmConfig
     from swarm_attack.models import RunState
+    from swarm_attack.orchestrator import Orchestrator
     from swarm_attack.state_store import StateStore
 
 # Create feature command group
@@ -254,8 +255,9 @@ def _run_implementation(
     state: "RunState",
     feature_id: str,
     issue_number: Optional[int] = None,
+    parallel: int = 1,
 ) -> None:
-    """Run the implementation pipeline for an issue."""
+    """Run the implementation pipeline for an issue (or issue waves in parallel)."""
     from swarm_attack.orchestrator import Orchestrator
     from swarm_attack.session_manager import SessionManager
 
@@ -292,6 +294,10 @@ def _run_implementation(
     # Inject session manager into orchestrator
     orchestrator._session_manager = session_manager
 
+    if parallel > 1 and issue_number is None:
+        _run_parallel_implementation(orchestrator, feature_id, parallel)
+        return
+
     with console.status("[yellow]Running implementation...[/yellow]"):
         result = orchestrator.run_issue_session(feature_id, issue_number)
 
@@ -366,6 +372,44 @@ def _run_implementation(
         raise typer.Exit(1)
 
 
+def _run_parallel_implementation(
+    orchestrator: "Orchestrator",
+    feature_id: str,
+    parallel: int,
+) -> None:
+    """Run independent issues concurrently in worktrees and summarize the waves."""
+    console.print(f"[dim]Parallel waves:[/dim] up to {parallel} issues at a time")
+    console.print()
+
+    with console.status("[yellow]Running implementation waves...[/yellow]"):
+        results = orchestrator.run_parallel_waves(feature_id, max_parallel=parallel)
+
+    if not results:
+        console.print("[yellow]No issues ready to work on.[/yellow]")
+        return
+
+    table = Table(title="Parallel Implementation", show_header=True, header_style="bold")
+    table.add_column("Issue", justify="right")
+    table.add_column("Status")
+    table.add_column("Cost", justify="right")
+    table.add_column("Error")
+
+    styles = {"success": "green", "blocked": "yellow"}
+    for result in results:
+        style = styles.get(result.status, "red")
+        table.add_row(
+            f"#{result.issue_number}",
+            f"[{style}]{result.status}[/{style}]",
+            format_cost(result.cost_usd),
+            (result.error or "")[:80],
+        )
+    console.print(table)
+
+    if any(r.status != "success" for r in results):
+        console.print(f"[dim]Run 'swarm-attack recover {feature_id}' for options on blocked issues.[/dim]")
+        raise typer.Exit(1)
+
+
 def _generate_prd_stub_from_spec(feature_id: str, spec_content: str) -> str:
     """
     Generate a minimal PRD stub from spec content.
@@ -464,6 +508,7 @@ def events(
     feature_id: str = typer.Argument(..., help="Feature ID to show events for"),
     limit: int = typer.Option(20, "--limit", "-n", help="Number of events to show"),
     issue: Optional[int] = typer.Option(None, "--issue", "-i", help="Filter by issue number"),
+    follow: bool = typer.Option(False, "--follow", "-f", help="Keep printing new events as they arrive"),
 ) -> None:
     """
     Show event log for a feature.
@@ -475,6 +520,19 @@ def events(
     config = get_config_or_default()
     event_logger = get_event_logger(config)
 
+    if follow:
+        console.print(f"[dim]Following events for {feature_id} (Ctrl+C to stop)...[/dim]")
+        try:
+            for event in event_logger.follow(feature_id):
+                if issue is not None and event.get("issue") != issue:
+                    continue
+                ts = event.get("ts", "")[:19].replace("T", " ")
+                issue_num = event.get("issue", "-")
+                console.print(f"[dim]{ts}[/dim] [cyan]{event.get('event', 'unknown')}[/cyan] #{issue_num}")
+        except KeyboardInterrupt:
+            pass
+        return
+
     if issue is not None:
         events_list = event_logger.get_issue_timeline(feature_id, issue)
         title = f"Events for {feature_id} Issue #{issue}"
@@ -850,6 +908,13 @@ def run(
         "-i",
         help="Specific issue number to implement (only for implementation phase).",
     ),
+    parallel: Optional[int] = typer.Option(
+        None,
+        "--parallel",
+        "-p",
+        help="Implement up to N independent issues at once in git worktrees "
+             "(default: git.max_parallel_issues).",
+    ),
 ) -> None:
     """
     Run the appropriate pipeline for a feature based on its phase.
@@ -896,7 +961,9 @@ def run(
     if state.phase in spec_phases:
         _run_spec_pipeline(config, store, state, feature_id)
     elif state.phase in impl_phases:
-        _run_implementation(config, store, state, feature_id, issue)
+        if parallel is None:
+            parallel = config.git.max_parallel_issues
+        _run_implementation(config, store, state, feature_id, issue, parallel)
     elif state.phase == FeaturePhase.SPEC_APPROVED:
         console.print(f"[yellow]Feature is in SPEC_APPROVED phase.[/yellow]")
         console.print(f"  Run 'swarm-attack issues {feature_id}' to create issues first.")
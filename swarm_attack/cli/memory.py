@@ -27,6 +27,7 @@ console = get_console()
 # Standard store file names to check (in priority order)
 # These are relative to cwd, evaluated at runtime
 DEFAULT_STORE_FILENAMES = [
+    ".swarm/memory/memories.jsonl",
     ".swarm/memory/store.json",
     ".swarm/memory/memories.json",
 ]
@@ -36,9 +37,10 @@ def get_memory_store() -> "MemoryStore":
     """Get memory store, loading from default path if exists.
 
     Checks multiple standard locations for the store file:
-    1. .swarm/memory/store.json (preferred)
-    2. .swarm/memory/memories.json (legacy)
-    3. Falls back to MemoryStore.load() for backward compatibility
+    1. .swarm/memory/memories.jsonl (journal, see memory.journal config)
+    2. .swarm/memory/store.json
+    3. .swarm/memory/memories.json (legacy)
+    4. Falls back to MemoryStore.load() for backward compatibility
 
     Returns:
         MemoryStore instance with entries loaded from file if found.
@@ -50,6 +52,8 @@ def get_memory_store() -> "MemoryStore":
     for filename in DEFAULT_STORE_FILENAMES:
         default_path = cwd / filename
         if default_path.exists():
+            if default_path.suffix == ".jsonl":
+                return MemoryStore.load(default_path)
             store = MemoryStore()
             store.load_from_file(default_path)
             # Update store_path to use the found path for saving
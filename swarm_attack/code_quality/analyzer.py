@@ -7,9 +7,22 @@ Based on the Code Quality spec:
 - Timing budget: 90 seconds for analyst phase
 - Decision points: APPROVE, REFACTOR, ESCALATE
 - Priority classification: FIX_NOW, FIX_LATER, IGNORE
+
+Each file is read and parsed once and the tree is shared by all detectors.
+Findings are cached per file, keyed by content hash and DETECTOR_VERSION,
+and larger batches of uncached files are spread across a process pool.
+Files not analyzed within the timing budget are listed in the result's
+files_skipped.
 """
 
+import ast
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Union
@@ -26,6 +39,30 @@ from .models import (
 from .smell_detector import SmellDetector
 from .solid_checker import SOLIDChecker
 
+logger = logging.getLogger(__name__)
+
+# Bump whenever detector logic changes so cached findings are recomputed.
+DETECTOR_VERSION = 1
+
+# Below this many uncached files, process start-up costs more than it saves.
+PARALLEL_MIN_FILES = 8
+
+# Analyzer used by pool worker processes, created on first use in each worker.
+_worker_analyzer: Optional["CodeQualityAnalyzer"] = None
+
+
+def _analyze_in_worker(file_path: str, source: str) -> list[Finding]:
+    """Analyze one file's source in a pool worker process."""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = CodeQualityAnalyzer()
+    return _worker_analyzer._analyze_source(Path(file_path), source)
+
+
+def _content_key(source: str) -> str:
+    """Cache key for a file's findings: its content plus the detector version."""
+    return hashlib.sha256(f"{DETECTOR_VERSION}\0{source}".encode()).hexdigest()
+
 
 class CodeQualityAnalyzer:
     """Orchestrates all detection modules and produces unified analysis.
@@ -44,11 +81,26 @@ class CodeQualityAnalyzer:
 
     TIMING_BUDGET_SECONDS = 90  # From spec: analyst phase has 90 seconds
 
-    def __init__(self) -> None:
-        """Initialize the analyzer with all detection modules."""
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Initialize the analyzer with all detection modules.
+
+        Args:
+            cache_dir: Directory for persisting per-file findings across
+                runs. Without it findings are cached in memory only.
+            max_workers: Worker processes for large batches. Defaults to
+                the CPU count; 1 disables the pool.
+        """
         self.smell_detector = SmellDetector()
         self.solid_checker = SOLIDChecker()
         self.llm_auditor = LLMAuditor()
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # file path -> {"key": content key, "findings": [finding dicts]}
+        self._cache: Optional[dict[str, dict]] = None
 
     def analyze_files(self, file_paths: list[Union[str, Path]]) -> AnalysisResult:
         """Analyze multiple files and produce unified result.
@@ -58,24 +110,54 @@ class CodeQualityAnalyzer:
 
         Returns:
             AnalysisResult containing all findings, counts, and recommendation.
+            Files the timing budget didn't allow for are in files_skipped.
         """
         start_time = time.time()
 
         # Normalize paths
         paths = [Path(p) for p in file_paths]
 
+        # Read every file once; unchanged files are answered from the cache
+        cache = self._load_cache()
+        findings_by_path: dict[Path, list[Finding]] = {}
+        pending: list[tuple[Path, str, str]] = []
+        for path in paths:
+            source = self._read_source(path)
+            if source is None:
+                findings_by_path[path] = []
+                continue
+            key = _content_key(source)
+            entry = cache.get(str(path))
+            if entry is not None and entry.get("key") == key:
+                findings_by_path[path] = [Finding.from_dict(f) for f in entry["findings"]]
+            else:
+                pending.append((path, source, key))
+
+        analyzed = self._analyze_pending(pending, start_time)
+        for path, source, key in pending:
+            if path in analyzed:
+                findings_by_path[path] = analyzed[path]
+                cache[str(path)] = {
+                    "key": key,
+                    "findings": [f.to_dict() for f in analyzed[path]],
+                }
+        if analyzed:
+            self._save_cache()
+
+        skipped = [str(path) for path in paths if path not in findings_by_path]
+        if skipped:
+            logger.warning(
+                "Timing budget exceeded: %d of %d files not analyzed", len(skipped), len(paths)
+            )
+
         # Collect all findings
         all_findings: list[Finding] = []
         files_analyzed: list[str] = []
-
         for path in paths:
-            if not self.check_timing_budget(start_time):
-                break  # Exit early if timing budget exceeded
-
-            findings = self.analyze_file(path)
-            if findings:
-                all_findings.extend(findings)
-            files_analyzed.append(str(path))
+            if path in findings_by_path:
+                all_findings.extend(findings_by_path[path])
+                files_analyzed.append(str(path))
+        self._renumber_findings(all_findings)
 
         # Prioritize findings
         prioritized_findings = self.prioritize_findings(all_findings)
@@ -116,6 +198,7 @@ class CodeQualityAnalyzer:
             findings=prioritized_findings,
             recommendation=verdict,
             refactor_summary=refactor_summary,
+            files_skipped=skipped,
         )
 
     def analyze_file(self, file_path: Union[str, Path]) -> list[Finding]:
@@ -128,24 +211,121 @@ class CodeQualityAnalyzer:
             List of Finding objects from all detectors.
         """
         path = Path(file_path)
-
-        # Handle non-existent files
-        if not path.exists():
+        source = self._read_source(path)
+        if source is None:
             return []
+        return self._analyze_source(path, source)
 
+    def _read_source(self, path: Path) -> Optional[str]:
+        """Read a Python file, or return None if it can't be analyzed."""
         # Handle non-Python files
         if path.suffix != ".py":
+            return None
+        try:
+            return path.read_text()
+        except (OSError, ValueError):
+            return None
+
+    def _analyze_source(self, path: Path, source: str) -> list[Finding]:
+        """Parse a file's source once and run every detector on the tree."""
+        try:
+            tree = ast.parse(source)
+        except (SyntaxError, ValueError):
+            # Detectors can't analyze unparseable files
             return []
 
         findings: list[Finding] = []
 
         # Run all detectors
-        findings.extend(self.smell_detector.analyze_file(path))
-        findings.extend(self.solid_checker.analyze_file(path))
-        findings.extend(self.llm_auditor.analyze_file(path))
+        findings.extend(self.smell_detector.analyze_file(path, source=source, tree=tree))
+        findings.extend(self.solid_checker.analyze_file(path, source=source, tree=tree))
+        findings.extend(self.llm_auditor.analyze_file(path, source=source, tree=tree))
 
         return findings
 
+    def _analyze_pending(
+        self,
+        pending: list[tuple[Path, str, str]],
+        start_time: float,
+    ) -> dict[Path, list[Finding]]:
+        """Analyze uncached files, in worker processes for larger batches.
+
+        Files not finished within the timing budget are left out.
+        """
+        results: dict[Path, list[Finding]] = {}
+        workers = min(self.max_workers, len(pending))
+
+        if len(pending) < PARALLEL_MIN_FILES or workers <= 1:
+            for path, source, _ in pending:
+                if not self.check_timing_budget(start_time):
+                    break  # Exit early if timing budget exceeded
+                results[path] = self._analyze_source(path, source)
+            return results
+
+        # Spawned workers don't inherit forked copies of locks held by other
+        # threads (such as a buffered log writer), which could deadlock them
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        try:
+            futures = [
+                (path, executor.submit(_analyze_in_worker, str(path), source))
+                for path, source, _ in pending
+            ]
+            for path, future in futures:
+                remaining = self.TIMING_BUDGET_SECONDS - (time.time() - start_time)
+                try:
+                    results[path] = future.result(timeout=max(remaining, 0))
+                except FuturesTimeoutError:
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return results
+
+    def _renumber_findings(self, findings: list[Finding]) -> None:
+        """Give findings sequential IDs per detector prefix (CQA, SOLID, LLM).
+
+        Findings from the cache or from worker processes carry IDs from
+        independent counters, so they are renumbered to stay unique.
+        """
+        counters: dict[str, int] = {}
+        for finding in findings:
+            prefix = finding.finding_id.rsplit("-", 1)[0]
+            counters[prefix] = counters.get(prefix, 0) + 1
+            finding.finding_id = f"{prefix}-{counters[prefix]:03d}"
+
+    def _cache_path(self) -> Optional[Path]:
+        return self.cache_dir / "findings.json" if self.cache_dir else None
+
+    def _load_cache(self) -> dict[str, dict]:
+        """Load the per-file findings cache (once per analyzer)."""
+        if self._cache is not None:
+            return self._cache
+
+        self._cache = {}
+        cache_path = self._cache_path()
+        if cache_path is not None:
+            try:
+                data = json.loads(cache_path.read_text())
+                if data.get("version") == DETECTOR_VERSION:
+                    self._cache = dict(data["files"])
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                pass
+        return self._cache
+
+    def _save_cache(self) -> None:
+        """Persist the findings cache. Failures only cost re-analysis later."""
+        cache_path = self._cache_path()
+        if cache_path is None or self._cache is None:
+            return
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = cache_path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps({"version": DETECTOR_VERSION, "files": self._cache}))
+            temp_path.replace(cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to save code quality cache: {e}")
+
     def prioritize_findings(self, findings: list[Finding]) -> list[Finding]:
         """Classify findings as fix_now, fix_later, or ignore.
 
@@ -20,7 +20,7 @@ Based on the Code Quality spec three-stage debate section.
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 from .analyzer import CodeQualityAnalyzer
 from .models import (
@@ -44,6 +44,9 @@ from .models import (
 from .refactor_suggester import RefactorSuggester
 from .tdd_generator import TDDGenerator
 
+if TYPE_CHECKING:
+    from swarm_attack.config import SwarmConfig
+
 
 class CodeQualityDispatcher:
     """Three-stage debate orchestration for code quality review.
@@ -68,9 +71,15 @@ class CodeQualityDispatcher:
     MODERATOR_BUDGET_SECONDS = 30  # From spec: moderator phase has 30 seconds
     MAX_RETRIES = 3  # From spec: max 3 retry iterations
 
-    def __init__(self) -> None:
-        """Initialize the dispatcher with all required components."""
-        self.analyzer = CodeQualityAnalyzer()
+    def __init__(self, config: Optional["SwarmConfig"] = None) -> None:
+        """Initialize the dispatcher with all required components.
+
+        Args:
+            config: Swarm configuration. When given, analyst findings are
+                cached under .swarm/cache/code_quality across runs.
+        """
+        cache_dir = config.swarm_path / "cache" / "code_quality" if config else None
+        self.analyzer = CodeQualityAnalyzer(cache_dir=cache_dir)
         self.suggester = RefactorSuggester()
         self.tdd_generator = TDDGenerator()
 
@@ -40,43 +40,53 @@ class LLMAuditor:
         self._finding_counter += 1
         return f"LLM-{self._finding_counter:03d}"
 
-    def analyze_file(self, file_path: Path) -> list[Finding]:
+    def analyze_file(
+        self,
+        file_path: Path,
+        source: Optional[str] = None,
+        tree: Optional[ast.AST] = None,
+    ) -> list[Finding]:
         """Analyze file for LLM-specific issues.
 
         Args:
             file_path: Path to the Python file to analyze.
+            source: The file's source, if the caller has already read it.
+            tree: The parsed AST of ``source``, if the caller has already
+                parsed it. The file is only read and parsed when omitted.
 
         Returns:
             List of Finding objects for detected issues.
         """
         findings: list[Finding] = []
 
-        # Handle non-existent file
-        if not file_path.exists():
-            return findings
+        if source is None:
+            # Handle non-existent file
+            if not file_path.exists():
+                return findings
 
-        try:
-            source = file_path.read_text()
-        except Exception:
-            return findings
+            try:
+                source = file_path.read_text()
+            except Exception:
+                return findings
 
         # Handle empty file
         if not source.strip():
             return findings
 
-        # Try to parse the AST
-        try:
-            tree = ast.parse(source)
-        except SyntaxError:
-            # File has syntax errors - can't analyze
-            return findings
+        if tree is None:
+            # Try to parse the AST
+            try:
+                tree = ast.parse(source)
+            except SyntaxError:
+                # File has syntax errors - can't analyze
+                return findings
 
         file_str = str(file_path)
 
         # Run all detectors
         findings.extend(self.detect_hallucinated_imports(tree, file_str))
         findings.extend(self.detect_hallucinated_apis(tree, file_str, source))
-        findings.extend(self.detect_incomplete_implementations(source, file_str))
+        findings.extend(self.detect_incomplete_implementations(source, file_str, tree))
         findings.extend(self.detect_swallowed_exceptions(tree, file_str))
 
         return findings
@@ -261,7 +271,7 @@ class LLMAuditor:
         return findings
 
     def detect_incomplete_implementations(
-        self, source: str, file_path: str
+        self, source: str, file_path: str, tree: Optional[ast.AST] = None
     ) -> list[Finding]:
         """Find TODO, FIXME, XXX, HACK comments.
 
@@ -271,6 +281,7 @@ class LLMAuditor:
         Args:
             source: The source code as a string.
             file_path: Path to the file being analyzed.
+            tree: The parsed AST of ``source``; parsed here if omitted.
 
         Returns:
             List of findings for incomplete implementations.
@@ -305,10 +316,11 @@ class LLMAuditor:
 
         # Check for placeholder returns
         # Only flag if the function body is very short (likely a stub)
-        try:
-            tree = ast.parse(source)
-        except SyntaxError:
-            return findings
+        if tree is None:
+            try:
+                tree = ast.parse(source)
+            except SyntaxError:
+                return findings
 
         for node in ast.walk(tree):
             if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
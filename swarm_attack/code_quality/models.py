@@ -170,6 +170,8 @@ class AnalysisResult:
         findings: List of Finding objects
         recommendation: Overall verdict (APPROVE, REFACTOR, ESCALATE)
         refactor_summary: Brief description of what needs fixing
+        files_skipped: Files left unanalyzed because the timing budget ran
+            out; non-empty means the analysis is partial
     """
     analysis_id: str
     files_analyzed: list[str]
@@ -184,6 +186,7 @@ class AnalysisResult:
     findings: list[Finding]
     recommendation: Verdict
     refactor_summary: str
+    files_skipped: list[str] = field(default_factory=list)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "AnalysisResult":
@@ -203,6 +206,7 @@ class AnalysisResult:
             findings=[Finding.from_dict(f) for f in data.get("findings", [])],
             recommendation=Verdict(data["recommendation"]),
             refactor_summary=data.get("refactor_summary", ""),
+            files_skipped=data.get("files_skipped", []),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -210,6 +214,7 @@ class AnalysisResult:
         return {
             "analysis_id": self.analysis_id,
             "files_analyzed": self.files_analyzed,
+            "files_skipped": self.files_skipped,
             "summary": {
                 "total_issues": self.total_issues,
                 "critical": self.critical,
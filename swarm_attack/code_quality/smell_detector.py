@@ -11,7 +11,7 @@ Based on the Code Quality spec anti-patterns section.
 
 import ast
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from .models import Finding, Severity, Category, Priority
 
@@ -40,11 +40,19 @@ class SmellDetector:
         SmellDetector._finding_counter += 1
         return f"CQA-{SmellDetector._finding_counter:03d}"
 
-    def analyze_file(self, file_path: Union[Path, str]) -> list[Finding]:
+    def analyze_file(
+        self,
+        file_path: Union[Path, str],
+        source: Optional[str] = None,
+        tree: Optional[ast.AST] = None,
+    ) -> list[Finding]:
         """Analyze a Python file for code smells.
 
         Args:
             file_path: Path to the Python file to analyze.
+            source: The file's source, if the caller has already read it.
+            tree: The parsed AST of ``source``, if the caller has already
+                parsed it. The file is only read and parsed when omitted.
 
         Returns:
             List of Finding objects for any code smells detected.
@@ -52,16 +60,17 @@ class SmellDetector:
         """
         file_path = Path(file_path)
 
-        # Handle non-existent files gracefully
-        if not file_path.exists():
-            return []
-
-        try:
-            source = file_path.read_text()
-            tree = ast.parse(source)
-        except (SyntaxError, ValueError, OSError):
-            # Handle syntax errors and other parsing issues gracefully
-            return []
+        if tree is None:
+            # Handle non-existent files gracefully
+            if not file_path.exists():
+                return []
+
+            try:
+                source = file_path.read_text()
+                tree = ast.parse(source)
+            except (SyntaxError, ValueError, OSError):
+                # Handle syntax errors and other parsing issues gracefully
+                return []
 
         findings: list[Finding] = []
         file_str = str(file_path)
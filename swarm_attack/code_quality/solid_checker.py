@@ -57,24 +57,33 @@ class SOLIDChecker:
         self._finding_counter += 1
         return f"SOLID-{self._finding_counter:03d}"
 
-    def analyze_file(self, file_path: Path) -> list[Finding]:
+    def analyze_file(
+        self,
+        file_path: Path,
+        source: Optional[str] = None,
+        tree: Optional[ast.AST] = None,
+    ) -> list[Finding]:
         """Analyze a Python file for SOLID violations.
 
         Args:
             file_path: Path to the Python file to analyze
+            source: The file's source, if the caller has already read it
+            tree: The parsed AST of ``source``, if the caller has already
+                parsed it. The file is only read and parsed when omitted.
 
         Returns:
             List of Finding objects for detected SOLID violations
         """
-        try:
-            if not file_path.exists():
+        if tree is None:
+            try:
+                if not file_path.exists():
+                    return []
+
+                source = file_path.read_text()
+                tree = ast.parse(source)
+            except (OSError, SyntaxError):
                 return []
 
-            source = file_path.read_text()
-            tree = ast.parse(source)
-        except (OSError, SyntaxError):
-            return []
-
         findings: list[Finding] = []
         file_str = str(file_path)
 
@@ -6,6 +6,7 @@ This module provides a Python interface to the OpenAI Codex CLI:
 - JSONL streaming output parsing
 - Error classification and handling
 - Graceful failure with user notifications
+- Optional response cache for read-only invocations
 
 IMPORTANT: Codex CLI has a known bug where it crashes on rate limits
 (GitHub issue #690). This client includes defensive handling for this.
@@ -27,6 +28,7 @@ from swarm_attack.errors import (
     RateLimitError,
     get_user_action_message,
 )
+from swarm_attack.llm_cache import LLMResponseCache
 
 if TYPE_CHECKING:
     from swarm_attack.config import SwarmConfig
@@ -95,12 +97,16 @@ class CodexCliRunner:
         skip_auth_classification: If True, auth errors raise CodexInvocationError
             instead of CodexAuthError. Used to skip auth classification when
             preflight checks are disabled.
+        response_cache: Optional cache for read-only invocations. Runs with
+            any other sandbox mode may modify the workspace and are never
+            cached.
     """
 
     config: SwarmConfig
     logger: Optional[SwarmLogger] = None
     checkpoint_callback: Optional[Callable[[], None]] = None
     skip_auth_classification: bool = False
+    response_cache: Optional[LLMResponseCache] = None
 
     def _build_command(
         self,
@@ -299,17 +305,6 @@ class CodexCliRunner:
             CodexTimeoutError: If command times out
             CodexInvocationError: For other failures
         """
-        # Checkpoint before execution (critical for rate limit crash bug)
-        if self.checkpoint_callback:
-            try:
-                self.checkpoint_callback()
-            except Exception as e:
-                self._log(
-                    "codex_checkpoint_warning",
-                    {"error": str(e)},
-                    level="warning",
-                )
-
         # Get config values with fallbacks
         codex_config = getattr(self.config, 'codex', None)
         default_model = None
@@ -330,6 +325,28 @@ class CodexCliRunner:
             working_dir=working_dir,
         )
 
+        cache_key = None
+        if self.response_cache is not None and sandbox_mode == "read-only":
+            # The command line carries binary, model and prompt
+            cache_key = self.response_cache.make_key(
+                runner="codex", cmd=cmd, cwd=str(cwd)
+            )
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                self._log("codex_invocation_cached", {"key": cache_key[:12]})
+                return CodexResult(**cached)
+
+        # Checkpoint before execution (critical for rate limit crash bug)
+        if self.checkpoint_callback:
+            try:
+                self.checkpoint_callback()
+            except Exception as e:
+                self._log(
+                    "codex_checkpoint_warning",
+                    {"error": str(e)},
+                    level="warning",
+                )
+
         self._log("codex_invocation_start", {
             "prompt_length": len(prompt),
             "model": actual_model,
@@ -379,6 +396,9 @@ class CodexCliRunner:
                 "response_length": len(response_text),
             })
 
+            if cache_key is not None:
+                self.response_cache.put(cache_key, result.to_dict())
+
             return result
 
         except subprocess.TimeoutExpired:
@@ -18,6 +18,13 @@ from swarm_attack.config.main import (
     PreflightConfig,
     SpecDebateConfig,
     SessionConfig,
+    LLMCacheConfig,
+    PytestCacheConfig,
+    ImpactSelectionConfig,
+    PytestShardingConfig,
+    LoggingConfig,
+    EventsConfig,
+    MemoryConfig,
     ExecutorConfig,
     TestRunnerConfig,
     GitConfig,
@@ -60,6 +67,13 @@ __all__ = [
     "PreflightConfig",
     "SpecDebateConfig",
     "SessionConfig",
+    "LLMCacheConfig",
+    "PytestCacheConfig",
+    "ImpactSelectionConfig",
+    "PytestShardingConfig",
+    "LoggingConfig",
+    "EventsConfig",
+    "MemoryConfig",
     "ExecutorConfig",
     "TestRunnerConfig",
     "GitConfig",
@@ -47,6 +47,8 @@ class ClaudeConfig:
     binary: str = "claude"                     # Path to claude binary
     max_turns: int = 10                        # Maximum conversation turns
     timeout_seconds: int = 600                 # Command timeout in seconds (10 min)
+    max_concurrent: int = 4                    # Max concurrent CLI processes (async runner)
+    stream_progress: bool = True               # Stream coder runs, logging turns/cost as they happen
 
 
 @dataclass
@@ -130,6 +132,66 @@ class SessionConfig:
     max_implementation_retries: int = 3        # Maximum retries for failed implementations
 
 
+@dataclass
+class LLMCacheConfig:
+    """On-disk response cache for deterministic LLM invocations."""
+    enabled: bool = False                      # Opt-in; only cache-safe agents use it
+    ttl_hours: float = 168.0                   # Entries older than this are misses (7 days)
+    max_size_mb: float = 100.0                 # LRU eviction past this total size
+
+
+@dataclass
+class PytestCacheConfig:
+    """On-disk cache of pytest results keyed by working-tree hash.
+
+    Gitignored files are not part of the hash; disable the cache if tests
+    read ignored inputs such as .env files or generated fixtures.
+    """
+    enabled: bool = True                       # Reuse results of identical test runs
+    max_entries: int = 200                     # Oldest results are evicted past this
+
+
+@dataclass
+class ImpactSelectionConfig:
+    """Coverage-based selection of regression tests affected by a change."""
+    enabled: bool = True                       # Needs pytest-cov; otherwise every test runs
+    full_run_every: int = 5                    # Every Nth regression check runs all tests
+
+
+@dataclass
+class PytestShardingConfig:
+    """Parallel pytest execution for large regression runs."""
+    enabled: bool = True                       # Split big runs across worker processes
+    workers: int = 0                           # Worker processes (0 = one per CPU)
+    min_files: int = 4                         # Smaller targeted runs stay in one process
+
+
+@dataclass
+class EventsConfig:
+    """Event bus persistence configuration."""
+    buffered: bool = True                      # Persist events from a background batch writer
+    flush_interval_seconds: float = 1.0        # Max time a buffered event waits before writing
+    max_pending_events: int = 100              # Queue length that forces an immediate flush
+    durability: str = "flush"                  # "flush" or "fsync" each batch
+
+
+@dataclass
+class MemoryConfig:
+    """Memory store persistence configuration."""
+    journal: bool = True                       # Append-only memories.jsonl (imports memories.json once)
+
+
+@dataclass
+class LoggingConfig:
+    """SwarmLogger file writer configuration."""
+    buffered: bool = True                      # Batch lines and flush from a background thread
+    flush_interval_seconds: float = 1.0        # Max time a buffered line waits before writing
+    max_pending_lines: int = 500               # Queue length that forces an immediate flush
+    max_file_mb: float = 50.0                  # Rotate the day's log past this size
+    compress_archives: bool = True             # gzip rotated and previous-day segments
+    retention_days: int = 0                    # Delete segments older than this (0 = keep all)
+
+
 @dataclass
 class ExecutorConfig:
     """Test execution configuration. (Renamed from TestRunnerConfig for BUG-14)"""
@@ -150,6 +212,7 @@ class GitConfig:
     feature_branch_pattern: str = "feature/{feature_slug}"  # Branch naming pattern
     use_worktrees: bool = True                 # Whether to use git worktrees
     worktrees_root: str = ".swarm/worktrees"   # Where to create worktrees
+    max_parallel_issues: int = 1               # Issues implemented concurrently per wave
 
 
 @dataclass
@@ -245,6 +308,13 @@ class SwarmConfig:
     bug_bash: BugBashConfig = field(default_factory=BugBashConfig)
     chief_of_staff: ChiefOfStaffConfig = field(default_factory=ChiefOfStaffConfig)
     auto_fix: AutoFixConfig = field(default_factory=AutoFixConfig)
+    llm_cache: LLMCacheConfig = field(default_factory=LLMCacheConfig)
+    test_cache: PytestCacheConfig = field(default_factory=PytestCacheConfig)
+    test_impact: ImpactSelectionConfig = field(default_factory=ImpactSelectionConfig)
+    test_sharding: PytestShardingConfig = field(default_factory=PytestShardingConfig)
+    logging: LoggingConfig = field(default_factory=LoggingConfig)
+    events: EventsConfig = field(default_factory=EventsConfig)
+    memory: MemoryConfig = field(default_factory=MemoryConfig)
 
     # Automatic issue splitting on timeout
     auto_split_on_timeout: bool = True  # Auto-split when coder times out
@@ -330,7 +400,9 @@ def _parse_claude_config(data: dict[str, Any]) -> ClaudeConfig:
     return ClaudeConfig(
         binary=data.get("binary", "claude"),
         max_turns=data.get("max_turns", 6),
-        timeout_seconds=data.get("timeout_seconds", 300)
+        timeout_seconds=data.get("timeout_seconds", 300),
+        max_concurrent=data.get("max_concurrent", 4),
+        stream_progress=data.get("stream_progress", True),
     )
 
 
@@ -417,6 +489,69 @@ def _parse_session_config(data: dict[str, Any]) -> SessionConfig:
     )
 
 
+def _parse_llm_cache_config(data: dict[str, Any]) -> LLMCacheConfig:
+    """Parse LLM response cache configuration from dict."""
+    return LLMCacheConfig(
+        enabled=data.get("enabled", False),
+        ttl_hours=data.get("ttl_hours", 168.0),
+        max_size_mb=data.get("max_size_mb", 100.0),
+    )
+
+
+def _parse_test_cache_config(data: dict[str, Any]) -> PytestCacheConfig:
+    """Parse test result cache configuration from dict."""
+    return PytestCacheConfig(
+        enabled=data.get("enabled", True),
+        max_entries=data.get("max_entries", 200),
+    )
+
+
+def _parse_test_impact_config(data: dict[str, Any]) -> ImpactSelectionConfig:
+    """Parse test impact selection configuration from dict."""
+    return ImpactSelectionConfig(
+        enabled=data.get("enabled", True),
+        full_run_every=data.get("full_run_every", 5),
+    )
+
+
+def _parse_test_sharding_config(data: dict[str, Any]) -> PytestShardingConfig:
+    """Parse test sharding configuration from dict."""
+    return PytestShardingConfig(
+        enabled=data.get("enabled", True),
+        workers=data.get("workers", 0),
+        min_files=data.get("min_files", 4),
+    )
+
+
+def _parse_logging_config(data: dict[str, Any]) -> LoggingConfig:
+    """Parse logging configuration from dict."""
+    return LoggingConfig(
+        buffered=data.get("buffered", True),
+        flush_interval_seconds=data.get("flush_interval_seconds", 1.0),
+        max_pending_lines=data.get("max_pending_lines", 500),
+        max_file_mb=data.get("max_file_mb", 50.0),
+        compress_archives=data.get("compress_archives", True),
+        retention_days=data.get("retention_days", 0),
+    )
+
+
+def _parse_events_config(data: dict[str, Any]) -> EventsConfig:
+    """Parse event persistence configuration from dict."""
+    return EventsConfig(
+        buffered=data.get("buffered", True),
+        flush_interval_seconds=data.get("flush_interval_seconds", 1.0),
+        max_pending_events=data.get("max_pending_events", 100),
+        durability=data.get("durability", "flush"),
+    )
+
+
+def _parse_memory_config(data: dict[str, Any]) -> MemoryConfig:
+    """Parse memory store configuration from dict."""
+    return MemoryConfig(
+        journal=data.get("journal", True),
+    )
+
+
 def _parse_tests_config(data: dict[str, Any]) -> TestRunnerConfig:
     """Parse tests configuration from dict."""
     if not data.get("command"):
@@ -434,7 +569,8 @@ def _parse_git_config(data: dict[str, Any]) -> GitConfig:
         base_branch=data.get("base_branch", "main"),
         feature_branch_pattern=data.get("feature_branch_pattern", "feature/{feature_slug}"),
         use_worktrees=data.get("use_worktrees", True),
-        worktrees_root=data.get("worktrees_root", ".swarm/worktrees")
+        worktrees_root=data.get("worktrees_root", ".swarm/worktrees"),
+        max_parallel_issues=data.get("max_parallel_issues", 1),
     )
 
 
@@ -547,6 +683,13 @@ def load_config(config_path: Optional[str] = None, repo_root: Optional[str] = No
     bug_bash_config = _parse_bug_bash_config(data.get("bug_bash", {}))
     chief_of_staff_config = _parse_chief_of_staff_config(data.get("chief_of_staff", {}))
     auto_fix_config = _parse_auto_fix_config(data.get("auto_fix", {}))
+    llm_cache_config = _parse_llm_cache_config(data.get("llm_cache", {}))
+    test_cache_config = _parse_test_cache_config(data.get("test_cache", {}))
+    test_impact_config = _parse_test_impact_config(data.get("test_impact", {}))
+    test_sharding_config = _parse_test_sharding_config(data.get("test_sharding", {}))
+    logging_config = _parse_logging_config(data.get("logging", {}))
+    events_config = _parse_events_config(data.get("events", {}))
+    memory_config = _parse_memory_config(data.get("memory", {}))
 
     # Use CLI repo_root override if provided, otherwise use config file value or "."
     actual_repo_root = repo_root if repo_root else data.get("repo_root", ".")
@@ -569,6 +712,13 @@ def load_config(config_path: Optional[str] = None, repo_root: Optional[str] = No
         bug_bash=bug_bash_config,
         chief_of_staff=chief_of_staff_config,
         auto_fix=auto_fix_config,
+        llm_cache=llm_cache_config,
+        test_cache=test_cache_config,
+        test_impact=test_impact_config,
+        test_sharding=test_sharding_config,
+        logging=logging_config,
+        events=events_config,
+        memory=memory_config,
     )
 
 
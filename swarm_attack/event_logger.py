@@ -5,21 +5,99 @@ This module provides structured event logging to JSONL files:
 - Logs events with timestamps for debugging and auditing
 - Stores events per-feature in .swarm/events/<feature>.jsonl
 - Enables timeline reconstruction and dashboard visualization
+
+Reads are proportional to what is returned, not to the log size:
+- Limited queries read blocks backwards from the end of the file
+- Issue timelines seek via a sidecar index (<feature>.issues.idx) of line
+  offsets by issue number, extended lazily with newly appended lines
+- follow() tails the log for live consumers
 """
 
 from __future__ import annotations
 
 import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Iterator, Optional
 
-from swarm_attack.utils.fs import ensure_dir
+from swarm_attack.utils.fs import FileSystemError, ensure_dir, safe_write
 
 if TYPE_CHECKING:
     from swarm_attack.config import SwarmConfig
 
 
+# Bump when the sidecar layout changes; older sidecars are rebuilt.
+ISSUE_INDEX_VERSION = 1
+
+# Bytes read per step when scanning backwards from the end of a log.
+TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def _iter_lines_reverse(f: BinaryIO, end: int, block_size: int = TAIL_BLOCK_SIZE) -> Iterator[bytes]:
+    """
+    Yield the complete lines before ``end``, last line first.
+
+    Reads fixed-size blocks backwards from ``end``; a trailing partial line
+    (still being written) is skipped.
+    """
+    position = end
+    remainder = b""
+    skip_partial = True
+    while position > 0:
+        read_size = min(block_size, position)
+        position -= read_size
+        f.seek(position)
+        lines = (f.read(read_size) + remainder).split(b"\n")
+        remainder = lines.pop(0)
+        for line in reversed(lines):
+            if skip_partial:
+                # Text after the final newline is an unfinished line
+                skip_partial = False
+                continue
+            if line.strip():
+                yield line
+    if remainder.strip() and not skip_partial:
+        yield remainder
+
+
+@dataclass
+class IssueIndex:
+    """
+    Sidecar index of a feature event log's line offsets by issue number.
+
+    ``size`` is how many bytes of the log the index covers; anything after
+    it has not been indexed yet.
+    """
+
+    size: int = 0
+    inode: int = 0
+    issues: dict[str, list[int]] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dict for JSON serialization."""
+        return {
+            "version": ISSUE_INDEX_VERSION,
+            "size": self.size,
+            "inode": self.inode,
+            "issues": self.issues,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "IssueIndex":
+        """Create from dict."""
+        if data.get("version") != ISSUE_INDEX_VERSION:
+            raise ValueError(f"Unsupported issue index version: {data.get('version')}")
+        return cls(
+            size=int(data["size"]),
+            inode=int(data["inode"]),
+            issues=dict(data["issues"]),
+        )
+
+
 class EventLogger:
     """
     Logs swarm events to JSONL files.
@@ -53,6 +131,9 @@ class EventLogger:
         """
         self.config = config
         self.events_dir = config.swarm_path / "events"
+        # Up-to-date issue indexes, keyed by feature_id
+        self._issue_indexes: dict[str, IssueIndex] = {}
+        self._index_lock = threading.Lock()
 
     def _ensure_events_dir(self) -> None:
         """Ensure the events directory exists."""
@@ -62,6 +143,10 @@ class EventLogger:
         """Get path to feature's event log file."""
         return self.events_dir / f"{feature_id}.jsonl"
 
+    def _get_index_path(self, feature_id: str) -> Path:
+        """Get path to a feature's issue index sidecar."""
+        return self.events_dir / f"{feature_id}.issues.idx"
+
     def log(
         self,
         feature_id: str,
@@ -119,35 +204,183 @@ class EventLogger:
         if not events_path.exists():
             return []
 
-        events: list[dict[str, Any]] = []
+        def matches(entry: Any) -> bool:
+            if not isinstance(entry, dict):
+                return False
+            if event_type and entry.get("event") != event_type:
+                return False
+            if issue_number is not None and entry.get("issue") != issue_number:
+                return False
+            return True
 
         try:
-            with open(events_path, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        entry = json.loads(line)
-
-                        # Apply filters
-                        if event_type and entry.get("event") != event_type:
-                            continue
-                        if issue_number is not None and entry.get("issue") != issue_number:
-                            continue
-
-                        events.append(entry)
-                    except json.JSONDecodeError:
-                        continue
+            if issue_number is not None:
+                events = self._read_indexed(feature_id, issue_number, matches, limit)
+            elif limit:
+                events = self._read_tail(events_path, matches, limit)
+            else:
+                events = self._read_all(events_path, matches)
         except (IOError, OSError):
             return []
 
-        # Apply limit (return most recent)
-        if limit and len(events) > limit:
-            events = events[-limit:]
+        return events
+
+    def _read_all(
+        self,
+        events_path: Path,
+        matches: Callable[[Any], bool],
+    ) -> list[dict[str, Any]]:
+        """Read every matching event, oldest first."""
+        events: list[dict[str, Any]] = []
+        with open(events_path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if matches(entry):
+                    events.append(entry)
+        return events
+
+    def _read_tail(
+        self,
+        events_path: Path,
+        matches: Callable[[Any], bool],
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Read the last ``limit`` matching events by scanning backwards from EOF."""
+        events: list[dict[str, Any]] = []
+        with open(events_path, "rb") as f:
+            end = f.seek(0, os.SEEK_END)
+            for line in _iter_lines_reverse(f, end):
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if matches(entry):
+                    events.append(entry)
+                    if len(events) >= limit:
+                        break
+        events.reverse()
+        return events
+
+    def _read_indexed(
+        self,
+        feature_id: str,
+        issue_number: int,
+        matches: Callable[[Any], bool],
+        limit: Optional[int],
+    ) -> list[dict[str, Any]]:
+        """Read an issue's matching events by seeking to indexed offsets."""
+        index = self.get_issue_index(feature_id)
+        if index is None:
+            return []
+        offsets = index.issues.get(str(issue_number), [])
 
+        events: list[dict[str, Any]] = []
+        with open(self._get_events_path(feature_id), "rb") as f:
+            for offset in reversed(offsets):
+                f.seek(offset)
+                try:
+                    entry = json.loads(f.readline())
+                except ValueError:
+                    continue
+                # Index narrows candidates; filters remain authoritative
+                if matches(entry):
+                    events.append(entry)
+                    if limit and len(events) >= limit:
+                        break
+        events.reverse()
         return events
 
+    # Issue index
+
+    def _read_index(self, feature_id: str) -> Optional[IssueIndex]:
+        """Read a sidecar index from disk, or None if missing or unusable."""
+        try:
+            data = json.loads(self._get_index_path(feature_id).read_text())
+            return IssueIndex.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_index(self, feature_id: str, index: IssueIndex) -> None:
+        """Atomically write a sidecar index. Failures only cost a rescan."""
+        try:
+            safe_write(self._get_index_path(feature_id), json.dumps(index.to_dict()))
+        except FileSystemError:
+            pass
+
+    @staticmethod
+    def _catch_up(events_path: Path, index: IssueIndex, size: int) -> bool:
+        """
+        Index lines appended after ``index.size``.
+
+        Only complete (newline-terminated) lines are indexed, so a line being
+        written concurrently is picked up on a later call.
+
+        Returns:
+            True if the index changed.
+        """
+        if size <= index.size:
+            return False
+
+        with events_path.open("rb") as f:
+            f.seek(index.size)
+            offset = index.size
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                try:
+                    issue = json.loads(raw).get("issue")
+                except (ValueError, AttributeError):
+                    issue = None
+                if isinstance(issue, int) and not isinstance(issue, bool):
+                    index.issues.setdefault(str(issue), []).append(offset)
+                offset += len(raw)
+
+        changed = offset != index.size
+        index.size = offset
+        return changed
+
+    def get_issue_index(self, feature_id: str) -> Optional[IssueIndex]:
+        """
+        Get an up-to-date issue index for a feature's event log.
+
+        Uses the in-memory copy when the log hasn't grown, otherwise loads
+        the sidecar and indexes only the new tail. A log whose inode changed
+        or that shrank is reindexed from the start.
+
+        Args:
+            feature_id: The feature identifier.
+
+        Returns:
+            IssueIndex, or None if the feature has no event log.
+        """
+        events_path = self._get_events_path(feature_id)
+        with self._index_lock:
+            try:
+                st = os.stat(events_path)
+            except OSError:
+                self._issue_indexes.pop(feature_id, None)
+                return None
+
+            index = self._issue_indexes.get(feature_id)
+            if index is not None and index.inode == st.st_ino and index.size == st.st_size:
+                return index
+
+            if index is None or index.inode != st.st_ino or index.size > st.st_size:
+                index = self._read_index(feature_id)
+            if index is None or index.inode != st.st_ino or index.size > st.st_size:
+                index = IssueIndex(inode=st.st_ino)
+
+            if self._catch_up(events_path, index, st.st_size):
+                self._write_index(feature_id, index)
+            self._issue_indexes[feature_id] = index
+            return index
+
     def get_issue_timeline(
         self,
         feature_id: str,
@@ -182,6 +415,81 @@ class EventLogger:
         """
         return self.get_events(feature_id, limit=count)
 
+    def follow(
+        self,
+        feature_id: str,
+        from_start: bool = False,
+        poll_interval: float = 0.5,
+        idle_timeout: Optional[float] = None,
+        stop: Optional[threading.Event] = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield events as they are appended to a feature's log.
+
+        Starts at the end of the log (or the beginning with ``from_start``)
+        and polls for complete new lines. A log that is replaced or
+        truncated is followed from its new beginning.
+
+        Args:
+            feature_id: The feature identifier.
+            from_start: Yield existing events first.
+            poll_interval: Seconds between checks when no new data arrived.
+            idle_timeout: Stop after this many seconds without new events.
+                None means follow until ``stop`` is set.
+            stop: Event that ends the generator when set.
+
+        Yields:
+            Event dictionaries in write order.
+        """
+        events_path = self._get_events_path(feature_id)
+        position: Optional[int] = None
+        inode: Optional[int] = None
+        buffer = b""
+        last_data = time.monotonic()
+
+        while stop is None or not stop.is_set():
+            try:
+                st = os.stat(events_path)
+            except OSError:
+                st = None
+
+            if st is not None:
+                if position is None:
+                    position = 0 if from_start else st.st_size
+                    inode = st.st_ino
+                elif st.st_ino != inode or st.st_size < position:
+                    position, inode, buffer = 0, st.st_ino, b""
+
+                if st.st_size > position:
+                    try:
+                        with open(events_path, "rb") as f:
+                            f.seek(position)
+                            chunk = f.read(st.st_size - position)
+                    except OSError:
+                        chunk = b""
+                    position += len(chunk)
+                    *lines, buffer = (buffer + chunk).split(b"\n")
+                    for line in lines:
+                        if not line.strip():
+                            continue
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue
+                        last_data = time.monotonic()
+                        yield entry
+                    continue
+            elif position is None and not from_start:
+                # Log doesn't exist yet: everything written later is new
+                position, inode = 0, None
+
+            if idle_timeout is not None and time.monotonic() - last_data >= idle_timeout:
+                return
+            if stop is not None:
+                stop.wait(poll_interval)
+            else:
+                time.sleep(poll_interval)
+
     def log_issue_started(
         self,
         feature_id: str,
@@ -6,7 +6,7 @@ Supports sync handlers (for Phase 1) with async-ready design.
 """
 
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 from swarm_attack.events.persistence import EventPersistence
 from swarm_attack.events.types import EventType, SwarmEvent
@@ -22,6 +22,10 @@ class EventBus:
         self,
         swarm_dir: Optional[Path] = None,
         persist: bool = True,
+        buffered: bool = False,
+        durability: str = "flush",
+        max_pending: int = 100,
+        flush_interval: float = 1.0,
     ) -> None:
         """
         Initialize the event bus.
@@ -29,12 +33,23 @@ class EventBus:
         Args:
             swarm_dir: Path to .swarm directory for persistence.
             persist: Whether to persist events to disk.
+            buffered: Persist events in background batches so emit() doesn't
+                wait on file I/O. Call flush() to force pending events out.
+            durability: Buffered mode: "flush" or "fsync" per batch.
+            max_pending: Buffered mode: queue length that triggers a flush.
+            flush_interval: Buffered mode: maximum seconds before a flush.
         """
         self._handlers: dict[EventType, list[EventHandler]] = {}
         self._global_handlers: list[EventHandler] = []
         self._persist = persist
         if persist and swarm_dir:
-            self._persistence: Optional[EventPersistence] = EventPersistence(swarm_dir)
+            self._persistence: Optional[EventPersistence] = EventPersistence(
+                swarm_dir,
+                buffered=buffered,
+                max_pending=max_pending,
+                flush_interval=flush_interval,
+                durability=durability,
+            )
         else:
             self._persistence = None
 
@@ -92,6 +107,16 @@ class EventBus:
                     # Log but don't fail - handlers shouldn't break the bus
                     pass
 
+    def flush(self) -> None:
+        """Write any buffered events to disk."""
+        if self._persistence:
+            self._persistence.flush()
+
+    def close(self) -> None:
+        """Flush buffered events and stop the background writer."""
+        if self._persistence:
+            self._persistence.close()
+
     def emit_spec_approved(
         self,
         feature_id: str,
@@ -129,9 +154,28 @@ class EventBus:
 _default_bus: Optional[EventBus] = None
 
 
-def get_event_bus(swarm_dir: Optional[Path] = None) -> EventBus:
-    """Get or create the default event bus."""
+def get_event_bus(
+    swarm_dir: Optional[Path] = None,
+    config: Optional[Any] = None,
+) -> EventBus:
+    """Get or create the default event bus.
+
+    ``config`` only applies when this call creates the bus: its ``events``
+    section (EventsConfig) decides whether persistence is buffered. Without
+    it events are written synchronously.
+    """
     global _default_bus
     if _default_bus is None:
-        _default_bus = EventBus(swarm_dir, persist=True)
+        settings = getattr(config, "events", None)
+        if getattr(settings, "buffered", False) is True:
+            _default_bus = EventBus(
+                swarm_dir,
+                persist=True,
+                buffered=True,
+                durability=settings.durability,
+                max_pending=settings.max_pending_events,
+                flush_interval=settings.flush_interval_seconds,
+            )
+        else:
+            _default_bus = EventBus(swarm_dir, persist=True)
     return _default_bus
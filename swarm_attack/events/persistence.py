@@ -3,39 +3,497 @@ Event persistence for the swarm-attack event system.
 
 Persists events to JSONL files for debugging and replay.
 Supports querying by feature, time range, and event type.
+
+Each day's log (events-YYYY-MM-DD.jsonl) has a sidecar index
+(events-YYYY-MM-DD.idx) holding byte offsets by feature_id and event_type
+plus the min/max event timestamp. Indexes are brought up to date lazily at
+query time by scanning only the bytes appended since they were written, so
+queries can skip whole days and seek straight to matching lines.
+
+Appends are synchronous by default. With ``buffered=True`` events are
+queued and a background thread coalesces them into one write per batch,
+keeping the day's file handle open between batches.
 """
 
+import atexit
 import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import IO, Any, Iterator, Optional
 
 from swarm_attack.events.types import EventType, SwarmEvent
+from swarm_attack.utils.fs import FileSystemError, safe_write
+
+# Bump when the sidecar layout changes; older sidecars are rebuilt.
+SEGMENT_INDEX_VERSION = 1
+
+# Durability levels for buffered writes: "flush" hands each batch to the OS
+# (survives a process crash), "fsync" also forces it to disk (survives power loss).
+DURABILITY_MODES = ("flush", "fsync")
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an event timestamp, returning None if it is unusable."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_before(value: Optional[str], since: datetime) -> bool:
+    """True only if the timestamp is known to be before ``since``."""
+    ts = _parse_timestamp(value)
+    if ts is None:
+        return False
+    try:
+        return ts < since
+    except TypeError:
+        # Naive vs aware mismatch: can't prove it, so don't skip
+        return False
+
+
+@dataclass
+class SegmentIndex:
+    """
+    Sidecar index for one day's event log segment.
+
+    Offsets are byte positions of line starts in the JSONL file, in file
+    order. ``size`` is how many bytes of the log the index covers; anything
+    after it has not been indexed yet.
+    """
+
+    size: int = 0
+    inode: int = 0
+    min_ts: Optional[str] = None
+    max_ts: Optional[str] = None
+    lines: list[int] = field(default_factory=list)
+    features: dict[str, list[int]] = field(default_factory=dict)
+    event_types: dict[str, list[int]] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dict for JSON serialization."""
+        return {
+            "version": SEGMENT_INDEX_VERSION,
+            "size": self.size,
+            "inode": self.inode,
+            "min_ts": self.min_ts,
+            "max_ts": self.max_ts,
+            "lines": self.lines,
+            "features": self.features,
+            "event_types": self.event_types,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SegmentIndex":
+        """Create from dict."""
+        if data.get("version") != SEGMENT_INDEX_VERSION:
+            raise ValueError(f"Unsupported segment index version: {data.get('version')}")
+        return cls(
+            size=int(data["size"]),
+            inode=int(data["inode"]),
+            min_ts=data.get("min_ts"),
+            max_ts=data.get("max_ts"),
+            lines=list(data["lines"]),
+            features=dict(data["features"]),
+            event_types=dict(data["event_types"]),
+        )
+
+    def add(self, offset: int, data: dict[str, Any]) -> None:
+        """Record one decoded event line starting at ``offset``."""
+        self.lines.append(offset)
+        self.features.setdefault(data.get("feature_id") or "", []).append(offset)
+        self.event_types.setdefault(str(data.get("event_type", "")), []).append(offset)
+
+        timestamp = data.get("timestamp")
+        ts = _parse_timestamp(timestamp)
+        if ts is None:
+            return
+        try:
+            if self.min_ts is None or ts < _parse_timestamp(self.min_ts):
+                self.min_ts = timestamp
+            if self.max_ts is None or ts > _parse_timestamp(self.max_ts):
+                self.max_ts = timestamp
+        except TypeError:
+            pass  # Mixed naive/aware timestamps: keep the bounds we have
+
+    def candidates(
+        self,
+        feature_id: Optional[str] = None,
+        event_types: Optional[list[EventType]] = None,
+    ) -> list[int]:
+        """Get offsets that may match the filters, in file order."""
+        if not feature_id and not event_types:
+            return self.lines
+
+        selected: Optional[set[int]] = None
+        if feature_id:
+            selected = set(self.features.get(feature_id, []))
+        if event_types:
+            by_type: set[int] = set()
+            for event_type in event_types:
+                by_type.update(self.event_types.get(event_type.value, []))
+            selected = by_type if selected is None else selected & by_type
+        return sorted(selected or ())
+
+
+class BufferedEventWriter:
+    """
+    Batched, background writer for event log lines.
+
+    Lines are queued by write() and flushed by a daemon thread every
+    ``flush_interval`` seconds, or as soon as ``max_pending`` lines are
+    queued. Each flush issues a single write() per log file and keeps that
+    file's handle open until the day rolls over to a new file. Pending lines
+    are flushed on close() and at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        max_pending: int = 100,
+        flush_interval: float = 1.0,
+        durability: str = "flush",
+    ) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            max_pending: Queue length that triggers an immediate flush.
+            flush_interval: Maximum seconds a line waits in the queue.
+            durability: "flush" or "fsync" (see DURABILITY_MODES).
+
+        Raises:
+            ValueError: If durability is not a known mode.
+        """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(
+                f"durability must be one of {DURABILITY_MODES}, got {durability!r}"
+            )
+        self._max_pending = max(1, max_pending)
+        self._flush_interval = flush_interval
+        self._fsync = durability == "fsync"
+
+        self._cond = threading.Condition()
+        self._pending: list[tuple[Path, str]] = []
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Serializes flushes and guards the open handle
+        self._io_lock = threading.Lock()
+        self._handle: Optional[IO[str]] = None
+        self._handle_path: Optional[Path] = None
+
+        atexit.register(self.close)
+
+    def write(self, path: Path, line: str) -> None:
+        """Queue a newline-terminated line for ``path``."""
+        with self._cond:
+            if not self._closed:
+                self._pending.append((path, line))
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="event-writer", daemon=True
+                    )
+                    self._thread.start()
+                if len(self._pending) >= self._max_pending:
+                    self._cond.notify()
+                return
+
+        # Closed (e.g. during interpreter shutdown): fall back to a direct append
+        with path.open("a") as f:
+            f.write(line)
+
+    def _run(self) -> None:
+        """Background loop: flush on interval, on a full queue, and on close."""
+        while True:
+            with self._cond:
+                if not self._closed and len(self._pending) < self._max_pending:
+                    self._cond.wait(timeout=self._flush_interval)
+                closed = self._closed
+            try:
+                self.flush()
+            except OSError as e:
+                # Batch is lost; event persistence must not crash the caller
+                logger.warning("Failed to write buffered events: %s", e)
+            if closed:
+                return
+
+    def _get_handle(self, path: Path) -> IO[str]:
+        """Get an append handle for ``path``, reopening on rollover or replacement."""
+        if self._handle is not None and self._handle_path == path:
+            try:
+                if os.stat(path).st_ino == os.fstat(self._handle.fileno()).st_ino:
+                    return self._handle
+            except OSError:
+                pass  # File was removed; reopen below
+        self._close_handle()
+        self._handle = path.open("a")
+        self._handle_path = path
+        return self._handle
+
+    def _close_handle(self) -> None:
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            finally:
+                self._handle = None
+                self._handle_path = None
+
+    def flush(self) -> None:
+        """
+        Write all queued lines now.
+
+        Raises:
+            OSError: If writing the batch fails.
+        """
+        with self._io_lock:
+            with self._cond:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return
+
+            # Group consecutive lines by file so order is preserved on rollover
+            start = 0
+            while start < len(batch):
+                path = batch[start][0]
+                end = start
+                while end < len(batch) and batch[end][0] == path:
+                    end += 1
+                handle = self._get_handle(path)
+                handle.write("".join(line for _, line in batch[start:end]))
+                handle.flush()
+                if self._fsync:
+                    os.fsync(handle.fileno())
+                start = end
+
+    def close(self) -> None:
+        """Flush pending lines, stop the background thread and close the handle."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+            thread = self._thread
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        try:
+            self.flush()
+        finally:
+            with self._io_lock:
+                self._close_handle()
+            atexit.unregister(self.close)
 
 
 class EventPersistence:
     """Persist events to JSONL files."""
 
-    def __init__(self, swarm_dir: Path) -> None:
+    def __init__(
+        self,
+        swarm_dir: Path,
+        buffered: bool = False,
+        max_pending: int = 100,
+        flush_interval: float = 1.0,
+        durability: str = "flush",
+    ) -> None:
         """
         Initialize event persistence.
 
         Args:
             swarm_dir: Path to .swarm directory (will create events/ subdirectory).
+            buffered: Queue appends and write them in batches from a
+                background thread instead of opening the file per event.
+            max_pending: Buffered mode: queue length that triggers a flush.
+            flush_interval: Buffered mode: maximum seconds before a flush.
+            durability: Buffered mode: "flush" or "fsync" per batch.
         """
         self._events_dir = Path(swarm_dir) / "events"
         self._events_dir.mkdir(parents=True, exist_ok=True)
+        # Up-to-date segment indexes, keyed by log path
+        self._segments: dict[Path, SegmentIndex] = {}
+        self._writer: Optional[BufferedEventWriter] = None
+        if buffered:
+            self._writer = BufferedEventWriter(
+                max_pending=max_pending,
+                flush_interval=flush_interval,
+                durability=durability,
+            )
 
     def _get_log_path(self) -> Path:
         """Get today's event log path."""
         date_str = datetime.now().strftime("%Y-%m-%d")
         return self._events_dir / f"events-{date_str}.jsonl"
 
+    @staticmethod
+    def _get_index_path(log_path: Path) -> Path:
+        """Get the sidecar index path for a log segment."""
+        return log_path.with_suffix(".idx")
+
+    def _log_files(self) -> list[Path]:
+        """Get all log segments, newest day first."""
+        return sorted(self._events_dir.glob("events-*.jsonl"), reverse=True)
+
     def append(self, event: SwarmEvent) -> None:
-        """Append event to today's log."""
+        """Append event to today's log (queued when buffered)."""
         log_path = self._get_log_path()
+        line = json.dumps(event.to_dict()) + "\n"
+        if self._writer is not None:
+            self._writer.write(log_path, line)
+            return
         with log_path.open("a") as f:
-            f.write(json.dumps(event.to_dict()) + "\n")
+            f.write(line)
+
+    def flush(self) -> None:
+        """Write any buffered events to disk. No-op when unbuffered."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self) -> None:
+        """Flush buffered events and release the writer. No-op when unbuffered."""
+        if self._writer is not None:
+            self._writer.close()
+
+    # Segment indexes
+
+    def _read_index(self, log_path: Path) -> Optional[SegmentIndex]:
+        """Read a sidecar index from disk, or None if missing or unusable."""
+        try:
+            data = json.loads(self._get_index_path(log_path).read_text())
+            return SegmentIndex.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_index(self, log_path: Path, index: SegmentIndex) -> None:
+        """Atomically write a sidecar index. Failures only cost a rescan."""
+        try:
+            safe_write(self._get_index_path(log_path), json.dumps(index.to_dict()))
+        except FileSystemError:
+            pass
+
+    def _catch_up(self, log_path: Path, index: SegmentIndex, size: int) -> bool:
+        """
+        Index lines appended after ``index.size``.
+
+        Only complete (newline-terminated) lines are indexed, so a line being
+        written concurrently is picked up on a later call.
+
+        Returns:
+            True if the index changed.
+        """
+        if size <= index.size:
+            return False
+
+        with log_path.open("rb") as f:
+            f.seek(index.size)
+            offset = index.size
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                if raw.strip():
+                    try:
+                        index.add(offset, json.loads(raw))
+                    except (ValueError, AttributeError):
+                        pass  # Undecodable line: never matches a query
+                offset += len(raw)
+
+        changed = offset != index.size
+        index.size = offset
+        return changed
+
+    def get_segment_index(self, log_path: Path) -> Optional[SegmentIndex]:
+        """
+        Get an up-to-date index for a log segment.
+
+        Uses the in-memory copy when the file hasn't grown, otherwise loads
+        the sidecar and indexes only the new tail. A segment whose inode
+        changed or that shrank is reindexed from the start.
+
+        Args:
+            log_path: Path to an events-*.jsonl segment.
+
+        Returns:
+            SegmentIndex, or None if the segment no longer exists.
+        """
+        try:
+            st = os.stat(log_path)
+        except OSError:
+            self._segments.pop(log_path, None)
+            return None
+
+        index = self._segments.get(log_path)
+        if index is not None and index.inode == st.st_ino and index.size == st.st_size:
+            return index
+
+        if index is None or index.inode != st.st_ino or index.size > st.st_size:
+            index = self._read_index(log_path)
+        if index is None or index.inode != st.st_ino or index.size > st.st_size:
+            index = SegmentIndex(inode=st.st_ino)
+
+        if self._catch_up(log_path, index, st.st_size):
+            self._write_index(log_path, index)
+        self._segments[log_path] = index
+        return index
+
+    # Queries
+
+    def _iter_segment(
+        self,
+        log_path: Path,
+        index: SegmentIndex,
+        feature_id: Optional[str],
+        event_types: Optional[list[EventType]],
+        since: Optional[datetime],
+        reverse: bool,
+    ) -> Iterator[SwarmEvent]:
+        """Yield matching events from one segment by seeking to candidates."""
+        offsets = index.candidates(feature_id, event_types)
+        if reverse:
+            offsets = reversed(offsets)
+
+        with log_path.open("rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                try:
+                    event = SwarmEvent.from_dict(json.loads(f.readline()))
+                except (ValueError, KeyError, TypeError):
+                    continue
+
+                # Index narrows candidates; filters remain authoritative
+                if feature_id and event.feature_id != feature_id:
+                    continue
+                if event_types and event.event_type not in event_types:
+                    continue
+                if since and datetime.fromisoformat(event.timestamp) < since:
+                    continue
+
+                yield event
+
+    def _iter_events(
+        self,
+        feature_id: Optional[str],
+        event_types: Optional[list[EventType]],
+        since: Optional[datetime],
+        reverse: bool,
+    ) -> Iterator[SwarmEvent]:
+        """Yield matching events across segments, newest day first."""
+        # Read-your-writes: queued events must be visible to queries
+        self.flush()
+        for log_path in self._log_files():
+            index = self.get_segment_index(log_path)
+            if index is None or not index.lines:
+                continue
+            if since and _is_before(index.max_ts, since):
+                continue
+            yield from self._iter_segment(
+                log_path, index, feature_id, event_types, since, reverse
+            )
 
     def query(
         self,
@@ -47,6 +505,9 @@ class EventPersistence:
         """
         Query events with filters.
 
+        Days are visited newest first and events within a day in the order
+        they were written.
+
         Args:
             feature_id: Filter by feature ID.
             event_types: Filter by event types.
@@ -57,39 +518,50 @@ class EventPersistence:
             List of matching SwarmEvent objects.
         """
         events: list[SwarmEvent] = []
+        if limit <= 0:
+            return events
 
-        # Determine which log files to read
-        log_files = sorted(self._events_dir.glob("events-*.jsonl"), reverse=True)
+        for event in self._iter_events(feature_id, event_types, since, reverse=False):
+            events.append(event)
+            if len(events) >= limit:
+                break
+        return events
 
-        for log_file in log_files:
-            with log_file.open() as f:
-                for line in f:
-                    if not line.strip():
-                        continue
+    def iter_reverse(
+        self,
+        feature_id: Optional[str] = None,
+        event_types: Optional[list[EventType]] = None,
+        since: Optional[datetime] = None,
+    ) -> Iterator[SwarmEvent]:
+        """
+        Iterate matching events newest first.
 
-                    data = json.loads(line)
-                    event = SwarmEvent.from_dict(data)
+        Only the segments and lines actually consumed are read, so taking
+        the first few events is cheap regardless of log age.
 
-                    # Apply filters
-                    if feature_id and event.feature_id != feature_id:
-                        continue
-                    if event_types and event.event_type not in event_types:
-                        continue
-                    if since and datetime.fromisoformat(event.timestamp) < since:
-                        continue
+        Args:
+            feature_id: Filter by feature ID.
+            event_types: Filter by event types.
+            since: Only yield events after this time.
 
-                    events.append(event)
+        Yields:
+            Matching SwarmEvent objects in reverse write order.
+        """
+        return self._iter_events(feature_id, event_types, since, reverse=True)
 
-                    if len(events) >= limit:
-                        return events
+    def get_recent(self, minutes: int = 60, limit: int = 100) -> list[SwarmEvent]:
+        """Get up to ``limit`` events from the last N minutes, newest first."""
+        since = datetime.now() - timedelta(minutes=minutes)
+        events: list[SwarmEvent] = []
+        if limit <= 0:
+            return events
 
+        for event in self.iter_reverse(since=since):
+            events.append(event)
+            if len(events) >= limit:
+                break
         return events
 
-    def get_recent(self, minutes: int = 60) -> list[SwarmEvent]:
-        """Get events from the last N minutes."""
-        since = datetime.now() - timedelta(minutes=minutes)
-        return self.query(since=since)
-
     def get_by_feature(self, feature_id: str, limit: int = 50) -> list[SwarmEvent]:
         """Get events for a specific feature."""
         return self.query(feature_id=feature_id, limit=limit)
@@ -0,0 +1,264 @@
+"""
+Content-addressed response cache for deterministic LLM invocations.
+
+This module provides:
+- LLMResponseCache, an on-disk cache under .swarm/cache/llm/
+- Keys derived from a SHA-256 of everything that affects the response
+  (prompt, tools, turn budget, binary/model)
+- TTL expiry and size-bounded LRU eviction
+- get_response_cache() to build a cache from SwarmConfig when enabled
+
+Only agents that opt in (read-only, single-shot prompts such as complexity
+gating or spec critique) should be given a cache. Tool-using agents like
+the coder have side effects that a cached response would silently skip.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from swarm_attack.utils.fs import ensure_dir, safe_write
+
+if TYPE_CHECKING:
+    from swarm_attack.config import SwarmConfig
+    from swarm_attack.logger import SwarmLogger
+
+
+# Bump when the entry layout changes; entries with another version are misses.
+LLM_CACHE_VERSION = 1
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+
+class LLMResponseCache:
+    """
+    On-disk, content-addressed cache of LLM responses.
+
+    Entries live at ``<cache_dir>/<key[:2]>/<key>.json`` and are written
+    atomically. An entry's mtime is its last-used time: hits touch it, and
+    when the cache grows past ``max_bytes`` the least recently used entries
+    are removed first. Entries older than ``ttl_seconds`` are misses and
+    are deleted on access.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | str,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        logger: Optional[SwarmLogger] = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries.
+            ttl_seconds: Maximum age of an entry before it expires.
+            max_bytes: Total size budget; older entries are evicted past it.
+            logger: Optional logger for recording cache activity.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._logger = logger
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """
+        Build a cache key from the inputs that determine a response.
+
+        Args:
+            **parts: JSON-serializable invocation parameters. Lists are
+                kept in order, so callers should pass them as the CLI sees them.
+
+        Returns:
+            Hex SHA-256 digest of the canonical JSON encoding.
+        """
+        canonical = json.dumps(
+            {"version": LLM_CACHE_VERSION, **parts},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the file path for a cache key."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _log(
+        self, event_type: str, data: Optional[dict] = None, level: str = "debug"
+    ) -> None:
+        """Log an event if logger is configured."""
+        if self._logger:
+            self._logger.log(event_type, data, level=level)
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from make_key().
+
+        Returns:
+            The stored response payload, or None on a miss.
+        """
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            with self._lock:
+                self._misses += 1
+            return None
+
+        expired = time.time() - entry.get("created_at", 0) > self.ttl_seconds
+        if entry.get("version") != LLM_CACHE_VERSION or expired:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            with self._lock:
+                self._misses += 1
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        with self._lock:
+            self._hits += 1
+        self._log("llm_cache_hit", {"key": key[:12]})
+        return entry.get("response")
+
+    def put(self, key: str, response: dict[str, Any]) -> None:
+        """
+        Store a response, then evict if the cache is over budget.
+
+        Write failures are logged and otherwise ignored; the cache is an
+        optimization and must never fail the invocation it wraps.
+
+        Args:
+            key: Key from make_key().
+            response: JSON-serializable response payload.
+        """
+        entry = {
+            "version": LLM_CACHE_VERSION,
+            "created_at": time.time(),
+            "response": response,
+        }
+        path = self._entry_path(key)
+        try:
+            ensure_dir(path.parent)
+            safe_write(path, json.dumps(entry))
+        except Exception as e:
+            self._log("llm_cache_write_error", {"error": str(e)}, level="warning")
+            return
+
+        self._evict()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """List (mtime, size, path) for every entry on disk."""
+        entries = []
+        if not self.cache_dir.exists():
+            return entries
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under max_bytes."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+
+        removed = 0
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+
+        with self._lock:
+            self._evictions += removed
+        self._log("llm_cache_evicted", {"entries": removed, "bytes": total})
+
+    def clear(self) -> int:
+        """
+        Remove every cache entry.
+
+        Returns:
+            Number of entries removed.
+        """
+        removed = 0
+        for _, _, path in self._entries():
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hits, misses, evictions, entries and bytes.
+        """
+        entries = self._entries()
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(entries),
+                "bytes": sum(size for _, size, _ in entries),
+            }
+
+
+def get_response_cache(
+    config: SwarmConfig,
+    logger: Optional[SwarmLogger] = None,
+) -> Optional[LLMResponseCache]:
+    """
+    Build the response cache described by config.llm_cache.
+
+    Args:
+        config: SwarmConfig with an optional llm_cache section.
+        logger: Optional logger for recording cache activity.
+
+    Returns:
+        An LLMResponseCache, or None if caching is disabled.
+    """
+    cache_config = getattr(config, "llm_cache", None)
+    if getattr(cache_config, "enabled", False) is not True:
+        return None
+
+    return LLMResponseCache(
+        Path(config.swarm_path) / "cache" / "llm",
+        ttl_seconds=cache_config.ttl_hours * 3600,
+        max_bytes=int(cache_config.max_size_mb * 1024 * 1024),
+        logger=logger,
+    )
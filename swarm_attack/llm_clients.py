@@ -3,21 +3,39 @@ Claude Code CLI wrapper for Feature Swarm.
 
 This module provides a Python interface to the Claude Code CLI:
 - ClaudeCliRunner class for executing prompts
+- AsyncClaudeCliRunner with a process-wide concurrency cap and a sync facade
+- Opt-in streaming (stream-json) runs with live progress and early termination
 - JSON output parsing
 - Timeout handling with graceful termination
 - Cost tracking and logging
+- Optional content-addressed response cache for read-only invocations
 """
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import json
 import os
+import re
 import signal
 import subprocess
-from dataclasses import dataclass
+import threading
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Iterator,
+    Optional,
+)
 
+from swarm_attack.llm_cache import LLMResponseCache
 from swarm_attack.models import ClaudeResult
 
 if TYPE_CHECKING:
@@ -44,16 +62,283 @@ class ClaudeTimeoutError(ClaudeInvocationError):
     pass
 
 
+class ClaudeStreamAborted(ClaudeInvocationError):
+    """Raised when a streamed run is terminated early by a StreamLimits check."""
+
+    def __init__(
+        self,
+        message: str,
+        reason: str,
+        progress: StreamProgress,
+    ) -> None:
+        super().__init__(message, stderr=reason, returncode=-1)
+        self.reason = reason
+        self.progress = progress
+
+
+@dataclass
+class StreamProgress:
+    """Running totals for a streamed Claude run, updated per event."""
+    num_turns: int = 0               # Distinct assistant messages seen
+    cost_usd: float = 0.0            # Latest cost reported by the CLI
+    input_tokens: int = 0            # Summed from assistant message usage
+    output_tokens: int = 0
+    events: int = 0                  # Stream events consumed
+
+
+@dataclass
+class StreamLimits:
+    """
+    Early-termination limits for a streamed run. None disables a check.
+
+    Cost is only as fresh as the CLI reports it, so token and turn limits
+    are the earliest cut-offs; stop_patterns are regexes matched against
+    assistant text and tool-use inputs.
+    """
+    max_turns: Optional[int] = None
+    max_output_tokens: Optional[int] = None
+    max_cost_usd: Optional[float] = None
+    stop_patterns: list[str] = field(default_factory=list)
+
+    def check(self, progress: StreamProgress, text: str = "") -> Optional[str]:
+        """
+        Check progress and new content against the limits.
+
+        Returns:
+            Reason string if the run should stop, None otherwise.
+        """
+        if self.max_turns is not None and progress.num_turns > self.max_turns:
+            return f"turns {progress.num_turns} > {self.max_turns}"
+        if (
+            self.max_output_tokens is not None
+            and progress.output_tokens > self.max_output_tokens
+        ):
+            return f"output tokens {progress.output_tokens} > {self.max_output_tokens}"
+        if self.max_cost_usd is not None and progress.cost_usd > self.max_cost_usd:
+            return f"cost ${progress.cost_usd:.4f} > ${self.max_cost_usd:.4f}"
+        if text:
+            for pattern in self.stop_patterns:
+                if re.search(pattern, text):
+                    return f"matched stop pattern {pattern!r}"
+        return None
+
+
+def _terminate_process_group(
+    proc: subprocess.Popen,
+    grace_seconds: float = 5.0,
+) -> None:
+    """Terminate a process started with start_new_session, escalating to SIGKILL."""
+    if proc.poll() is not None:
+        return
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+        proc.wait(timeout=grace_seconds)
+    except (ProcessLookupError, PermissionError):
+        return
+    except subprocess.TimeoutExpired:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            return
+        proc.wait()
+
+
+class ClaudeStream:
+    """
+    Iterator over a streamed (stream-json) Claude CLI run.
+
+    Yields each decoded event dict as soon as the CLI writes it, keeping
+    ``progress`` current and calling ``on_progress`` whenever the turn count,
+    tokens or cost change. When iteration finishes, ``result`` holds the
+    ClaudeResult. Breaking out early or closing the stream kills the CLI.
+
+    Raises (during iteration):
+        ClaudeStreamAborted: If a StreamLimits check trips.
+        ClaudeTimeoutError: If the run exceeds its timeout.
+        ClaudeInvocationError: If the CLI fails or returns an error result.
+    """
+
+    def __init__(
+        self,
+        runner: ClaudeCliRunner,
+        cmd: list[str],
+        cwd: str,
+        timeout_seconds: int,
+        limits: Optional[StreamLimits] = None,
+        on_progress: Optional[Callable[[StreamProgress], None]] = None,
+    ) -> None:
+        self._runner = runner
+        self._cmd = cmd
+        self._cwd = cwd
+        self._timeout_seconds = timeout_seconds
+        self._limits = limits or StreamLimits()
+        self._on_progress = on_progress
+
+        self.progress = StreamProgress()
+        self.result: Optional[ClaudeResult] = None
+
+        self._proc: Optional[subprocess.Popen] = None
+        self._timed_out = False
+        self._stderr_chunks: list[str] = []
+        self._message_usage: dict[str, tuple[int, int]] = {}
+
+    def _drain_stderr(self) -> None:
+        assert self._proc is not None and self._proc.stderr is not None
+        for chunk in self._proc.stderr:
+            self._stderr_chunks.append(chunk)
+
+    def _on_timeout(self) -> None:
+        self._timed_out = True
+        self.close()
+
+    def close(self) -> None:
+        """Kill the CLI process group if it is still running."""
+        if self._proc is not None:
+            _terminate_process_group(self._proc)
+
+    def _consume(self, event: dict[str, Any]) -> str:
+        """
+        Fold one event into ``progress``.
+
+        Returns:
+            Assistant text and tool-use input carried by the event, for
+            stop-pattern matching.
+        """
+        before = (
+            self.progress.num_turns,
+            self.progress.output_tokens,
+            self.progress.cost_usd,
+        )
+        self.progress.events += 1
+        text_parts: list[str] = []
+
+        if event.get("type") == "assistant":
+            message = event.get("message") or {}
+            message_id = message.get("id") or f"event-{self.progress.events}"
+            usage = message.get("usage") or {}
+            if message_id not in self._message_usage:
+                self.progress.num_turns += 1
+            # Usage is cumulative per message, so replace rather than add
+            old_in, old_out = self._message_usage.get(message_id, (0, 0))
+            new_in = int(usage.get("input_tokens", 0) or 0)
+            new_out = int(usage.get("output_tokens", 0) or 0)
+            self._message_usage[message_id] = (new_in, new_out)
+            self.progress.input_tokens += new_in - old_in
+            self.progress.output_tokens += new_out - old_out
+
+            for block in message.get("content") or []:
+                if not isinstance(block, dict):
+                    continue
+                if block.get("type") == "text":
+                    text_parts.append(str(block.get("text", "")))
+                elif block.get("type") == "tool_use":
+                    text_parts.append(json.dumps(block.get("input", {})))
+
+        cost = event.get("total_cost_usd")
+        if isinstance(cost, (int, float)):
+            self.progress.cost_usd = float(cost)
+        if event.get("type") == "result":
+            self.progress.num_turns = max(
+                self.progress.num_turns, int(event.get("num_turns", 0) or 0)
+            )
+
+        after = (
+            self.progress.num_turns,
+            self.progress.output_tokens,
+            self.progress.cost_usd,
+        )
+        if after != before and self._on_progress is not None:
+            self._on_progress(replace(self.progress))
+
+        return "\n".join(text_parts)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        self._proc = subprocess.Popen(
+            self._cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            cwd=self._cwd,
+            start_new_session=True,
+        )
+        stderr_thread = threading.Thread(target=self._drain_stderr, daemon=True)
+        stderr_thread.start()
+        watchdog = threading.Timer(self._timeout_seconds, self._on_timeout)
+        watchdog.daemon = True
+        watchdog.start()
+
+        final: Optional[dict[str, Any]] = None
+        try:
+            assert self._proc.stdout is not None
+            for line in self._proc.stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Non-JSON noise on stdout
+                if not isinstance(event, dict):
+                    continue
+
+                text = self._consume(event)
+                if event.get("type") == "result":
+                    final = event
+                yield event
+
+                reason = self._limits.check(self.progress, text)
+                if reason:
+                    self.close()
+                    self._runner._log("claude_stream_aborted", {
+                        "reason": reason,
+                        "num_turns": self.progress.num_turns,
+                        "output_tokens": self.progress.output_tokens,
+                        "cost_usd": self.progress.cost_usd,
+                    }, level="warning")
+                    raise ClaudeStreamAborted(
+                        f"Claude CLI stream aborted: {reason}",
+                        reason=reason,
+                        progress=replace(self.progress),
+                    )
+
+            self._proc.wait()
+        finally:
+            watchdog.cancel()
+            self.close()
+            stderr_thread.join(timeout=1)
+
+        if self._timed_out:
+            self._runner._log("claude_invocation_timeout", {
+                "timeout_seconds": self._timeout_seconds,
+            }, level="error")
+            raise ClaudeTimeoutError(
+                f"Claude CLI timed out after {self._timeout_seconds} seconds",
+                returncode=-1,
+            )
+
+        self.result = self._runner._build_result(
+            self._proc.returncode,
+            json.dumps(final) if final is not None else "",
+            "".join(self._stderr_chunks),
+        )
+
+
 @dataclass
 class ClaudeCliRunner:
     """
     Runner for the Claude Code CLI.
 
     Executes prompts using the Claude Code CLI and parses JSON output.
+
+    If a response_cache is set, run() answers byte-identical invocations
+    from the cache (reporting zero cost) and stores successful results.
+    Streamed runs are never cached.
     """
 
     config: SwarmConfig
     logger: Optional[SwarmLogger] = None
+    response_cache: Optional[LLMResponseCache] = None
 
     def _build_command(
         self,
@@ -62,6 +347,7 @@ class ClaudeCliRunner:
         max_turns: Optional[int] = None,
         allowed_tools: Optional[list[str]] = None,
         working_dir: Optional[str] = None,
+        output_format: str = "json",
     ) -> list[str]:
         """
         Build the CLI command.
@@ -71,15 +357,19 @@ class ClaudeCliRunner:
             max_turns: Maximum conversation turns.
             allowed_tools: List of allowed tools.
             working_dir: Working directory for the command.
+            output_format: "json" or "stream-json".
 
         Returns:
             List of command arguments.
         """
         cmd = [
             self.config.claude.binary,
-            "--output-format", "json",
+            "--output-format", output_format,
             "--max-turns", str(max_turns or self.config.claude.max_turns),
         ]
+        if output_format == "stream-json":
+            # The CLI only emits per-message events in verbose mode
+            cmd.append("--verbose")
 
         # Handle allowed_tools:
         # - None: don't pass --allowedTools (use default tools)
@@ -130,6 +420,116 @@ class ClaudeCliRunner:
         if self.logger:
             self.logger.log(event_type, data, level=level)
 
+    def _build_result(
+        self,
+        returncode: int,
+        stdout: str,
+        stderr: str,
+    ) -> ClaudeResult:
+        """
+        Turn a finished CLI process's output into a ClaudeResult.
+
+        Args:
+            returncode: Process exit code.
+            stdout: Captured stdout (JSON output).
+            stderr: Captured stderr.
+
+        Returns:
+            ClaudeResult with response and metadata.
+
+        Raises:
+            ClaudeInvocationError: If the CLI failed or Claude returned an error.
+        """
+        if returncode != 0:
+            self._log("claude_invocation_error", {
+                "returncode": returncode,
+                "stderr": stderr[:500] if stderr else "",
+            }, level="error")
+            raise ClaudeInvocationError(
+                f"Claude CLI exited with code {returncode}",
+                stderr=stderr,
+                returncode=returncode,
+            )
+
+        # Parse the JSON output
+        data = self._parse_output(stdout)
+
+        # Check for Claude CLI error subtypes (e.g., max_turns exceeded)
+        subtype = data.get("subtype", "")
+        if subtype.startswith("error_"):
+            self._log("claude_invocation_error_subtype", {
+                "subtype": subtype,
+                "num_turns": data.get("num_turns", 0),
+                "cost_usd": data.get("total_cost_usd", 0.0),
+            }, level="error")
+            raise ClaudeInvocationError(
+                f"Claude CLI returned error: {subtype}",
+                stderr=f"subtype={subtype}, num_turns={data.get('num_turns', 0)}",
+                returncode=0,  # CLI succeeded but Claude hit a limit
+            )
+
+        result = ClaudeResult(
+            text=data.get("result", ""),
+            total_cost_usd=data.get("total_cost_usd", 0.0),
+            num_turns=data.get("num_turns", 0),
+            duration_ms=data.get("duration_ms", 0),
+            session_id=data.get("session_id", ""),
+            raw=data,
+        )
+
+        self._log("claude_invocation_complete", {
+            "cost_usd": result.total_cost_usd,
+            "num_turns": result.num_turns,
+            "duration_ms": result.duration_ms,
+            "session_id": result.session_id,
+        })
+
+        return result
+
+    def _cache_key(
+        self,
+        prompt: str,
+        max_turns: Optional[int],
+        allowed_tools: Optional[list[str]],
+        working_dir: Optional[str],
+    ) -> Optional[str]:
+        """Get the response cache key for an invocation, if caching is on."""
+        if self.response_cache is None:
+            return None
+        return self.response_cache.make_key(
+            runner="claude",
+            binary=self.config.claude.binary,
+            prompt=prompt,
+            max_turns=max_turns or self.config.claude.max_turns,
+            allowed_tools=allowed_tools,
+            cwd=str(working_dir or self.config.repo_root),
+        )
+
+    def _cached_result(self, key: Optional[str]) -> Optional[ClaudeResult]:
+        """Get a cached result for key; cache hits cost nothing."""
+        if key is None:
+            return None
+        data = self.response_cache.get(key)
+        if data is None:
+            return None
+        try:
+            result = ClaudeResult.from_dict(data)
+        except TypeError:
+            return None
+
+        self._log("claude_invocation_cached", {
+            "key": key[:12],
+            "saved_cost_usd": result.total_cost_usd,
+            "session_id": result.session_id,
+        })
+        return replace(result, total_cost_usd=0.0, duration_ms=0)
+
+    def _store_result(self, key: Optional[str], result: ClaudeResult) -> ClaudeResult:
+        """Store a successful result in the response cache."""
+        if key is not None:
+            self.response_cache.put(key, result.to_dict())
+        return result
+
     def run(
         self,
         prompt: str,
@@ -156,6 +556,11 @@ class ClaudeCliRunner:
             ClaudeInvocationError: If the CLI fails.
             ClaudeTimeoutError: If the CLI times out.
         """
+        cache_key = self._cache_key(prompt, max_turns, allowed_tools, working_dir)
+        cached = self._cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         cmd = self._build_command(
             prompt,
             max_turns=max_turns,
@@ -183,51 +588,8 @@ class ClaudeCliRunner:
                 timeout=timeout_seconds,
             )
 
-            if proc.returncode != 0:
-                self._log("claude_invocation_error", {
-                    "returncode": proc.returncode,
-                    "stderr": proc.stderr[:500] if proc.stderr else "",
-                }, level="error")
-                raise ClaudeInvocationError(
-                    f"Claude CLI exited with code {proc.returncode}",
-                    stderr=proc.stderr,
-                    returncode=proc.returncode,
-                )
-
-            # Parse the JSON output
-            data = self._parse_output(proc.stdout)
-
-            # Check for Claude CLI error subtypes (e.g., max_turns exceeded)
-            subtype = data.get("subtype", "")
-            if subtype.startswith("error_"):
-                self._log("claude_invocation_error_subtype", {
-                    "subtype": subtype,
-                    "num_turns": data.get("num_turns", 0),
-                    "cost_usd": data.get("total_cost_usd", 0.0),
-                }, level="error")
-                raise ClaudeInvocationError(
-                    f"Claude CLI returned error: {subtype}",
-                    stderr=f"subtype={subtype}, num_turns={data.get('num_turns', 0)}",
-                    returncode=0,  # CLI succeeded but Claude hit a limit
-                )
-
-            result = ClaudeResult(
-                text=data.get("result", ""),
-                total_cost_usd=data.get("total_cost_usd", 0.0),
-                num_turns=data.get("num_turns", 0),
-                duration_ms=data.get("duration_ms", 0),
-                session_id=data.get("session_id", ""),
-                raw=data,
-            )
-
-            self._log("claude_invocation_complete", {
-                "cost_usd": result.total_cost_usd,
-                "num_turns": result.num_turns,
-                "duration_ms": result.duration_ms,
-                "session_id": result.session_id,
-            })
-
-            return result
+            result = self._build_result(proc.returncode, proc.stdout, proc.stderr)
+            return self._store_result(cache_key, result)
 
         except subprocess.TimeoutExpired:
             self._log("claude_invocation_timeout", {
@@ -238,6 +600,97 @@ class ClaudeCliRunner:
                 returncode=-1,
             )
 
+    def stream(
+        self,
+        prompt: str,
+        *,
+        max_turns: Optional[int] = None,
+        allowed_tools: Optional[list[str]] = None,
+        working_dir: Optional[str] = None,
+        timeout: Optional[int] = None,
+        limits: Optional[StreamLimits] = None,
+        on_progress: Optional[Callable[[StreamProgress], None]] = None,
+    ) -> ClaudeStream:
+        """
+        Start a streamed run using ``--output-format stream-json``.
+
+        The CLI is launched when the returned stream is first iterated.
+
+        Args:
+            prompt: The prompt to send to Claude.
+            max_turns: Maximum conversation turns (overrides config).
+            allowed_tools: List of allowed tools for this invocation.
+            working_dir: Working directory (defaults to repo_root).
+            timeout: Timeout in seconds (overrides config).
+            limits: Optional early-termination limits.
+            on_progress: Called with a snapshot whenever turns, tokens or
+                cost change (e.g. to feed ProgressLogger).
+
+        Returns:
+            ClaudeStream yielding decoded events.
+        """
+        cmd = self._build_command(
+            prompt,
+            max_turns=max_turns,
+            allowed_tools=allowed_tools,
+            working_dir=working_dir,
+            output_format="stream-json",
+        )
+        timeout_seconds = timeout or self.config.claude.timeout_seconds
+
+        self._log("claude_invocation_start", {
+            "prompt_length": len(prompt),
+            "max_turns": max_turns or self.config.claude.max_turns,
+            "allowed_tools": allowed_tools,
+            "timeout": timeout_seconds,
+            "output_format": "stream-json",
+        })
+
+        return ClaudeStream(
+            self,
+            cmd,
+            cwd=working_dir or self.config.repo_root,
+            timeout_seconds=timeout_seconds,
+            limits=limits,
+            on_progress=on_progress,
+        )
+
+    def run_streaming(
+        self,
+        prompt: str,
+        *,
+        limits: Optional[StreamLimits] = None,
+        on_progress: Optional[Callable[[StreamProgress], None]] = None,
+        on_event: Optional[Callable[[dict[str, Any]], None]] = None,
+        **kwargs: Any,
+    ) -> ClaudeResult:
+        """
+        Streamed equivalent of run(): consume the stream, return the result.
+
+        Args:
+            prompt: The prompt to send to Claude.
+            limits: Optional early-termination limits.
+            on_progress: Progress callback (see stream()).
+            on_event: Called with every decoded event.
+            **kwargs: Additional arguments passed to stream().
+
+        Returns:
+            ClaudeResult with response and metadata.
+
+        Raises:
+            ClaudeStreamAborted: If a limit trips.
+            ClaudeInvocationError: If the CLI fails.
+            ClaudeTimeoutError: If the CLI times out.
+        """
+        claude_stream = self.stream(
+            prompt, limits=limits, on_progress=on_progress, **kwargs
+        )
+        for event in claude_stream:
+            if on_event is not None:
+                on_event(event)
+        assert claude_stream.result is not None
+        return claude_stream.result
+
     def run_with_context(
         self,
         prompt: str,
@@ -285,6 +738,337 @@ class ClaudeCliRunner:
         return self.run(full_prompt, **kwargs)
 
 
+# Default cap on concurrent Claude CLI processes when config doesn't set one
+DEFAULT_MAX_CONCURRENT = 4
+
+# Seconds to wait after SIGTERM before escalating to SIGKILL
+TERMINATE_GRACE_SECONDS = 5.0
+
+
+@dataclass
+class _SlotWaiter:
+    """A coroutine queued for a limiter slot on its own event loop."""
+
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future[None]
+    granted: bool = False
+
+
+def _wake_waiter(future: asyncio.Future[None]) -> None:
+    """Resolve a waiter's future on its loop unless it was cancelled."""
+    if not future.done():
+        future.set_result(None)
+
+
+class ClaudeConcurrencyLimiter:
+    """
+    Process-wide cap on concurrently running Claude CLI subprocesses.
+
+    Unlike asyncio.Semaphore this is not bound to one event loop, so the
+    sync facade (which may spin up a loop per call, on any thread) and
+    native async callers all draw from the same pool. Waiters are queued
+    and a released slot is handed straight to the oldest one, on whichever
+    loop it waits.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._limit = max(1, limit)
+        self._active = 0
+        self._lock = threading.Lock()
+        self._waiters: deque[_SlotWaiter] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Maximum concurrent slots."""
+        return self._limit
+
+    @property
+    def active(self) -> int:
+        """Slots currently held."""
+        return self._active
+
+    def resize(self, limit: int) -> None:
+        """Change the cap. Running holders are not interrupted."""
+        with self._lock:
+            self._limit = max(1, limit)
+            self._grant_locked()
+
+    def _grant_locked(self) -> None:
+        """Hand free slots to queued waiters in FIFO order. Needs self._lock."""
+        while self._waiters and self._active < self._limit:
+            waiter = self._waiters.popleft()
+            try:
+                waiter.loop.call_soon_threadsafe(_wake_waiter, waiter.future)
+            except RuntimeError:
+                continue  # Waiter's loop is closed; nobody is waiting there
+            waiter.granted = True
+            self._active += 1
+
+    async def acquire(self) -> None:
+        """
+        Wait for a slot.
+
+        Cancellation-safe: a cancelled waiter never holds a slot; one that
+        was handed a slot as it got cancelled passes it to the next waiter.
+        """
+        with self._lock:
+            if not self._waiters and self._active < self._limit:
+                self._active += 1
+                return
+            loop = asyncio.get_running_loop()
+            waiter = _SlotWaiter(loop, loop.create_future())
+            self._waiters.append(waiter)
+
+        try:
+            await waiter.future
+        except BaseException:
+            with self._lock:
+                if waiter.granted:
+                    self._active = max(0, self._active - 1)
+                    self._grant_locked()
+                else:
+                    self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """Release a slot."""
+        with self._lock:
+            self._active = max(0, self._active - 1)
+            self._grant_locked()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one slot for the duration of the block."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+
+_limiter: Optional[ClaudeConcurrencyLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_claude_limiter(limit: Optional[int] = None) -> ClaudeConcurrencyLimiter:
+    """
+    Get the process-wide Claude CLI concurrency limiter.
+
+    Args:
+        limit: If given, (re)size the pool to this many slots.
+
+    Returns:
+        The shared ClaudeConcurrencyLimiter.
+    """
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = ClaudeConcurrencyLimiter(limit or DEFAULT_MAX_CONCURRENT)
+        elif limit is not None and limit != _limiter.limit:
+            _limiter.resize(limit)
+        return _limiter
+
+
+@dataclass
+class AsyncClaudeCliRunner(ClaudeCliRunner):
+    """
+    Asyncio-based runner for the Claude Code CLI.
+
+    run_async() launches the CLI with asyncio.create_subprocess_exec in its
+    own process group, bounded by the process-wide limiter sized from
+    config.claude.max_concurrent. On timeout or task cancellation the whole
+    process group is terminated (SIGTERM, then SIGKILL after a grace period)
+    so tool subprocesses spawned by the CLI don't outlive the call.
+
+    run() is a blocking facade over run_async(), so this is a drop-in
+    replacement for ClaudeCliRunner wherever agents call self.llm.run().
+    run_streaming() holds a pool slot for the whole streamed run too.
+    """
+
+    def _max_concurrent(self) -> int:
+        """Get the configured concurrency cap."""
+        value = getattr(self.config.claude, "max_concurrent", None)
+        if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+            return value
+        return DEFAULT_MAX_CONCURRENT
+
+    async def _terminate(self, proc: asyncio.subprocess.Process) -> None:
+        """Terminate the CLI's process group, escalating to SIGKILL."""
+        if proc.returncode is not None:
+            return
+
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+        except (ProcessLookupError, PermissionError):
+            return
+
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=TERMINATE_GRACE_SECONDS)
+        except asyncio.TimeoutError:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                return
+            await proc.wait()
+
+    async def run_async(
+        self,
+        prompt: str,
+        *,
+        max_turns: Optional[int] = None,
+        allowed_tools: Optional[list[str]] = None,
+        working_dir: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> ClaudeResult:
+        """
+        Execute a prompt using the Claude CLI without blocking the event loop.
+
+        Args:
+            prompt: The prompt to send to Claude.
+            max_turns: Maximum conversation turns (overrides config).
+            allowed_tools: List of allowed tools for this invocation.
+            working_dir: Working directory (defaults to repo_root).
+            timeout: Timeout in seconds (overrides config). Time spent
+                waiting for a pool slot does not count.
+
+        Returns:
+            ClaudeResult with response and metadata.
+
+        Raises:
+            ClaudeInvocationError: If the CLI fails.
+            ClaudeTimeoutError: If the CLI times out.
+            asyncio.CancelledError: If the calling task is cancelled; the
+                CLI process group is killed first.
+        """
+        cache_key = self._cache_key(prompt, max_turns, allowed_tools, working_dir)
+        cached = self._cached_result(cache_key)
+        if cached is not None:
+            return cached
+
+        cmd = self._build_command(
+            prompt,
+            max_turns=max_turns,
+            allowed_tools=allowed_tools,
+            working_dir=working_dir,
+        )
+
+        cwd = working_dir or self.config.repo_root
+        timeout_seconds = timeout or self.config.claude.timeout_seconds
+        limiter = get_claude_limiter(self._max_concurrent())
+
+        self._log("claude_invocation_start", {
+            "prompt_length": len(prompt),
+            "max_turns": max_turns or self.config.claude.max_turns,
+            "allowed_tools": allowed_tools,
+            "timeout": timeout_seconds,
+            "cli_command": " ".join(cmd[:5]) + " ..." if len(cmd) > 5 else " ".join(cmd),
+            "pool_active": limiter.active,
+            "pool_limit": limiter.limit,
+        })
+
+        async with limiter.slot():
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=cwd,
+                start_new_session=True,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    proc.communicate(), timeout=timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                await self._terminate(proc)
+                self._log("claude_invocation_timeout", {
+                    "timeout_seconds": timeout_seconds,
+                }, level="error")
+                raise ClaudeTimeoutError(
+                    f"Claude CLI timed out after {timeout_seconds} seconds",
+                    returncode=-1,
+                )
+            except asyncio.CancelledError:
+                await self._terminate(proc)
+                self._log("claude_invocation_cancelled", {
+                    "pid": proc.pid,
+                }, level="warning")
+                raise
+
+        result = self._build_result(
+            proc.returncode,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
+        return self._store_result(cache_key, result)
+
+    def run(
+        self,
+        prompt: str,
+        *,
+        max_turns: Optional[int] = None,
+        allowed_tools: Optional[list[str]] = None,
+        working_dir: Optional[str] = None,
+        timeout: Optional[int] = None,
+    ) -> ClaudeResult:
+        """
+        Blocking facade over run_async() with the ClaudeCliRunner signature.
+
+        If called from a thread that is already running an event loop, the
+        call is executed on a helper thread with its own loop.
+        """
+        return self._run_blocking(lambda: self.run_async(
+            prompt,
+            max_turns=max_turns,
+            allowed_tools=allowed_tools,
+            working_dir=working_dir,
+            timeout=timeout,
+        ))
+
+    def run_streaming(
+        self,
+        prompt: str,
+        *,
+        limits: Optional[StreamLimits] = None,
+        on_progress: Optional[Callable[[StreamProgress], None]] = None,
+        on_event: Optional[Callable[[dict[str, Any]], None]] = None,
+        **kwargs: Any,
+    ) -> ClaudeResult:
+        """
+        Streamed run (see ClaudeCliRunner.run_streaming) inside a pool slot.
+
+        The stream is consumed on a worker thread while the slot is held,
+        so streamed and buffered runs share the same concurrency cap.
+        """
+        async def invoke() -> ClaudeResult:
+            async with get_claude_limiter(self._max_concurrent()).slot():
+                return await asyncio.to_thread(
+                    super(AsyncClaudeCliRunner, self).run_streaming,
+                    prompt,
+                    limits=limits,
+                    on_progress=on_progress,
+                    on_event=on_event,
+                    **kwargs,
+                )
+
+        return self._run_blocking(invoke)
+
+    @staticmethod
+    def _run_blocking(
+        make_coro: Callable[[], Coroutine[Any, Any, ClaudeResult]],
+    ) -> ClaudeResult:
+        """Run a coroutine to completion from synchronous code."""
+        def invoke() -> ClaudeResult:
+            return asyncio.run(make_coro())
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return invoke()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(invoke).result()
+
+
 # Convenience function for quick invocations
 def run_claude(
     prompt: str,
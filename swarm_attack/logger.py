@@ -6,18 +6,45 @@ This module provides:
 - Log files organized by feature and date
 - Log levels (debug, info, warn, error)
 - Context manager for session-scoped logging
+- Buffered writes with size rotation and gzip-compressed archives
+
+Each day's log may be split into segments:
+
+    <feature>-YYYY-MM-DD.jsonl             active segment (newest)
+    <feature>-YYYY-MM-DD.NNN.jsonl[.gz]    rotated segments, NNN ascending
+
+A segment is rotated when it grows past ``logging.max_file_mb``; rotated
+segments and previous days' logs are gzip-compressed when
+``logging.compress_archives`` is set. Readers see all segments of a day,
+compressed or not, in write order.
+
+Each segment gets a sidecar ``<segment>.idx`` holding the byte offsets of
+its lines by session_id and event_type, so SwarmLogger.query() can skip
+segments and seek straight to matching lines across any date range, in
+either direction. Indexes of the active segment are extended lazily with
+only the bytes appended since they were written.
 """
 
 from __future__ import annotations
 
+import atexit
+import gzip
 import json
 import os
+import re
+import shutil
+import threading
 from contextlib import contextmanager
-from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Iterator, Optional
+from typing import IO, Any, BinaryIO, Iterator, Optional
+
+from swarm_attack.config import get_config, LoggingConfig, SwarmConfig
+from swarm_attack.utils.fs import FileSystemError, safe_write
 
-from swarm_attack.config import get_config, SwarmConfig
+# Bump when the sidecar layout changes; older sidecars are rebuilt.
+LOG_INDEX_VERSION = 1
 
 
 class LogLevel:
@@ -28,11 +55,415 @@ class LogLevel:
     ERROR = "error"
 
 
+def _today() -> str:
+    """Today's UTC date, as used in log file names."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+def _segment_pattern(feature_id: str) -> re.Pattern[str]:
+    """Match a feature's log segment names, capturing date and sequence."""
+    return re.compile(
+        rf"^{re.escape(feature_id)}-(\d{{4}}-\d{{2}}-\d{{2}})(?:\.(\d+))?\.jsonl(?:\.gz)?$"
+    )
+
+
+def _segment_sort_key(match: re.Match[str]) -> tuple[str, int]:
+    """Order segments by date, then sequence; the active segment sorts last."""
+    seq = match.group(2)
+    return match.group(1), int(seq) if seq is not None else 1_000_000_000
+
+
+def _index_path(segment: Path) -> Path:
+    """Sidecar index path for a log segment."""
+    return segment.with_name(segment.name + ".idx")
+
+
+def _remove_segment(path: Path) -> None:
+    """Delete a segment and its sidecar index, ignoring missing files."""
+    for target in (path, _index_path(path)):
+        try:
+            target.unlink()
+        except OSError:
+            pass
+
+
+def _read_line_at(f: BinaryIO, offset: int) -> bytes:
+    """Read the line starting at ``offset``."""
+    f.seek(offset)
+    return f.readline()
+
+
+@dataclass
+class LogSegmentIndex:
+    """
+    Sidecar index for one log segment.
+
+    Offsets are byte positions of line starts in the (decompressed) segment,
+    in file order. ``size`` is how many bytes of the segment the index
+    covers; ``file_size`` is the on-disk size when it was built, which is
+    how a compressed segment's index is validated.
+    """
+
+    size: int = 0
+    inode: int = 0
+    file_size: int = 0
+    lines: list[int] = field(default_factory=list)
+    sessions: dict[str, list[int]] = field(default_factory=dict)
+    event_types: dict[str, list[int]] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dict for JSON serialization."""
+        return {
+            "version": LOG_INDEX_VERSION,
+            "size": self.size,
+            "inode": self.inode,
+            "file_size": self.file_size,
+            "lines": self.lines,
+            "sessions": self.sessions,
+            "event_types": self.event_types,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LogSegmentIndex":
+        """Create from dict."""
+        if data.get("version") != LOG_INDEX_VERSION:
+            raise ValueError(f"Unsupported log index version: {data.get('version')}")
+        return cls(
+            size=int(data["size"]),
+            inode=int(data["inode"]),
+            file_size=int(data["file_size"]),
+            lines=list(data["lines"]),
+            sessions=dict(data["sessions"]),
+            event_types=dict(data["event_types"]),
+        )
+
+    def add(self, offset: int, entry: dict[str, Any]) -> None:
+        """Record one decoded log line starting at ``offset``."""
+        self.lines.append(offset)
+        session_id = entry.get("session_id")
+        if session_id:
+            self.sessions.setdefault(str(session_id), []).append(offset)
+        self.event_types.setdefault(str(entry.get("event_type", "")), []).append(offset)
+
+    def usable_for(self, st: os.stat_result, compressed: bool) -> bool:
+        """Whether this index describes the segment with the given stat."""
+        if self.inode != st.st_ino:
+            return False
+        if compressed:
+            return self.file_size == st.st_size
+        return self.size <= st.st_size
+
+    def candidates(
+        self,
+        session_id: Optional[str] = None,
+        event_type: Optional[str] = None,
+    ) -> list[int]:
+        """Get offsets that may match the filters, in file order."""
+        if not session_id and not event_type:
+            return self.lines
+
+        selected: Optional[set[int]] = None
+        if session_id:
+            selected = set(self.sessions.get(session_id, []))
+        if event_type:
+            by_type = set(self.event_types.get(event_type, []))
+            selected = by_type if selected is None else selected & by_type
+        return sorted(selected or ())
+
+
+class RotatingLogWriter:
+    """
+    Batched, size-rotating writer for one feature's JSONL logs.
+
+    Lines are queued by write() and flushed by a daemon thread every
+    ``flush_interval`` seconds, or as soon as ``max_pending`` lines are
+    queued (or on every write when unbuffered). The day's file handle is
+    kept open between flushes and reopened on day rollover or when another
+    process rotated the file. Past ``max_bytes`` the active segment is
+    renamed to the next sequence number and, with ``compress``, gzipped;
+    previous days' active segments are archived the same way on rollover.
+    """
+
+    def __init__(
+        self,
+        logs_dir: Path,
+        feature_id: str,
+        settings: Optional[LoggingConfig] = None,
+    ) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            logs_dir: Directory holding the log files.
+            feature_id: Feature whose logs this writer owns.
+            settings: Logging configuration (defaults if omitted).
+        """
+        settings = settings or LoggingConfig()
+        self.logs_dir = Path(logs_dir)
+        self.feature_id = feature_id
+        self._buffered = settings.buffered
+        self._flush_interval = settings.flush_interval_seconds
+        self._max_pending = max(1, settings.max_pending_lines)
+        self._max_bytes = int(settings.max_file_mb * 1024 * 1024)
+        self._compress = settings.compress_archives
+        self._retention_days = settings.retention_days
+
+        self._cond = threading.Condition()
+        self._pending: list[tuple[str, str]] = []
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Serializes flushes and guards the open handle
+        self._io_lock = threading.Lock()
+        self._handle: Optional[IO[str]] = None
+        self._handle_path: Optional[Path] = None
+
+        atexit.register(self.close)
+
+    def active_path(self, date: str) -> Path:
+        """Path of the active segment for a date."""
+        return self.logs_dir / f"{self.feature_id}-{date}.jsonl"
+
+    def write(self, line: str) -> None:
+        """Queue a newline-terminated line for today's log."""
+        date = _today()
+        with self._cond:
+            closed = self._closed
+            if not closed:
+                self._pending.append((date, line))
+                if self._buffered:
+                    if self._thread is None:
+                        self._thread = threading.Thread(
+                            target=self._run,
+                            name=f"log-writer-{self.feature_id}",
+                            daemon=True,
+                        )
+                        self._thread.start()
+                    if len(self._pending) >= self._max_pending:
+                        self._cond.notify()
+
+        if closed:
+            # Closed (e.g. during interpreter shutdown): fall back to a direct append
+            self.logs_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.active_path(date), "a") as f:
+                f.write(line)
+        elif not self._buffered:
+            self.flush()
+
+    def _run(self) -> None:
+        """Background loop: flush on interval, on a full queue, and on close."""
+        while True:
+            with self._cond:
+                if not self._closed and len(self._pending) < self._max_pending:
+                    self._cond.wait(timeout=self._flush_interval)
+                closed = self._closed
+            try:
+                self.flush()
+            except OSError:
+                pass  # Batch is lost; logging must not crash the caller
+            if closed:
+                return
+
+    def _get_handle(self, path: Path) -> IO[str]:
+        """Get an append handle for ``path``, reopening on rollover or replacement."""
+        if self._handle is not None and self._handle_path == path:
+            try:
+                if os.stat(path).st_ino == os.fstat(self._handle.fileno()).st_ino:
+                    return self._handle
+            except OSError:
+                pass  # File was rotated away; reopen below
+        new_day = self._handle_path != path
+        self._close_handle()
+        if new_day:
+            # First open or day rollover: archive earlier days' logs
+            self.archive_old_segments()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = open(path, "a")
+        self._handle_path = path
+        return self._handle
+
+    def _close_handle(self) -> None:
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            finally:
+                self._handle = None
+                self._handle_path = None
+
+    def flush(self) -> None:
+        """
+        Write all queued lines now, rotating the active segment if it is full.
+
+        Raises:
+            OSError: If writing the batch fails.
+        """
+        with self._io_lock:
+            with self._cond:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return
+
+            # Group consecutive lines by date so order is preserved on rollover
+            start = 0
+            while start < len(batch):
+                date = batch[start][0]
+                end = start
+                while end < len(batch) and batch[end][0] == date:
+                    end += 1
+                path = self.active_path(date)
+                handle = self._get_handle(path)
+                handle.write("".join(line for _, line in batch[start:end]))
+                handle.flush()
+                if self._max_bytes > 0 and handle.tell() >= self._max_bytes:
+                    self._close_handle()
+                    self._rotate(path, date)
+                start = end
+
+    def _next_sequence(self, date: str) -> int:
+        """Next unused rotation sequence number for a date."""
+        pattern = _segment_pattern(self.feature_id)
+        highest = 0
+        try:
+            for path in self.logs_dir.iterdir():
+                match = pattern.match(path.name)
+                if match and match.group(1) == date and match.group(2) is not None:
+                    highest = max(highest, int(match.group(2)))
+        except OSError:
+            pass
+        return highest + 1
+
+    def _rotate(self, path: Path, date: str) -> Optional[Path]:
+        """
+        Move an active segment aside under the next sequence number.
+
+        Uses link+unlink so concurrent rotations never overwrite a segment.
+
+        Returns:
+            The archived segment path, or None if there was nothing to rotate.
+        """
+        for _ in range(5):
+            target = self.logs_dir / f"{self.feature_id}-{date}.{self._next_sequence(date):03d}.jsonl"
+            try:
+                os.link(path, target)
+            except FileExistsError:
+                continue  # Another process took this number
+            except OSError:
+                return None  # Already rotated by another process
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            if self._compress:
+                return self._compress_segment(target)
+            return target
+        return None
+
+    @staticmethod
+    def _compress_segment(path: Path) -> Path:
+        """gzip a rotated segment in place of the plain file."""
+        gz_path = path.with_name(path.name + ".gz")
+        tmp_path = gz_path.with_name(gz_path.name + ".tmp")
+        try:
+            with open(path, "rb") as src, gzip.open(tmp_path, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(tmp_path, gz_path)
+            _remove_segment(path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return path
+        return gz_path
+
+    def archive_old_segments(self) -> None:
+        """Rotate previous days' logs and apply the retention policy."""
+        pattern = _segment_pattern(self.feature_id)
+        today = _today()
+        cutoff = None
+        if self._retention_days > 0:
+            cutoff = (
+                datetime.now(timezone.utc) - timedelta(days=self._retention_days)
+            ).strftime("%Y-%m-%d")
+
+        try:
+            paths = list(self.logs_dir.iterdir())
+        except OSError:
+            return
+        for path in paths:
+            match = pattern.match(path.name)
+            if not match or match.group(1) >= today:
+                continue
+            date = match.group(1)
+            if cutoff is not None and date < cutoff:
+                _remove_segment(path)
+            elif match.group(2) is None:
+                self._rotate(path, date)
+            elif self._compress and path.suffix == ".jsonl":
+                self._compress_segment(path)
+
+    def close(self) -> None:
+        """Flush pending lines, stop the background thread and close the handle."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        try:
+            self.flush()
+        finally:
+            with self._io_lock:
+                self._close_handle()
+            atexit.unregister(self.close)
+
+
+# Writers shared by all loggers of a feature, keyed by (logs_dir, feature_id)
+_writers: dict[tuple[str, str], RotatingLogWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_log_writer(config: SwarmConfig, feature_id: str) -> RotatingLogWriter:
+    """
+    Get the shared writer for a feature's logs.
+
+    Args:
+        config: SwarmConfig with logs_path and logging settings.
+        feature_id: The feature identifier.
+
+    Returns:
+        RotatingLogWriter shared by every logger of this feature.
+    """
+    logs_dir = Path(config.logs_path)
+    key = (str(logs_dir), feature_id)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None or writer._closed:
+            settings = getattr(config, "logging", None)
+            if not isinstance(settings, LoggingConfig):
+                settings = LoggingConfig()
+            writer = RotatingLogWriter(logs_dir, feature_id, settings)
+            _writers[key] = writer
+        return writer
+
+
+def close_log_writers() -> None:
+    """Flush and close all shared log writers."""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.close()
+
+
 class SwarmLogger:
     """
     JSONL event logger for Feature Swarm.
 
     Writes structured log entries to .swarm/logs/<feature>-YYYY-MM-DD.jsonl
+    through a shared RotatingLogWriter.
 
     Each log entry is a JSON object with:
     - timestamp: ISO format timestamp
@@ -53,7 +484,9 @@ class SwarmLogger:
         self.feature_id = feature_id
         self._config = config
         self._current_session_id: Optional[str] = None
-        self._file_handle: Optional[Any] = None
+        self._writer: Optional[RotatingLogWriter] = None
+        # Up-to-date segment indexes, keyed by segment path
+        self._segment_indexes: dict[Path, LogSegmentIndex] = {}
 
     @property
     def config(self) -> SwarmConfig:
@@ -63,23 +496,23 @@ class SwarmLogger:
         return self._config
 
     def _get_log_path(self) -> Path:
-        """Get the log file path for today."""
-        logs_dir = self.config.logs_path
-        logs_dir.mkdir(parents=True, exist_ok=True)
+        """Get the active log file path for today."""
+        return self.config.logs_path / f"{self.feature_id}-{_today()}.jsonl"
 
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        return logs_dir / f"{self.feature_id}-{today}.jsonl"
+    def _get_writer(self) -> RotatingLogWriter:
+        """Get the shared writer for this feature (lazily)."""
+        if self._writer is None or self._writer._closed:
+            self._writer = get_log_writer(self.config, self.feature_id)
+        return self._writer
 
     def _write_entry(self, entry: dict[str, Any]) -> None:
-        """Write a log entry to the JSONL file."""
-        log_path = self._get_log_path()
-
-        # Ensure parent directory exists
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        """Queue a log entry for the feature's JSONL log."""
+        self._get_writer().write(json.dumps(entry, default=str) + "\n")
 
-        # Append to log file
-        with open(log_path, "a") as f:
-            f.write(json.dumps(entry, default=str) + "\n")
+    def flush(self) -> None:
+        """Write any buffered entries to disk."""
+        if self._writer is not None:
+            self._writer.flush()
 
     def log(
         self,
@@ -172,24 +605,175 @@ class SwarmLogger:
             List of log entries matching the filters.
         """
         if date is None:
-            date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+            date = _today()
+        return self.query(
+            since=date,
+            until=date,
+            level=level,
+            event_type=event_type,
+            session_id=session_id,
+            limit=limit,
+        )
 
-        log_path = self.config.logs_path / f"{self.feature_id}-{date}.jsonl"
-        if not log_path.exists():
+    def get_log_files(self) -> list[Path]:
+        """
+        Get all log files for this feature.
+
+        Includes rotated and gzip-compressed segments.
+
+        Returns:
+            List of log file paths, newest first (by date, then segment).
+        """
+        logs_dir = self.config.logs_path
+        if not logs_dir.exists():
             return []
 
-        entries = []
-        with open(log_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
+        pattern = _segment_pattern(self.feature_id)
+        matches = [pattern.match(path.name) for path in logs_dir.iterdir()]
+        matches = [match for match in matches if match]
+        matches.sort(key=_segment_sort_key, reverse=True)
+        return [logs_dir / match.group(0) for match in matches]
+
+    # Segment indexes
+
+    def _read_index(self, segment: Path) -> Optional[LogSegmentIndex]:
+        """Read a sidecar index from disk, or None if missing or unusable."""
+        try:
+            data = json.loads(_index_path(segment).read_text())
+            return LogSegmentIndex.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_index(self, segment: Path, index: LogSegmentIndex) -> None:
+        """Atomically write a sidecar index. Failures only cost a rescan."""
+        try:
+            safe_write(_index_path(segment), json.dumps(index.to_dict()))
+        except FileSystemError:
+            pass
+
+    @staticmethod
+    def _open_binary(segment: Path) -> BinaryIO:
+        """Open a plain or compressed segment for byte-offset reads."""
+        if segment.suffix == ".gz":
+            return gzip.open(segment, "rb")  # type: ignore[return-value]
+        return open(segment, "rb")
+
+    def _catch_up(
+        self,
+        segment: Path,
+        index: LogSegmentIndex,
+        st: os.stat_result,
+        compressed: bool,
+    ) -> bool:
+        """
+        Index lines not yet covered by ``index``.
+
+        Plain segments are indexed from ``index.size`` and only up to the
+        last complete line, so a line being written is picked up later.
+        Compressed segments are immutable and indexed once, in full.
+
+        Returns:
+            True if the index changed.
+        """
+        if compressed:
+            if index.file_size == st.st_size:
+                return False
+        elif st.st_size <= index.size:
+            return False
+
+        with self._open_binary(segment) as f:
+            if index.size:
+                f.seek(index.size)
+            offset = index.size
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                if raw.strip():
+                    try:
+                        index.add(offset, json.loads(raw))
+                    except (ValueError, AttributeError):
+                        pass  # Undecodable line: never matches a query
+                offset += len(raw)
+
+        changed = offset != index.size or index.file_size != st.st_size
+        index.size = offset
+        index.file_size = st.st_size
+        return changed
+
+    def get_segment_index(self, segment: Path) -> Optional[LogSegmentIndex]:
+        """
+        Get an up-to-date index for a log segment.
+
+        Uses the in-memory copy when the segment hasn't changed, otherwise
+        loads the sidecar and indexes only what it doesn't cover. A segment
+        that was replaced or shrank is reindexed from the start.
+
+        Args:
+            segment: Path to one of this feature's log segments.
+
+        Returns:
+            LogSegmentIndex, or None if the segment no longer exists.
+        """
+        try:
+            st = os.stat(segment)
+        except OSError:
+            self._segment_indexes.pop(segment, None)
+            return None
+
+        compressed = segment.suffix == ".gz"
+        index = self._segment_indexes.get(segment)
+        if index is not None and index.usable_for(st, compressed) and index.file_size == st.st_size:
+            return index
+
+        if index is None or not index.usable_for(st, compressed):
+            index = self._read_index(segment)
+        if index is None or not index.usable_for(st, compressed):
+            index = LogSegmentIndex(inode=st.st_ino)
+
+        if index.file_size != st.st_size:
+            try:
+                changed = self._catch_up(segment, index, st, compressed)
+            except (OSError, EOFError):
+                # Vanished mid-read or truncated archive
+                return None
+            if changed:
+                self._write_index(segment, index)
+        self._segment_indexes[segment] = index
+        return index
+
+    # Queries
+
+    def _iter_segment(
+        self,
+        segment: Path,
+        index: LogSegmentIndex,
+        level: Optional[str],
+        event_type: Optional[str],
+        session_id: Optional[str],
+        newest_first: bool,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield matching entries from one segment by seeking to candidates."""
+        offsets = index.candidates(session_id, event_type)
+        if not offsets:
+            return
+
+        with self._open_binary(segment) as f:
+            if newest_first and segment.suffix == ".gz":
+                # gzip can only seek forward cheaply: read candidates, then reverse
+                raw_lines: Iterator[bytes] = reversed(
+                    [_read_line_at(f, offset) for offset in offsets]
+                )
+            else:
+                ordered = reversed(offsets) if newest_first else offsets
+                raw_lines = (_read_line_at(f, offset) for offset in ordered)
+
+            for raw in raw_lines:
                 try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
+                    entry = json.loads(raw)
+                except ValueError:
                     continue
 
-                # Apply filters
+                # Index narrows candidates; filters remain authoritative
                 if level and entry.get("level") != level:
                     continue
                 if event_type and entry.get("event_type") != event_type:
@@ -197,28 +781,90 @@ class SwarmLogger:
                 if session_id and entry.get("session_id") != session_id:
                     continue
 
-                entries.append(entry)
+                yield entry
 
-                if limit and len(entries) >= limit:
-                    break
+    def iter_logs(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        level: Optional[str] = None,
+        event_type: Optional[str] = None,
+        session_id: Optional[str] = None,
+        newest_first: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Iterate log entries across all of this feature's segments.
 
-        return entries
+        Only segments whose date is in range and whose index has candidates
+        are opened, and only candidate lines are decoded, so taking the
+        first few matches is cheap regardless of history length.
 
-    def get_log_files(self) -> list[Path]:
+        Args:
+            since: First date (YYYY-MM-DD) to include. None means no bound.
+            until: Last date (YYYY-MM-DD) to include. None means no bound.
+            level: Filter by log level.
+            event_type: Filter by event type.
+            session_id: Filter by session ID.
+            newest_first: Yield entries in reverse write order.
+
+        Yields:
+            Matching log entries.
         """
-        Get all log files for this feature.
+        # Read-your-writes: queued entries must be visible to queries
+        self.flush()
+
+        pattern = _segment_pattern(self.feature_id)
+        segments = self.get_log_files()
+        if not newest_first:
+            segments.reverse()
+
+        for segment in segments:
+            match = pattern.match(segment.name)
+            date = match.group(1) if match else ""
+            if (since and date < since) or (until and date > until):
+                continue
+            index = self.get_segment_index(segment)
+            if index is None:
+                continue
+            try:
+                yield from self._iter_segment(
+                    segment, index, level, event_type, session_id, newest_first
+                )
+            except (OSError, EOFError):
+                # Rotated away concurrently or truncated archive
+                continue
+
+    def query(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        level: Optional[str] = None,
+        event_type: Optional[str] = None,
+        session_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        newest_first: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Query log entries over a date range.
+
+        Args:
+            since: First date (YYYY-MM-DD) to include. None means no bound.
+            until: Last date (YYYY-MM-DD) to include. None means no bound.
+            level: Filter by log level.
+            event_type: Filter by event type.
+            session_id: Filter by session ID.
+            limit: Maximum number of entries to return.
+            newest_first: Return the most recent entries first.
 
         Returns:
-            List of log file paths, sorted by date (newest first).
+            List of matching log entries.
         """
-        logs_dir = self.config.logs_path
-        if not logs_dir.exists():
-            return []
-
-        pattern = f"{self.feature_id}-*.jsonl"
-        files = list(logs_dir.glob(pattern))
-        files.sort(reverse=True)
-        return files
+        entries: list[dict[str, Any]] = []
+        for entry in self.iter_logs(since, until, level, event_type, session_id, newest_first):
+            entries.append(entry)
+            if limit and len(entries) >= limit:
+                break
+        return entries
 
 
 # Module-level logger cache
@@ -242,6 +888,7 @@ def get_logger(feature_id: str, config: Optional[SwarmConfig] = None) -> SwarmLo
 
 
 def clear_logger_cache() -> None:
-    """Clear the logger cache. Useful for testing."""
+    """Clear the logger cache and close shared writers. Useful for testing."""
     global _logger_cache
     _logger_cache = {}
+    close_log_writers()
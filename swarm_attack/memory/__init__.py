@@ -11,6 +11,7 @@ from swarm_attack.memory.categories import (
     SCHEMA_DRIFT,
     TEST_FAILURE,
 )
+from swarm_attack.memory.backends import JournalBackend, JsonBackend, MemoryBackend
 from swarm_attack.memory.index import MemoryIndex
 from swarm_attack.memory.patterns import PatternDetector, VerificationPattern
 from swarm_attack.memory.recommendations import Recommendation, RecommendationEngine
@@ -21,6 +22,9 @@ __all__ = [
     # Core storage
     "MemoryEntry",
     "MemoryStore",
+    "MemoryBackend",
+    "JsonBackend",
+    "JournalBackend",
     # Pattern detection
     "PatternDetector",
     "VerificationPattern",
@@ -0,0 +1,340 @@
+"""Storage backends for MemoryStore persistence.
+
+Provides:
+- JsonBackend: the original single-document memories.json format, rewritten
+  in full on every save
+- JournalBackend: an append-only JSONL journal where each save appends only
+  the entries added, deleted or touched since the last save, with periodic
+  compaction into a snapshot
+
+MemoryStore picks JournalBackend automatically for ``*.jsonl`` store paths
+(memories.jsonl when the memory.journal config option is on). The JSON
+format remains the import/export path via
+MemoryStore.save_to_file()/load_from_file().
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from swarm_attack.utils.fs import safe_write
+
+if TYPE_CHECKING:
+    from swarm_attack.memory.store import MemoryEntry
+
+
+# Bump when the journal record layout changes
+JOURNAL_VERSION = 1
+
+
+@dataclass
+class PendingChanges:
+    """Changes made to a MemoryStore since it was last saved or loaded.
+
+    Attributes:
+        puts: IDs of entries added, replaced or modified.
+        deletes: IDs of entries removed.
+        hits: IDs of entries whose hit_count changed.
+        reset: True if the store was cleared; a full rewrite is required.
+    """
+
+    puts: set[str] = field(default_factory=set)
+    deletes: set[str] = field(default_factory=set)
+    hits: set[str] = field(default_factory=set)
+    reset: bool = False
+
+    def put(self, entry_id: str) -> None:
+        """Record an added or modified entry."""
+        self.deletes.discard(entry_id)
+        self.puts.add(entry_id)
+
+    def delete(self, entry_id: str) -> None:
+        """Record a removed entry."""
+        self.puts.discard(entry_id)
+        self.hits.discard(entry_id)
+        self.deletes.add(entry_id)
+
+    def hit(self, entry_id: str) -> None:
+        """Record a hit_count change."""
+        self.hits.add(entry_id)
+
+    def clear(self) -> None:
+        """Forget all recorded changes."""
+        self.puts.clear()
+        self.deletes.clear()
+        self.hits.clear()
+        self.reset = False
+
+
+class MemoryBackend:
+    """Base class for MemoryStore storage backends."""
+
+    def load(self, path: Path) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Read entries and stats from disk.
+
+        Args:
+            path: Store path.
+
+        Returns:
+            Tuple of (entry dicts in insertion order, stats dict). Missing
+            files yield empty results.
+        """
+        raise NotImplementedError
+
+    def save(
+        self,
+        path: Path,
+        entries: dict[str, MemoryEntry],
+        changes: PendingChanges,
+        total_queries: int,
+    ) -> None:
+        """Persist the store.
+
+        Args:
+            path: Store path.
+            entries: All live entries, in insertion order.
+            changes: What changed since the last save/load.
+            total_queries: Query counter to persist.
+        """
+        raise NotImplementedError
+
+
+class JsonBackend(MemoryBackend):
+    """Single JSON document, rewritten in full on every save."""
+
+    def load(self, path: Path) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Read the JSON document."""
+        if not path.exists():
+            return [], {}
+
+        with open(path, "r") as f:
+            data = json.load(f)
+
+        return data.get("entries", []), data.get("stats", {})
+
+    def save(
+        self,
+        path: Path,
+        entries: dict[str, MemoryEntry],
+        changes: PendingChanges,
+        total_queries: int,
+    ) -> None:
+        """Rewrite the JSON document."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        data = {
+            "version": "1.0",
+            "entries": [e.to_dict() for e in entries.values()],
+            "stats": {
+                "total_queries": total_queries,
+                "last_saved": datetime.now().isoformat(),
+            },
+        }
+
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
+
+class JournalBackend(MemoryBackend):
+    """Append-only JSONL journal with periodic compaction.
+
+    Each line is one record:
+
+    - ``{"op": "header", "version": 1}`` (first line)
+    - ``{"op": "put", "entry": {...}}``
+    - ``{"op": "del", "id": "..."}``
+    - ``{"op": "hits", "counts": {"id": n, ...}}``
+    - ``{"op": "meta", "total_queries": n, "last_saved": "..."}``
+
+    Replay applies records in order; a torn final line from an interrupted
+    append, or any other malformed record, is ignored. Once the journal
+    holds more than ``compact_ratio`` times as many records as live entries
+    (and at least ``min_compact_records``), the next save rewrites it
+    atomically as a snapshot. A JSON store at the same path with a
+    ``.json`` suffix is imported the first time the journal is loaded.
+
+    Appends and compaction hold an exclusive lock on ``<journal>.lock``.
+    Compaction is skipped (the save appends instead) if another writer has
+    appended since this process last read or wrote the journal, since the
+    snapshot would drop their records.
+    """
+
+    def __init__(self, compact_ratio: float = 2.0, min_compact_records: int = 1000):
+        """Initialize the backend.
+
+        Args:
+            compact_ratio: Records-per-live-entry ratio that triggers compaction.
+            min_compact_records: Never compact journals smaller than this.
+        """
+        self.compact_ratio = compact_ratio
+        self.min_compact_records = min_compact_records
+        # Record counts per journal path, learned on load or write
+        self._records: dict[Path, int] = {}
+        # Journal sizes after this backend's last load or write
+        self._sizes: dict[Path, int] = {}
+
+    @staticmethod
+    def _lock_path(path: Path) -> Path:
+        """Get the lock file guarding a journal."""
+        return path.with_name(path.name + ".lock")
+
+    @contextmanager
+    def _locked(self, path: Path) -> Iterator[None]:
+        """Hold the journal's exclusive lock."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._lock_path(path), "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def _size(path: Path) -> Optional[int]:
+        """Get a journal's size, or None if it doesn't exist."""
+        try:
+            return os.stat(path).st_size
+        except OSError:
+            return None
+
+    def load(self, path: Path) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Replay the journal."""
+        if not path.exists():
+            legacy = path.with_suffix(".json")
+            if legacy.exists():
+                # The first save writes a snapshot since the journal is absent
+                return JsonBackend().load(legacy)
+            return [], {}
+
+        entries: dict[str, dict[str, Any]] = {}
+        stats: dict[str, Any] = {}
+        records = 0
+
+        with open(path, "r") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    op = record.get("op")
+                    if op == "put":
+                        entry = record["entry"]
+                        entries[entry["id"]] = entry
+                    elif op == "del":
+                        entries.pop(record["id"], None)
+                    elif op == "hits":
+                        for entry_id, count in record.get("counts", {}).items():
+                            if entry_id in entries:
+                                entries[entry_id]["hit_count"] = count
+                    elif op == "meta":
+                        stats = {k: v for k, v in record.items() if k != "op"}
+                except (json.JSONDecodeError, AttributeError, KeyError, TypeError):
+                    continue  # Torn or malformed record
+                records += 1
+            self._sizes[path] = f.tell()
+
+        self._records[path] = records
+        return list(entries.values()), stats
+
+    def _count_records(self, path: Path) -> int:
+        """Count records in an existing journal."""
+        if path not in self._records:
+            try:
+                with open(path, "rb") as f:
+                    self._records[path] = sum(1 for _ in f)
+            except OSError:
+                self._records[path] = 0
+        return self._records[path]
+
+    def _meta(self, total_queries: int) -> dict[str, Any]:
+        return {
+            "op": "meta",
+            "total_queries": total_queries,
+            "last_saved": datetime.now().isoformat(),
+        }
+
+    def compact(
+        self,
+        path: Path,
+        entries: dict[str, MemoryEntry],
+        total_queries: int,
+    ) -> None:
+        """Atomically rewrite the journal as a snapshot of live entries."""
+        with self._locked(path):
+            self._write_snapshot(path, entries, total_queries)
+
+    def _write_snapshot(
+        self,
+        path: Path,
+        entries: dict[str, MemoryEntry],
+        total_queries: int,
+    ) -> None:
+        """Replace the journal with a snapshot. Needs the journal lock."""
+        records = [{"op": "header", "version": JOURNAL_VERSION}]
+        records.extend({"op": "put", "entry": e.to_dict()} for e in entries.values())
+        records.append(self._meta(total_queries))
+
+        payload = "".join(json.dumps(r) + "\n" for r in records)
+        safe_write(path, payload)
+        self._records[path] = len(records)
+        self._sizes[path] = len(payload.encode())
+
+    def save(
+        self,
+        path: Path,
+        entries: dict[str, MemoryEntry],
+        changes: PendingChanges,
+        total_queries: int,
+    ) -> None:
+        """Append changed entries, compacting when the journal is bloated."""
+        records: list[dict[str, Any]] = []
+        for entry_id in changes.deletes:
+            records.append({"op": "del", "id": entry_id})
+        for entry_id, entry in entries.items():
+            if entry_id in changes.puts:
+                records.append({"op": "put", "entry": entry.to_dict()})
+        hits = {
+            entry_id: entries[entry_id].hit_count
+            for entry_id in changes.hits
+            if entry_id in entries and entry_id not in changes.puts
+        }
+        if hits:
+            records.append({"op": "hits", "counts": hits})
+        records.append(self._meta(total_queries))
+
+        payload = "".join(json.dumps(r) + "\n" for r in records)
+        threshold = max(self.min_compact_records, self.compact_ratio * len(entries))
+
+        with self._locked(path):
+            size = self._size(path)
+            if changes.reset or size is None:
+                self._write_snapshot(path, entries, total_queries)
+                return
+
+            total = self._count_records(path) + len(records)
+            # Only this process has written since it last read the journal
+            unshared = size == self._sizes.get(path)
+            if total > threshold and unshared:
+                self._write_snapshot(path, entries, total_queries)
+                return
+
+            with open(path, "a") as f:
+                f.write(payload)
+                f.flush()
+            self._records[path] = total
+            if unshared:
+                self._sizes[path] = size + len(payload.encode())
+            else:
+                self._sizes.pop(path, None)
+
+
+def default_backend(path: Optional[Path]) -> MemoryBackend:
+    """Pick a backend from the store path's suffix."""
+    if path is not None and Path(path).suffix == ".jsonl":
+        return JournalBackend()
+    return JsonBackend()
@@ -1,10 +1,19 @@
 """Memory compression for reducing store size.
 
 Merges similar entries to reduce memory footprint during long sessions.
+
+Candidate pairs are found with prefix filtering: entries are bucketed by
+(category, feature_id), each entry's keywords are extracted once, and only
+pairs that share a keyword from the rarer end of the smaller entry's
+keyword set are compared exactly. For the overlap-ratio similarity any pair
+reaching the threshold must share such a keyword, so results are identical
+to comparing every pair.
 """
 
 from __future__ import annotations
 
+import math
+from collections import defaultdict
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, List
 from uuid import uuid4
@@ -36,6 +45,9 @@ class MemoryCompressor:
         - Keep most recent content
         - Keep most recent outcome
 
+        Each entry seeds a group with every later, not yet merged entry
+        whose similarity to it reaches the threshold.
+
         Returns list of compressed entries.
         """
         if not entries:
@@ -44,6 +56,14 @@ class MemoryCompressor:
         if len(entries) == 1:
             return entries.copy()
 
+        if similarity_threshold <= 0:
+            # Every pair qualifies, including across categories; no pruning
+            candidates = {i: set(range(len(entries))) for i in range(len(entries))}
+            keywords = None
+        else:
+            keywords = [self._extract_keywords(e.content) for e in entries]
+            candidates = self._candidate_pairs(entries, keywords, similarity_threshold)
+
         # Track which entries have been merged
         merged_indices: set[int] = set()
         result: List["MemoryEntry"] = []
@@ -56,13 +76,16 @@ class MemoryCompressor:
             group = [entry_a]
             group_indices = [i]
 
-            for j, entry_b in enumerate(entries):
+            for j in sorted(candidates.get(i, ())):
                 if j <= i or j in merged_indices:
                     continue
 
-                sim = self.similarity(entry_a, entry_b)
+                if keywords is None:
+                    sim = self.similarity(entry_a, entries[j])
+                else:
+                    sim = self._keyword_similarity(keywords[i], keywords[j])
                 if sim >= similarity_threshold:
-                    group.append(entry_b)
+                    group.append(entries[j])
                     group_indices.append(j)
 
             # Mark all in group as merged
@@ -98,10 +121,13 @@ class MemoryCompressor:
         if a.feature_id != b.feature_id:
             return 0.0
 
-        # Extract keywords from both entries
-        keywords_a = self._extract_keywords(a.content)
-        keywords_b = self._extract_keywords(b.content)
+        return self._keyword_similarity(
+            self._extract_keywords(a.content),
+            self._extract_keywords(b.content),
+        )
 
+    def _keyword_similarity(self, keywords_a: set[str], keywords_b: set[str]) -> float:
+        """Overlap ratio of two keyword sets (see similarity())."""
         # Handle edge case of empty keyword sets
         if not keywords_a and not keywords_b:
             return 1.0  # Both empty, consider identical
@@ -116,6 +142,70 @@ class MemoryCompressor:
 
         return len(intersection) / min_size
 
+    def _candidate_pairs(
+        self,
+        entries: List["MemoryEntry"],
+        keywords: List[set[str]],
+        threshold: float,
+    ) -> dict[int, set[int]]:
+        """Find every pair of entries that could reach the threshold.
+
+        Entries only match within the same (category, feature_id) bucket.
+        Within a bucket, keywords are ordered rarest first. For a pair with
+        |A| <= |B| to reach the threshold they must share at least
+        k = ceil(threshold * |A|) keywords, so at least one shared keyword
+        lies in A's first |A| - k + 1 keywords. Probing an inverted index
+        with each entry's prefix therefore finds a superset of the
+        matching pairs, and common keywords (shared dict keys) rarely
+        appear in prefixes.
+
+        Args:
+            entries: Entries being compressed.
+            keywords: Precomputed keyword set for each entry.
+            threshold: Similarity threshold (> 0).
+
+        Returns:
+            Map of entry index to candidate partner indices (symmetric).
+        """
+        buckets: dict[tuple[str, str], list[int]] = defaultdict(list)
+        for i, entry in enumerate(entries):
+            buckets[(entry.category, entry.feature_id)].append(i)
+
+        candidates: dict[int, set[int]] = defaultdict(set)
+
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+
+            # Entries without keywords only match each other (similarity 1.0)
+            empty = [i for i in members if not keywords[i]]
+            if len(empty) > 1:
+                for i in empty:
+                    candidates[i].update(j for j in empty if j != i)
+
+            frequency: dict[str, int] = defaultdict(int)
+            inverted: dict[str, list[int]] = defaultdict(list)
+            for i in members:
+                for word in keywords[i]:
+                    frequency[word] += 1
+                    inverted[word].append(i)
+
+            for i in members:
+                words = keywords[i]
+                if not words:
+                    continue
+                # Small tolerance keeps float rounding from shortening the prefix
+                overlap_needed = max(1, math.ceil(threshold * len(words) - 1e-9))
+                prefix_length = max(1, len(words) - overlap_needed + 1)
+                prefix = sorted(words, key=lambda w: (frequency[w], w))[:prefix_length]
+                for word in prefix:
+                    for j in inverted[word]:
+                        if j != i:
+                            candidates[i].add(j)
+                            candidates[j].add(i)
+
+        return candidates
+
     def _extract_keywords(self, content: dict) -> set[str]:
         """Extract keywords from content dictionary.
 
@@ -570,6 +570,7 @@ class PatternDetector:
 
         # Update the content with the fix
         entry.content["fix_applied"] = fix_description
+        self.store.reindex(failure_entry_id)
         return True
 
     def get_verification_patterns(
@@ -678,4 +678,5 @@ class RecommendationEngine:
                 "notes": notes,
             })
 
+        self.store.reindex(entry_id)
         return True
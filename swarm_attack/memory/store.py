@@ -6,6 +6,8 @@ Phase A implementation provides:
 - MemoryStore class for JSON-based persistence
 - Query by category, feature_id, tags
 - Simple keyword-based similarity search (no embeddings)
+- In-memory inverted and secondary indexes maintained on add/delete
+- Pluggable persistence (JSON document or append-only JSONL journal)
 
 This module enables cross-session learning by persisting:
 - Checkpoint decisions and their outcomes
@@ -21,9 +23,23 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, List, Optional, Union
 
+from swarm_attack.memory.backends import MemoryBackend, PendingChanges, default_backend
 from swarm_attack.memory.relevance import RelevanceScorer
 
 
+def default_store_path(config: Optional[Any] = None) -> Path:
+    """Get the store path for a SwarmConfig.
+
+    With memory.journal on, this is the append-only memories.jsonl, which
+    imports an existing memories.json the first time it is loaded.
+    """
+    memory_config = getattr(config, "memory", None)
+    filename = "memories.json"
+    if getattr(memory_config, "journal", False) is True:
+        filename = "memories.jsonl"
+    return Path.cwd() / ".swarm" / "memory" / filename
+
+
 @dataclass
 class MemoryEntry:
     """A single memory entry in the persistent store.
@@ -90,20 +106,47 @@ class MemoryStore:
     - save(): Persist to disk
     - load(): Load from disk
 
-    Storage location: .swarm/memory/memories.json (default)
+    Storage location: .swarm/memory/memories.json (default), or the path
+    from default_store_path(config) in production. Store paths ending in
+    .jsonl use the append-only JournalBackend, so save() only writes what
+    changed since the last save.
+
+    Keyword sets for find_similar() are computed once when an entry is
+    added, and kept in an inverted index alongside category, feature_id
+    and tag indexes, so lookups only score entries that can match. Code
+    that mutates an entry's content, category, feature_id or tags in place
+    must call reindex() afterwards.
     """
 
-    def __init__(self, store_path: Optional[Path] = None):
+    def __init__(
+        self,
+        store_path: Optional[Path] = None,
+        backend: Optional[MemoryBackend] = None,
+    ):
         """Initialize the memory store.
 
         Args:
-            store_path: Path to the JSON file. Defaults to .swarm/memory/memories.json
+            store_path: Path to the store file. Defaults to .swarm/memory/memories.json
+            backend: Storage backend. Defaults to JournalBackend for .jsonl
+                paths and JsonBackend otherwise.
         """
         if store_path is None:
             store_path = Path.cwd() / ".swarm" / "memory" / "memories.json"
         self.store_path = store_path
+        self.backend = backend if backend is not None else default_backend(store_path)
         self._entries: dict[str, MemoryEntry] = {}
         self._query_count = 0
+        self._changes = PendingChanges()
+
+        # Indexes over _entries, maintained by _index_entry/_unindex_entry
+        self._seq: dict[str, int] = {}
+        self._next_seq = 0
+        self._keywords: dict[str, frozenset[str]] = {}
+        self._indexed_attrs: dict[str, tuple[str, str, frozenset[str]]] = {}
+        self._keyword_index: dict[str, set[str]] = {}
+        self._category_index: dict[str, set[str]] = {}
+        self._feature_index: dict[str, set[str]] = {}
+        self._tag_index: dict[str, set[str]] = {}
 
     def __len__(self) -> int:
         """Return number of entries in the store."""
@@ -112,59 +155,178 @@ class MemoryStore:
     def add(self, entry: MemoryEntry) -> None:
         """Add a memory entry to the store.
 
+        Adding an entry whose ID already exists replaces it.
+
         Args:
             entry: The MemoryEntry to add.
         """
+        self._index_entry(entry)
+
+    def reindex(self, entry_id: Optional[str] = None) -> None:
+        """Refresh indexes after entries were modified in place.
+
+        Reindexed entries are also marked as changed for the next save().
+
+        Args:
+            entry_id: Entry to refresh. If None, rebuilds all indexes.
+        """
+        if entry_id is not None:
+            entry = self._entries.get(entry_id)
+            if entry is not None:
+                self._index_entry(entry)
+            return
+
+        entries = list(self._entries.values())
+        self._clear_indexes()
+        self._entries.clear()
+        for entry in entries:
+            self._index_entry(entry)
+
+    def _clear_indexes(self) -> None:
+        """Drop all index state."""
+        self._seq.clear()
+        self._next_seq = 0
+        self._keywords.clear()
+        self._indexed_attrs.clear()
+        self._keyword_index.clear()
+        self._category_index.clear()
+        self._feature_index.clear()
+        self._tag_index.clear()
+
+    def _index_entry(self, entry: MemoryEntry) -> None:
+        """Store an entry and add it to every index.
+
+        Replacing an existing entry keeps its original insertion position.
+        """
+        if entry.id in self._entries:
+            self._unindex_entry(entry.id)
+        else:
+            self._seq[entry.id] = self._next_seq
+            self._next_seq += 1
+
         self._entries[entry.id] = entry
+        self._changes.put(entry.id)
+        keywords = frozenset(self._extract_keywords(entry.content))
+        self._keywords[entry.id] = keywords
+        for keyword in keywords:
+            self._keyword_index.setdefault(keyword, set()).add(entry.id)
+        tags = frozenset(t.lower() for t in entry.tags)
+        self._indexed_attrs[entry.id] = (entry.category, entry.feature_id, tags)
+        self._category_index.setdefault(entry.category, set()).add(entry.id)
+        self._feature_index.setdefault(entry.feature_id, set()).add(entry.id)
+        for tag in tags:
+            self._tag_index.setdefault(tag, set()).add(entry.id)
+
+    def _unindex_entry(self, entry_id: str) -> None:
+        """Remove an entry from every index (but not from _entries).
+
+        Uses the keyword set and attributes captured at index time, so it
+        is correct even if the entry was mutated since.
+        """
+        def discard(index: dict[str, set[str]], key: str) -> None:
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(entry_id)
+                if not ids:
+                    del index[key]
+
+        for keyword in self._keywords.pop(entry_id, frozenset()):
+            discard(self._keyword_index, keyword)
+
+        category, feature_id, tags = self._indexed_attrs.pop(entry_id)
+        discard(self._category_index, category)
+        discard(self._feature_index, feature_id)
+        for tag in tags:
+            discard(self._tag_index, tag)
+
+    def _remove(self, entry_id: str) -> None:
+        """Remove an entry and its index postings."""
+        self._unindex_entry(entry_id)
+        del self._entries[entry_id]
+        del self._seq[entry_id]
+        self._changes.delete(entry_id)
+
+    def _record_hit(self, entry: MemoryEntry) -> None:
+        """Count a query hit on an entry."""
+        entry.hit_count += 1
+        self._changes.hit(entry.id)
+
+    def _ordered(self, entry_ids: set[str]) -> list[MemoryEntry]:
+        """Get entries for IDs in insertion order."""
+        return [
+            self._entries[entry_id]
+            for entry_id in sorted(entry_ids, key=self._seq.__getitem__)
+        ]
 
-    def save(self) -> None:
-        """Persist the store to disk.
+    def _candidate_ids(
+        self,
+        category: Optional[str] = None,
+        feature_id: Optional[str] = None,
+        tags: Optional[list[str]] = None,
+    ) -> Optional[set[str]]:
+        """Intersect secondary indexes for the given filters.
 
-        Creates parent directories if they don't exist.
+        Returns:
+            Matching entry IDs, or None if no filter was given.
         """
-        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        postings: list[set[str]] = []
+        if category is not None:
+            postings.append(self._category_index.get(category, set()))
+        if feature_id is not None:
+            postings.append(self._feature_index.get(feature_id, set()))
+        if tags is not None:
+            for tag in {t.lower() for t in tags}:
+                postings.append(self._tag_index.get(tag, set()))
+
+        if not postings:
+            return None
+
+        postings.sort(key=len)
+        result = set(postings[0])
+        for ids in postings[1:]:
+            if not result:
+                break
+            result &= ids
+        return result
 
-        data = {
-            "version": "1.0",
-            "entries": [e.to_dict() for e in self._entries.values()],
-            "stats": {
-                "total_queries": self._query_count,
-                "last_saved": datetime.now().isoformat(),
-            },
-        }
+    def save(self) -> None:
+        """Persist the store to disk via the storage backend.
 
-        with open(self.store_path, "w") as f:
-            json.dump(data, f, indent=2)
+        Creates parent directories if they don't exist.
+        """
+        self.backend.save(self.store_path, self._entries, self._changes, self._query_count)
+        self._changes.clear()
 
     @classmethod
-    def load(cls, store_path: Optional[Path] = None) -> "MemoryStore":
+    def load(
+        cls,
+        store_path: Optional[Path] = None,
+        backend: Optional[MemoryBackend] = None,
+    ) -> "MemoryStore":
         """Load a memory store from disk.
 
         Args:
-            store_path: Path to the JSON file. Defaults to .swarm/memory/memories.json
+            store_path: Path to the store file. Defaults to .swarm/memory/memories.json
+            backend: Storage backend (see __init__).
 
         Returns:
             MemoryStore instance with loaded entries.
         """
-        store = cls(store_path=store_path)
-
-        if not store.store_path.exists():
-            return store
+        store = cls(store_path=store_path, backend=backend)
 
         try:
-            with open(store.store_path, "r") as f:
-                data = json.load(f)
+            entries, stats = store.backend.load(Path(store.store_path))
 
-            for entry_data in data.get("entries", []):
-                entry = MemoryEntry.from_dict(entry_data)
-                store._entries[entry.id] = entry
+            for entry_data in entries:
+                store.add(MemoryEntry.from_dict(entry_data))
 
-            store._query_count = data.get("stats", {}).get("total_queries", 0)
+            store._query_count = stats.get("total_queries", 0)
 
         except (json.JSONDecodeError, IOError, OSError):
             # Gracefully handle corrupted/empty files
             pass
 
+        store._changes.clear()
         return store
 
     def query(
@@ -191,24 +353,16 @@ class MemoryStore:
         self._query_count += 1
         results: list[MemoryEntry] = []
 
-        for entry in self._entries.values():
-            # Apply category filter
-            if category is not None and entry.category != category:
-                continue
-
-            # Apply feature_id filter
-            if feature_id is not None and entry.feature_id != feature_id:
-                continue
-
-            # Apply tags filter (must have ALL specified tags)
-            if tags is not None:
-                entry_tags_lower = {t.lower() for t in entry.tags}
-                query_tags_lower = {t.lower() for t in tags}
-                if not query_tags_lower.issubset(entry_tags_lower):
-                    continue
+        # Intersect the category/feature/tag indexes instead of scanning
+        candidate_ids = self._candidate_ids(category, feature_id, tags)
+        if candidate_ids is None:
+            candidates = list(self._entries.values())
+        else:
+            candidates = self._ordered(candidate_ids)
 
+        for entry in candidates:
             # Entry matches all filters
-            entry.hit_count += 1
+            self._record_hit(entry)
             results.append(entry)
 
             if len(results) >= limit:
@@ -242,26 +396,26 @@ class MemoryStore:
         if not query_keywords:
             return []
 
-        # Score each entry by keyword overlap
-        scored: list[tuple[float, MemoryEntry]] = []
-
-        for entry in self._entries.values():
-            # Apply category filter
-            if category is not None and entry.category != category:
-                continue
-
-            # Extract keywords from entry content
-            entry_keywords = self._extract_keywords(entry.content)
-
-            # Calculate overlap score
-            if not entry_keywords:
-                continue
-
-            overlap = len(query_keywords & entry_keywords)
-            if overlap > 0:
-                # Normalize by query keywords for relevance
-                score = overlap / len(query_keywords)
-                scored.append((score, entry))
+        # Count keyword overlap from the inverted index; only entries
+        # sharing at least one keyword are ever touched
+        overlaps: dict[str, int] = {}
+        for keyword in query_keywords:
+            for entry_id in self._keyword_index.get(keyword, ()):
+                overlaps[entry_id] = overlaps.get(entry_id, 0) + 1
+
+        if category is not None:
+            in_category = self._category_index.get(category, set())
+            overlaps = {
+                entry_id: overlap
+                for entry_id, overlap in overlaps.items()
+                if entry_id in in_category
+            }
+
+        # Normalize by query keywords for relevance; ties keep insertion order
+        scored: list[tuple[float, MemoryEntry]] = [
+            (overlaps[entry_id] / len(query_keywords), self._entries[entry_id])
+            for entry_id in sorted(overlaps, key=self._seq.__getitem__)
+        ]
 
         # Sort by score descending
         scored.sort(key=lambda x: x[0], reverse=True)
@@ -271,7 +425,7 @@ class MemoryStore:
 
         # Update hit counts
         for entry in results:
-            entry.hit_count += 1
+            self._record_hit(entry)
 
         return results
 
@@ -353,7 +507,7 @@ class MemoryStore:
             True if deleted, False if not found.
         """
         if entry_id in self._entries:
-            del self._entries[entry_id]
+            self._remove(entry_id)
             return True
         return False
 
@@ -375,15 +529,12 @@ class MemoryStore:
         results: list[MemoryEntry] = []
         class_names_set = set(class_names)
 
-        for entry in self._entries.values():
-            if entry.category != "schema_drift":
-                continue
-
+        for entry in self._ordered(self._category_index.get("schema_drift", set())):
             # Check if the entry's class_name or class matches any in the list
             # Support both "class_name" and "class" keys (common variations)
             entry_class_name = entry.content.get("class_name") or entry.content.get("class")
             if entry_class_name and entry_class_name in class_names_set:
-                entry.hit_count += 1
+                self._record_hit(entry)
                 results.append(entry)
 
         return results
@@ -402,14 +553,11 @@ class MemoryStore:
         """
         results: list[MemoryEntry] = []
 
-        for entry in self._entries.values():
-            if entry.category != "test_failure":
-                continue
-
+        for entry in self._ordered(self._category_index.get("test_failure", set())):
             # Check if the entry's test_path matches
             entry_test_path = entry.content.get("test_path")
             if entry_test_path == test_path:
-                entry.hit_count += 1
+                self._record_hit(entry)
                 results.append(entry)
 
         return results
@@ -425,10 +573,7 @@ class MemoryStore:
             List of MemoryEntry objects sorted by created_at descending.
         """
         # Filter by category
-        category_entries = [
-            entry for entry in self._entries.values()
-            if entry.category == category
-        ]
+        category_entries = self._ordered(self._category_index.get(category, set()))
 
         # Sort by created_at descending (most recent first)
         category_entries.sort(key=lambda e: e.created_at, reverse=True)
@@ -436,7 +581,7 @@ class MemoryStore:
         # Apply limit and update hit counts
         results = category_entries[:limit]
         for entry in results:
-            entry.hit_count += 1
+            self._record_hit(entry)
 
         return results
 
@@ -462,7 +607,7 @@ class MemoryStore:
                 to_remove.append(entry_id)
 
         for entry_id in to_remove:
-            del self._entries[entry_id]
+            self._remove(entry_id)
 
         return len(to_remove)
 
@@ -483,14 +628,17 @@ class MemoryStore:
                 to_remove.append(entry_id)
 
         for entry_id in to_remove:
-            del self._entries[entry_id]
+            self._remove(entry_id)
 
         return len(to_remove)
 
     def clear(self) -> None:
         """Clear all entries from the store."""
         self._entries.clear()
+        self._clear_indexes()
         self._query_count = 0
+        self._changes.clear()
+        self._changes.reset = True
 
     def prune_by_relevance(
         self,
@@ -593,7 +741,7 @@ class MemoryStore:
         # Remove entries not in keep set
         to_remove = [eid for eid in self._entries if eid not in entries_to_keep]
         for entry_id in to_remove:
-            del self._entries[entry_id]
+            self._remove(entry_id)
 
         return len(to_remove)
 
@@ -617,11 +765,10 @@ class MemoryStore:
         scorer = RelevanceScorer()
 
         # Filter by category if specified
-        candidates = []
-        for entry in self._entries.values():
-            if category is not None and entry.category != category:
-                continue
-            candidates.append(entry)
+        if category is not None:
+            candidates = self._ordered(self._category_index.get(category, set()))
+        else:
+            candidates = list(self._entries.values())
 
         if not candidates:
             return []
@@ -639,7 +786,7 @@ class MemoryStore:
 
         # Update hit counts for returned entries
         for entry in results:
-            entry.hit_count += 1
+            self._record_hit(entry)
 
         return results
 
@@ -689,8 +836,7 @@ class MemoryStore:
                 return
 
             for entry_data in data.get("entries", []):
-                entry = MemoryEntry.from_dict(entry_data)
-                self._entries[entry.id] = entry
+                self.add(MemoryEntry.from_dict(entry_data))
 
             # Load stats if present
             stats = data.get("stats", {})
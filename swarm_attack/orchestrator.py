@@ -21,10 +21,13 @@ This module orchestrates:
 
 from __future__ import annotations
 
+import copy
 import json
 import os
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
@@ -48,12 +51,13 @@ from swarm_attack.events.bus import EventBus, get_event_bus
 from swarm_attack.events.types import EventType, SwarmEvent
 from swarm_attack.github.issue_context import IssueContextManager
 from swarm_attack.github_sync import GitHubSync
-from swarm_attack.memory.store import MemoryStore
+from swarm_attack.memory.store import MemoryStore, default_store_path
 from swarm_attack.models import FeaturePhase, TaskStage
 from swarm_attack.planning.dependency_graph import DependencyGraph
 from swarm_attack.progress_logger import ProgressLogger
 from swarm_attack.session_initializer import SessionInitializer
 from swarm_attack.session_finalizer import SessionFinalizer
+from swarm_attack.testing.collection import CollectabilityChecker
 from swarm_attack.verification_tracker import VerificationTracker
 from swarm_attack.debate_retry import DebateRetryHandler
 
@@ -227,7 +231,11 @@ class Orchestrator:
 
         # Memory store for cross-session learning (create default if not provided)
         # Use explicit None check to support empty mock stores in tests
-        self._memory_store = memory_store if memory_store is not None else MemoryStore.load()
+        self._memory_store = (
+            memory_store
+            if memory_store is not None
+            else MemoryStore.load(default_store_path(config))
+        )
 
         # Spec debate agents
         self._author = author or SpecAuthorAgent(config, logger)
@@ -244,6 +252,9 @@ class Orchestrator:
         self._verifier = verifier or VerifierAgent(config, logger, memory_store=self._memory_store)
         self._github_client: Optional[GitHubClient] = None
 
+        # Serializes merges of issue worktree branches during parallel waves
+        self._merge_lock = threading.Lock()
+
         # Gate agent for pre-coder validation (lazy initialized)
         self._gate_agent: Optional[GateAgent] = None
         self._post_coder_gate_agent: Optional[GateAgent] = None
@@ -251,6 +262,9 @@ class Orchestrator:
         # Complexity Gate for issue sizing validation (lazy initialized)
         self._complexity_gate: Optional[ComplexityGateAgent] = None
 
+        # Batched pytest collectability checks for regression files (lazy initialized)
+        self._collectability_checker: Optional[CollectabilityChecker] = None
+
         # Coordination Layer v2 components
         self._context_builder = ContextBuilder(config, state_store)
         self._github_sync = GitHubSync(config, logger)
@@ -276,7 +290,7 @@ class Orchestrator:
 
         # AC 3.7, 3.8: Initialize event bus and subscribe to events
         swarm_dir = Path(config.repo_root) / ".swarm"
-        self._bus = get_event_bus(swarm_dir)
+        self._bus = get_event_bus(swarm_dir, config=config)
         self._bus.subscribe(EventType.ISSUE_CREATED, self._on_issue_created)
         self._bus.subscribe(EventType.ISSUE_COMPLETE, self._on_issue_complete)
 
@@ -772,12 +786,13 @@ class Orchestrator:
         self._emit_phase_transition(feature_id, old_phase, phase)
 
     def _update_cost(self, feature_id: str, cost_usd: float, phase_name: str) -> None:
-        """Update the cost tracking in the state store."""
+        """Update the cost tracking in the state store with exclusive locking."""
         if self._state_store:
-            state = self._state_store.load(feature_id)
-            if state:
-                state.add_cost(cost_usd, phase_name)
-                self._state_store.save(state)
+            with self._state_store.exclusive_lock(feature_id):
+                state = self._state_store.load(feature_id)
+                if state:
+                    state.add_cost(cost_usd, phase_name)
+                    self._state_store.save(state)
 
     def _emit_phase_transition(
         self,
@@ -797,7 +812,7 @@ class Orchestrator:
             to_phase: New phase.
         """
         swarm_dir = Path(self.config.repo_root) / ".swarm"
-        bus = get_event_bus(swarm_dir)
+        bus = get_event_bus(swarm_dir, config=self.config)
 
         # Map specific transitions to semantic events
         event_type = EventType.SYSTEM_PHASE_TRANSITION
@@ -1685,6 +1700,23 @@ class Orchestrator:
                     return selected.issue_number
         return None
 
+    def _get_collectability_checker(self, root: Optional[str] = None) -> CollectabilityChecker:
+        """
+        Get the collectability checker, creating it on first use.
+
+        Args:
+            root: Issue worktree to check files in. Worktrees are
+                short-lived, so their checker is fresh and unpersisted.
+        """
+        if root is not None:
+            return CollectabilityChecker(Path(root))
+        if self._collectability_checker is None:
+            self._collectability_checker = CollectabilityChecker(
+                Path(self.config.repo_root),
+                cache_path=Path(self.config.swarm_path) / "cache" / "collectability.json",
+            )
+        return self._collectability_checker
+
     def _can_collect_test_file(self, test_file: Path) -> bool:
         """
         Check if a test file can be collected by pytest without import errors.
@@ -1698,32 +1730,24 @@ class Orchestrator:
         Returns:
             True if the test file can be collected, False otherwise.
         """
-        try:
-            result = subprocess.run(
-                ["pytest", str(test_file), "--collect-only", "-q"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-                cwd=self.config.repo_root,
-                env={**os.environ, "PYTHONPATH": str(self.config.repo_root)},
-            )
-            # Collection succeeds if exit code is 0 or 5 (no tests collected but no errors)
-            # Exit code 2 means collection errors (import failures, etc.)
-            return result.returncode in (0, 5)
-        except (subprocess.TimeoutExpired, OSError):
-            return False
+        return self._get_collectability_checker().check([test_file])[test_file]
 
-    def _get_regression_test_files(self, feature_id: str) -> list[str]:
+    def _get_regression_test_files(
+        self, feature_id: str, worktree_path: Optional[str] = None
+    ) -> list[str]:
         """
         Get test files from DONE issues only for regression checking.
 
         This prevents cascading failures where BLOCKED issues cause
         subsequent issues to fail regression even when their own tests pass.
 
-        Also validates that test files can be collected (no import errors).
+        Also validates that test files can be collected (no import errors),
+        checking all candidates in a single batched, cached pytest run.
 
         Args:
             feature_id: The feature identifier.
+            worktree_path: Issue worktree to look in instead of the main
+                checkout, which other wave workers merge into concurrently.
 
         Returns:
             List of test file paths from DONE issues that can be collected.
@@ -1735,32 +1759,50 @@ class Orchestrator:
         if state is None:
             return []
 
-        test_files = []
-        tests_dir = Path(self.config.repo_root) / "tests" / "generated" / feature_id
+        root = worktree_path or self.config.repo_root
+        tests_dir = Path(root) / "tests" / "generated" / feature_id
 
+        # Only include tests from DONE issues
+        candidates: list[tuple[int, Path]] = []
         for task in state.tasks:
-            # Only include tests from DONE issues
             if task.stage == TaskStage.DONE:
                 test_file = tests_dir / f"test_issue_{task.issue_number}.py"
                 if test_file.exists():
-                    # Validate test file can be collected (no import errors)
-                    if self._can_collect_test_file(test_file):
-                        test_files.append(str(test_file))
-                    else:
-                        self._log(
-                            "regression_skip_uncollectable",
-                            {
-                                "feature_id": feature_id,
-                                "issue_number": task.issue_number,
-                                "test_file": str(test_file),
-                                "reason": "Test file has collection errors (likely import failures)",
-                            },
-                            level="warning",
-                        )
+                    candidates.append((task.issue_number, test_file))
+
+        if not candidates:
+            return []
+
+        # Validate test files can be collected (no import errors)
+        collectable = self._get_collectability_checker(worktree_path).check(
+            [f for _, f in candidates]
+        )
+
+        test_files = []
+        for issue_number, test_file in candidates:
+            if collectable[test_file]:
+                test_files.append(str(test_file))
+            else:
+                self._log(
+                    "regression_skip_uncollectable",
+                    {
+                        "feature_id": feature_id,
+                        "issue_number": issue_number,
+                        "test_file": str(test_file),
+                        "reason": "Test file has collection errors (likely import failures)",
+                    },
+                    level="warning",
+                )
 
         return test_files
 
-    def _run_baseline_check(self, feature_id: str, issue_number: int) -> BaselineResult:
+    def _run_baseline_check(
+        self,
+        feature_id: str,
+        issue_number: int,
+        worktree_path: Optional[str] = None,
+        test_files: Optional[list[str]] = None,
+    ) -> BaselineResult:
         """
         Run baseline test validation before coder starts.
 
@@ -1770,6 +1812,8 @@ class Orchestrator:
         Args:
             feature_id: The feature identifier.
             issue_number: The issue being implemented.
+            worktree_path: Issue worktree to run in instead of the main checkout.
+            test_files: Regression test files, if the caller already has them.
 
         Returns:
             BaselineResult with pass/fail status and any pre-existing failures.
@@ -1784,7 +1828,9 @@ class Orchestrator:
         start_time = time.time()
 
         # Collect test files from DONE issues
-        test_files_to_run = self._get_regression_test_files(feature_id)
+        test_files_to_run = test_files
+        if test_files_to_run is None:
+            test_files_to_run = self._get_regression_test_files(feature_id, worktree_path)
 
         if not test_files_to_run:
             return BaselineResult(
@@ -1799,17 +1845,19 @@ class Orchestrator:
             )
 
         # Run pytest on collected files using verifier's method
-        exit_code, output = self._verifier._run_pytest(
-            test_files=[Path(f) for f in test_files_to_run]
-        )
+        report = self._verifier._as_report(self._verifier._run_pytest(
+            test_files=[Path(f) for f in test_files_to_run],
+            cwd=Path(worktree_path) if worktree_path else None,
+        ))
 
         duration = time.time() - start_time
-        parsed = self._verifier._parse_pytest_output(output)
-        baseline_passed = exit_code == 0
+        # Counts and failures come from the run's JUnit report when available
+        parsed = self._verifier._parse_pytest_output(report.output, report)
+        baseline_passed = report.exit_code == 0
 
         pre_existing_failures: list[dict[str, Any]] = []
         if not baseline_passed:
-            pre_existing_failures = self._verifier._parse_pytest_failures(output)
+            pre_existing_failures = self._verifier._parse_pytest_failures(report.output, report)
 
         result = BaselineResult(
             passed=baseline_passed,
@@ -1828,6 +1876,7 @@ class Orchestrator:
             "tests_run": result.tests_run,
             "tests_failed": result.tests_failed,
             "duration_seconds": result.duration_seconds,
+            "slowest_tests": report.slowest(5),
         })
 
         return result
@@ -2843,7 +2892,8 @@ class Orchestrator:
         # Get test files from DONE issues only for regression check
         # This prevents BLOCKED issues from causing cascading failures
         # Pass empty list if no DONE issues (disables regression) vs None (run all)
-        regression_test_files = self._get_regression_test_files(feature_id)
+        # In an issue worktree, look there: the main checkout may be mid-merge
+        regression_test_files = self._get_regression_test_files(feature_id, worktree_path)
 
         total_cost = 0.0
 
@@ -2852,7 +2902,12 @@ class Orchestrator:
         # If tests are already broken, don't blame coder for regressions
         baseline_result: Optional[BaselineResult] = None
         if retry_number == 0:
-            baseline_result = self._run_baseline_check(feature_id, issue_number)
+            baseline_result = self._run_baseline_check(
+                feature_id,
+                issue_number,
+                worktree_path=worktree_path,
+                test_files=regression_test_files,
+            )
 
             if not baseline_result.passed and not baseline_result.skipped_reason:
                 self._log("baseline_check_abort", {
@@ -2895,8 +2950,9 @@ class Orchestrator:
 
         # Compute test_path for coder context handoff
         # This ensures orchestrator and coder use the same test file location
+        # (inside the issue worktree when running in one)
         test_path = str(
-            Path(self.config.repo_root)
+            Path(worktree_path or self.config.repo_root)
             / "tests"
             / "generated"
             / feature_id
@@ -3180,7 +3236,7 @@ class Orchestrator:
                 "issue_number": issue_number,
                 "previous_agent": "coder",
                 "expected_artifacts": ["test file"],
-                "project_root": str(self.config.repo_root),
+                "project_root": str(context.get("worktree_path") or self.config.repo_root),
                 "test_path": test_path,
             }
 
@@ -3267,7 +3323,7 @@ class Orchestrator:
                 "issue_number": issue_number,
                 "previous_agent": "coder",
                 "expected_artifacts": ["implementation file", "passing tests"],
-                "project_root": str(self.config.repo_root),
+                "project_root": str(context.get("worktree_path") or self.config.repo_root),
                 "test_path": test_path,
                 "impl_files": impl_files,
             }
@@ -3314,6 +3370,7 @@ class Orchestrator:
         feature_id: str,
         issue_number: int,
         message: str,
+        cwd: Optional[str] = None,
     ) -> str:
         """
         Create a git commit with the proper message format.
@@ -3322,18 +3379,20 @@ class Orchestrator:
             feature_id: The feature identifier.
             issue_number: The issue number.
             message: Commit message body.
+            cwd: Checkout to commit in; defaults to the repo root.
 
         Returns:
             Commit hash string.
         """
         # Format: feat(feature_id): message (#issue_number)
         commit_msg = f"feat({feature_id}): {message} (#{issue_number})"
+        cwd = cwd or self.config.repo_root
 
         try:
             # Stage all changes
             subprocess.run(
                 ["git", "add", "-A"],
-                cwd=self.config.repo_root,
+                cwd=cwd,
                 capture_output=True,
                 check=True,
             )
@@ -3341,7 +3400,7 @@ class Orchestrator:
             # Create commit
             result = subprocess.run(
                 ["git", "commit", "-m", commit_msg],
-                cwd=self.config.repo_root,
+                cwd=cwd,
                 capture_output=True,
                 text=True,
             )
@@ -3350,7 +3409,7 @@ class Orchestrator:
                 # Get commit hash
                 hash_result = subprocess.run(
                     ["git", "rev-parse", "HEAD"],
-                    cwd=self.config.repo_root,
+                    cwd=cwd,
                     capture_output=True,
                     text=True,
                 )
@@ -3443,6 +3502,8 @@ class Orchestrator:
         self,
         feature_id: str,
         issue_number: Optional[int] = None,
+        worktree_path: Optional[str] = None,
+        lock_held: bool = False,
     ) -> IssueSessionResult:
         """
         Run a complete issue implementation session.
@@ -3462,13 +3523,22 @@ class Orchestrator:
         8. On blocked: mark task blocked
         9. Release issue lock
 
+        When worktree_path is given (parallel waves), the session implements
+        and commits in that issue worktree and merges its branch back into
+        the feature branch before marking the task done; a merge conflict
+        blocks the issue.
+
         Args:
             feature_id: The feature identifier.
             issue_number: Specific issue to work on. If None, uses PrioritizationAgent.
+            worktree_path: Issue worktree created by SessionManager.create_issue_worktree().
+            lock_held: True if the caller already claimed the issue lock and
+                will release it.
 
         Returns:
             IssueSessionResult with status and details.
         """
+        in_issue_worktree = worktree_path is not None
         total_cost = 0.0
         commits: list[str] = []
         tests_written = 0
@@ -3587,7 +3657,7 @@ class Orchestrator:
         session_id = ""  # Initialize before try block for guaranteed cleanup access
 
         # Step 2: Claim issue lock
-        if self._session_manager:
+        if self._session_manager and not lock_held:
             # Clean stale locks before attempting to claim (self-healing)
             cleaned = self._session_manager.clean_stale_locks(feature_id)
             if cleaned:
@@ -3613,12 +3683,16 @@ class Orchestrator:
 
             lock_claimed = True
 
-        # P0 FIX: Initialize worktree_path (may be set when session starts)
-        worktree_path: Optional[str] = None
-
         try:
             # Step 3: Ensure feature branch (now inside try for guaranteed lock cleanup)
-            if self._session_manager:
+            if self._session_manager and in_issue_worktree:
+                # Parallel wave: the feature branch exists and other issues
+                # run alongside, so skip the one-session-per-feature check
+                session = self._session_manager.start_session(
+                    feature_id, issue_number, worktree_path=worktree_path, exclusive=False
+                )
+                session_id = session.session_id
+            elif self._session_manager:
                 self._session_manager.ensure_feature_branch(feature_id)
 
                 # Start session
@@ -3825,16 +3899,58 @@ class Orchestrator:
                     pass  # Summary generation failures should not block implementation
 
                 # Create commit
-                commit_hash = self._create_commit(
-                    feature_id,
-                    issue_number,
-                    f"Implement issue #{issue_number}",
-                )
+                if in_issue_worktree:
+                    commit_hash = self._create_commit(
+                        feature_id,
+                        issue_number,
+                        f"Implement issue #{issue_number}",
+                        cwd=worktree_path,
+                    )
+                else:
+                    commit_hash = self._create_commit(
+                        feature_id,
+                        issue_number,
+                        f"Implement issue #{issue_number}",
+                    )
                 if commit_hash:
                     commits.append(commit_hash)
                     if self._session_manager:
                         self._session_manager.add_commit(session_id, commit_hash)
 
+                # Parallel wave: bring the issue branch into the feature branch
+                if in_issue_worktree and self._session_manager:
+                    with self._merge_lock:
+                        conflicts = self._session_manager.merge_issue_branch(
+                            feature_id, issue_number
+                        )
+                    if conflicts:
+                        error_msg = (
+                            f"Merge conflict with feature branch in: {', '.join(conflicts)}"
+                        )
+                        self._mark_task_blocked(feature_id, issue_number, reason=error_msg)
+                        try:
+                            self._event_logger.log_issue_blocked(
+                                feature_id, issue_number, error_msg, retries
+                            )
+                        except Exception:
+                            pass  # Event logging failures must not block implementation
+                        self._update_cost(feature_id, total_cost, "IMPLEMENTATION")
+                        self._session_manager.end_session(session_id, "failed")
+                        session_ended = True
+
+                        return IssueSessionResult(
+                            status="blocked",
+                            issue_number=issue_number,
+                            session_id=session_id,
+                            tests_written=tests_written,
+                            tests_passed=tests_passed,
+                            tests_failed=tests_failed,
+                            commits=commits,
+                            cost_usd=total_cost,
+                            retries=retries,
+                            error=error_msg,
+                        )
+
                 # Session Finalization Protocol (verify all tests pass before marking complete)
                 verification_tracker = VerificationTracker(self.config.swarm_path)
                 finalizer = SessionFinalizer(
@@ -4040,6 +4156,208 @@ class Orchestrator:
                         "error": str(cleanup_error),
                     }, level="warning")
 
+    # =========================================================================
+    # Parallel Wave Execution
+    # =========================================================================
+
+    def get_ready_waves(self, feature_id: str) -> list[list[int]]:
+        """
+        Plan the outstanding issues as waves of mutually independent issues.
+
+        Wave 0 can start now; each later wave becomes ready once the waves
+        before it are done. Only READY/BACKLOG issues are planned, so
+        anything depending on a blocked, skipped or split issue is left out.
+
+        Args:
+            feature_id: The feature identifier.
+
+        Returns:
+            List of waves, each a sorted list of issue numbers.
+        """
+        if not self._state_store:
+            return []
+
+        state = self._state_store.load(feature_id)
+        if not state or not state.tasks:
+            return []
+
+        done = {t.issue_number for t in state.done_tasks}
+        graph = DependencyGraph([
+            t for t in state.tasks
+            if t.stage in (TaskStage.READY, TaskStage.BACKLOG)
+        ])
+        return graph.get_waves(done)
+
+    def run_parallel_waves(
+        self,
+        feature_id: str,
+        max_parallel: Optional[int] = None,
+    ) -> list[IssueSessionResult]:
+        """
+        Implement a feature's issues wave by wave, several at a time.
+
+        Each issue in a wave is claimed with SessionManager.claim_issue(),
+        implemented in its own worktree under config.git.worktrees_root,
+        committed on an issue branch and merged back into the feature branch
+        as soon as it passes. Issues in one wave never depend on each other,
+        and a wave only starts once the previous one has merged, so merges
+        land in dependency order. The plan is recomputed after every wave
+        and execution stops when a wave produces no successes.
+
+        Args:
+            feature_id: The feature identifier.
+            max_parallel: Maximum concurrent issues. Defaults to
+                config.git.max_parallel_issues.
+
+        Returns:
+            IssueSessionResult for every issue attempted, in wave order.
+        """
+        if max_parallel is None:
+            max_parallel = getattr(self.config.git, "max_parallel_issues", 1)
+        max_parallel = max(1, int(max_parallel))
+
+        results: list[IssueSessionResult] = []
+        wave_number = 0
+
+        while True:
+            waves = self.get_ready_waves(feature_id)
+            if not waves:
+                break
+
+            wave = waves[0]
+            self._log("parallel_wave_start", {
+                "feature_id": feature_id,
+                "wave": wave_number,
+                "issues": wave,
+                "waves_remaining": len(waves),
+                "max_parallel": max_parallel,
+            })
+
+            wave_results = self._run_wave(feature_id, wave, max_parallel)
+            results.extend(wave_results)
+
+            self._log("parallel_wave_complete", {
+                "feature_id": feature_id,
+                "wave": wave_number,
+                "statuses": {r.issue_number: r.status for r in wave_results},
+            })
+
+            if not any(r.status == "success" for r in wave_results):
+                break
+            wave_number += 1
+
+        return results
+
+    def _run_wave(
+        self,
+        feature_id: str,
+        wave: list[int],
+        max_parallel: int,
+    ) -> list[IssueSessionResult]:
+        """Run one wave of independent issues, each in its own worktree."""
+        if not self._session_manager:
+            # Worktrees and issue locks need a SessionManager; run serially
+            return [self.run_issue_session(feature_id, n) for n in wave]
+
+        self._session_manager.ensure_feature_branch(feature_id)
+        self._session_manager.clean_stale_locks(feature_id)
+
+        with ThreadPoolExecutor(max_workers=min(max_parallel, len(wave))) as pool:
+            futures = [
+                pool.submit(self._run_issue_in_worktree, feature_id, n)
+                for n in wave
+            ]
+            return [f.result() for f in futures]
+
+    def _parallel_worker(self) -> Orchestrator:
+        """
+        Copy this orchestrator for running one issue on a worker thread.
+
+        Agents keep per-run state (checkpoints, cost, injected context), so
+        each worker gets its own agent instances. Stores, the session
+        manager and the merge lock are shared.
+        """
+        worker = copy.copy(self)
+        for name in (
+            "_coder",
+            "_verifier",
+            "_recovery_agent",
+            "_summarizer",
+            "_gate_agent",
+            "_post_coder_gate_agent",
+            "_complexity_gate",
+        ):
+            setattr(worker, name, copy.copy(getattr(self, name)))
+        return worker
+
+    def _run_issue_in_worktree(
+        self,
+        feature_id: str,
+        issue_number: int,
+    ) -> IssueSessionResult:
+        """Claim an issue, run its session in a fresh worktree, then clean up."""
+        from swarm_attack.session_manager import SessionError
+
+        session_manager = self._session_manager
+        if not session_manager.claim_issue(feature_id, issue_number):
+            return IssueSessionResult(
+                status="failed",
+                issue_number=issue_number,
+                session_id="",
+                tests_written=0,
+                tests_passed=0,
+                tests_failed=0,
+                commits=[],
+                cost_usd=0.0,
+                retries=0,
+                error=f"Issue {issue_number} is already claimed/locked",
+            )
+
+        result: Optional[IssueSessionResult] = None
+        try:
+            worktree_path = session_manager.create_issue_worktree(feature_id, issue_number)
+            result = self._parallel_worker().run_issue_session(
+                feature_id,
+                issue_number,
+                worktree_path=worktree_path,
+                lock_held=True,
+            )
+            return result
+
+        except SessionError as e:
+            self._log("issue_worktree_error", {
+                "feature_id": feature_id,
+                "issue_number": issue_number,
+                "error": str(e),
+            }, level="error")
+            return IssueSessionResult(
+                status="failed",
+                issue_number=issue_number,
+                session_id="",
+                tests_written=0,
+                tests_passed=0,
+                tests_failed=0,
+                commits=[],
+                cost_usd=0.0,
+                retries=0,
+                error=str(e),
+            )
+
+        finally:
+            # Keep branches of unmerged issues for inspection or conflict resolution
+            keep_branch = result is not None and result.status != "success"
+            try:
+                session_manager.remove_issue_worktree(
+                    feature_id, issue_number, delete_branch=not keep_branch
+                )
+            except Exception as cleanup_error:
+                self._log("issue_worktree_cleanup_error", {
+                    "feature_id": feature_id,
+                    "issue_number": issue_number,
+                    "error": str(cleanup_error),
+                }, level="warning")
+            session_manager.release_issue(feature_id, issue_number)
+
     # =========================================================================
     # Safe Execution Methods - Production Error Handling
     # =========================================================================
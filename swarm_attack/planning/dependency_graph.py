@@ -270,5 +270,38 @@ class DependencyGraph:
 
         return result
 
+    def get_waves(self, completed: Optional[Set[int]] = None) -> list[list[int]]:
+        """
+        Group outstanding issues into waves that can run concurrently.
+
+        Wave 0 holds issues whose dependencies are all in ``completed``;
+        wave N holds issues whose dependencies are satisfied by ``completed``
+        plus waves 0..N-1. Issues within a wave never depend on each other.
+        Dependencies that are neither in the graph nor completed block
+        their dependents, as do cycles.
+
+        Args:
+            completed: Issue numbers already done.
+
+        Returns:
+            List of waves, each a sorted list of issue numbers.
+        """
+        done = set(completed or ())
+        remaining = {issue for issue in self._graph if issue not in done}
+        waves: list[list[int]] = []
+
+        while remaining:
+            wave = sorted(
+                issue for issue in remaining
+                if self._graph[issue] <= done
+            )
+            if not wave:
+                break
+            waves.append(wave)
+            done.update(wave)
+            remaining.difference_update(wave)
+
+        return waves
+
     def __repr__(self) -> str:
         return f"DependencyGraph(issues={len(self._graph)})"
@@ -113,6 +113,27 @@ class ProgressLogger:
         failures_str = ", ".join(failures[:3]) if failures else "unknown"
         self._append(f"VERIFICATION_FAILED {failure_count} failures: {failures_str}")
 
+    def log_llm_progress(
+        self,
+        agent: str,
+        num_turns: int,
+        cost_usd: float,
+        output_tokens: int = 0,
+    ) -> None:
+        """
+        Log live progress of a streamed LLM run.
+
+        Args:
+            agent: Name of the agent running the LLM.
+            num_turns: Turns completed so far.
+            cost_usd: Cost reported so far.
+            output_tokens: Output tokens generated so far.
+        """
+        self._append(
+            f"LLM_PROGRESS agent={agent} turns={num_turns} "
+            f"cost=${cost_usd:.4f} output_tokens={output_tokens}"
+        )
+
     def log_error(self, error: str) -> None:
         """
         Log an error that occurred during the session.
@@ -6,6 +6,7 @@ This module handles:
 - Checkpoint creation at each stage
 - Recovery from interrupted sessions
 - Session state persistence
+- Per-issue git worktrees for parallel wave execution
 
 Session Lifecycle:
 1. start_session() - Claim an issue, create session
@@ -20,6 +21,7 @@ Interrupt Handling:
 
 from __future__ import annotations
 
+import shutil
 import subprocess
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -128,6 +130,7 @@ class SessionManager:
         feature_id: str,
         issue_number: int,
         worktree_path: Optional[str] = None,
+        exclusive: bool = True,
     ) -> SessionState:
         """
         Start a new session for working on an issue.
@@ -136,6 +139,9 @@ class SessionManager:
             feature_id: The feature identifier.
             issue_number: GitHub issue number to work on.
             worktree_path: Optional path to git worktree.
+            exclusive: If True, refuse to start while any other session is
+                active for the feature. Parallel wave execution passes False
+                and relies on claim_issue() for per-issue exclusivity.
 
         Returns:
             The created SessionState.
@@ -150,7 +156,7 @@ class SessionManager:
             raise SessionError(f"Feature '{feature_id}' not found")
 
         # Check for existing active session
-        active = self.get_active_session(feature_id)
+        active = self.get_active_session(feature_id) if exclusive else None
         if active is not None:
             raise SessionAlreadyActiveError(
                 f"Session '{active.session_id}' is already active for feature "
@@ -171,9 +177,12 @@ class SessionManager:
         # Save session
         self.state_store.save_session(session)
 
-        # Update run state with current session
-        state.current_session = session_id
-        self.state_store.save(state)
+        # Update run state with current session. Concurrent sessions leave it
+        # alone: there is no single current one, and saving the state loaded
+        # above could overwrite task updates from the other sessions.
+        if exclusive:
+            state.current_session = session_id
+            self.state_store.save(state)
 
         self._log(
             "session_started",
@@ -652,6 +661,218 @@ class SessionManager:
 
         return branch_name
 
+    # =========================================================================
+    # Issue Worktrees (parallel wave execution)
+    # =========================================================================
+
+    def _git(self, *args: str) -> subprocess.CompletedProcess:
+        """Run a git command in the main checkout."""
+        return subprocess.run(
+            ["git", *args],
+            capture_output=True,
+            text=True,
+            cwd=self.config.repo_root,
+        )
+
+    def get_issue_branch(self, feature_id: str, issue_number: int) -> str:
+        """
+        Get the branch name an issue is implemented on in its worktree.
+
+        Args:
+            feature_id: The feature identifier.
+            issue_number: GitHub issue number.
+
+        Returns:
+            Branch name string, derived from the feature branch.
+        """
+        return f"{self.get_feature_branch(feature_id)}-issue-{issue_number}"
+
+    def get_issue_worktree_path(self, feature_id: str, issue_number: int) -> Path:
+        """
+        Get the worktree directory for an issue.
+
+        Args:
+            feature_id: The feature identifier.
+            issue_number: GitHub issue number.
+
+        Returns:
+            Absolute path under config.git.worktrees_root.
+        """
+        root = Path(self.config.repo_root).resolve() / self.config.git.worktrees_root
+        return root / feature_id / f"issue-{issue_number}"
+
+    def _exclude_worktrees_root(self) -> None:
+        """
+        Add the worktrees root to .git/info/exclude.
+
+        Without this, ``git add -A`` in the main checkout would pick up
+        every issue worktree as an embedded repository.
+        """
+        info_dir = Path(self.config.repo_root) / ".git" / "info"
+        if not info_dir.parent.is_dir():
+            # The main checkout is itself a linked worktree; nothing to do
+            return
+
+        pattern = "/" + self.config.git.worktrees_root.strip("/") + "/"
+        exclude = info_dir / "exclude"
+        existing = exclude.read_text() if exclude.exists() else ""
+        if pattern in existing.splitlines():
+            return
+
+        info_dir.mkdir(parents=True, exist_ok=True)
+        separator = "\n" if existing and not existing.endswith("\n") else ""
+        with open(exclude, "a") as f:
+            f.write(f"{separator}{pattern}\n")
+
+    def create_issue_worktree(self, feature_id: str, issue_number: int) -> str:
+        """
+        Create a git worktree for implementing an issue in isolation.
+
+        The worktree gets a fresh issue branch starting at the current tip
+        of the feature branch. Leftovers from an interrupted run at the
+        same path are removed first.
+
+        Args:
+            feature_id: The feature identifier.
+            issue_number: GitHub issue number.
+
+        Returns:
+            Worktree path string.
+
+        Raises:
+            SessionError: If git cannot create the worktree.
+        """
+        branch_name = self.get_issue_branch(feature_id, issue_number)
+        path = self.get_issue_worktree_path(feature_id, issue_number)
+
+        self._exclude_worktrees_root()
+        if path.exists():
+            self._git("worktree", "remove", "--force", str(path))
+            if path.exists():
+                shutil.rmtree(path, ignore_errors=True)
+        self._git("worktree", "prune")
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        result = self._git(
+            "worktree", "add", "-B", branch_name, str(path),
+            self.get_feature_branch(feature_id),
+        )
+        if result.returncode != 0:
+            raise SessionError(
+                f"Failed to create worktree for issue #{issue_number}: "
+                f"{result.stderr.strip()}"
+            )
+
+        self._log(
+            "issue_worktree_created",
+            {
+                "feature_id": feature_id,
+                "issue_number": issue_number,
+                "branch_name": branch_name,
+                "worktree_path": str(path),
+            },
+        )
+
+        return str(path)
+
+    def merge_issue_branch(self, feature_id: str, issue_number: int) -> list[str]:
+        """
+        Merge an issue branch back into the feature branch.
+
+        Runs in the main checkout, switching it to the feature branch if
+        needed. A conflicting merge is aborted so the feature branch is
+        left untouched.
+
+        Args:
+            feature_id: The feature identifier.
+            issue_number: GitHub issue number.
+
+        Returns:
+            Conflicting file paths; empty if the merge succeeded.
+
+        Raises:
+            SessionError: If the merge fails for a reason other than conflicts.
+        """
+        branch_name = self.get_issue_branch(feature_id, issue_number)
+        feature_branch = self.get_feature_branch(feature_id)
+
+        current = self._git("rev-parse", "--abbrev-ref", "HEAD").stdout.strip()
+        if current != feature_branch:
+            checkout = self._git("checkout", feature_branch)
+            if checkout.returncode != 0:
+                raise SessionError(
+                    f"Failed to check out {feature_branch}: {checkout.stderr.strip()}"
+                )
+
+        result = self._git("merge", "--no-ff", "--no-edit", branch_name)
+        if result.returncode == 0:
+            self._log(
+                "issue_branch_merged",
+                {
+                    "feature_id": feature_id,
+                    "issue_number": issue_number,
+                    "branch_name": branch_name,
+                },
+            )
+            return []
+
+        unmerged = self._git("diff", "--name-only", "--diff-filter=U").stdout
+        conflicts = [line for line in unmerged.splitlines() if line]
+        self._git("merge", "--abort")
+
+        if not conflicts:
+            raise SessionError(
+                f"Failed to merge {branch_name}: "
+                f"{(result.stderr or result.stdout).strip()}"
+            )
+
+        self._log(
+            "issue_merge_conflict",
+            {
+                "feature_id": feature_id,
+                "issue_number": issue_number,
+                "branch_name": branch_name,
+                "conflicts": conflicts,
+            },
+            level="warning",
+        )
+        return conflicts
+
+    def remove_issue_worktree(
+        self,
+        feature_id: str,
+        issue_number: int,
+        delete_branch: bool = True,
+    ) -> None:
+        """
+        Remove an issue worktree.
+
+        Args:
+            feature_id: The feature identifier.
+            issue_number: GitHub issue number.
+            delete_branch: Also delete the issue branch. Pass False to keep
+                an unmerged branch around for manual conflict resolution.
+        """
+        path = self.get_issue_worktree_path(feature_id, issue_number)
+
+        if path.exists():
+            self._git("worktree", "remove", "--force", str(path))
+            if path.exists():
+                shutil.rmtree(path, ignore_errors=True)
+        self._git("worktree", "prune")
+
+        if delete_branch:
+            self._git("branch", "-D", self.get_issue_branch(feature_id, issue_number))
+
+        self._log(
+            "issue_worktree_removed",
+            {
+                "feature_id": feature_id,
+                "issue_number": issue_number,
+                "branch_deleted": delete_branch,
+            },
+        )
+
     # =========================================================================
     # Issue Locking
     # =========================================================================
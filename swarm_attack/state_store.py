@@ -6,12 +6,15 @@ This module handles:
 - Atomic writes to prevent corruption
 - Graceful handling of missing or corrupted state files
 - Session state persistence to .swarm/sessions/<feature>/<session_id>.json
+- Compact per-feature session index at .swarm/sessions/.<feature>.index
 - File-based locking for concurrent access protection
 - Git state synchronization to detect already-implemented issues
+- Validated in-process read cache for feature state
 """
 
 from __future__ import annotations
 
+import copy
 import fcntl
 import hashlib
 import hmac
@@ -19,9 +22,10 @@ import json
 import os
 import re
 import subprocess
+import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, Generator, Optional
+from typing import TYPE_CHECKING, Any, Generator, Optional
 
 from swarm_attack.models import (
     FeaturePhase,
@@ -45,6 +49,10 @@ if TYPE_CHECKING:
     from swarm_attack.logger import SwarmLogger
 
 
+# Bump when the session index layout changes; older indexes are rebuilt.
+SESSION_INDEX_VERSION = 1
+
+
 class StateStoreError(Exception):
     """Raised when state store operations fail."""
     pass
@@ -61,12 +69,18 @@ class StateStore:
 
     Handles saving and loading feature state to the file system with
     atomic writes and corruption handling.
+
+    Loaded states are kept in a read-through cache keyed by feature_id.
+    Each entry is validated against the state file's (mtime_ns, size, inode)
+    and the signing key before use, so out-of-band writes and key changes
+    always fall through to a full read and signature verification.
     """
 
     def __init__(
         self,
         config: SwarmConfig,
-        logger: Optional[SwarmLogger] = None
+        logger: Optional[SwarmLogger] = None,
+        enable_cache: bool = True,
     ) -> None:
         """
         Initialize the state store.
@@ -74,12 +88,21 @@ class StateStore:
         Args:
             config: SwarmConfig with paths configured.
             logger: Optional logger for recording operations.
+            enable_cache: Whether to cache loaded states in-process.
         """
         self._config = config
         self._logger = logger
         self._state_dir = config.state_path
         self._sessions_dir = config.sessions_path
 
+        # feature_id -> (validation fingerprint, verified RunState)
+        self._cache_enabled = enable_cache
+        self._cache: dict[str, tuple[tuple, RunState]] = {}
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_invalidations = 0
+
     def _ensure_directories(self) -> None:
         """Ensure state and session directories exist."""
         ensure_dir(self._state_dir)
@@ -97,6 +120,19 @@ class StateStore:
         """Get path to session state file."""
         return self._get_session_dir(feature_id) / f"{session_id}.json"
 
+    def _get_session_index_path(self, feature_id: str) -> Path:
+        """
+        Get path to the feature's session index file.
+
+        Lives beside (not inside) the session directory so that writing the
+        index does not change the directory mtime it records.
+        """
+        return self._sessions_dir / f".{feature_id}.index"
+
+    def _get_session_index_lock_path(self, feature_id: str) -> Path:
+        """Get path to the feature's session index lock file."""
+        return self._sessions_dir / f".{feature_id}.index.lock"
+
     def _log(
         self,
         event_type: str,
@@ -155,6 +191,73 @@ class StateStore:
         expected = self._sign_state(data)
         return hmac.compare_digest(expected, signature)
 
+    # State Cache Operations
+
+    def _file_fingerprint(self, path: Path) -> Optional[tuple]:
+        """
+        Build the cache validation fingerprint for a state file.
+
+        Combines the file's (mtime_ns, size, inode) with a digest of the
+        signing key, so a cached state is never served after the file was
+        rewritten or the key changed.
+
+        Returns:
+            Fingerprint tuple, or None if the file cannot be stat'ed.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        key_digest = hashlib.sha256(self._get_signing_key()).digest()
+        return (st.st_mtime_ns, st.st_size, st.st_ino, key_digest)
+
+    def _cache_get(self, feature_id: str, fingerprint: tuple) -> Optional[RunState]:
+        """Return a copy of the cached state if its fingerprint still matches."""
+        with self._cache_lock:
+            entry = self._cache.get(feature_id)
+            if entry is None or entry[0] != fingerprint:
+                self._cache_misses += 1
+                return None
+            self._cache_hits += 1
+            cached = entry[1]
+        # Callers mutate loaded states, so never hand out the cached object
+        return copy.deepcopy(cached)
+
+    def _cache_put(self, feature_id: str, fingerprint: tuple, state: RunState) -> None:
+        """Store a private copy of a freshly verified state."""
+        with self._cache_lock:
+            self._cache[feature_id] = (fingerprint, copy.deepcopy(state))
+
+    def invalidate_cache(self, feature_id: Optional[str] = None) -> None:
+        """
+        Drop cached state for one feature, or for all features.
+
+        Args:
+            feature_id: Feature to invalidate. None clears the whole cache.
+        """
+        with self._cache_lock:
+            if feature_id is None:
+                self._cache_invalidations += len(self._cache)
+                self._cache.clear()
+            elif self._cache.pop(feature_id, None) is not None:
+                self._cache_invalidations += 1
+
+    def cache_stats(self) -> dict[str, Any]:
+        """
+        Get load cache counters for diagnostics.
+
+        Returns:
+            Dict with enabled, hits, misses, invalidations and entries.
+        """
+        with self._cache_lock:
+            return {
+                "enabled": self._cache_enabled,
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "invalidations": self._cache_invalidations,
+                "entries": len(self._cache),
+            }
+
     @contextmanager
     def exclusive_lock(
         self,
@@ -227,6 +330,8 @@ class StateStore:
         Load feature state from disk with signature verification.
 
         Verifies HMAC signature before returning state to detect tampering.
+        Repeated loads of an unchanged file are served from the in-process
+        cache without re-reading or re-verifying.
 
         Args:
             feature_id: The feature identifier.
@@ -241,9 +346,19 @@ class StateStore:
         state_path = self._get_state_path(feature_id)
 
         if not file_exists(state_path):
+            self.invalidate_cache(feature_id)
             self._log("state_load_miss", {"feature_id": feature_id}, level="debug")
             return None
 
+        fingerprint = None
+        if self._cache_enabled:
+            fingerprint = self._file_fingerprint(state_path)
+            if fingerprint is not None:
+                cached = self._cache_get(feature_id, fingerprint)
+                if cached is not None:
+                    self._log("state_cache_hit", {"feature_id": feature_id}, level="debug")
+                    return cached
+
         try:
             content = read_file(state_path)
             data = json.loads(content)
@@ -271,6 +386,8 @@ class StateStore:
                 )
 
             state = RunState.from_dict(data)
+            if fingerprint is not None:
+                self._cache_put(feature_id, fingerprint, state)
             self._log("state_loaded", {
                 "feature_id": feature_id,
                 "phase": state.phase.name
@@ -315,6 +432,7 @@ class StateStore:
         """
         self._ensure_directories()
         state_path = self._get_state_path(state.feature_id)
+        self.invalidate_cache(state.feature_id)
 
         try:
             # Convert state to dict and sign it
@@ -347,6 +465,7 @@ class StateStore:
             True if state was deleted, False if it didn't exist.
         """
         state_path = self._get_state_path(feature_id)
+        self.invalidate_cache(feature_id)
 
         if not file_exists(state_path):
             return False
@@ -504,6 +623,9 @@ class StateStore:
         """
         Save session state to disk atomically.
 
+        Also records the session's status and timestamps in the feature's
+        session index.
+
         Args:
             session: The SessionState to save.
 
@@ -518,24 +640,27 @@ class StateStore:
             session.session_id
         )
 
-        try:
-            content = model_to_json(session.to_dict(), indent=2)
-            safe_write(session_path, content)
-            self._log("session_saved", {
-                "feature_id": session.feature_id,
-                "session_id": session.session_id,
-                "status": session.status
-            })
+        with self._session_index_lock(session.feature_id):
+            try:
+                content = model_to_json(session.to_dict(), indent=2)
+                safe_write(session_path, content)
+                self._log("session_saved", {
+                    "feature_id": session.feature_id,
+                    "session_id": session.session_id,
+                    "status": session.status
+                })
+
+            except FileSystemError as e:
+                self._log("session_save_error", {
+                    "feature_id": session.feature_id,
+                    "session_id": session.session_id,
+                    "error": str(e)
+                }, level="error")
+                raise StateStoreError(
+                    f"Failed to save session {session.session_id}: {e}"
+                )
 
-        except FileSystemError as e:
-            self._log("session_save_error", {
-                "feature_id": session.feature_id,
-                "session_id": session.session_id,
-                "error": str(e)
-            }, level="error")
-            raise StateStoreError(
-                f"Failed to save session {session.session_id}: {e}"
-            )
+            self._update_session_index(session)
 
     def list_sessions(self, feature_id: str) -> list[str]:
         """
@@ -565,26 +690,33 @@ class StateStore:
         """
         Get the most recent session for a feature.
 
+        Uses the session index, so only the winning session file is loaded.
+
         Args:
             feature_id: The feature identifier.
 
         Returns:
             Most recent SessionState or None if no sessions exist.
         """
-        session_ids = self.list_sessions(feature_id)
-        if not session_ids:
-            return None
+        for attempt in range(2):
+            index = self._get_session_index(feature_id, rebuild=attempt > 0)
 
-        # Load all sessions and find the one with latest started_at
-        latest: Optional[SessionState] = None
-        for sid in session_ids:
-            session = self.load_session(feature_id, sid)
-            if session is None:
-                continue
-            if latest is None or session.started_at > latest.started_at:
-                latest = session
+            # Pick the latest started_at; ties go to the first id, as before
+            latest_id: Optional[str] = None
+            for sid in sorted(index):
+                started_at = index[sid].get("started_at") or ""
+                if latest_id is None or started_at > (index[latest_id].get("started_at") or ""):
+                    latest_id = sid
 
-        return latest
+            if latest_id is None:
+                return None
+
+            session = self.load_session(feature_id, latest_id)
+            if session is not None:
+                return session
+            # Index pointed at a missing or unreadable file: rebuild and retry
+
+        return None
 
     def get_active_session(
         self,
@@ -594,7 +726,8 @@ class StateStore:
         Get the active (non-ended) session for a feature.
 
         Automatically marks stale sessions (older than stale_timeout_minutes)
-        as abandoned to prevent blocking future implementations.
+        as abandoned to prevent blocking future implementations. Only
+        sessions the index lists as active are loaded.
 
         Args:
             feature_id: The feature identifier.
@@ -604,7 +737,11 @@ class StateStore:
         """
         from datetime import datetime, timezone, timedelta
 
-        session_ids = self.list_sessions(feature_id)
+        index = self._get_session_index(feature_id)
+        session_ids = [
+            sid for sid in sorted(index)
+            if index[sid].get("status") == "active"
+        ]
         stale_timeout = self._config.sessions.stale_timeout_minutes
 
         for sid in session_ids:
@@ -648,6 +785,168 @@ class StateStore:
 
         return None
 
+    # Session Index Operations
+
+    @contextmanager
+    def _session_index_lock(self, feature_id: str) -> Generator[None, None, None]:
+        """
+        Serialize session index read-modify-write cycles across processes.
+
+        Separate from exclusive_lock() so save_session() can be called while
+        the feature state lock is held.
+        """
+        ensure_dir(self._sessions_dir)
+        lock_file = open(self._get_session_index_lock_path(feature_id), "w")
+        try:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            except (IOError, OSError) as e:
+                raise StateStoreError(
+                    f"Failed to acquire session index lock for {feature_id}: {e}"
+                )
+            yield
+        finally:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            except (IOError, OSError):
+                pass  # Best effort release
+            lock_file.close()
+
+    def _get_session_dir_mtime(self, feature_id: str) -> Optional[int]:
+        """Get the session directory's mtime_ns, or None if it doesn't exist."""
+        try:
+            return os.stat(self._get_session_dir(feature_id)).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _session_index_entry(session: SessionState) -> dict[str, Optional[str]]:
+        """Build the compact index entry for a session."""
+        return {
+            "status": session.status,
+            "started_at": session.started_at,
+            "ended_at": session.ended_at,
+        }
+
+    def _read_session_index(self, feature_id: str) -> Optional[dict[str, Any]]:
+        """Read the session index file, or None if missing or unusable."""
+        index_path = self._get_session_index_path(feature_id)
+        if not file_exists(index_path):
+            return None
+
+        try:
+            data = json.loads(read_file(index_path))
+        except (json.JSONDecodeError, FileSystemError):
+            return None
+
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != SESSION_INDEX_VERSION
+            or not isinstance(data.get("sessions"), dict)
+        ):
+            return None
+        return data
+
+    def _write_session_index(
+        self,
+        feature_id: str,
+        sessions: dict[str, dict[str, Optional[str]]]
+    ) -> None:
+        """
+        Atomically write the session index.
+
+        Must be called with the session index lock held and after the
+        session files are written, so the recorded directory mtime matches.
+        Failures are logged, not raised: the index is only an accelerator.
+        """
+        data = {
+            "version": SESSION_INDEX_VERSION,
+            "dir_mtime_ns": self._get_session_dir_mtime(feature_id),
+            "sessions": sessions,
+        }
+        try:
+            safe_write(
+                self._get_session_index_path(feature_id),
+                json.dumps(data, sort_keys=True),
+            )
+        except FileSystemError as e:
+            self._log("session_index_write_error", {
+                "feature_id": feature_id,
+                "error": str(e),
+            }, level="warning")
+
+    def _update_session_index(self, session: SessionState) -> None:
+        """Record one session in its feature's index (lock must be held)."""
+        index = self._read_session_index(session.feature_id)
+        if index is None:
+            # Missing or unusable index: rebuild, which includes this session
+            self._rebuild_session_index_locked(session.feature_id)
+            return
+
+        sessions = index["sessions"]
+        sessions[session.session_id] = self._session_index_entry(session)
+        self._write_session_index(session.feature_id, sessions)
+
+    def _rebuild_session_index_locked(
+        self,
+        feature_id: str
+    ) -> dict[str, dict[str, Optional[str]]]:
+        """Rebuild the index by loading every session file (lock must be held)."""
+        sessions: dict[str, dict[str, Optional[str]]] = {}
+        if not self._get_session_dir(feature_id).exists():
+            return sessions
+
+        for sid in self.list_sessions(feature_id):
+            session = self.load_session(feature_id, sid)
+            if session is not None:
+                sessions[sid] = self._session_index_entry(session)
+
+        self._write_session_index(feature_id, sessions)
+        self._log("session_index_rebuilt", {
+            "feature_id": feature_id,
+            "sessions": len(sessions),
+        }, level="debug")
+        return sessions
+
+    def rebuild_session_index(
+        self,
+        feature_id: str
+    ) -> dict[str, dict[str, Optional[str]]]:
+        """
+        Rebuild a feature's session index from the session files on disk.
+
+        Args:
+            feature_id: The feature identifier.
+
+        Returns:
+            Dict mapping session_id to its status, started_at and ended_at.
+        """
+        with self._session_index_lock(feature_id):
+            return self._rebuild_session_index_locked(feature_id)
+
+    def _get_session_index(
+        self,
+        feature_id: str,
+        rebuild: bool = False
+    ) -> dict[str, dict[str, Optional[str]]]:
+        """
+        Get a feature's session index, rebuilding it if stale.
+
+        The index is trusted only while the session directory's mtime matches
+        the one recorded at write time; any out-of-band file creation,
+        rename or deletion forces a rebuild from disk.
+        """
+        dir_mtime = self._get_session_dir_mtime(feature_id)
+        if dir_mtime is None:
+            return {}
+
+        if not rebuild:
+            index = self._read_session_index(feature_id)
+            if index is not None and index.get("dir_mtime_ns") == dir_mtime:
+                return index["sessions"]
+
+        return self.rebuild_session_index(feature_id)
+
     # Issue Output and Module Registry Operations
 
     def save_issue_outputs(
@@ -3,23 +3,101 @@
 StaticBugDetector provides a unified interface to run static analysis
 tools (pytest, mypy, ruff) and collect their findings as StaticBugReport
 instances.
+
+detect_all() runs the tools concurrently. In incremental mode mypy and
+ruff only see files changed since a git ref, or whose content hash
+differs from the previous run; findings for unchanged files are reused
+from a per-file cache. Both tools are handed explicit file lists there, so
+the project's configured excludes are applied by ruff's --force-exclude
+and by filtering the list through mypy's ``exclude`` setting.
 """
 
 from __future__ import annotations
 
+import configparser
+import hashlib
 import json
 import logging
+import os
+import re
 import shutil
 import subprocess
-from typing import TYPE_CHECKING
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional
 
 from .models import StaticAnalysisResult, StaticBugReport
 
+try:
+    import tomllib
+except ImportError:  # Python 3.10
+    tomllib = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from typing import Literal
 
 logger = logging.getLogger(__name__)
 
+# Bump when the cache layout changes; older caches are discarded.
+FINDINGS_CACHE_VERSION = 1
+
+# Tools whose findings are attributable to single files and can be cached.
+_PER_FILE_TOOLS = ("mypy", "ruff")
+
+_SKIP_DIRS = {".git", ".swarm", ".claude", "node_modules", "__pycache__", ".venv", "venv", ".tox"}
+
+
+def _normalize_path(path: str) -> str:
+    """Normalize a reported file path to be relative to the working directory."""
+    return os.path.relpath(os.path.abspath(path))
+
+
+def _file_hash(path: str) -> Optional[str]:
+    """SHA-256 of a file's contents, or None if it can't be read."""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _mypy_exclude_patterns() -> list[str]:
+    """Regexes from the ``exclude`` setting of the project's mypy config.
+
+    Config files are looked up in the working directory in mypy's order
+    (mypy.ini, .mypy.ini, pyproject.toml, setup.cfg); the first one with a
+    mypy section wins. pyproject.toml is skipped on Python 3.10, which has
+    no TOML parser in the standard library.
+    """
+    for name in ("mypy.ini", ".mypy.ini", "pyproject.toml", "setup.cfg"):
+        if not os.path.isfile(name):
+            continue
+        if name == "pyproject.toml":
+            if tomllib is None:
+                continue
+            try:
+                with open(name, "rb") as f:
+                    section = tomllib.load(f).get("tool", {}).get("mypy")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to read {name}: {e}")
+                continue
+            if not isinstance(section, dict):
+                continue
+            exclude = section.get("exclude", [])
+            return [exclude] if isinstance(exclude, str) else list(exclude)
+
+        parser = configparser.ConfigParser()
+        try:
+            parser.read(name)
+        except configparser.Error as e:
+            logger.warning(f"Failed to read {name}: {e}")
+            continue
+        if not parser.has_section("mypy"):
+            continue
+        exclude = parser.get("mypy", "exclude", fallback="").strip()
+        return [exclude] if exclude else []
+    return []
+
 
 class StaticBugDetector:
     """Wrapper for static analysis tools.
@@ -34,6 +112,18 @@ class StaticBugDetector:
             print(f"{bug.file_path}:{bug.line_number}: {bug.message}")
     """
 
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        """Initialize the detector.
+
+        Args:
+            cache_dir: Directory for persisting per-file findings between
+                incremental runs. Without it the cache lives in memory only.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        # tool -> normalized file path -> {"hash": ..., "bugs": [...]}
+        self._findings: Optional[dict[str, dict[str, dict]]] = None
+        self._cache_lock = threading.Lock()
+
     def _tool_available(self, tool: str) -> bool:
         """Check if a tool is available on the system.
 
@@ -314,7 +404,13 @@ class StaticBugDetector:
 
         return bugs
 
-    def detect_from_types(self, path: str | None = None) -> list[StaticBugReport]:
+    def detect_from_types(
+        self,
+        path: str | None = None,
+        files: list[str] | None = None,
+        *,
+        strict: bool = False,
+    ) -> Optional[list[StaticBugReport]]:
         """Run mypy and detect type errors.
 
         Runs mypy with --output=json to get structured output, then
@@ -323,18 +419,41 @@ class StaticBugDetector:
         Args:
             path: Optional path to file or directory. If None, runs
                 mypy on the current directory.
+            files: Explicit files to check instead of ``path``. An empty
+                list checks nothing.
+            strict: Return None instead of an empty list when mypy times
+                out, crashes or reports errors that can't be parsed.
 
         Returns:
             List of StaticBugReport instances for each type error.
             Returns empty list if mypy is not available or if no errors found.
         """
+        failed: Optional[list[StaticBugReport]] = None if strict else []
+
         if not self._tool_available("mypy"):
             logger.warning("mypy not available, skipping type detection")
             return []
 
+        if files:
+            # mypy only applies its exclude setting to files it discovers
+            try:
+                patterns = [re.compile(p) for p in _mypy_exclude_patterns()]
+            except re.error as e:
+                logger.warning(f"Ignoring invalid mypy exclude pattern: {e}")
+                patterns = []
+            files = [
+                f for f in files
+                if not any(p.search(f.replace(os.sep, "/")) for p in patterns)
+            ]
+
+        if files is not None and not files:
+            return []
+
         # Build command
         cmd = ["mypy", "--output=json"]
-        if path:
+        if files:
+            cmd.extend(files)
+        elif path:
             cmd.append(path)
         else:
             cmd.append(".")
@@ -351,20 +470,27 @@ class StaticBugDetector:
             stdout = result.stdout
 
             if not stdout.strip():
-                # No output means no errors
+                # No output means no errors, unless mypy itself failed
+                if result.returncode != 0:
+                    logger.warning(f"mypy exited with {result.returncode}: {result.stderr.strip()}")
+                    return failed
                 return []
 
-            return self._parse_mypy_json(stdout)
+            bugs = self._parse_mypy_json(stdout)
+            if not bugs and result.returncode != 0:
+                logger.warning("mypy reported errors but no JSON findings could be parsed")
+                return failed
+            return bugs
 
         except subprocess.TimeoutExpired:
             logger.warning("mypy timed out after 300 seconds")
-            return []
+            return failed
         except subprocess.SubprocessError as e:
             logger.warning(f"Failed to run mypy: {e}")
-            return []
+            return failed
         except Exception as e:
             logger.warning(f"Unexpected error running mypy: {e}")
-            return []
+            return failed
 
     def _map_ruff_severity(
         self, code: str
@@ -449,7 +575,13 @@ class StaticBugDetector:
 
         return bugs
 
-    def detect_from_lint(self, path: str | None = None) -> list[StaticBugReport]:
+    def detect_from_lint(
+        self,
+        path: str | None = None,
+        files: list[str] | None = None,
+        *,
+        strict: bool = False,
+    ) -> Optional[list[StaticBugReport]]:
         """Run ruff and detect lint issues.
 
         Runs ruff with --output-format=json to get structured output, then
@@ -458,18 +590,31 @@ class StaticBugDetector:
         Args:
             path: Optional path to file or directory to lint. If None, runs
                 ruff on the current directory.
+            files: Explicit files to lint instead of ``path``. An empty
+                list lints nothing.
+            strict: Return None instead of an empty list when ruff times
+                out, terminates abnormally or prints unparseable output.
 
         Returns:
             List of StaticBugReport instances for each lint issue.
             Returns empty list if ruff is not available or if no issues found.
         """
+        failed: Optional[list[StaticBugReport]] = None if strict else []
+
         if not self._tool_available("ruff"):
             logger.warning("ruff not available, skipping lint detection")
             return []
 
+        if files is not None and not files:
+            return []
+
         # Build command
         cmd = ["ruff", "check", "--output-format=json"]
-        if path:
+        if files:
+            # Apply configured excludes to explicitly passed files too
+            cmd.append("--force-exclude")
+            cmd.extend(files)
+        elif path:
             cmd.append(path)
 
         try:
@@ -483,6 +628,11 @@ class StaticBugDetector:
             # ruff outputs JSON to stdout
             stdout = result.stdout.strip()
 
+            # Exit code 2 means ruff terminated abnormally (bad config, crash)
+            if result.returncode not in (0, 1):
+                logger.warning(f"ruff exited with {result.returncode}: {result.stderr.strip()}")
+                return failed
+
             if not stdout:
                 # No output means no issues found
                 return []
@@ -491,24 +641,24 @@ class StaticBugDetector:
                 json_data = json.loads(stdout)
             except json.JSONDecodeError as e:
                 logger.warning(f"Failed to parse ruff JSON output: {e}")
-                return []
+                return failed
 
             # Ruff outputs a JSON array
             if not isinstance(json_data, list):
                 logger.warning("ruff output is not a JSON array")
-                return []
+                return failed
 
             return self._parse_ruff_json(json_data)
 
         except subprocess.TimeoutExpired:
             logger.warning("ruff timed out after 120 seconds")
-            return []
+            return failed
         except subprocess.SubprocessError as e:
             logger.warning(f"Failed to run ruff: {e}")
-            return []
+            return failed
         except Exception as e:
             logger.warning(f"Unexpected error running ruff: {e}")
-            return []
+            return failed
 
     def _deduplicate_bugs(
         self, bugs: list[StaticBugReport]
@@ -536,16 +686,173 @@ class StaticBugDetector:
 
         return unique_bugs
 
-    def detect_all(self, path: str | None = None) -> StaticAnalysisResult:
+    # Incremental analysis
+
+    def _cache_path(self) -> Optional[Path]:
+        return self.cache_dir / "findings.json" if self.cache_dir else None
+
+    def _load_findings(self) -> dict[str, dict[str, dict]]:
+        """Load the per-file findings cache (once per detector)."""
+        if self._findings is not None:
+            return self._findings
+
+        findings: dict[str, dict[str, dict]] = {tool: {} for tool in _PER_FILE_TOOLS}
+        cache_path = self._cache_path()
+        if cache_path is not None:
+            try:
+                data = json.loads(cache_path.read_text())
+                if data.get("version") == FINDINGS_CACHE_VERSION:
+                    for tool in _PER_FILE_TOOLS:
+                        findings[tool] = dict(data["tools"].get(tool, {}))
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                pass
+        self._findings = findings
+        return findings
+
+    def _save_findings(self) -> None:
+        """Persist the findings cache. Failures only cost a later full run."""
+        cache_path = self._cache_path()
+        if cache_path is None or self._findings is None:
+            return
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = cache_path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps({
+                "version": FINDINGS_CACHE_VERSION,
+                "tools": self._findings,
+            }))
+            temp_path.replace(cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to save static analysis cache: {e}")
+
+    def _python_files(self, path: str | None) -> list[str]:
+        """All Python files under ``path`` (or the working directory)."""
+        root = path or "."
+        if os.path.isfile(root):
+            return [_normalize_path(root)] if root.endswith(".py") else []
+
+        files = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+            for name in filenames:
+                if name.endswith(".py"):
+                    files.append(_normalize_path(os.path.join(dirpath, name)))
+        return sorted(files)
+
+    def _git_changed_files(self, since: str) -> Optional[set[str]]:
+        """Files changed since a git ref, plus untracked files.
+
+        Returns:
+            Normalized paths, or None if git could not answer.
+        """
+        changed: set[str] = set()
+        for cmd in (
+            ["git", "diff", "--name-only", "--relative", since],
+            ["git", "ls-files", "--others", "--exclude-standard"],
+        ):
+            try:
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            except (subprocess.SubprocessError, OSError) as e:
+                logger.warning(f"Failed to run git: {e}")
+                return None
+            if result.returncode != 0:
+                logger.warning(f"git failed: {result.stderr.strip()}")
+                return None
+            changed.update(_normalize_path(line) for line in result.stdout.splitlines() if line)
+        return changed
+
+    def _detect_incremental(
+        self,
+        tool: str,
+        detect: Callable[..., Optional[list[StaticBugReport]]],
+        path: str | None,
+        since: str | None,
+    ) -> list[StaticBugReport]:
+        """Run a per-file tool on changed files and merge cached findings.
+
+        Without ``since``, a file is re-checked when its content hash
+        differs from the cached one (so the first run checks everything).
+        With ``since``, only files git reports as changed since that ref,
+        or cached files edited since the last run, are checked; files with
+        no cached findings are otherwise left out. Cached findings are
+        reused for every file that is not re-checked.
+
+        If the tool fails (timeout, crash, unparseable output) its cache is
+        left untouched, so the stale files are re-checked next time, and
+        only the cached findings of files that did not change are returned.
+
+        mypy findings in one file can depend on other files, so a cached
+        result may miss errors introduced by a change elsewhere; run a
+        full detect_all() periodically.
+        """
+        files = self._python_files(path)
+        hashes = {f: _file_hash(f) for f in files}
+        changed_since = self._git_changed_files(since) if since else None
+
+        with self._cache_lock:
+            cache = self._load_findings()[tool]
+            if changed_since is not None:
+                stale = [
+                    f for f in files
+                    if f in changed_since or (f in cache and cache[f].get("hash") != hashes[f])
+                ]
+            else:
+                stale = [f for f in files if cache.get(f, {}).get("hash") != hashes[f]]
+
+        detected = detect(path, files=stale, strict=True)
+        if detected is None:
+            logger.warning(f"{tool} failed; keeping cached findings for {len(stale)} stale files")
+            with self._cache_lock:
+                cache = self._load_findings()[tool]
+                return [
+                    StaticBugReport.from_dict(bug)
+                    for f in files
+                    if f not in stale
+                    for bug in cache.get(f, {}).get("bugs", [])
+                ]
+
+        fresh: dict[str, list[dict]] = {f: [] for f in stale}
+        for bug in detected:
+            key = _normalize_path(bug.file_path)
+            if key in fresh:
+                fresh[key].append(bug.to_dict())
+
+        with self._cache_lock:
+            cache = self._load_findings()[tool]
+            under_path = set(files)
+            for f in [f for f in cache if f not in under_path]:
+                if path is None or not os.path.exists(f):
+                    del cache[f]
+            for f, bugs in fresh.items():
+                cache[f] = {"hash": hashes[f], "bugs": bugs}
+
+            return [
+                StaticBugReport.from_dict(bug)
+                for f in files
+                for bug in cache.get(f, {}).get("bugs", [])
+            ]
+
+    def detect_all(
+        self,
+        path: str | None = None,
+        incremental: bool = False,
+        since: str | None = None,
+    ) -> StaticAnalysisResult:
         """Run all available static analysis tools and combine results.
 
-        Runs pytest, mypy, and ruff in sequence, collecting all detected bugs.
-        Tools that are not installed are gracefully skipped and recorded in
-        tools_skipped. Duplicate bugs (same file and line) are removed.
+        Runs pytest, mypy, and ruff concurrently, collecting all detected
+        bugs in that tool order. Tools that are not installed are gracefully
+        skipped and recorded in tools_skipped. Duplicate bugs (same file and
+        line) are removed.
 
         Args:
             path: Optional path to file or directory to analyze. If None,
                 runs on the current directory.
+            incremental: Restrict mypy and ruff to changed files and reuse
+                cached findings for the rest. pytest always runs in full.
+            since: Git ref to diff against in incremental mode. Files
+                changed since it are always re-checked; without it, changes
+                are detected by content hash.
 
         Returns:
             StaticAnalysisResult containing all bugs found, which tools ran,
@@ -558,33 +865,32 @@ class StaticBugDetector:
             print(f"Tools run: {result.tools_run}")
             print(f"Tools skipped: {result.tools_skipped}")
         """
-        all_bugs: list[StaticBugReport] = []
-        tools_run: list[str] = []
-        tools_skipped: list[str] = []
-
-        # Run pytest
-        if self._tool_available("pytest"):
-            pytest_bugs = self.detect_from_tests(path)
-            all_bugs.extend(pytest_bugs)
-            tools_run.append("pytest")
-        else:
-            tools_skipped.append("pytest")
+        incremental = incremental or since is not None
+        detectors = {
+            "pytest": self.detect_from_tests,
+            "mypy": self.detect_from_types,
+            "ruff": self.detect_from_lint,
+        }
+
+        def run(tool: str) -> list[StaticBugReport]:
+            if incremental and tool in _PER_FILE_TOOLS:
+                return self._detect_incremental(tool, detectors[tool], path, since)
+            return detectors[tool](path)
+
+        available = [tool for tool in detectors if self._tool_available(tool)]
+        tools_run = available
+        tools_skipped = [tool for tool in detectors if tool not in available]
 
-        # Run mypy
-        if self._tool_available("mypy"):
-            mypy_bugs = self.detect_from_types(path)
-            all_bugs.extend(mypy_bugs)
-            tools_run.append("mypy")
-        else:
-            tools_skipped.append("mypy")
-
-        # Run ruff
-        if self._tool_available("ruff"):
-            ruff_bugs = self.detect_from_lint(path)
-            all_bugs.extend(ruff_bugs)
-            tools_run.append("ruff")
-        else:
-            tools_skipped.append("ruff")
+        all_bugs: list[StaticBugReport] = []
+        if available:
+            with ThreadPoolExecutor(max_workers=len(available)) as executor:
+                futures = [executor.submit(run, tool) for tool in available]
+                for future in futures:
+                    all_bugs.extend(future.result())
+
+        if incremental:
+            with self._cache_lock:
+                self._save_findings()
 
         # Deduplicate bugs
         unique_bugs = self._deduplicate_bugs(all_bugs)
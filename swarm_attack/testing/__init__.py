@@ -5,6 +5,11 @@ This module provides:
 - AdversarialTestGenerator: Generates adversarial test cases from interface specs
 - MutationTestGate (from mutation_test_gate): Validates test quality via actual mutation runs
 - LLMMutationTestGate (from quality_gate_runner): LLM-based mutation analysis
+- CollectabilityChecker: Batched, cached pytest collectability checks
+- PytestReport: Structured pytest results read from JUnit XML reports
+- PytestResultCache: Reuses pytest results for an unchanged working tree
+- CoverageImpactMap: Coverage-based selection of regression tests affected by a change
+- ShardedPytestExecutor: Runs large pytest runs across worker processes
 """
 
 from swarm_attack.testing.mutation_test_gate import (
@@ -33,6 +38,16 @@ from swarm_attack.testing.adversarial_test_generator import (
     GenerationError,
 )
 
+from swarm_attack.testing.collection import CollectabilityChecker
+from swarm_attack.testing.pytest_results import PytestCase, PytestReport, run_pytest
+from swarm_attack.testing.result_cache import PytestResultCache, get_result_cache
+from swarm_attack.testing.impact import CoverageImpactMap, ImpactSelection, get_impact_map
+from swarm_attack.testing.sharding import (
+    FileDurationStore,
+    ShardedPytestExecutor,
+    get_sharded_executor,
+)
+
 __all__ = [
     # Core mutation testing (actual mutmut runner)
     "MutationTestGate",
@@ -53,4 +68,20 @@ __all__ = [
     "AdversarialCategory",
     "MutationTestResult",
     "GenerationError",
+    # Batched collectability checks for regression files
+    "CollectabilityChecker",
+    # Structured pytest results
+    "PytestCase",
+    "PytestReport",
+    "run_pytest",
+    "PytestResultCache",
+    "get_result_cache",
+    # Test impact selection
+    "ImpactSelection",
+    "CoverageImpactMap",
+    "get_impact_map",
+    # Sharded pytest execution
+    "FileDurationStore",
+    "ShardedPytestExecutor",
+    "get_sharded_executor",
 ]
@@ -0,0 +1,329 @@
+"""Batched, cached pytest collectability checks.
+
+Regression checks only run test files that pytest can collect, so that a
+DONE issue whose tests have broken imports doesn't fail every later issue.
+Checking each file with its own ``pytest --collect-only`` pays a cold
+interpreter start per file; CollectabilityChecker instead collects every
+candidate in one pytest process and attributes collection errors back to
+the files that caused them.
+
+Verdicts are cached keyed on the content hash of the test file, the local
+modules it imports (transitively) and the conftest.py files above it, so
+a file is only re-collected when something that could change the verdict
+changed. The whole cache is tied to the Python environment, so installing
+a missing package re-collects everything. Timeouts and failures to run
+pytest give no verdict and are never cached.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+import re
+import subprocess
+import threading
+from pathlib import Path
+from typing import Optional
+
+from swarm_attack.testing.result_cache import environment_fingerprint
+from swarm_attack.utils.fs import FileSystemError, safe_write
+
+# Bump when the fingerprint scheme changes; older caches are discarded.
+COLLECTION_CACHE_VERSION = 2
+
+# "___ ERROR collecting tests/foo/test_bar.py ___" headers in pytest output
+_ERROR_COLLECTING = re.compile(r"ERROR collecting (\S+?\.py)\b")
+
+
+class CollectabilityChecker:
+    """
+    Decide which test files pytest can collect.
+
+    check() may be called from several threads; calls run one at a time.
+
+    Example:
+        checker = CollectabilityChecker(repo_root, cache_path=swarm / "cache" / "collect.json")
+        verdicts = checker.check([Path("tests/test_a.py"), Path("tests/test_b.py")])
+    """
+
+    def __init__(
+        self,
+        repo_root: Path,
+        cache_path: Optional[Path] = None,
+        timeout: int = 120,
+    ) -> None:
+        """
+        Initialize the checker.
+
+        Args:
+            repo_root: Repository root; pytest runs here and local imports
+                are resolved against it.
+            cache_path: File for persisting verdicts. None keeps them in
+                memory only.
+            timeout: Seconds allowed for one batched collection run.
+        """
+        self.repo_root = Path(repo_root).resolve()
+        self.cache_path = cache_path
+        self.timeout = timeout
+        self._cache: Optional[dict[str, dict]] = None
+        # module file -> resolved local imports, for one check() call
+        self._imports: dict[Path, tuple[list[Path], list[str]]] = {}
+        # Guards the verdict cache and import map during check()
+        self._lock = threading.Lock()
+
+    def check(self, test_files: list[Path]) -> dict[Path, bool]:
+        """
+        Check whether each test file can be collected.
+
+        Args:
+            test_files: Test files to check.
+
+        Returns:
+            Dict mapping each given path to True if it collects cleanly.
+            Files whose collection timed out or couldn't run are False for
+            this call but are checked again next time.
+        """
+        with self._lock:
+            return self._check(test_files)
+
+    def _check(self, test_files: list[Path]) -> dict[Path, bool]:
+        self._imports = {}
+        cache = self._load_cache()
+        verdicts: dict[Path, bool] = {}
+        pending: dict[Path, str] = {}
+
+        for test_file in test_files:
+            key = self._fingerprint(test_file)
+            entry = cache.get(str(self._resolve(test_file)))
+            if entry is not None and entry.get("key") == key:
+                verdicts[test_file] = bool(entry["collectable"])
+            else:
+                pending[test_file] = key
+
+        if pending:
+            results = self._collect_batch(list(pending))
+            if results is None:
+                # Couldn't attribute errors to files: check them one by one
+                results = {f: self._collect_one(f) for f in pending}
+            for test_file, key in pending.items():
+                verdicts[test_file] = results[test_file] is True
+                if results[test_file] is None:
+                    continue
+                cache[str(self._resolve(test_file))] = {
+                    "key": key,
+                    "collectable": results[test_file],
+                }
+            self._save_cache()
+
+        return verdicts
+
+    # Running pytest
+
+    def _run_collect(self, test_files: list[Path], timeout: int) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            ["pytest", *[str(f) for f in test_files], "--collect-only", "-q"],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            cwd=self.repo_root,
+            env={**os.environ, "PYTHONPATH": str(self.repo_root)},
+        )
+
+    def _collect_batch(self, test_files: list[Path]) -> Optional[dict[Path, Optional[bool]]]:
+        """
+        Collect all files in one pytest process.
+
+        Returns:
+            Verdict per file, or None if failures couldn't be attributed to
+            individual files (timeout, conftest errors, internal errors).
+        """
+        if len(test_files) == 1:
+            return {test_files[0]: self._collect_one(test_files[0])}
+        try:
+            result = self._run_collect(test_files, self.timeout)
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+
+        # Exit code 0: all collected; 5: nothing collected but no errors
+        if result.returncode in (0, 5):
+            return {f: True for f in test_files}
+        # Exit code 2 with per-file error headers: collection errors
+        if result.returncode != 2:
+            return None
+
+        failed = {
+            self._resolve(Path(match))
+            for match in _ERROR_COLLECTING.findall(result.stdout + result.stderr)
+        }
+        candidates = {self._resolve(f) for f in test_files}
+        if not failed or not failed <= candidates:
+            # Errors in conftest.py files etc. can't be pinned on one test file
+            return None
+        return {f: self._resolve(f) not in failed for f in test_files}
+
+    def _collect_one(self, test_file: Path) -> Optional[bool]:
+        """
+        Collect a single file in its own pytest process.
+
+        Returns:
+            Whether the file collects, or None if pytest timed out or
+            couldn't be run.
+        """
+        try:
+            result = self._run_collect([test_file], 30)
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+        # Collection succeeds if exit code is 0 or 5 (no tests collected but no errors)
+        return result.returncode in (0, 5)
+
+    # Fingerprints
+
+    def _resolve(self, path: Path) -> Path:
+        path = Path(path)
+        if not path.is_absolute():
+            path = self.repo_root / path
+        return path.resolve()
+
+    def _fingerprint(self, test_file: Path) -> str:
+        """
+        Hash everything that can change whether ``test_file`` collects.
+
+        Covers the file itself, local modules it imports (transitively),
+        conftest.py files between it and the repo root, and the names of
+        imports that don't resolve locally (so a module appearing later
+        changes the key).
+        """
+        test_file = self._resolve(test_file)
+        digest = hashlib.sha256()
+
+        files: set[Path] = set()
+        unresolved: set[str] = set()
+        queue = [test_file]
+        while queue:
+            path = queue.pop()
+            if path in files:
+                continue
+            files.add(path)
+            local, missing = self._local_imports(path)
+            queue.extend(local)
+            unresolved.update(missing)
+
+        directory = test_file.parent
+        while directory == self.repo_root or self.repo_root in directory.parents:
+            conftest = directory / "conftest.py"
+            if conftest.exists():
+                files.add(conftest)
+            if directory == self.repo_root:
+                break
+            directory = directory.parent
+
+        for path in sorted(files):
+            digest.update(str(path).encode())
+            try:
+                digest.update(hashlib.sha256(path.read_bytes()).digest())
+            except OSError:
+                digest.update(b"<missing>")
+        for name in sorted(unresolved):
+            digest.update(f"?{name}".encode())
+        return digest.hexdigest()
+
+    def _local_imports(self, path: Path) -> tuple[list[Path], list[str]]:
+        """Modules under the repo root imported by ``path``, and unresolved names."""
+        if path in self._imports:
+            return self._imports[path]
+
+        local: list[Path] = []
+        missing: list[str] = []
+        try:
+            tree = ast.parse(path.read_text())
+        except (OSError, SyntaxError, ValueError):
+            self._imports[path] = (local, missing)
+            return local, missing
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    self._add_import(alias.name, local, missing)
+            elif isinstance(node, ast.ImportFrom):
+                base = self._import_base(path, node)
+                if base is None:
+                    continue
+                if base:
+                    self._add_import(base, local, missing)
+                for alias in node.names:
+                    # "from package import module" imports a submodule
+                    submodule = self._module_path(f"{base}.{alias.name}" if base else alias.name)
+                    if submodule is not None:
+                        local.append(submodule)
+
+        self._imports[path] = (local, missing)
+        return local, missing
+
+    def _add_import(self, name: str, local: list[Path], missing: list[str]) -> None:
+        """Record a dotted import and the packages it initializes along the way."""
+        parts = name.split(".")
+        for i in range(1, len(parts) + 1):
+            module = self._module_path(".".join(parts[:i]))
+            if module is not None:
+                local.append(module)
+        if self._module_path(name) is None:
+            missing.append(name)
+
+    def _import_base(self, path: Path, node: ast.ImportFrom) -> Optional[str]:
+        """Dotted module name an ImportFrom refers to, resolving relative levels."""
+        if node.level == 0:
+            return node.module or ""
+        try:
+            package = path.parent.relative_to(self.repo_root).parts
+        except ValueError:
+            return None
+        if node.level - 1 > len(package):
+            return None
+        parts = list(package[: len(package) - (node.level - 1)])
+        if node.module:
+            parts.append(node.module)
+        return ".".join(parts)
+
+    def _module_path(self, name: str) -> Optional[Path]:
+        """Resolve a dotted module name to a file under the repo root."""
+        base = self.repo_root.joinpath(*name.split("."))
+        for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+            if candidate.is_file():
+                return candidate.resolve()
+        return None
+
+    # Cache
+
+    def _load_cache(self) -> dict[str, dict]:
+        if self._cache is not None:
+            return self._cache
+        self._cache = {}
+        if self.cache_path is not None:
+            try:
+                data = json.loads(Path(self.cache_path).read_text())
+                if (
+                    data.get("version") == COLLECTION_CACHE_VERSION
+                    and data.get("environment") == environment_fingerprint()
+                ):
+                    self._cache = dict(data["files"])
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                pass
+        return self._cache
+
+    def _save_cache(self) -> None:
+        """Persist verdicts. Failures only cost a later re-collection."""
+        if self.cache_path is None or self._cache is None:
+            return
+        try:
+            safe_write(
+                Path(self.cache_path),
+                json.dumps({
+                    "version": COLLECTION_CACHE_VERSION,
+                    "environment": environment_fingerprint(),
+                    "files": self._cache,
+                }),
+            )
+        except FileSystemError:
+            pass
@@ -0,0 +1,313 @@
+"""
+Coverage-based test impact selection for regression checks.
+
+Regression checks used to run every DONE issue's tests no matter what the
+current issue touched, so their cost grew with the feature's history. The
+impact map records which source files each test file executes (per-test
+line coverage from pytest-cov) and selects only the tests whose covered
+files intersect the files changed by the current issue. Coverage is
+recorded when an issue's own tests pass, and for regression test files
+that have none yet; those are instrumented in a run of their own so the
+rest of the regression run can still be sharded and cached.
+
+Tests are never skipped on missing information: a test file with no
+recorded coverage, or one that changed itself, always runs. Every Nth
+check runs all candidates anyway as a safety net for dependencies coverage
+can't see (module-level code run at import time, data files).
+
+This module provides:
+- CoverageImpactMap, persisted at .swarm/cache/test_impact.json
+- coverage_args()/read_test_coverage() to record coverage with pytest-cov
+- changed_files(): files changed in a working tree relative to HEAD
+- get_impact_map() to build a map from SwarmConfig when enabled
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import subprocess
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from swarm_attack.utils.fs import FileSystemError, safe_write
+
+if TYPE_CHECKING:
+    from swarm_attack.config import SwarmConfig
+    from swarm_attack.logger import SwarmLogger
+
+
+# Bump when the map layout changes; maps with another version start empty.
+IMPACT_MAP_VERSION = 1
+
+# Changes under these paths never affect tests
+_IGNORED_PREFIXES = (".swarm/",)
+
+
+def coverage_available() -> bool:
+    """
+    Whether pytest-cov and coverage are installed in this interpreter.
+
+    coverage is needed here to read the data. The pytest that runs the
+    tests may still lack pytest-cov; the verifier then turns selection off
+    and reruns without coverage.
+    """
+    return (
+        importlib.util.find_spec("pytest_cov") is not None
+        and importlib.util.find_spec("coverage") is not None
+    )
+
+
+def coverage_args(data_file: Path) -> tuple[list[str], dict[str, str]]:
+    """
+    pytest arguments and environment for recording per-test coverage.
+
+    An empty rcfile next to the data file keeps the project's own coverage
+    settings (source filters, omit patterns) from hiding files.
+
+    Args:
+        data_file: Where coverage writes its data.
+
+    Returns:
+        Tuple of (extra pytest args, extra environment variables).
+    """
+    rcfile = data_file.with_suffix(".rc")
+    rcfile.write_text("[run]\n")
+    args = [
+        "--cov=.",
+        "--cov-context=test",
+        "--cov-report=",
+        f"--cov-config={rcfile}",
+    ]
+    return args, {"COVERAGE_FILE": str(data_file)}
+
+
+def read_test_coverage(data_file: Path, root: Path) -> dict[str, set[str]]:
+    """
+    Map each test file to the source files its tests executed.
+
+    Args:
+        data_file: Coverage data written by a run with coverage_args().
+        root: Directory pytest ran in; paths are made relative to it.
+
+    Returns:
+        Dict of test file -> covered files, both relative to root. Empty if
+        the data can't be read.
+    """
+    try:
+        from coverage import CoverageData
+    except ImportError:
+        return {}
+
+    data = CoverageData(basename=str(data_file))
+    try:
+        data.read()
+    except Exception:
+        return {}
+
+    root = Path(root).resolve()
+    covered: dict[str, set[str]] = {}
+    for measured in data.measured_files():
+        try:
+            source = Path(measured).resolve().relative_to(root).as_posix()
+        except ValueError:
+            continue
+        contexts = set()
+        for line_contexts in data.contexts_by_lineno(measured).values():
+            contexts.update(line_contexts)
+        for context in contexts:
+            # Contexts are "<nodeid>|run"; "" is code run during collection
+            nodeid = context.split("|", 1)[0]
+            if not nodeid:
+                continue
+            test_file = nodeid.split("::", 1)[0]
+            covered.setdefault(test_file, set()).add(source)
+    return covered
+
+
+def changed_files(cwd: Path) -> Optional[set[str]]:
+    """
+    Files changed in a working tree relative to HEAD, untracked included.
+
+    Args:
+        cwd: Repository or worktree root.
+
+    Returns:
+        Paths relative to cwd, or None if git can't tell (not a repository).
+    """
+    changed: set[str] = set()
+    for args in (
+        ["diff", "--name-only", "HEAD"],
+        ["ls-files", "--others", "--exclude-standard"],
+    ):
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                capture_output=True,
+                text=True,
+                timeout=60,
+                cwd=cwd,
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+        if result.returncode != 0:
+            return None
+        changed.update(line.strip() for line in result.stdout.splitlines() if line.strip())
+    return {path for path in changed if not path.startswith(_IGNORED_PREFIXES)}
+
+
+@dataclass
+class ImpactSelection:
+    """Which candidate test files a regression check should run."""
+
+    selected: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    # Candidates with no recorded coverage (always selected)
+    unmapped: list[str] = field(default_factory=list)
+    full_run: bool = False
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for logging."""
+        return {
+            "selected": len(self.selected),
+            "skipped": len(self.skipped),
+            "unmapped": len(self.unmapped),
+            "full_run": self.full_run,
+        }
+
+
+class CoverageImpactMap:
+    """
+    Recorded coverage per test file, used to pick affected tests.
+
+    Example:
+        impact = CoverageImpactMap(swarm_path / "cache" / "test_impact.json")
+        selection = impact.select(candidates, changed_files(repo_root))
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        full_run_every: int = 5,
+        logger: Optional[SwarmLogger] = None,
+    ) -> None:
+        """
+        Initialize the map.
+
+        Args:
+            path: JSON file the map is persisted in.
+            full_run_every: Every Nth selection runs every candidate. 0 or 1
+                disables selection entirely.
+            logger: Optional logger for recording activity.
+        """
+        self.path = Path(path)
+        self.full_run_every = full_run_every
+        self._logger = logger
+        self._lock = threading.Lock()
+
+    def _log(
+        self, event_type: str, data: Optional[dict] = None, level: str = "debug"
+    ) -> None:
+        """Log an event if logger is configured."""
+        if self._logger:
+            self._logger.log(event_type, data, level=level)
+
+    def _load(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get("version") == IMPACT_MAP_VERSION:
+                return data
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {"version": IMPACT_MAP_VERSION, "tests": {}, "checks_since_full_run": 0}
+
+    def _save(self, data: dict) -> None:
+        """Persist the map. Failures only cost later full runs."""
+        try:
+            safe_write(self.path, json.dumps(data))
+        except FileSystemError as e:
+            self._log("test_impact_write_error", {"error": str(e)}, level="warning")
+
+    def covered_files(self, test_file: str) -> Optional[set[str]]:
+        """Files recorded as executed by ``test_file``, or None if unknown."""
+        entry = self._load()["tests"].get(test_file)
+        return set(entry["covers"]) if entry else None
+
+    def select(self, candidates: list[str], changed: Optional[set[str]]) -> ImpactSelection:
+        """
+        Choose which candidate test files to run.
+
+        Args:
+            candidates: Test files (relative to the run directory).
+            changed: Files changed by the current issue, or None if unknown.
+
+        Returns:
+            ImpactSelection; selected keeps the order of candidates.
+        """
+        with self._lock:
+            data = self._load()
+            checks = data.get("checks_since_full_run", 0) + 1
+            full_run = changed is None or checks >= max(self.full_run_every, 1)
+            data["checks_since_full_run"] = 0 if full_run else checks
+            self._save(data)
+
+        selection = ImpactSelection(full_run=full_run)
+        for test_file in candidates:
+            entry = data["tests"].get(test_file)
+            if entry is None:
+                selection.unmapped.append(test_file)
+                selection.selected.append(test_file)
+            elif full_run or test_file in changed or changed & set(entry["covers"]):
+                selection.selected.append(test_file)
+            else:
+                selection.skipped.append(test_file)
+        return selection
+
+    def record(self, coverage: dict[str, set[str]]) -> None:
+        """
+        Store coverage for test files from a passing run.
+
+        Args:
+            coverage: Test file -> covered files, from read_test_coverage().
+        """
+        if not coverage:
+            return
+        now = datetime.now().isoformat()
+        with self._lock:
+            data = self._load()
+            for test_file, covers in coverage.items():
+                data["tests"][test_file] = {"covers": sorted(covers), "recorded_at": now}
+            self._save(data)
+        self._log("test_impact_recorded", {"test_files": len(coverage)})
+
+
+def get_impact_map(
+    config: SwarmConfig,
+    logger: Optional[SwarmLogger] = None,
+) -> Optional[CoverageImpactMap]:
+    """
+    Build the test impact map described by config.test_impact.
+
+    Args:
+        config: SwarmConfig with an optional test_impact section.
+        logger: Optional logger for recording activity.
+
+    Returns:
+        A CoverageImpactMap, or None if selection is disabled or pytest-cov is
+        not installed.
+    """
+    impact_config = getattr(config, "test_impact", None)
+    if getattr(impact_config, "enabled", False) is not True:
+        return None
+    if not coverage_available():
+        return None
+
+    return CoverageImpactMap(
+        Path(config.swarm_path) / "cache" / "test_impact.json",
+        full_run_every=impact_config.full_run_every,
+        logger=logger,
+    )
@@ -0,0 +1,262 @@
+"""Structured pytest results read from JUnit XML reports.
+
+Scraping ``pytest -v`` output with regexes is slow on large regression runs
+and loses detail (which assertion failed, how long each test took). Instead
+run_pytest() asks pytest for a JUnit XML report (``--junitxml``, built into
+pytest, xunit1 flavour so each test case carries its file and line) and
+turns it into a PytestReport with per-test outcome, duration, nodeid and
+failure excerpt.
+
+The report's summary() and failures() return the same dict shapes the
+verifier's text parsers produce, so callers can switch over without
+changing what they hand to other agents.
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import tempfile
+import xml.etree.ElementTree as ET
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+# Characters of failure text kept per test
+EXCERPT_CHARS = 2000
+
+# pytest's exit code for command-line usage errors
+EXIT_USAGE_ERROR = 4
+
+
+@dataclass
+class PytestCase:
+    """Outcome of a single test case."""
+
+    nodeid: str
+    outcome: str  # "passed", "failed", "error" or "skipped"
+    duration_seconds: float
+    file: Optional[str] = None
+    line: Optional[int] = None
+    message: str = ""
+    excerpt: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class PytestReport:
+    """Structured result of one pytest run."""
+
+    exit_code: int
+    output: str
+    cases: list[PytestCase] = field(default_factory=list)
+    duration_seconds: float = 0.0
+    # False when pytest wrote no readable report (e.g. it crashed before the
+    # session finished); only exit_code and output are meaningful then
+    structured: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PytestReport":
+        """Create a PytestReport from dictionary."""
+        return cls(
+            exit_code=data["exit_code"],
+            output=data["output"],
+            cases=[PytestCase(**case) for case in data.get("cases", [])],
+            duration_seconds=data.get("duration_seconds", 0.0),
+            structured=data.get("structured", False),
+        )
+
+    def count(self, outcome: str) -> int:
+        """Number of test cases with the given outcome."""
+        return sum(1 for case in self.cases if case.outcome == outcome)
+
+    def summary(self) -> dict[str, Any]:
+        """Test counts and duration, shaped like VerifierAgent._parse_pytest_output."""
+        passed = self.count("passed")
+        failed = self.count("failed")
+        return {
+            "tests_passed": passed,
+            "tests_failed": failed,
+            "tests_run": passed + failed,
+            "errors": self.count("error"),
+            "skipped": self.count("skipped"),
+            "duration_seconds": round(self.duration_seconds, 2),
+        }
+
+    def failures(self) -> list[dict[str, Any]]:
+        """Failed tests, shaped like VerifierAgent._parse_pytest_failures."""
+        failures = []
+        for case in self.cases:
+            if case.outcome != "failed":
+                continue
+            parts = case.nodeid.split("::")
+            failures.append({
+                "test": parts[-1],
+                "class": parts[-2] if len(parts) > 2 else None,
+                "file": case.file or parts[0],
+                "line": case.line,
+                "error": case.message,
+                "short_message": case.message[:100],
+                "nodeid": case.nodeid,
+                "excerpt": case.excerpt,
+            })
+        return failures
+
+    def slowest(self, limit: int = 10) -> list[dict[str, Any]]:
+        """The slowest test cases, for spotting tests that drag down verification."""
+        ranked = sorted(self.cases, key=lambda c: c.duration_seconds, reverse=True)
+        return [
+            {"nodeid": case.nodeid, "duration_seconds": case.duration_seconds}
+            for case in ranked[:limit]
+        ]
+
+
+def _nodeid(classname: str, name: str, file: Optional[str]) -> str:
+    """Rebuild a pytest nodeid from xunit1 classname/name/file attributes."""
+    if not file:
+        return f"{classname}::{name}" if classname else name
+    module = file[:-3] if file.endswith(".py") else file
+    module = module.replace("/", ".").replace("\\", ".")
+    parts = [file]
+    if classname.startswith(module):
+        parts.extend(p for p in classname[len(module):].split(".") if p)
+    if classname:
+        parts.append(name)
+    return "::".join(parts)
+
+
+def _failure_line(file: Optional[str], text: str, fallback: Optional[int]) -> Optional[int]:
+    """Line in ``file`` where the failure was raised, from the traceback text."""
+    if file:
+        matches = re.findall(rf"{re.escape(file)}:(\d+)", text)
+        if matches:
+            return int(matches[-1])
+    return fallback
+
+
+def parse_junit_xml(path: Path) -> Optional[tuple[list[PytestCase], float]]:
+    """
+    Parse a pytest JUnit XML report.
+
+    Args:
+        path: Report file written by ``pytest --junitxml``.
+
+    Returns:
+        Tuple of (cases, total duration), or None if the report is missing
+        or unreadable.
+    """
+    try:
+        root = ET.parse(path).getroot()
+    except (OSError, ET.ParseError):
+        return None
+
+    suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+    cases: list[PytestCase] = []
+    duration = 0.0
+    for suite in suites:
+        duration += float(suite.get("time") or 0.0)
+        for testcase in suite.iter("testcase"):
+            file = testcase.get("file")
+            line = testcase.get("line")
+            # xunit1 line numbers are 0-based and point at the test definition
+            def_line = int(line) + 1 if line is not None else None
+
+            outcome, detail = "passed", None
+            for tag in ("failure", "error", "skipped"):
+                detail = testcase.find(tag)
+                if detail is not None:
+                    outcome = {"failure": "failed"}.get(tag, tag)
+                    break
+
+            message = ""
+            excerpt = ""
+            if detail is not None:
+                message = detail.get("message") or ""
+                excerpt = (detail.text or "")[:EXCERPT_CHARS]
+
+            cases.append(PytestCase(
+                nodeid=_nodeid(testcase.get("classname") or "", testcase.get("name") or "", file),
+                outcome=outcome,
+                duration_seconds=float(testcase.get("time") or 0.0),
+                file=file,
+                line=_failure_line(file, excerpt, def_line) if outcome == "failed" else def_line,
+                message=message,
+                excerpt=excerpt,
+            ))
+
+    return cases, duration
+
+
+def run_pytest(
+    cmd: list[str],
+    cwd: Path,
+    timeout: int,
+    env: Optional[dict[str, str]] = None,
+) -> PytestReport:
+    """
+    Run a pytest command with a JUnit XML report attached.
+
+    Args:
+        cmd: pytest command line (e.g. ``["pytest", "-v", "tests/test_x.py"]``).
+        cwd: Directory to run in.
+        timeout: Seconds before the run is abandoned.
+        env: Environment for the subprocess.
+
+    Returns:
+        PytestReport for the run.
+
+    Raises:
+        subprocess.TimeoutExpired: If pytest times out.
+        OSError: If pytest cannot be executed.
+    """
+    with tempfile.TemporaryDirectory(prefix="swarm-pytest-") as tmp:
+        report_path = Path(tmp) / "report.xml"
+        result = subprocess.run(
+            [*cmd, f"--junitxml={report_path}", "-o", "junit_family=xunit1"],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            cwd=cwd,
+            env=env,
+        )
+        output = result.stdout
+        if result.stderr:
+            output += "\n" + result.stderr
+
+        report = PytestReport(exit_code=result.returncode, output=output)
+        parsed = parse_junit_xml(report_path)
+
+    if parsed is not None:
+        report.cases, report.duration_seconds = parsed
+        report.structured = True
+    return report
+
+
+def unrecognized_option(report: PytestReport, option: str) -> bool:
+    """
+    Whether pytest rejected ``option`` as an unknown command-line argument.
+
+    That is how a run fails when the plugin providing the option (pytest-cov,
+    pytest-xdist) isn't installed in the environment pytest runs in, which
+    may differ from the one swarm runs in.
+
+    Args:
+        report: Report of the run.
+        option: Option name, e.g. ``"--cov"`` or ``"-n"``.
+    """
+    if report.exit_code != EXIT_USAGE_ERROR:
+        return False
+    marker = "unrecognized arguments:"
+    for line in report.output.splitlines():
+        if marker in line:
+            rejected = line.split(marker, 1)[1].split()
+            if any(arg == option or arg.startswith(f"{option}=") for arg in rejected):
+                return True
+    return False
@@ -0,0 +1,334 @@
+"""
+Cache of pytest results keyed by the exact code they ran against.
+
+Per issue, the baseline check and the verifier's regression check run the
+same DONE-issue test files, and retries repeat both. When nothing under
+test has changed in between, the result is the same, so the run is skipped
+and the stored report returned instead.
+
+This module provides:
+- PytestResultCache, an on-disk cache under .swarm/cache/test_results/
+- working_tree_hash(): a hash of the working tree, tracked and untracked
+  files included, computed with read-only git plumbing so neither the
+  index nor the object database is written
+- environment_fingerprint(): the interpreter, pytest and installed packages
+- get_result_cache() to build a cache from SwarmConfig when enabled
+
+Keys combine the pytest command, the working directory, the tree hash and
+the environment fingerprint, so any edit to a file git can see (outside
+.swarm/, which changes on every run) is an automatic invalidation.
+
+Files matched by .gitignore are not part of the hash. Tests that read
+ignored inputs (a .env file, generated fixtures, local data) can be served
+a stale result after those change; disable test_cache for such projects,
+or clear .swarm/cache/test_results/ after editing them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import shutil
+import subprocess
+import sys
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from swarm_attack.testing.pytest_results import PytestReport
+from swarm_attack.utils.fs import ensure_dir, safe_write
+
+if TYPE_CHECKING:
+    from swarm_attack.config import SwarmConfig
+    from swarm_attack.logger import SwarmLogger
+
+
+# Bump when the key scheme or entry layout changes; older entries are misses.
+TEST_CACHE_VERSION = 2
+
+# Paths left out of the tree hash: swarm's own state changes on every run
+_EXCLUDED_PATHS = (".swarm",)
+
+
+def _git(args: list[str], cwd: Path, input: Optional[str] = None) -> Optional[str]:
+    """Run a git command, returning stdout or None on failure.
+
+    Output is stripped unless the command uses ``-z``, whose NUL-separated
+    paths may start or end with whitespace.
+    """
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            capture_output=True,
+            text=True,
+            timeout=60,
+            cwd=cwd,
+            input=input,
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout if "-z" in args else result.stdout.strip()
+
+
+def _split_z(output: str) -> list[str]:
+    """Split NUL-terminated ``-z`` output into its records."""
+    return [record for record in output.split("\0") if record]
+
+
+def working_tree_hash(cwd: Path) -> Optional[str]:
+    """
+    Hash the working tree as git sees it, including uncommitted changes.
+
+    Starts from the object ids recorded in the index, then re-hashes the
+    tracked files that git's stat check reports as modified and every
+    untracked, non-ignored file with ``git hash-object`` (without ``-w``).
+    Nothing is written to the index or the object database, and clean
+    tracked files are never read.
+
+    Args:
+        cwd: Any directory inside the repository or worktree.
+
+    Returns:
+        A hex SHA-256 of every path and blob id, or None if cwd is not in
+        a git repository.
+    """
+    top = _git(["rev-parse", "--show-toplevel"], cwd)
+    if top is None:
+        return None
+    top_path = Path(top)
+    pathspec = ["--", ".", *[f":(exclude){p}" for p in _EXCLUDED_PATHS]]
+
+    staged = _git(["ls-files", "--stage", "-z", *pathspec], top_path)
+    modified = _git(["diff-files", "--name-only", "-z", *pathspec], top_path)
+    untracked = _git(
+        ["ls-files", "--others", "--exclude-standard", "-z", *pathspec], top_path
+    )
+    if staged is None or modified is None or untracked is None:
+        return None
+
+    # path -> blob id ("mode oid stage\tpath" records)
+    blobs: dict[str, str] = {}
+    for record in _split_z(staged):
+        info, _, path = record.partition("\t")
+        blobs[path] = info.split()[1]
+
+    changed = _split_z(modified) + _split_z(untracked)
+    for path in changed:
+        blobs.pop(path, None)
+    present = [path for path in changed if (top_path / path).is_file()]
+    if present:
+        oids = _git(["hash-object", "--stdin-paths"], top_path, input="\n".join(present) + "\n")
+        if oids is None:
+            return None
+        blobs.update(zip(present, oids.splitlines()))
+
+    digest = hashlib.sha256()
+    for path in sorted(blobs):
+        digest.update(f"{path}\0{blobs[path]}\0".encode())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def environment_fingerprint() -> str:
+    """
+    Fingerprint the Python environment tests run in.
+
+    Covers the interpreter, the pytest executable on PATH and every
+    installed distribution's version. Computed once per process.
+    """
+    digest = hashlib.sha256()
+    digest.update(sys.executable.encode())
+    digest.update(sys.version.encode())
+    digest.update(str(shutil.which("pytest")).encode())
+    packages = sorted(
+        f"{dist.metadata['Name']}=={dist.version}"
+        for dist in metadata.distributions()
+    )
+    for package in packages:
+        digest.update(package.encode())
+    return digest.hexdigest()
+
+
+class PytestResultCache:
+    """
+    On-disk cache of pytest reports.
+
+    Entries live at ``<cache_dir>/<key[:2]>/<key>.json`` and are written
+    atomically. When there are more than ``max_entries`` the least
+    recently used are removed.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | str,
+        *,
+        max_entries: int = 200,
+        logger: Optional[SwarmLogger] = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries.
+            max_entries: Number of results kept; older ones are evicted.
+            logger: Optional logger for recording cache activity.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self._logger = logger
+
+    def _log(
+        self, event_type: str, data: Optional[dict] = None, level: str = "debug"
+    ) -> None:
+        """Log an event if logger is configured."""
+        if self._logger:
+            self._logger.log(event_type, data, level=level)
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the file path for a cache key."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def make_key(self, cmd: list[str], cwd: Path) -> Optional[str]:
+        """
+        Build the key for running ``cmd`` in ``cwd`` against the current tree.
+
+        Args:
+            cmd: The pytest command line.
+            cwd: Directory pytest runs in.
+
+        Returns:
+            Hex SHA-256 key, or None if the tree can't be hashed (not a git
+            repository), in which case the run must not be cached.
+        """
+        tree = working_tree_hash(cwd)
+        if tree is None:
+            return None
+        canonical = json.dumps(
+            {
+                "version": TEST_CACHE_VERSION,
+                "cmd": cmd,
+                "cwd": str(Path(cwd).resolve()),
+                "tree": tree,
+                "env": environment_fingerprint(),
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[PytestReport]:
+        """
+        Look up a stored report.
+
+        Args:
+            key: Key from make_key().
+
+        Returns:
+            The stored report, or None on a miss.
+        """
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            if entry.get("version") != TEST_CACHE_VERSION:
+                return None
+            report = PytestReport.from_dict(entry["report"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        try:
+            path.touch()
+        except OSError:
+            pass
+        self._log("test_cache_hit", {"key": key[:12]})
+        return report
+
+    def put(self, key: str, report: PytestReport) -> None:
+        """
+        Store a report, then evict if over max_entries.
+
+        Write failures are logged and otherwise ignored; a missing entry
+        only costs a later re-run.
+
+        Args:
+            key: Key from make_key().
+            report: Report of the run.
+        """
+        path = self._entry_path(key)
+        entry = {"version": TEST_CACHE_VERSION, "report": report.to_dict()}
+        try:
+            ensure_dir(path.parent)
+            safe_write(path, json.dumps(entry))
+        except Exception as e:
+            self._log("test_cache_write_error", {"error": str(e)}, level="warning")
+            return
+
+        self._evict()
+
+    def _entries(self) -> list[tuple[float, Path]]:
+        """List (mtime, path) for every entry on disk."""
+        entries = []
+        if not self.cache_dir.exists():
+            return entries
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        return entries
+
+    def _evict(self) -> None:
+        """Remove least recently used entries past max_entries."""
+        entries = self._entries()
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return
+        for _, path in sorted(entries)[:excess]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        self._log("test_cache_evicted", {"entries": excess})
+
+    def clear(self) -> int:
+        """
+        Remove every cache entry.
+
+        Returns:
+            Number of entries removed.
+        """
+        removed = 0
+        for _, path in self._entries():
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+
+def get_result_cache(
+    config: SwarmConfig,
+    logger: Optional[SwarmLogger] = None,
+) -> Optional[PytestResultCache]:
+    """
+    Build the test result cache described by config.test_cache.
+
+    Args:
+        config: SwarmConfig with an optional test_cache section.
+        logger: Optional logger for recording cache activity.
+
+    Returns:
+        A PytestResultCache, or None if caching is disabled.
+    """
+    cache_config = getattr(config, "test_cache", None)
+    if getattr(cache_config, "enabled", False) is not True:
+        return None
+
+    return PytestResultCache(
+        Path(config.swarm_path) / "cache" / "test_results",
+        max_entries=cache_config.max_entries,
+        logger=logger,
+    )
@@ -0,0 +1,374 @@
+"""
+Sharded, parallel pytest execution for large verifier runs.
+
+Full-suite and large targeted regression runs used a single pytest process
+on one core. ShardedPytestExecutor spreads them across worker processes:
+
+- With pytest-xdist installed, pytest does the work itself
+  (``-n <workers> --dist loadfile``), still producing one JUnit report.
+  If the pytest the tests run under rejects those options, the executor
+  switches to built-in shards for that run and every later one.
+- Otherwise test files are split into shards balanced by their historical
+  durations (longest-first onto the least loaded shard), each shard runs
+  in its own pytest process concurrently, and the shard reports are merged
+  into one PytestReport.
+
+Per-file durations are learned from every structured report and kept in
+.swarm/cache/test_durations.json.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from statistics import median
+from typing import TYPE_CHECKING, Optional
+
+from swarm_attack.testing.pytest_results import (
+    PytestReport,
+    run_pytest,
+    unrecognized_option,
+)
+from swarm_attack.utils.fs import FileSystemError, safe_write
+
+if TYPE_CHECKING:
+    from swarm_attack.config import SwarmConfig
+    from swarm_attack.logger import SwarmLogger
+
+
+# Assumed duration for a file with no history when nothing is known at all
+DEFAULT_FILE_SECONDS = 1.0
+
+
+def xdist_available() -> bool:
+    """
+    Whether pytest-xdist is installed in this interpreter.
+
+    Only a first guess: tests may run under a different pytest, so
+    ShardedPytestExecutor.run() falls back to built-in shards if xdist's
+    options are rejected.
+    """
+    return importlib.util.find_spec("xdist") is not None
+
+
+class FileDurationStore:
+    """Historical per-file test durations, persisted as JSON."""
+
+    def __init__(self, path: Path) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            path: JSON file the durations are kept in.
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def load(self) -> dict[str, float]:
+        """Get seconds per test file (relative to the run directory)."""
+        try:
+            data = json.loads(self.path.read_text())
+            return {str(k): float(v) for k, v in data.items()}
+        except (OSError, ValueError, AttributeError, TypeError):
+            return {}
+
+    def update(self, report: PytestReport) -> None:
+        """
+        Record the per-file durations from a structured report.
+
+        Args:
+            report: Report of a completed run.
+        """
+        if not report.structured:
+            return
+        per_file: dict[str, float] = {}
+        for case in report.cases:
+            if case.file:
+                per_file[case.file] = per_file.get(case.file, 0.0) + case.duration_seconds
+        if not per_file:
+            return
+        with self._lock:
+            durations = self.load()
+            durations.update({f: round(s, 3) for f, s in per_file.items()})
+            try:
+                safe_write(self.path, json.dumps(durations))
+            except FileSystemError:
+                pass
+
+
+def plan_shards(
+    test_files: list[str],
+    durations: dict[str, float],
+    workers: int,
+) -> list[list[str]]:
+    """
+    Split test files into balanced shards.
+
+    Files are placed longest-first onto the currently lightest shard. Files
+    without history are assumed to take the median known duration.
+
+    Args:
+        test_files: Files to distribute.
+        durations: Historical seconds per file.
+        workers: Number of shards wanted.
+
+    Returns:
+        Non-empty shards; fewer than ``workers`` if there are fewer files.
+    """
+    known = [durations[f] for f in test_files if f in durations]
+    default = median(known) if known else DEFAULT_FILE_SECONDS
+    weighted = sorted(
+        test_files, key=lambda f: durations.get(f, default), reverse=True
+    )
+
+    shards: list[list[str]] = [[] for _ in range(max(1, min(workers, len(test_files))))]
+    loads = [0.0] * len(shards)
+    for test_file in weighted:
+        lightest = loads.index(min(loads))
+        shards[lightest].append(test_file)
+        loads[lightest] += durations.get(test_file, default)
+    return [shard for shard in shards if shard]
+
+
+def merge_reports(reports: list[PytestReport], wall_seconds: float) -> PytestReport:
+    """
+    Combine shard reports into one report for the whole run.
+
+    The exit code is the most severe one (collection/internal errors, then
+    test failures, then "no tests collected" only if every shard had none).
+    A combined pytest-style summary line is appended to the output so text
+    parsing still sees the totals.
+
+    Args:
+        reports: One report per shard.
+        wall_seconds: Elapsed time of the whole sharded run.
+
+    Returns:
+        The merged report; structured only if every shard's was.
+    """
+    codes = [r.exit_code for r in reports]
+    if all(code == 5 for code in codes):
+        exit_code = 5
+    else:
+        failing = [code for code in codes if code not in (0, 5)]
+        exit_code = max(failing, key=lambda c: (c != 1, c)) if failing else 0
+
+    outputs = [
+        f"---------- shard {i + 1}/{len(reports)} ----------\n{r.output}"
+        for i, r in enumerate(reports)
+    ]
+    merged = PytestReport(
+        exit_code=exit_code,
+        output="",
+        cases=[case for r in reports for case in r.cases],
+        duration_seconds=wall_seconds,
+        structured=all(r.structured for r in reports),
+    )
+    if merged.structured:
+        summary = merged.summary()
+        parts = [
+            f"{summary[key]} {label}"
+            for key, label in (
+                ("tests_failed", "failed"),
+                ("tests_passed", "passed"),
+                ("skipped", "skipped"),
+                ("errors", "error"),
+            )
+            if summary[key]
+        ]
+        outputs.append(
+            f"========== {', '.join(parts) or 'no tests ran'} in {wall_seconds:.2f}s =========="
+        )
+    merged.output = "\n".join(outputs)
+    return merged
+
+
+class ShardedPytestExecutor:
+    """
+    Run pytest across several worker processes.
+
+    Example:
+        executor = ShardedPytestExecutor(workers=8, durations=FileDurationStore(path))
+        report = executor.run(["-v", "--tb=short"], test_files, cwd=repo, timeout=600)
+    """
+
+    def __init__(
+        self,
+        workers: int = 0,
+        *,
+        min_files: int = 4,
+        durations: Optional[FileDurationStore] = None,
+        use_xdist: Optional[bool] = None,
+        logger: Optional[SwarmLogger] = None,
+    ) -> None:
+        """
+        Initialize the executor.
+
+        Args:
+            workers: Worker processes; 0 means one per CPU.
+            min_files: Targeted runs with fewer files aren't worth sharding.
+            durations: Historical durations for balancing built-in shards.
+            use_xdist: Force pytest-xdist on or off; None detects it.
+            logger: Optional logger for recording shard plans.
+        """
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.min_files = min_files
+        self.durations = durations
+        self.use_xdist = xdist_available() if use_xdist is None else use_xdist
+        self._logger = logger
+
+    def _log(
+        self, event_type: str, data: Optional[dict] = None, level: str = "debug"
+    ) -> None:
+        """Log an event if logger is configured."""
+        if self._logger:
+            self._logger.log(event_type, data, level=level)
+
+    def should_shard(self, test_files: Optional[list[str]]) -> bool:
+        """
+        Whether a run is big enough to shard.
+
+        Args:
+            test_files: Files to run, or None for the full suite.
+        """
+        if self.workers < 2:
+            return False
+        return test_files is None or len(test_files) >= self.min_files
+
+    def run(
+        self,
+        options: list[str],
+        test_files: Optional[list[str]],
+        cwd: Path,
+        timeout: int,
+        env: Optional[dict[str, str]] = None,
+    ) -> PytestReport:
+        """
+        Run the tests sharded across workers.
+
+        Args:
+            options: pytest options (e.g. ``["-v", "--tb=short"]``).
+            test_files: Files to run, or None for the full suite.
+            cwd: Directory to run in.
+            timeout: Seconds allowed for each pytest process.
+            env: Environment for the subprocesses.
+
+        Returns:
+            One PytestReport covering every shard.
+
+        Raises:
+            subprocess.TimeoutExpired: If any pytest process times out.
+            OSError: If pytest cannot be executed.
+        """
+        targets = test_files or []
+        if self.use_xdist:
+            self._log("pytest_sharded", {"mode": "xdist", "workers": self.workers})
+            cmd = ["pytest", *options, "-n", str(self.workers), "--dist", "loadfile", *targets]
+            report = run_pytest(cmd, cwd=cwd, timeout=timeout, env=env)
+            if not unrecognized_option(report, "-n"):
+                self.record(report)
+                return report
+            # The pytest on PATH doesn't have pytest-xdist
+            self._log("pytest_xdist_unavailable", {"cwd": str(cwd)}, level="warning")
+            self.use_xdist = False
+
+        if test_files is None:
+            test_files = self._collect_files(cwd, timeout, env)
+        if not test_files or len(test_files) < 2:
+            report = run_pytest(["pytest", *options, *targets], cwd=cwd, timeout=timeout, env=env)
+            self.record(report)
+            return report
+
+        # Durations are recorded under rootdir-relative paths
+        by_name = {self._relative(f, cwd): f for f in test_files}
+        history = self.durations.load() if self.durations else {}
+        shards = [
+            [by_name[name] for name in shard]
+            for shard in plan_shards(list(by_name), history, self.workers)
+        ]
+        self._log("pytest_sharded", {
+            "mode": "builtin",
+            "shards": len(shards),
+            "files": len(test_files),
+        })
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+            futures = [
+                pool.submit(run_pytest, ["pytest", *options, *shard], cwd, timeout, env)
+                for shard in shards
+            ]
+            reports = [f.result() for f in futures]
+
+        report = merge_reports(reports, time.monotonic() - start)
+        self.record(report)
+        return report
+
+    def record(self, report: PytestReport) -> None:
+        """Learn per-file durations from a report."""
+        if self.durations is not None:
+            self.durations.update(report)
+
+    @staticmethod
+    def _relative(path: str, cwd: Path) -> str:
+        """Express a test file path relative to cwd when possible."""
+        try:
+            return Path(cwd, path).resolve().relative_to(Path(cwd).resolve()).as_posix()
+        except ValueError:
+            return path
+
+    def _collect_files(
+        self, cwd: Path, timeout: int, env: Optional[dict[str, str]]
+    ) -> Optional[list[str]]:
+        """List the suite's test files, or None if collection fails."""
+        try:
+            result = subprocess.run(
+                ["pytest", "--collect-only", "-q"],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                cwd=cwd,
+                env=env,
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+        if result.returncode != 0:
+            return None
+
+        files: dict[str, None] = {}
+        for line in result.stdout.splitlines():
+            if "::" in line:
+                files[line.split("::", 1)[0].strip()] = None
+        return list(files)
+
+
+def get_sharded_executor(
+    config: SwarmConfig,
+    logger: Optional[SwarmLogger] = None,
+) -> Optional[ShardedPytestExecutor]:
+    """
+    Build the executor described by config.test_sharding.
+
+    Args:
+        config: SwarmConfig with an optional test_sharding section.
+        logger: Optional logger for recording shard plans.
+
+    Returns:
+        A ShardedPytestExecutor, or None if sharding is disabled.
+    """
+    sharding_config = getattr(config, "test_sharding", None)
+    if getattr(sharding_config, "enabled", False) is not True:
+        return None
+
+    return ShardedPytestExecutor(
+        sharding_config.workers,
+        min_files=sharding_config.min_files,
+        durations=FileDurationStore(Path(config.swarm_path) / "cache" / "test_durations.json"),
+        logger=logger,
+    )
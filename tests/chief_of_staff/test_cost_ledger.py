@@ -0,0 +1,162 @@
+"""Tests for the rolling cost ledger.
+
+Tests verify:
+- Costs from EventLogger and SwarmEvent records roll up per day,
+  per feature and per agent
+- Refreshes fold in only newly appended lines and survive reloads
+- Truncated or replaced logs trigger a rebuild
+- StateGatherer.calculate_costs() answers from the ledger
+"""
+
+import json
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from swarm_attack.chief_of_staff.cost_ledger import CostLedger, event_cost
+from swarm_attack.chief_of_staff.state_gatherer import StateGatherer
+
+
+@pytest.fixture
+def swarm_dir(tmp_path):
+    (tmp_path / ".swarm" / "events").mkdir(parents=True)
+    return tmp_path / ".swarm"
+
+
+def append(path, *events):
+    with open(path, "a") as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+def at(day):
+    return datetime.combine(day, datetime.min.time()).isoformat()
+
+
+TODAY = datetime.now().date()
+
+
+class TestEventCost:
+    """Cost extraction handles every event shape we write."""
+
+    def test_shapes(self):
+        assert event_cost({"cost": 1.5}) == 1.5
+        assert event_cost({"cost_usd": 2.0}) == 2.0
+        assert event_cost({"payload": {"cost_usd": 0.5}}) == 0.5
+        assert event_cost({"event": "issue_started"}) == 0.0
+        assert event_cost({"cost": "lots"}) == 0.0
+
+
+class TestCostLedger:
+    """Rollups and incremental refresh."""
+
+    def test_rollups(self, swarm_dir):
+        """Costs are grouped by day, feature and agent."""
+        events = swarm_dir / "events"
+        append(
+            events / "feat.jsonl",
+            {"ts": at(TODAY) + "Z", "event": "issue_done", "cost_usd": 1.0},
+            {"ts": at(TODAY - timedelta(days=3)), "event": "issue_done", "cost_usd": 2.0},
+        )
+        append(
+            events / f"events-{TODAY.isoformat()}.jsonl",
+            {"timestamp": at(TODAY), "feature_id": "other", "source_agent": "coder",
+             "payload": {"cost_usd": 0.5}},
+        )
+        ledger = CostLedger(swarm_dir)
+
+        assert ledger.today() == 1.5
+        assert ledger.week() == 3.5
+        assert ledger.by_feature(TODAY, TODAY) == {"feat": 1.0, "other": 0.5}
+        assert ledger.by_agent(TODAY - timedelta(days=7), TODAY) == {"coder": 0.5}
+        assert ledger.day(TODAY - timedelta(days=3)).total == 2.0
+
+    def test_only_new_lines_consumed(self, swarm_dir):
+        """A refresh after an append adds just the new cost."""
+        log = swarm_dir / "events" / "feat.jsonl"
+        append(log, {"ts": at(TODAY), "cost_usd": 1.0})
+        ledger = CostLedger(swarm_dir)
+        assert ledger.today() == 1.0
+
+        append(log, {"ts": at(TODAY), "cost_usd": 2.0})
+
+        assert ledger.today() == 3.0
+        assert ledger._sources["feat.jsonl"]["size"] == log.stat().st_size
+
+    def test_partial_line_deferred(self, swarm_dir):
+        """A line still being written is counted once it is complete."""
+        log = swarm_dir / "events" / "feat.jsonl"
+        line = json.dumps({"ts": at(TODAY), "cost_usd": 1.0})
+        log.write_text(line[:10])
+        ledger = CostLedger(swarm_dir)
+        assert ledger.today() == 0.0
+
+        with open(log, "a") as f:
+            f.write(line[10:] + "\n")
+
+        assert ledger.today() == 1.0
+
+    def test_persisted_across_instances(self, swarm_dir):
+        """A new instance reuses the saved rollups instead of rescanning."""
+        log = swarm_dir / "events" / "feat.jsonl"
+        append(log, {"ts": at(TODAY), "cost_usd": 1.0})
+        CostLedger(swarm_dir).refresh()
+
+        # Rewrite the log in place with the same size: a rescan would find no cost
+        stat = log.stat()
+        log.write_text(" " * (stat.st_size - 1) + "\n")
+
+        assert CostLedger(swarm_dir).today() == 1.0
+
+    def test_truncated_log_rebuilds(self, swarm_dir):
+        """A log that shrinks is recounted from scratch."""
+        log = swarm_dir / "events" / "feat.jsonl"
+        append(log, {"ts": at(TODAY), "cost_usd": 1.0}, {"ts": at(TODAY), "cost_usd": 2.0})
+        ledger = CostLedger(swarm_dir)
+        assert ledger.today() == 3.0
+
+        log.write_text("")
+        append(log, {"ts": at(TODAY), "cost_usd": 0.5})
+
+        assert ledger.today() == 0.5
+
+    def test_range_queries(self, swarm_dir):
+        """total() covers inclusive date ranges."""
+        append(
+            swarm_dir / "events" / "feat.jsonl",
+            {"ts": "2025-01-01T10:00:00", "cost_usd": 1.0},
+            {"ts": "2025-01-31T10:00:00", "cost_usd": 2.0},
+            {"ts": "2025-02-01T10:00:00", "cost_usd": 4.0},
+        )
+        ledger = CostLedger(swarm_dir)
+
+        assert ledger.total(date(2025, 1, 1), date(2025, 1, 31)) == 3.0
+        assert ledger.total(date(2025, 2, 1), date(2025, 2, 28)) == 4.0
+
+
+class TestStateGathererCosts:
+    """StateGatherer uses the ledger for its cost totals."""
+
+    def test_calculate_costs(self, swarm_dir):
+        append(
+            swarm_dir / "events" / "feat.jsonl",
+            {"timestamp": at(TODAY), "cost": 1.0},
+            {"timestamp": at(TODAY - timedelta(days=6)), "cost": 2.0},
+            {"timestamp": at(TODAY - timedelta(days=30)), "cost": 4.0},
+        )
+        gatherer = StateGatherer(config=None)
+        gatherer._root = swarm_dir.parent
+
+        assert gatherer.calculate_costs() == (1.0, 3.0)
+        assert (swarm_dir / "cache" / "costs" / "ledger.json").exists()
+
+
+class TestReadOnlyLedger:
+    """An unwritable costs directory degrades to an in-memory ledger."""
+
+    def test_unwritable_costs_dir(self, swarm_dir):
+        append(swarm_dir / "events" / "feat.jsonl", {"ts": at(TODAY), "cost_usd": 1.0})
+        (swarm_dir / "cache").mkdir()
+        (swarm_dir / "cache" / "costs").write_text("not a directory")
+
+        assert CostLedger(swarm_dir).today() == 1.0
@@ -0,0 +1,233 @@
+"""Tests for the parallel-safe execution strategy in AutopilotRunner.
+
+Tests verify:
+- Independent goals run concurrently, up to max_parallel_goals
+- Goals sharing a lane (working tree, spec agents) never overlap
+- Estimated costs are reserved against the budget before launch and
+  reconciled with actual costs
+- Callbacks and checkpoint daily cost are reported once per goal
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from swarm_attack.chief_of_staff.autopilot_runner import (
+    AutopilotRunner,
+    DependencyGraph,
+    ExecutionStrategy,
+    GoalExecutionResult,
+)
+from swarm_attack.chief_of_staff.autopilot import AutopilotSession, AutopilotState
+from swarm_attack.chief_of_staff.autopilot_store import AutopilotSessionStore
+from swarm_attack.chief_of_staff.checkpoints import CheckpointSystem
+from swarm_attack.chief_of_staff.config import AutopilotConfig, ChiefOfStaffConfig
+from swarm_attack.chief_of_staff.goal_tracker import DailyGoal, GoalPriority, GoalStatus
+
+
+@pytest.fixture
+def mock_config(tmp_path):
+    """Create a mock config with PARALLEL_SAFE strategy."""
+    config = MagicMock(spec=ChiefOfStaffConfig)
+    config.storage_path = str(tmp_path)
+    config.budget_usd = 100.0
+    config.duration_minutes = 120
+    config.min_execution_budget = 0.1
+
+    autopilot_config = MagicMock(spec=AutopilotConfig)
+    autopilot_config.execution_strategy = ExecutionStrategy.PARALLEL_SAFE
+    autopilot_config.max_parallel_goals = 3
+    config.autopilot = autopilot_config
+
+    return config
+
+
+@pytest.fixture
+def runner(mock_config):
+    """Create an AutopilotRunner with mocked checkpoint system and store."""
+    checkpoint_system = MagicMock(spec=CheckpointSystem)
+    checkpoint_system.store = MagicMock()
+    runner = AutopilotRunner(
+        config=mock_config,
+        checkpoint_system=checkpoint_system,
+        session_store=MagicMock(spec=AutopilotSessionStore),
+        on_goal_start=MagicMock(),
+        on_goal_complete=MagicMock(),
+    )
+    runner._run_preflight = MagicMock(return_value=None)
+    return runner
+
+
+@pytest.fixture
+def session():
+    return AutopilotSession(session_id="s1", state=AutopilotState.RUNNING)
+
+
+def create_goal(goal_id, cost=None, **links):
+    """Helper to create a DailyGoal."""
+    return DailyGoal(
+        goal_id=goal_id,
+        description=f"Goal {goal_id}",
+        priority=GoalPriority.MEDIUM,
+        estimated_minutes=30,
+        estimated_cost_usd=cost,
+        **links,
+    )
+
+
+def success(cost=1.0):
+    return GoalExecutionResult(success=True, cost_usd=cost, duration_seconds=1)
+
+
+class Tracker:
+    """Records how many goals are executing at once."""
+
+    def __init__(self, results=None, delay=0.05):
+        self.lock = threading.Lock()
+        self.running = set()
+        self.max_running = 0
+        self.overlaps = []
+        self.results = results or {}
+        self.delay = delay
+
+    def __call__(self, goal):
+        with self.lock:
+            self.overlaps.append((goal.goal_id, frozenset(self.running)))
+            self.running.add(goal.goal_id)
+            self.max_running = max(self.max_running, len(self.running))
+        time.sleep(self.delay)
+        with self.lock:
+            self.running.discard(goal.goal_id)
+        return self.results.get(goal.goal_id, success())
+
+
+class TestConcurrency:
+    """Ready goals are dispatched concurrently."""
+
+    def test_independent_goals_overlap(self, runner, session):
+        """Manual goals run together, bounded by max_parallel_goals."""
+        tracker = Tracker()
+        runner._execute_goal = tracker
+        goals = [create_goal(f"g{i}", cost=0.0) for i in range(5)]
+
+        completed, cost, blocked = runner._execute_goals_parallel_safe(goals, 100.0, session)
+
+        assert completed == 5
+        assert cost == 5.0
+        assert blocked == set()
+        assert tracker.max_running == 3
+
+    def test_workspace_goals_serialized(self, runner, session):
+        """Feature and bug goals never overlap; a spec goal runs alongside them."""
+        tracker = Tracker()
+        runner._execute_goal = tracker
+        goals = [
+            create_goal("feat", linked_feature="f", linked_issue=1),
+            create_goal("bug", linked_bug="b"),
+            create_goal("spec", linked_spec="s"),
+        ]
+
+        runner._execute_goals_parallel_safe(goals, 100.0, session)
+
+        for goal_id, others in tracker.overlaps:
+            assert not {"feat", "bug"} <= (others | {goal_id})
+        assert tracker.max_running == 2
+
+    def test_dependencies_respected(self, runner, session, monkeypatch):
+        """A goal waits for its dependencies; blocked dependencies block it."""
+        goals = [create_goal("a"), create_goal("b"), create_goal("c")]
+        graph = DependencyGraph(issues=goals, dependencies={"c": ["a"]})
+        monkeypatch.setattr(DependencyGraph, "from_goals", classmethod(lambda cls, g: graph))
+        runner._execute_goal = Tracker(results={
+            "a": GoalExecutionResult(success=False, cost_usd=0.2, duration_seconds=1),
+        })
+
+        completed, cost, blocked = runner._execute_goals_parallel_safe(goals, 100.0, session)
+
+        assert completed == 1
+        assert blocked == {"a"}
+        assert goals[2].status == GoalStatus.PENDING
+        assert goals[0].is_hiccup is True
+
+
+class TestBudgetReservation:
+    """Estimated costs are reserved before launch."""
+
+    def test_estimates_limit_concurrency(self, runner, session):
+        """Goals whose estimates exceed the remaining budget wait for others."""
+        tracker = Tracker(results={g: success(cost=1.0) for g in ("a", "b", "c")})
+        runner._execute_goal = tracker
+        goals = [create_goal(g, cost=4.0) for g in ("a", "b", "c")]
+
+        completed, cost, _ = runner._execute_goals_parallel_safe(goals, 9.0, session)
+
+        # Only two $4 reservations fit in $9; actual costs free room for the third
+        assert tracker.max_running == 2
+        assert completed == 3
+        assert cost == 3.0
+        assert session.total_cost_usd == 3.0
+
+    def test_stops_when_budget_spent(self, runner, session):
+        """No goal launches once actual spend leaves less than min_execution_budget."""
+        runner.config.autopilot.max_parallel_goals = 1
+        runner._execute_goal = Tracker(results={"a": success(cost=5.0)}, delay=0)
+        goals = [create_goal("a", cost=1.0), create_goal("b", cost=1.0)]
+
+        completed, cost, _ = runner._execute_goals_parallel_safe(goals, 5.0, session)
+
+        assert completed == 1
+        assert cost == 5.0
+        assert goals[1].status == GoalStatus.PENDING
+
+    def test_preflight_sees_reserved_budget(self, runner, session):
+        """Pre-flight is told about budget held by running goals."""
+        runner._execute_goal = Tracker()
+        goals = [create_goal("a", cost=2.0), create_goal("b", cost=3.0)]
+
+        runner._execute_goals_parallel_safe(goals, 100.0, session)
+
+        spent = [call.args[1]["spent_usd"] for call in runner._run_preflight.call_args_list]
+        assert spent == [0.0, 2.0]
+
+
+class TestAccounting:
+    """Callbacks and checkpoint accounting happen once per goal."""
+
+    def test_callbacks_and_daily_cost(self, runner, session):
+        """Each goal gets one start and one complete callback."""
+        runner._execute_goal = Tracker()
+        goals = [create_goal(g, cost=0.0) for g in ("a", "b")]
+
+        runner._execute_goals_parallel_safe(goals, 100.0, session)
+
+        assert sorted(c.args[0].goal_id for c in runner.on_goal_start.call_args_list) == ["a", "b"]
+        assert sorted(c.args[0].goal_id for c in runner.on_goal_complete.call_args_list) == ["a", "b"]
+        assert runner.checkpoint_system.update_daily_cost.call_count == 2
+
+    def test_exception_blocks_goal(self, runner, session):
+        """A goal that raises is blocked without losing the others."""
+        def execute(goal):
+            if goal.goal_id == "a":
+                raise RuntimeError("boom")
+            return success()
+
+        runner._execute_goal = execute
+        goals = [create_goal("a"), create_goal("b")]
+
+        completed, _, blocked = runner._execute_goals_parallel_safe(goals, 100.0, session)
+
+        assert completed == 1
+        assert blocked == {"a"}
+
+    def test_start_uses_parallel_strategy(self, runner):
+        """start() routes PARALLEL_SAFE to the concurrent executor."""
+        runner._execute_goal = Tracker()
+        goals = [create_goal("a"), create_goal("b")]
+
+        result = runner.start(goals=goals, budget_usd=100.0)
+
+        assert result.goals_completed == 2
+        assert result.total_cost_usd == 2.0
+        assert result.session.state == AutopilotState.COMPLETED
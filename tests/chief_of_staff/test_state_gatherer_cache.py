@@ -0,0 +1,159 @@
+"""Tests for parallel, incremental StateGatherer.gather().
+
+Tests verify:
+- Independent sections are gathered concurrently
+- Unchanged sections are served from the cache; changed ones recompute
+- Test collection is invalidated by test-file edits and persisted across
+  instances when a cache directory is configured
+"""
+
+import json
+import os
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from swarm_attack.chief_of_staff.state_gatherer import (
+    GitState,
+    StateGatherer,
+    SuiteMetrics,
+)
+
+
+@pytest.fixture
+def root(tmp_path):
+    """Create a small project tree."""
+    (tmp_path / ".swarm" / "state").mkdir(parents=True)
+    (tmp_path / ".swarm" / "state" / "feat.json").write_text(
+        json.dumps({"feature_id": "feat", "phase": "IMPLEMENTING"})
+    )
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_a.py").write_text("def test_a(): pass\n")
+    return tmp_path
+
+
+def make_gatherer(root, cache_dir=None):
+    gatherer = StateGatherer(MagicMock(), cache_dir=cache_dir)
+    gatherer._root = root
+    gatherer.gather_git_state = MagicMock(return_value=GitState.empty())
+    gatherer.gather_tests = MagicMock(
+        return_value=SuiteMetrics(total_tests=1, test_files=["tests/test_a.py"])
+    )
+    return gatherer
+
+
+def bump_mtime(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestParallelGather:
+    """Sections run concurrently."""
+
+    def test_sections_overlap(self, root):
+        """Slow sections wait on each other instead of running back to back."""
+        gatherer = make_gatherer(root)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def slow_git():
+            barrier.wait()
+            return GitState.empty()
+
+        def slow_tests():
+            barrier.wait()
+            return SuiteMetrics(total_tests=0)
+
+        gatherer.gather_git_state = slow_git
+        gatherer.gather_tests = slow_tests
+
+        snapshot = gatherer.gather()
+
+        assert snapshot.tests.total_tests == 0
+        assert [f.feature_id for f in snapshot.features] == ["feat"]
+
+
+class TestIncrementalGather:
+    """Sections are reused while their signatures are unchanged."""
+
+    def test_unchanged_sections_reused(self, root):
+        gatherer = make_gatherer(root)
+        gatherer.gather_features = MagicMock(wraps=gatherer.gather_features)
+
+        gatherer.gather()
+        gatherer.gather()
+
+        assert gatherer.gather_tests.call_count == 1
+        assert gatherer.gather_features.call_count == 1
+        assert gatherer.gather_git_state.call_count == 2
+
+    def test_feature_change_recomputes(self, root):
+        gatherer = make_gatherer(root)
+        gatherer.gather()
+
+        state_file = root / ".swarm" / "state" / "feat.json"
+        state_file.write_text(json.dumps({"feature_id": "feat", "phase": "COMPLETE"}))
+        bump_mtime(state_file)
+
+        assert gatherer.gather().features[0].phase == "COMPLETE"
+
+    def test_test_file_edit_recollects(self, root):
+        gatherer = make_gatherer(root)
+        gatherer.gather()
+
+        bump_mtime(root / "tests" / "test_a.py")
+        gatherer.gather()
+
+        assert gatherer.gather_tests.call_count == 2
+
+    def test_new_test_file_recollects(self, root):
+        gatherer = make_gatherer(root)
+        gatherer.gather()
+
+        (root / "tests" / "sub").mkdir()
+        (root / "tests" / "sub" / "test_b.py").write_text("")
+        gatherer.gather()
+
+        assert gatherer.gather_tests.call_count == 2
+
+    def test_clear_cache(self, root):
+        gatherer = make_gatherer(root)
+        gatherer.gather()
+
+        gatherer.clear_cache()
+        gatherer.gather()
+
+        assert gatherer.gather_tests.call_count == 2
+
+
+class TestPersistedTestCache:
+    """Test collection results are shared across instances via cache_dir."""
+
+    def test_reused_by_new_instance(self, root):
+        cache_dir = root / ".swarm" / "cache" / "state"
+        make_gatherer(root, cache_dir).gather()
+
+        second = make_gatherer(root, cache_dir)
+        snapshot = second.gather()
+
+        second.gather_tests.assert_not_called()
+        assert snapshot.tests.total_tests == 1
+        assert snapshot.tests.test_files == ["tests/test_a.py"]
+
+    def test_stale_persisted_cache_ignored(self, root):
+        cache_dir = root / ".swarm" / "cache" / "state"
+        make_gatherer(root, cache_dir).gather()
+        bump_mtime(root / "tests" / "test_a.py")
+
+        second = make_gatherer(root, cache_dir)
+        second.gather()
+
+        second.gather_tests.assert_called_once()
+
+    def test_no_persistence_without_cache_dir(self, root):
+        make_gatherer(root).gather()
+
+        second = make_gatherer(root)
+        second.gather()
+
+        second.gather_tests.assert_called_once()
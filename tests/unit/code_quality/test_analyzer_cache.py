@@ -0,0 +1,142 @@
+"""Tests for CodeQualityAnalyzer's shared parsing, findings cache and process pool.
+
+Tests verify:
+- Each file is parsed once and the tree is shared by all detectors
+- Unchanged files are answered from the cache, changed files re-analyzed
+- The cache persists across analyzers and is invalidated by DETECTOR_VERSION
+- Large batches analyzed in worker processes match serial analysis
+"""
+
+import ast
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from swarm_attack.code_quality import analyzer as analyzer_module
+from swarm_attack.code_quality.analyzer import CodeQualityAnalyzer
+
+SOURCE = '''
+def too_many(a, b, c, d, e):
+    # TODO: finish this
+    try:
+        return a
+    except Exception:
+        pass
+'''
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> list[Path]:
+    """Create a batch of files with findings."""
+    paths = []
+    for i in range(10):
+        path = tmp_path / f"module_{i}.py"
+        path.write_text(SOURCE + f"\nVALUE = {i}\n")
+        paths.append(path)
+    return paths
+
+
+def summary(result):
+    return sorted((f.file, f.line, f.title) for f in result.findings)
+
+
+class TestSingleParse:
+    """Detectors share one parsed tree."""
+
+    def test_parsed_once_per_file(self, files):
+        analyzer = CodeQualityAnalyzer(max_workers=1)
+
+        with patch.object(ast, "parse", wraps=ast.parse) as parse:
+            analyzer.analyze_file(files[0])
+
+        assert parse.call_count == 1
+
+    def test_same_findings_as_detectors(self, files):
+        analyzer = CodeQualityAnalyzer(max_workers=1)
+        expected = (
+            analyzer.smell_detector.analyze_file(files[0])
+            + analyzer.solid_checker.analyze_file(files[0])
+            + analyzer.llm_auditor.analyze_file(files[0])
+        )
+
+        findings = analyzer.analyze_file(files[0])
+
+        assert [f.title for f in findings] == [f.title for f in expected]
+
+
+class TestFindingsCache:
+    """Per-file findings keyed by content hash."""
+
+    def test_unchanged_file_not_reanalyzed(self, files):
+        analyzer = CodeQualityAnalyzer(max_workers=1)
+        first = analyzer.analyze_files(files[:2])
+
+        with patch.object(analyzer, "_analyze_source") as analyze:
+            second = analyzer.analyze_files(files[:2])
+
+        analyze.assert_not_called()
+        assert summary(second) == summary(first)
+
+    def test_changed_file_reanalyzed(self, files):
+        analyzer = CodeQualityAnalyzer(max_workers=1)
+        analyzer.analyze_files(files[:2])
+
+        files[0].write_text("VALUE = 1\n")
+        result = analyzer.analyze_files(files[:2])
+
+        assert {f.file for f in result.findings} == {str(files[1])}
+
+    def test_persisted_across_analyzers(self, files, tmp_path):
+        cache_dir = tmp_path / "cache"
+        first = CodeQualityAnalyzer(cache_dir=cache_dir, max_workers=1).analyze_files(files[:3])
+
+        fresh = CodeQualityAnalyzer(cache_dir=cache_dir, max_workers=1)
+        with patch.object(fresh, "_analyze_source") as analyze:
+            second = fresh.analyze_files(files[:3])
+
+        analyze.assert_not_called()
+        assert summary(second) == summary(first)
+
+    def test_detector_version_invalidates(self, files, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        CodeQualityAnalyzer(cache_dir=cache_dir, max_workers=1).analyze_files(files[:1])
+        monkeypatch.setattr(analyzer_module, "DETECTOR_VERSION", analyzer_module.DETECTOR_VERSION + 1)
+
+        fresh = CodeQualityAnalyzer(cache_dir=cache_dir, max_workers=1)
+        with patch.object(fresh, "_analyze_source", return_value=[]) as analyze:
+            fresh.analyze_files(files[:1])
+
+        analyze.assert_called_once()
+
+    def test_finding_ids_unique(self, files):
+        analyzer = CodeQualityAnalyzer(max_workers=1)
+        analyzer.analyze_files(files)
+
+        result = analyzer.analyze_files(files)
+
+        ids = [f.finding_id for f in result.findings]
+        assert len(ids) == len(set(ids))
+
+
+class TestProcessPool:
+    """Large batches fan out across worker processes."""
+
+    def test_pool_matches_serial(self, files):
+        serial = CodeQualityAnalyzer(max_workers=1).analyze_files(files)
+
+        parallel = CodeQualityAnalyzer(max_workers=2).analyze_files(files)
+
+        assert parallel.files_analyzed == [str(p) for p in files]
+        assert summary(parallel) == summary(serial)
+
+    def test_budget_exceeded_skips_remaining(self, files, caplog):
+        analyzer = CodeQualityAnalyzer(max_workers=1)
+
+        with patch.object(analyzer, "check_timing_budget", side_effect=[True, False]):
+            result = analyzer.analyze_files(files[:3])
+
+        assert result.files_analyzed == [str(files[0])]
+        assert result.files_skipped == [str(files[1]), str(files[2])]
+        assert result.to_dict()["files_skipped"] == result.files_skipped
+        assert "2 of 3 files not analyzed" in caplog.text
@@ -3,6 +3,7 @@
 Tests verify:
 - Correct timing constants (90s analyst, 30s critic, 30s moderator)
 - Component initialization (analyzer, suggester, tdd_generator)
+- Analyst findings cached under the config's swarm path
 - Three-phase pipeline execution (analyst -> critic -> moderator)
 - Verdict determination based on findings
 - Retry context and escalation logic
@@ -305,6 +306,15 @@ class TestComponentInitialization:
 
         assert isinstance(dispatcher.tdd_generator, TDDGenerator)
 
+    def test_dispatcher_caches_findings_under_swarm_path(self, tmp_path: Path):
+        """With a config, analyst findings are cached in .swarm/cache/code_quality."""
+        config = MagicMock(swarm_path=tmp_path / ".swarm")
+
+        dispatcher = CodeQualityDispatcher(config)
+
+        assert dispatcher.analyzer.cache_dir == tmp_path / ".swarm" / "cache" / "code_quality"
+        assert CodeQualityDispatcher().analyzer.cache_dir is None
+
 
 # ============================================================
 # Test: Analyst Phase
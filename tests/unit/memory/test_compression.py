@@ -814,3 +814,60 @@ class TestEdgeCases:
 
         # Assert - Should NOT merge with default 0.8 threshold
         assert len(result) == 2
+
+
+def _pairwise_compress(compressor, entries, threshold):
+    """Reference all-pairs implementation of the grouping rule."""
+    merged: set[int] = set()
+    groups = []
+    for i, a in enumerate(entries):
+        if i in merged:
+            continue
+        group = [i]
+        for j in range(i + 1, len(entries)):
+            if j not in merged and compressor.similarity(a, entries[j]) >= threshold:
+                group.append(j)
+        merged.update(group)
+        groups.append(group)
+    return groups
+
+
+class TestCandidatePruning:
+    """Prefix-filtered candidate generation matches the all-pairs result."""
+
+    @pytest.mark.parametrize("threshold", [0.0, 0.3, 0.5, 0.8, 1.0, 1.5])
+    def test_equivalent_to_pairwise(self, threshold):
+        """Groups are identical to comparing every pair."""
+        import random
+
+        rng = random.Random(42)
+        vocab = [f"w{i}" for i in range(12)]
+        entries = []
+        for i in range(120):
+            words = rng.sample(vocab, rng.randint(0, 6))
+            content = {"msg": " ".join(words)} if words and rng.random() < 0.9 else {}
+            entries.append(_create_entry(
+                category=rng.choice(["a", "b"]),
+                feature_id=rng.choice(["f1", "f2"]),
+                content=content,
+                hit_count=1 << i,  # hit_count sums identify group members
+                days_ago=i,
+            ))
+
+        compressor = MemoryCompressor()
+        expected = [sum(1 << i for i in group) for group in _pairwise_compress(compressor, entries, threshold)]
+        actual = [e.hit_count for e in compressor.compress(entries, similarity_threshold=threshold)]
+
+        assert actual == expected
+
+    def test_keywords_extracted_once_per_entry(self, monkeypatch):
+        """Keyword extraction is linear in the number of entries."""
+        compressor = MemoryCompressor()
+        calls = []
+        original = compressor._extract_keywords
+        monkeypatch.setattr(compressor, "_extract_keywords", lambda c: calls.append(1) or original(c))
+
+        entries = [_create_entry(content={"error": f"e{i % 5}", "file": f"f{i}"}) for i in range(50)]
+        compressor.compress(entries, similarity_threshold=0.8)
+
+        assert len(calls) == 50
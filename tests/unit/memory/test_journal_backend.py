@@ -0,0 +1,213 @@
+"""Tests for MemoryStore storage backends (JSON document and JSONL journal)."""
+import json
+from datetime import datetime
+
+import pytest
+
+from swarm_attack.memory.backends import JournalBackend, JsonBackend
+from swarm_attack.config import MemoryConfig
+from swarm_attack.memory.store import MemoryEntry, MemoryStore, default_store_path
+
+
+def make_entry(entry_id, **content):
+    return MemoryEntry(
+        id=entry_id,
+        category="test_failure",
+        feature_id="feat",
+        issue_number=None,
+        content=content or {"error": entry_id},
+        outcome="failure",
+        created_at=datetime.now().isoformat(),
+        tags=["t"],
+    )
+
+
+def journal_records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return tmp_path / "memory" / "memories.jsonl"
+
+
+class TestBackendSelection:
+    """The backend follows the store path suffix unless given explicitly."""
+
+    def test_json_default(self, tmp_path):
+        assert isinstance(MemoryStore(tmp_path / "memories.json").backend, JsonBackend)
+
+    def test_jsonl_uses_journal(self, journal_path):
+        assert isinstance(MemoryStore(journal_path).backend, JournalBackend)
+
+    def test_config_selects_journal(self, tmp_path, monkeypatch):
+        """memory.journal picks the .jsonl store path; other configs keep JSON."""
+        monkeypatch.chdir(tmp_path)
+
+        class Config:
+            memory = MemoryConfig()
+
+        assert default_store_path(Config()).name == "memories.jsonl"
+        Config.memory = MemoryConfig(journal=False)
+        assert default_store_path(Config()).name == "memories.json"
+        assert default_store_path(None).name == "memories.json"
+
+
+class TestJournalBackend:
+    """Append-only journal persistence."""
+
+    def test_round_trip(self, journal_path):
+        """Saved entries, hit counts and stats survive a reload."""
+        store = MemoryStore(journal_path)
+        store.add(make_entry("a"))
+        store.add(make_entry("b"))
+        store.query(category="test_failure", limit=1)
+        store.save()
+
+        loaded = MemoryStore.load(journal_path)
+
+        assert [e.id for e in loaded._entries.values()] == ["a", "b"]
+        assert loaded.get_entry("a").hit_count == 1
+        assert loaded.get_stats()["total_queries"] == 1
+
+    def test_save_appends_only_changes(self, journal_path):
+        """A save after a single add appends one put record."""
+        store = MemoryStore(journal_path)
+        for i in range(10):
+            store.add(make_entry(f"e{i}"))
+        store.save()
+        before = len(journal_records(journal_path))
+
+        store.add(make_entry("new"))
+        store.save()
+
+        appended = journal_records(journal_path)[before:]
+        assert [r["op"] for r in appended] == ["put", "meta"]
+        assert appended[0]["entry"]["id"] == "new"
+
+    def test_deletes_and_hits(self, journal_path):
+        """Deletes and hit-count updates are small records replayed on load."""
+        store = MemoryStore(journal_path)
+        store.add(make_entry("a"))
+        store.add(make_entry("b"))
+        store.save()
+
+        store = MemoryStore.load(journal_path)
+        store.delete("a")
+        store.find_similar({"error": "b"})
+        store.save()
+
+        ops = [r["op"] for r in journal_records(journal_path)]
+        assert ops[-3:] == ["del", "hits", "meta"]
+
+        loaded = MemoryStore.load(journal_path)
+        assert loaded.get_entry("a") is None
+        assert loaded.get_entry("b").hit_count == 1
+
+    def test_reindexed_mutation_persisted(self, journal_path):
+        """In-place edits followed by reindex() are journaled."""
+        store = MemoryStore(journal_path)
+        store.add(make_entry("a"))
+        store.save()
+
+        store.get_entry("a").content["fix_applied"] = "yes"
+        store.reindex("a")
+        store.save()
+
+        assert MemoryStore.load(journal_path).get_entry("a").content["fix_applied"] == "yes"
+
+    def test_torn_tail_ignored(self, journal_path):
+        """A partially written final record does not break loading."""
+        store = MemoryStore(journal_path)
+        store.add(make_entry("a"))
+        store.save()
+        with open(journal_path, "a") as f:
+            f.write('{"op": "put", "entry": {"id": "b"')
+
+        assert [e.id for e in MemoryStore.load(journal_path)._entries.values()] == ["a"]
+
+    def test_malformed_records_skipped(self, journal_path):
+        """Valid JSON records missing required fields are skipped."""
+        store = MemoryStore(journal_path)
+        store.add(make_entry("a"))
+        store.save()
+        with open(journal_path, "a") as f:
+            f.write('{"op": "put"}\n{"op": "put", "entry": {}}\n{"op": "del"}\n[1]\n')
+        with open(journal_path, "a") as f:
+            f.write(json.dumps({"op": "put", "entry": make_entry("b").to_dict()}) + "\n")
+
+        loaded = MemoryStore.load(journal_path)
+        assert [e.id for e in loaded._entries.values()] == ["a", "b"]
+
+    def test_compaction_keeps_concurrent_appends(self, journal_path):
+        """A store never compacts away records another writer appended."""
+        backend = JournalBackend(compact_ratio=2.0, min_compact_records=5)
+        store = MemoryStore(journal_path, backend=backend)
+        store.add(make_entry("a"))
+        store.save()
+
+        other = MemoryStore.load(journal_path, backend=JournalBackend())
+        other.add(make_entry("b"))
+        other.save()
+
+        for _ in range(5):
+            store.query(limit=1)
+            store.save()
+
+        assert MemoryStore.load(journal_path).get_entry("b") is not None
+        assert journal_path.with_name("memories.jsonl.lock").exists()
+
+    def test_compaction(self, journal_path):
+        """The journal is rewritten as a snapshot once it grows past the ratio."""
+        backend = JournalBackend(compact_ratio=2.0, min_compact_records=5)
+        store = MemoryStore(journal_path, backend=backend)
+        store.add(make_entry("a"))
+        store.add(make_entry("b"))
+        store.save()
+
+        for _ in range(5):
+            store.query(limit=1)
+            store.save()
+
+        records = journal_records(journal_path)
+        assert records[0]["op"] == "header"
+        assert len(records) <= 5
+        assert MemoryStore.load(journal_path, backend=JournalBackend()).get_entry("a").hit_count == 5
+
+    def test_clear_rewrites(self, journal_path):
+        """Clearing the store writes an empty snapshot."""
+        store = MemoryStore(journal_path)
+        store.add(make_entry("a"))
+        store.save()
+
+        store.clear()
+        store.save()
+
+        assert len(MemoryStore.load(journal_path)) == 0
+
+    def test_imports_legacy_json(self, tmp_path):
+        """An existing memories.json is imported into a new journal."""
+        legacy = MemoryStore(tmp_path / "memories.json")
+        legacy.add(make_entry("old"))
+        legacy.save()
+
+        store = MemoryStore.load(tmp_path / "memories.jsonl")
+        assert store.get_entry("old") is not None
+
+        store.save()
+        assert (tmp_path / "memories.jsonl").exists()
+        assert MemoryStore.load(tmp_path / "memories.jsonl").get_entry("old") is not None
+
+    def test_json_export_path(self, journal_path, tmp_path):
+        """save_to_file/load_from_file still use the JSON format."""
+        store = MemoryStore(journal_path)
+        store.add(make_entry("a"))
+        store.save_to_file(tmp_path / "export.json")
+
+        data = json.loads((tmp_path / "export.json").read_text())
+        assert data["entries"][0]["id"] == "a"
+
+        imported = MemoryStore(tmp_path / "other.jsonl")
+        imported.load_from_file(tmp_path / "export.json")
+        imported.save()
+        assert MemoryStore.load(tmp_path / "other.jsonl").get_entry("a") is not None
@@ -0,0 +1,138 @@
+"""Tests for MemoryStore's in-memory keyword and secondary indexes."""
+from datetime import datetime
+
+import pytest
+
+from swarm_attack.memory.store import MemoryEntry, MemoryStore
+
+
+def make_entry(entry_id, category="test_failure", feature_id="feat", content=None, tags=None):
+    return MemoryEntry(
+        id=entry_id,
+        category=category,
+        feature_id=feature_id,
+        issue_number=None,
+        content=content if content is not None else {},
+        outcome="failure",
+        created_at=datetime.now().isoformat(),
+        tags=tags or [],
+    )
+
+
+def scan_similar(store, content, category=None, limit=5):
+    """Reference implementation: the original full-scan find_similar."""
+    query = store._extract_keywords(content)
+    scored = []
+    for entry in store._entries.values():
+        if category is not None and entry.category != category:
+            continue
+        keywords = store._extract_keywords(entry.content)
+        overlap = len(query & keywords)
+        if overlap:
+            scored.append((overlap / len(query), entry))
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return [e.id for _, e in scored[:limit]]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = MemoryStore(store_path=tmp_path / "memories.json")
+    for i in range(30):
+        store.add(make_entry(
+            f"e{i}",
+            category=["test_failure", "schema_drift", "bug_pattern"][i % 3],
+            feature_id=f"feat-{i % 4}",
+            content={
+                "error": ["ImportError", "KeyError", "TypeError"][i % 3],
+                "module": f"mod{i % 5}",
+                "detail": {"file": f"file{i % 7}.py"},
+            },
+            tags=["Flaky"] if i % 2 else ["stable", "core"],
+        ))
+    return store
+
+
+class TestFindSimilarIndex:
+    """find_similar uses precomputed keywords and the inverted index."""
+
+    @pytest.mark.parametrize("content,category", [
+        ({"error": "KeyError", "module": "mod2"}, None),
+        ({"error": "KeyError", "module": "mod2"}, "schema_drift"),
+        ({"detail": {"file": "file3.py"}, "module": "mod0"}, None),
+        ({"nothing": "matches here"}, None),
+    ])
+    def test_matches_full_scan(self, store, content, category):
+        """Results and order match the original scan."""
+        expected = scan_similar(store, content, category, limit=10)
+        actual = [e.id for e in store.find_similar(content, category=category, limit=10)]
+        assert actual == expected
+
+    def test_keywords_not_recomputed(self, store, monkeypatch):
+        """Entry keywords are extracted at insert time, not per query."""
+        calls = []
+        original = store._extract_keywords
+        monkeypatch.setattr(store, "_extract_keywords", lambda c: calls.append(c) or original(c))
+
+        store.find_similar({"error": "KeyError"})
+
+        assert len(calls) == 1
+
+    def test_reindex_after_mutation(self, store):
+        """In-place content changes are visible after reindex()."""
+        store.get_entry("e0").content["fix_applied"] = "pin dependency"
+        store.reindex("e0")
+
+        assert [e.id for e in store.find_similar({"fix_applied": "pin dependency"})] == ["e0"]
+
+    def test_delete_removes_postings(self, store):
+        """Deleted entries are never returned."""
+        store.delete("e1")
+
+        assert "e1" not in [e.id for e in store.find_similar({"error": "KeyError"}, limit=50)]
+        assert "e1" not in store._keyword_index.get("keyerror", set())
+
+
+class TestQueryIndexes:
+    """query() intersects category, feature_id and tag indexes."""
+
+    def test_filters_combined(self, store):
+        """All filters are ANDed and insertion order is kept."""
+        results = store.query(category="test_failure", feature_id="feat-1", tags=["FLAKY"], limit=50)
+
+        expected = [
+            e.id for e in store._entries.values()
+            if e.category == "test_failure" and e.feature_id == "feat-1" and "Flaky" in e.tags
+        ]
+        assert [e.id for e in results] == expected
+        assert expected
+
+    def test_missing_tag(self, store):
+        """Unknown tags match nothing."""
+        assert store.query(tags=["stable", "missing"]) == []
+
+    def test_replace_keeps_position(self, store):
+        """Re-adding an entry updates indexes and keeps its order."""
+        store.add(make_entry("e0", category="moved", feature_id="feat-x"))
+
+        assert [e.id for e in store.query(category="moved")] == ["e0"]
+        assert "e0" not in [e.id for e in store.query(category="test_failure", limit=50)]
+        assert store.query(limit=1)[0].id == "e0"
+
+    def test_prune_and_clear(self, store):
+        """Pruning and clearing keep indexes consistent."""
+        store.prune_low_value_entries(min_hits=1)
+        assert store.query(category="schema_drift") == []
+        assert store._category_index == {}
+
+        store.add(make_entry("new", tags=["x"]))
+        store.clear()
+        assert store.query(tags=["x"]) == []
+
+    def test_load_builds_indexes(self, store):
+        """Entries loaded from disk are indexed."""
+        store.save()
+        loaded = MemoryStore.load(store.store_path)
+
+        assert len(loaded.query(category="bug_pattern", limit=50)) == 10
+        assert [e.id for e in loaded.find_similar({"module": "mod1"}, limit=10)] == \
+            scan_similar(loaded, {"module": "mod1"}, limit=10)
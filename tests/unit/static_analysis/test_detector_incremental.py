@@ -0,0 +1,221 @@
+"""Tests for concurrent and incremental StaticBugDetector.detect_all."""
+
+import subprocess
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from swarm_attack.static_analysis.detector import StaticBugDetector
+from swarm_attack.static_analysis.models import StaticBugReport
+
+
+def lint_bug(file_path, line=1):
+    return StaticBugReport(
+        source="ruff",
+        file_path=file_path,
+        line_number=line,
+        error_code="F401",
+        message="unused import",
+        severity="moderate",
+    )
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A small source tree as the working directory."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("import os\n")
+    (tmp_path / "src" / "b.py").write_text("x = 1\n")
+    return tmp_path
+
+
+class FakeLint:
+    """Stand-in for detect_from_lint that flags every file importing os."""
+
+    def __init__(self):
+        self.calls = []
+        self.fail = False
+
+    def __call__(self, path=None, files=None, strict=False):
+        self.calls.append(files)
+        if self.fail:
+            return None if strict else []
+        return [lint_bug(f) for f in files or [] if "import os" in open(f).read()]
+
+
+def make_detector(cache_dir=None):
+    detector = StaticBugDetector(cache_dir=cache_dir)
+    detector._tool_available = lambda tool: tool == "ruff"
+    detector.detect_from_lint = FakeLint()
+    return detector
+
+
+class TestConcurrentDetectAll:
+    """Tools run at the same time."""
+
+    def test_tools_overlap(self):
+        detector = StaticBugDetector()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def slow(path=None):
+            barrier.wait()
+            return []
+
+        with patch.object(detector, "_tool_available", return_value=True):
+            detector.detect_from_tests = slow
+            detector.detect_from_types = slow
+            detector.detect_from_lint = slow
+            result = detector.detect_all()
+
+        assert result.tools_run == ["pytest", "mypy", "ruff"]
+
+
+class TestIncrementalDetectAll:
+    """Only changed files are re-checked."""
+
+    def test_unchanged_files_reuse_cache(self, project):
+        detector = make_detector()
+
+        first = detector.detect_all("src", incremental=True)
+        second = detector.detect_all("src", incremental=True)
+
+        assert [b.file_path for b in first.bugs] == ["src/a.py"]
+        assert [b.file_path for b in second.bugs] == ["src/a.py"]
+        assert detector.detect_from_lint.calls == [["src/a.py", "src/b.py"], []]
+
+    def test_edited_file_rechecked(self, project):
+        detector = make_detector()
+        detector.detect_all("src", incremental=True)
+
+        (project / "src" / "a.py").write_text("y = 2\n")
+        (project / "src" / "b.py").write_text("import os\n")
+        result = detector.detect_all("src", incremental=True)
+
+        assert detector.detect_from_lint.calls[-1] == ["src/a.py", "src/b.py"]
+        assert [b.file_path for b in result.bugs] == ["src/b.py"]
+
+    def test_deleted_file_dropped(self, project):
+        detector = make_detector()
+        detector.detect_all(incremental=True)
+
+        (project / "src" / "a.py").unlink()
+
+        assert detector.detect_all(incremental=True).bugs == []
+
+    def test_cache_persisted(self, project):
+        cache_dir = project / ".swarm" / "cache"
+        make_detector(cache_dir).detect_all("src", incremental=True)
+
+        fresh = make_detector(cache_dir)
+        result = fresh.detect_all("src", incremental=True)
+
+        assert fresh.detect_from_lint.calls == [[]]
+        assert [b.file_path for b in result.bugs] == ["src/a.py"]
+
+    def test_since_limits_to_git_changes(self, project):
+        detector = make_detector()
+        git = MagicMock(side_effect=[
+            MagicMock(returncode=0, stdout="src/b.py\nREADME.md\n"),
+            MagicMock(returncode=0, stdout=""),
+        ])
+
+        with patch.object(subprocess, "run", git):
+            result = detector.detect_all("src", since="HEAD~1")
+
+        assert detector.detect_from_lint.calls == [["src/b.py"]]
+        assert result.bugs == []
+        assert git.call_args_list[0][0][0] == ["git", "diff", "--name-only", "--relative", "HEAD~1"]
+
+    def test_git_failure_falls_back_to_hashes(self, project):
+        detector = make_detector()
+        failing = MagicMock(return_value=MagicMock(returncode=128, stdout="", stderr="bad ref"))
+
+        with patch.object(subprocess, "run", failing):
+            detector.detect_all("src", since="nope")
+
+        assert detector.detect_from_lint.calls == [["src/a.py", "src/b.py"]]
+
+    def test_tool_failure_not_cached(self, project):
+        detector = make_detector()
+        detector.detect_all("src", incremental=True)
+        (project / "src" / "b.py").write_text("import os\n")
+
+        detector.detect_from_lint.fail = True
+        failed = detector.detect_all("src", incremental=True)
+        detector.detect_from_lint.fail = False
+        retried = detector.detect_all("src", incremental=True)
+
+        assert [b.file_path for b in failed.bugs] == ["src/a.py"]
+        assert detector.detect_from_lint.calls[-1] == ["src/b.py"]
+        assert [b.file_path for b in retried.bugs] == ["src/a.py", "src/b.py"]
+
+    def test_lint_timeout_is_a_failure_when_strict(self):
+        detector = StaticBugDetector()
+
+        with patch.object(detector, "_tool_available", return_value=True), patch.object(
+            subprocess, "run", side_effect=subprocess.TimeoutExpired("ruff", 120)
+        ):
+            assert detector.detect_from_lint(files=["a.py"]) == []
+            assert detector.detect_from_lint(files=["a.py"], strict=True) is None
+
+    def test_mypy_crash_is_a_failure_when_strict(self):
+        detector = StaticBugDetector()
+        crashed = MagicMock(returncode=2, stdout="", stderr="mypy: error: bad config")
+
+        with patch.object(detector, "_tool_available", return_value=True), patch.object(
+            subprocess, "run", return_value=crashed
+        ):
+            assert detector.detect_from_types(files=["a.py"]) == []
+            assert detector.detect_from_types(files=["a.py"], strict=True) is None
+
+    def test_full_run_ignores_cache(self, project):
+        detector = make_detector()
+        detector.detect_from_lint = MagicMock(return_value=[])
+
+        detector.detect_all("src")
+
+        detector.detect_from_lint.assert_called_once_with("src")
+
+
+class TestConfiguredExcludes:
+    """Explicit file lists still honour the project's tool excludes."""
+
+    def test_ruff_forces_excludes(self):
+        detector = StaticBugDetector()
+        run = MagicMock(return_value=MagicMock(returncode=0, stdout="[]", stderr=""))
+
+        with patch.object(detector, "_tool_available", return_value=True), patch.object(
+            subprocess, "run", run
+        ):
+            detector.detect_from_lint(files=["a.py"])
+
+        assert run.call_args[0][0] == [
+            "ruff", "check", "--output-format=json", "--force-exclude", "a.py"
+        ]
+
+    def test_mypy_ini_exclude_filters_files(self, project):
+        (project / "mypy.ini").write_text("[mypy]\nexclude = ^src/gen/\n")
+        detector = StaticBugDetector()
+        run = MagicMock(return_value=MagicMock(returncode=0, stdout="", stderr=""))
+
+        with patch.object(detector, "_tool_available", return_value=True), patch.object(
+            subprocess, "run", run
+        ):
+            detector.detect_from_types(files=["src/a.py", "src/gen/c.py"])
+
+        assert run.call_args[0][0] == ["mypy", "--output=json", "src/a.py"]
+
+    def test_pyproject_exclude_list(self, project):
+        pytest.importorskip("tomllib")
+        (project / "pyproject.toml").write_text('[tool.mypy]\nexclude = ["^src/gen/"]\n')
+        detector = StaticBugDetector()
+        run = MagicMock()
+
+        with patch.object(detector, "_tool_available", return_value=True), patch.object(
+            subprocess, "run", run
+        ):
+            assert detector.detect_from_types(files=["src/gen/c.py"]) == []
+
+        run.assert_not_called()
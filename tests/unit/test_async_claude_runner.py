@@ -0,0 +1,271 @@
+"""
+Tests for AsyncClaudeCliRunner and the Claude CLI concurrency pool.
+
+Uses a small fake CLI script in place of the claude binary.
+
+Tests verify:
+- run_async parses JSON output like ClaudeCliRunner.run
+- The process-wide limiter bounds concurrent CLI processes
+- Timeouts and cancellation kill the CLI's whole process group
+- The sync run() facade works with and without a running event loop
+"""
+
+import asyncio
+import json
+import os
+import stat
+import sys
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+import swarm_attack.llm_clients as llm_clients
+from swarm_attack.llm_clients import (
+    AsyncClaudeCliRunner,
+    ClaudeConcurrencyLimiter,
+    ClaudeInvocationError,
+    ClaudeTimeoutError,
+    get_claude_limiter,
+)
+
+FAKE_CLI = """#!{python}
+import json, os, subprocess, sys, time
+mode = os.environ.get("FAKE_CLAUDE_MODE", "ok")
+if mode == "sleep":
+    # Spawn a grandchild in the same process group, then hang
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+    pidfile = os.environ["FAKE_CLAUDE_PIDFILE"]
+    with open(pidfile + ".tmp", "w") as f:
+        f.write(str(child.pid))
+    os.replace(pidfile + ".tmp", pidfile)  # Readers never see a partial pid
+    time.sleep(60)
+elif mode == "fail":
+    sys.stderr.write("boom")
+    sys.exit(3)
+elif mode == "slow":
+    time.sleep(0.3)
+print(json.dumps({{
+    "result": "hello",
+    "total_cost_usd": 0.25,
+    "num_turns": 2,
+    "duration_ms": 10,
+    "session_id": "sess-1",
+}}))
+"""
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # A killed process may linger as a zombie until its new parent reaps it
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except (OSError, IndexError):
+        return True
+
+
+@pytest.fixture(autouse=True)
+def reset_limiter(monkeypatch):
+    """Give each test a fresh process-wide limiter."""
+    monkeypatch.setattr(llm_clients, "_limiter", None)
+
+
+@pytest.fixture
+def fake_cli(tmp_path):
+    """Write an executable fake claude binary."""
+    path = tmp_path / "fake-claude"
+    path.write_text(FAKE_CLI.format(python=sys.executable))
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return path
+
+
+@pytest.fixture
+def runner(tmp_path, fake_cli):
+    """Create an AsyncClaudeCliRunner pointing at the fake CLI."""
+    config = MagicMock()
+    config.repo_root = str(tmp_path)
+    config.claude.binary = str(fake_cli)
+    config.claude.max_turns = 5
+    config.claude.timeout_seconds = 30
+    config.claude.max_concurrent = 2
+    return AsyncClaudeCliRunner(config=config)
+
+
+class TestConcurrencyLimiter:
+    """Tests for ClaudeConcurrencyLimiter."""
+
+    async def test_slot_bounds_concurrency(self):
+        """No more than `limit` holders run at once."""
+        limiter = ClaudeConcurrencyLimiter(2)
+        peak = 0
+
+        async def worker():
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limiter.active)
+                await asyncio.sleep(0.05)
+
+        await asyncio.gather(*(worker() for _ in range(6)))
+
+        assert peak == 2
+        assert limiter.active == 0
+
+    async def test_cancelled_waiter_holds_no_slot(self):
+        """Cancelling a waiting task does not leak a slot."""
+        limiter = ClaudeConcurrencyLimiter(1)
+
+        async with limiter.slot():
+            waiter = asyncio.create_task(limiter.slot().__aenter__())
+            await asyncio.sleep(0.1)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+        assert limiter.active == 0
+
+    async def test_waiters_served_in_order(self):
+        """Released slots go to waiters in the order they queued."""
+        limiter = ClaudeConcurrencyLimiter(1)
+        order = []
+
+        async def worker(i):
+            async with limiter.slot():
+                order.append(i)
+                await asyncio.sleep(0.01)
+
+        async with limiter.slot():
+            tasks = []
+            for i in range(5):
+                tasks.append(asyncio.create_task(worker(i)))
+                await asyncio.sleep(0)  # Queue in a known order
+        await asyncio.gather(*tasks)
+
+        assert order == [0, 1, 2, 3, 4]
+        assert limiter.active == 0
+
+    def test_slot_handed_across_threads(self):
+        """A slot released on one loop wakes a waiter on another thread's loop."""
+        limiter = ClaudeConcurrencyLimiter(1)
+        held = threading.Event()
+        done = threading.Event()
+
+        async def holder():
+            async with limiter.slot():
+                held.set()
+                await asyncio.sleep(0.2)
+
+        async def waiter():
+            async with limiter.slot():
+                done.set()
+
+        thread = threading.Thread(target=asyncio.run, args=(holder(),))
+        thread.start()
+        held.wait(5)
+        asyncio.run(asyncio.wait_for(waiter(), 5))
+        thread.join()
+
+        assert done.is_set()
+        assert limiter.active == 0
+
+    def test_get_claude_limiter_resizes(self):
+        """The shared limiter is resized to the requested limit."""
+        limiter = get_claude_limiter(3)
+        assert get_claude_limiter(5) is limiter
+        assert limiter.limit == 5
+
+
+class TestAsyncClaudeCliRunner:
+    """Tests for AsyncClaudeCliRunner.run_async and run."""
+
+    async def test_run_async_parses_output(self, runner):
+        """Successful runs return a ClaudeResult."""
+        result = await runner.run_async("hi")
+
+        assert result.text == "hello"
+        assert result.total_cost_usd == 0.25
+        assert result.num_turns == 2
+
+    async def test_run_async_nonzero_exit(self, runner, monkeypatch):
+        """Non-zero exit raises ClaudeInvocationError with stderr."""
+        monkeypatch.setenv("FAKE_CLAUDE_MODE", "fail")
+
+        with pytest.raises(ClaudeInvocationError) as exc_info:
+            await runner.run_async("hi")
+
+        assert exc_info.value.returncode == 3
+        assert "boom" in exc_info.value.stderr
+
+    async def test_parallel_runs_respect_pool(self, runner, monkeypatch):
+        """Concurrent run_async calls are capped by max_concurrent."""
+        monkeypatch.setenv("FAKE_CLAUDE_MODE", "slow")
+        limiter = get_claude_limiter(2)
+        peak = 0
+        done = False
+
+        async def sample():
+            nonlocal peak
+            while not done:
+                peak = max(peak, limiter.active)
+                await asyncio.sleep(0.01)
+
+        sampler = asyncio.create_task(sample())
+        results = await asyncio.gather(*(runner.run_async("hi") for _ in range(4)))
+        done = True
+        await sampler
+
+        assert len(results) == 4
+        assert peak == 2
+
+    async def test_timeout_kills_process_group(self, runner, tmp_path, monkeypatch):
+        """Timeouts raise ClaudeTimeoutError and kill grandchildren."""
+        pidfile = tmp_path / "child.pid"
+        monkeypatch.setenv("FAKE_CLAUDE_MODE", "sleep")
+        monkeypatch.setenv("FAKE_CLAUDE_PIDFILE", str(pidfile))
+
+        with pytest.raises(ClaudeTimeoutError):
+            await runner.run_async("hi", timeout=1)
+
+        child_pid = int(pidfile.read_text())
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline and _pid_alive(child_pid):
+            await asyncio.sleep(0.05)
+        assert not _pid_alive(child_pid)
+        assert get_claude_limiter().active == 0
+
+    async def test_cancellation_kills_process_group(self, runner, tmp_path, monkeypatch):
+        """Cancelling the task kills the CLI and its children."""
+        pidfile = tmp_path / "child.pid"
+        monkeypatch.setenv("FAKE_CLAUDE_MODE", "sleep")
+        monkeypatch.setenv("FAKE_CLAUDE_PIDFILE", str(pidfile))
+
+        task = asyncio.create_task(runner.run_async("hi"))
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline and not pidfile.exists():
+            await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        child_pid = int(pidfile.read_text())
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline and _pid_alive(child_pid):
+            await asyncio.sleep(0.05)
+        assert not _pid_alive(child_pid)
+
+    def test_sync_facade_without_loop(self, runner):
+        """run() works from plain synchronous code."""
+        assert runner.run("hi").text == "hello"
+
+    async def test_sync_facade_inside_running_loop(self, runner):
+        """run() works even when called from inside an event loop."""
+        assert runner.run("hi").text == "hello"
+
+    def test_invalid_max_concurrent_falls_back(self, runner):
+        """Non-integer config values use the default pool size."""
+        runner.config.claude.max_concurrent = MagicMock()
+        assert runner._max_concurrent() == llm_clients.DEFAULT_MAX_CONCURRENT
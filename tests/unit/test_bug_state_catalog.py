@@ -0,0 +1,166 @@
+"""
+Tests for the BugStateStore phase catalog.
+
+Tests verify:
+- save/delete/append_transition keep catalog.json current
+- list_all(phase=...) answers without loading unchanged state files
+- Out-of-band edits, additions and removals are picked up
+- A corrupt catalog is rebuilt
+- Read-only listings (StateGatherer) don't write the catalog
+"""
+
+import json
+import shutil
+from unittest.mock import MagicMock
+
+import pytest
+
+from swarm_attack.bug_models import (
+    AgentCost,
+    BugPhase,
+    BugReport,
+    BugState,
+    PhaseTransition,
+)
+from swarm_attack.bug_state_store import BugCatalogEntry, BugStateStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BugStateStore(base_path=tmp_path / "bugs")
+
+
+def make_bug(bug_id, phase=BugPhase.CREATED, description="Something broke\nDetails"):
+    return BugState(
+        bug_id=bug_id,
+        phase=phase,
+        created_at="",
+        updated_at="",
+        report=BugReport(description=description),
+    )
+
+
+def read_catalog(store):
+    data = json.loads((store.base_path / "catalog.json").read_text())
+    return {bug_id: BugCatalogEntry.from_dict(e) for bug_id, e in data["bugs"].items()}
+
+
+class TestCatalogMaintenance:
+    """Store operations update the catalog."""
+
+    def test_save_records_summary(self, store):
+        bug = make_bug("bug-1", BugPhase.ANALYZING)
+        bug.costs.append(AgentCost.create("analyzer", cost_usd=0.25))
+        store.save(bug)
+
+        entry = read_catalog(store)["bug-1"]
+
+        assert entry.phase == "analyzing"
+        assert entry.title == "Something broke"
+        assert entry.cost_usd == 0.25
+        assert entry.updated_at == bug.updated_at
+
+    def test_delete_removes_entry(self, store):
+        store.save(make_bug("bug-1"))
+        store.save(make_bug("bug-2"))
+
+        store.delete("bug-1")
+
+        assert set(read_catalog(store)) == {"bug-2"}
+
+    def test_transition_after_save(self, store):
+        bug = make_bug("bug-1", BugPhase.PLANNED)
+        store.save(bug)
+
+        store.approve_fix("bug-1")
+
+        assert read_catalog(store)["bug-1"].phase == "approved"
+        assert store.list_all(BugPhase.APPROVED) == ["bug-1"]
+
+
+class TestListAll:
+    """Listing is served from the catalog."""
+
+    def test_filter_by_phase(self, store):
+        store.save(make_bug("bug-a", BugPhase.CREATED))
+        store.save(make_bug("bug-b", BugPhase.FIXED))
+        store.save(make_bug("bug-c", BugPhase.CREATED))
+
+        assert store.list_all() == ["bug-a", "bug-b", "bug-c"]
+        assert store.list_all(BugPhase.CREATED) == ["bug-a", "bug-c"]
+        assert store.list_all(BugPhase.BLOCKED) == []
+
+    def test_unchanged_states_not_parsed(self, store, monkeypatch):
+        for i in range(5):
+            store.save(make_bug(f"bug-{i}"))
+        fresh = BugStateStore(base_path=store.base_path)
+        parse = MagicMock(side_effect=BugCatalogEntry.from_state_file)
+        monkeypatch.setattr(BugCatalogEntry, "from_state_file", parse)
+        fresh.load = MagicMock(side_effect=AssertionError("should use catalog"))
+
+        assert len(fresh.list_all(BugPhase.CREATED)) == 5
+        parse.assert_not_called()
+
+    def test_out_of_band_changes(self, store):
+        store.save(make_bug("bug-1"))
+        store.save(make_bug("bug-2"))
+        store.list_all()
+
+        # Edited, removed and added behind the store's back
+        state_path = store.base_path / "bug-1" / "state.json"
+        data = json.loads(state_path.read_text())
+        data["phase"] = "fixed"
+        state_path.write_text(json.dumps(data, indent=4))
+        shutil.rmtree(store.base_path / "bug-2")
+        other = BugStateStore(base_path=store.base_path)
+        other.save(make_bug("bug-3", BugPhase.FIXED))
+
+        assert store.list_all(BugPhase.FIXED) == ["bug-1", "bug-3"]
+        assert store.list_all() == ["bug-1", "bug-3"]
+
+    def test_corrupt_state_listed_but_unfiltered(self, store):
+        store.save(make_bug("bug-1"))
+        (store.base_path / "bad").mkdir()
+        (store.base_path / "bad" / "state.json").write_text("{not json")
+
+        assert store.list_all() == ["bad", "bug-1"]
+        assert store.list_all(BugPhase.CREATED) == ["bug-1"]
+
+    def test_corrupt_catalog_rebuilt(self, store):
+        store.save(make_bug("bug-1"))
+        (store.base_path / "catalog.json").write_text("garbage")
+
+        assert BugStateStore(base_path=store.base_path).list_all(BugPhase.CREATED) == ["bug-1"]
+        assert set(read_catalog(store)) == {"bug-1"}
+
+    def test_missing_base_path(self, tmp_path):
+        assert BugStateStore(base_path=tmp_path / "none").list_all() == []
+
+
+class TestReadOnlyCatalog:
+    """catalog(persist=False) syncs in memory only."""
+
+    def test_no_files_written(self, store):
+        store.save(make_bug("bug-1"))
+        (store.base_path / "catalog.json").unlink()
+        (store.base_path / "catalog.json.lock").unlink(missing_ok=True)
+
+        entries = BugStateStore(base_path=store.base_path).catalog(persist=False)
+
+        assert set(entries) == {"bug-1"}
+        assert not (store.base_path / "catalog.json").exists()
+        assert not (store.base_path / "catalog.json.lock").exists()
+
+    def test_state_gatherer_reads_without_writing(self, tmp_path, monkeypatch):
+        from swarm_attack.chief_of_staff.state_gatherer import StateGatherer
+
+        monkeypatch.chdir(tmp_path)
+        bugs = tmp_path / ".swarm" / "bugs"
+        BugStateStore(base_path=bugs).save(make_bug("bug-1", BugPhase.FIXED))
+        (bugs / "catalog.json").unlink()
+        (bugs / "catalog.json.lock").unlink(missing_ok=True)
+
+        summaries = StateGatherer(MagicMock()).gather_bugs()
+
+        assert [(b.bug_id, b.phase) for b in summaries] == [("bug-1", "fixed")]
+        assert sorted(p.name for p in bugs.iterdir()) == ["bug-1"]
@@ -0,0 +1,236 @@
+"""
+Tests for streamed (stream-json) ClaudeCliRunner runs.
+
+Uses a small fake CLI script that prints line-delimited JSON events.
+
+Tests verify:
+- Events are yielded incrementally and the final result is parsed
+- Progress (turns, tokens, cost) is tracked and reported via callback
+- StreamLimits terminate runaway runs early
+- Timeouts and CLI errors surface as the usual exceptions
+- Agents stream through the shared CLI pool and log progress per turn
+"""
+
+import json
+import stat
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+import swarm_attack.llm_clients as llm_clients
+from swarm_attack.agents.base import AgentResult, BaseAgent
+from swarm_attack.llm_clients import (
+    AsyncClaudeCliRunner,
+    ClaudeCliRunner,
+    ClaudeInvocationError,
+    ClaudeStreamAborted,
+    ClaudeTimeoutError,
+    StreamLimits,
+    StreamProgress,
+    get_claude_limiter,
+)
+
+FAKE_CLI = """#!{python}
+import json, os, sys, time
+assert "stream-json" in sys.argv and "--verbose" in sys.argv
+mode = os.environ.get("FAKE_CLAUDE_MODE", "ok")
+if mode == "fail":
+    sys.stderr.write("bad flag")
+    sys.exit(2)
+print(json.dumps({{"type": "system", "subtype": "init"}}), flush=True)
+for i in range(1, 4):
+    print("not json noise", flush=True)
+    print(json.dumps({{
+        "type": "assistant",
+        "message": {{
+            "id": f"msg_{{i}}",
+            "content": [{{"type": "text", "text": f"step {{i}} DANGER" if i == 2 else f"step {{i}}"}}],
+            "usage": {{"input_tokens": 10, "output_tokens": 100}},
+        }},
+    }}), flush=True)
+    if mode == "hang":
+        time.sleep(60)
+print(json.dumps({{
+    "type": "result",
+    "subtype": "error_max_turns" if mode == "max_turns" else "success",
+    "result": "done",
+    "total_cost_usd": 0.5,
+    "num_turns": 3,
+    "duration_ms": 5,
+    "session_id": "sess-1",
+}}), flush=True)
+"""
+
+
+@pytest.fixture
+def runner(tmp_path):
+    """Create a ClaudeCliRunner pointing at the fake streaming CLI."""
+    fake = tmp_path / "fake-claude"
+    fake.write_text(FAKE_CLI.format(python=sys.executable))
+    fake.chmod(fake.stat().st_mode | stat.S_IEXEC)
+
+    config = MagicMock()
+    config.repo_root = str(tmp_path)
+    config.claude.binary = str(fake)
+    config.claude.max_turns = 5
+    config.claude.timeout_seconds = 30
+    return ClaudeCliRunner(config=config)
+
+
+class TestStreamLimits:
+    """Tests for StreamLimits.check."""
+
+    def test_no_limits(self):
+        """Default limits never stop a run."""
+        assert StreamLimits().check(StreamProgress(num_turns=99), "anything") is None
+
+    def test_turn_and_token_limits(self):
+        """Turn and output-token budgets trip once exceeded."""
+        limits = StreamLimits(max_turns=2, max_output_tokens=500)
+        assert limits.check(StreamProgress(num_turns=2, output_tokens=500)) is None
+        assert "turns" in limits.check(StreamProgress(num_turns=3))
+        assert "output tokens" in limits.check(StreamProgress(output_tokens=501))
+
+    def test_cost_limit(self):
+        """Reported cost over budget trips the limit."""
+        assert "cost" in StreamLimits(max_cost_usd=0.1).check(StreamProgress(cost_usd=0.2))
+
+    def test_stop_pattern(self):
+        """Stop patterns match new assistant content."""
+        limits = StreamLimits(stop_patterns=[r"rm -rf"])
+        assert limits.check(StreamProgress(), "running rm -rf /") is not None
+        assert limits.check(StreamProgress(), "all good") is None
+
+
+class TestClaudeStream:
+    """Tests for ClaudeCliRunner.stream and run_streaming."""
+
+    def test_stream_yields_events_and_result(self, runner):
+        """All JSON events are yielded and the result is parsed."""
+        claude_stream = runner.stream("hi")
+        types = [event["type"] for event in claude_stream]
+
+        assert types == ["system", "assistant", "assistant", "assistant", "result"]
+        assert claude_stream.result.text == "done"
+        assert claude_stream.result.total_cost_usd == 0.5
+        assert claude_stream.progress.num_turns == 3
+        assert claude_stream.progress.output_tokens == 300
+
+    def test_progress_callback(self, runner):
+        """on_progress receives snapshots as turns and cost change."""
+        snapshots = []
+        result = runner.run_streaming("hi", on_progress=snapshots.append)
+
+        assert result.text == "done"
+        assert [s.num_turns for s in snapshots[:3]] == [1, 2, 3]
+        assert snapshots[-1].cost_usd == 0.5
+
+    def test_turn_budget_aborts_early(self, runner):
+        """Exceeding max_turns stops the run before the result."""
+        seen = []
+        with pytest.raises(ClaudeStreamAborted) as exc_info:
+            runner.run_streaming(
+                "hi",
+                limits=StreamLimits(max_turns=1),
+                on_event=lambda e: seen.append(e["type"]),
+            )
+
+        assert "result" not in seen
+        assert exc_info.value.progress.num_turns == 2
+
+    def test_stop_pattern_aborts(self, runner):
+        """A matching stop pattern terminates the run."""
+        with pytest.raises(ClaudeStreamAborted) as exc_info:
+            runner.run_streaming("hi", limits=StreamLimits(stop_patterns=["DANGER"]))
+
+        assert "DANGER" in exc_info.value.reason
+
+    def test_timeout(self, runner, monkeypatch):
+        """A hung stream raises ClaudeTimeoutError."""
+        monkeypatch.setenv("FAKE_CLAUDE_MODE", "hang")
+
+        with pytest.raises(ClaudeTimeoutError):
+            runner.run_streaming("hi", timeout=1)
+
+    def test_cli_failure(self, runner, monkeypatch):
+        """Non-zero exit raises ClaudeInvocationError with stderr."""
+        monkeypatch.setenv("FAKE_CLAUDE_MODE", "fail")
+
+        with pytest.raises(ClaudeInvocationError) as exc_info:
+            runner.run_streaming("hi")
+
+        assert exc_info.value.returncode == 2
+        assert "bad flag" in exc_info.value.stderr
+
+    def test_error_subtype(self, runner, monkeypatch):
+        """Error result subtypes raise like run()."""
+        monkeypatch.setenv("FAKE_CLAUDE_MODE", "max_turns")
+
+        with pytest.raises(ClaudeInvocationError, match="error_max_turns"):
+            runner.run_streaming("hi")
+
+    def test_breaking_early_kills_process(self, runner, monkeypatch):
+        """Abandoning the iterator terminates the CLI."""
+        monkeypatch.setenv("FAKE_CLAUDE_MODE", "hang")
+        claude_stream = runner.stream("hi")
+        iterator = iter(claude_stream)
+        next(iterator)
+        iterator.close()
+
+        assert claude_stream._proc.poll() is not None
+
+
+class StreamingAgent(BaseAgent):
+    name = "coder"
+
+    def run(self, context):
+        return AgentResult.success_result()
+
+
+class TestAgentStreaming:
+    """Tests for BaseAgent._run_llm."""
+
+    @pytest.fixture(autouse=True)
+    def reset_limiter(self, monkeypatch):
+        monkeypatch.setattr(llm_clients, "_limiter", None)
+
+    def test_streams_and_logs_each_turn(self, runner, tmp_path):
+        """With stream_progress on, each new turn is logged to progress.txt."""
+        config = runner.config
+        config.swarm_path = tmp_path / ".swarm"
+        config.claude.stream_progress = True
+        config.claude.max_concurrent = 1
+        llm = AsyncClaudeCliRunner(config=config)
+        active = []
+        original = ClaudeCliRunner.run_streaming
+
+        def spy(self, prompt, **kwargs):
+            active.append(get_claude_limiter().active)
+            return original(self, prompt, **kwargs)
+
+        agent = StreamingAgent(config, llm_runner=llm)
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(ClaudeCliRunner, "run_streaming", spy)
+            result = agent._run_llm("hi", max_turns=3)
+
+        lines = (tmp_path / ".swarm" / "progress.txt").read_text().splitlines()
+        assert result.text == "done"
+        assert [line.split("] ", 1)[1].split(" cost")[0] for line in lines] == [
+            "LLM_PROGRESS agent=coder turns=1",
+            "LLM_PROGRESS agent=coder turns=2",
+            "LLM_PROGRESS agent=coder turns=3",
+        ]
+        assert active == [1]  # Streamed inside a pool slot
+        assert get_claude_limiter().active == 0
+
+    def test_buffered_without_stream_progress(self, tmp_path):
+        """Without stream_progress the runner's plain run() is used."""
+        config = MagicMock()
+        config.claude.stream_progress = False
+        llm = MagicMock()
+
+        StreamingAgent(config, llm_runner=llm)._run_llm("hi", max_turns=3)
+
+        llm.run.assert_called_once_with("hi", max_turns=3)
+        llm.run_streaming.assert_not_called()
@@ -0,0 +1,177 @@
+"""
+Tests for batched, cached pytest collectability checks.
+
+Tests verify:
+- All candidates are collected in one pytest process
+- Collection errors are attributed to the files that caused them
+- Verdicts are cached and invalidated by changes to imported modules
+- Unattributable failures fall back to per-file collection
+- Timeouts are not cached and an environment change discards the cache
+- Checks from several threads run one at a time
+"""
+
+import json
+import subprocess
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from swarm_attack.testing.collection import CollectabilityChecker
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """A tiny repo with a local package and generated tests."""
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "pkg" / "helper.py").write_text("VALUE = 1\n")
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "test_ok.py").write_text("from pkg.helper import VALUE\n\ndef test_ok():\n    assert VALUE\n")
+    (tests / "test_broken.py").write_text("import pkg.missing\n\ndef test_broken():\n    pass\n")
+    (tests / "test_plain.py").write_text("def test_plain():\n    pass\n")
+    return tmp_path
+
+
+def run_counter():
+    return patch("swarm_attack.testing.collection.subprocess.run", wraps=subprocess.run)
+
+
+class TestBatchedCollection:
+    """One pytest process for all candidates."""
+
+    def test_errors_attributed_per_file(self, repo):
+        checker = CollectabilityChecker(repo)
+        files = [repo / "tests" / name for name in ("test_ok.py", "test_broken.py", "test_plain.py")]
+
+        with run_counter() as run:
+            verdicts = checker.check(files)
+
+        assert run.call_count == 1
+        assert verdicts == {files[0]: True, files[1]: False, files[2]: True}
+
+    def test_unattributable_failure_falls_back(self, repo):
+        (repo / "tests" / "conftest.py").write_text("raise RuntimeError('boom')\n")
+        checker = CollectabilityChecker(repo)
+        files = [repo / "tests" / "test_ok.py", repo / "tests" / "test_plain.py"]
+
+        with run_counter() as run:
+            verdicts = checker.check(files)
+
+        assert run.call_count == 3
+        assert verdicts == {files[0]: False, files[1]: False}
+
+    def test_timeout_falls_back(self, repo):
+        checker = CollectabilityChecker(repo)
+        files = [repo / "tests" / "test_ok.py", repo / "tests" / "test_plain.py"]
+        results = [subprocess.TimeoutExpired("pytest", 120), MagicMock(returncode=0), MagicMock(returncode=2)]
+
+        with patch("swarm_attack.testing.collection.subprocess.run", side_effect=results):
+            verdicts = checker.check(files)
+
+        assert verdicts == {files[0]: True, files[1]: False}
+
+    def test_timeout_verdict_not_cached(self, repo):
+        checker = CollectabilityChecker(repo)
+        test_ok = repo / "tests" / "test_ok.py"
+
+        with patch(
+            "swarm_attack.testing.collection.subprocess.run",
+            side_effect=subprocess.TimeoutExpired("pytest", 30),
+        ):
+            assert checker.check([test_ok]) == {test_ok: False}
+
+        with run_counter() as run:
+            assert checker.check([test_ok]) == {test_ok: True}
+        assert run.call_count == 1
+
+
+class TestVerdictCache:
+    """Verdicts are reused until something relevant changes."""
+
+    def test_cached_verdicts_reused(self, repo, tmp_path):
+        cache_path = tmp_path / "cache" / "collect.json"
+        files = [repo / "tests" / "test_ok.py", repo / "tests" / "test_broken.py"]
+        CollectabilityChecker(repo, cache_path=cache_path).check(files)
+
+        with run_counter() as run:
+            verdicts = CollectabilityChecker(repo, cache_path=cache_path).check(files)
+
+        run.assert_not_called()
+        assert verdicts == {files[0]: True, files[1]: False}
+
+    def test_environment_change_invalidates(self, repo, tmp_path):
+        cache_path = tmp_path / "cache" / "collect.json"
+        broken = repo / "tests" / "test_broken.py"
+        CollectabilityChecker(repo, cache_path=cache_path).check([broken])
+
+        with patch(
+            "swarm_attack.testing.collection.environment_fingerprint",
+            return_value="other-env",
+        ), run_counter() as run:
+            CollectabilityChecker(repo, cache_path=cache_path).check([broken])
+
+        assert run.call_count == 1
+
+    def test_imported_module_change_invalidates(self, repo):
+        checker = CollectabilityChecker(repo)
+        test_ok = repo / "tests" / "test_ok.py"
+        assert checker.check([test_ok]) == {test_ok: True}
+
+        (repo / "pkg" / "helper.py").write_text("OTHER = 1\n")
+
+        assert checker.check([test_ok]) == {test_ok: False}
+
+    def test_new_module_invalidates(self, repo):
+        checker = CollectabilityChecker(repo)
+        broken = repo / "tests" / "test_broken.py"
+        assert checker.check([broken]) == {broken: False}
+
+        (repo / "pkg" / "missing.py").write_text("")
+
+        assert checker.check([broken]) == {broken: True}
+
+    def test_unrelated_change_keeps_cache(self, repo):
+        checker = CollectabilityChecker(repo)
+        test_plain = repo / "tests" / "test_plain.py"
+        checker.check([test_plain])
+
+        (repo / "pkg" / "helper.py").write_text("VALUE = 2\n")
+
+        with run_counter() as run:
+            checker.check([test_plain])
+        run.assert_not_called()
+
+
+class TestConcurrentChecks:
+    """A checker shared by worker threads stays consistent."""
+
+    def test_checks_serialized(self, repo, tmp_path):
+        cache_path = tmp_path / "cache" / "collect.json"
+        checker = CollectabilityChecker(repo, cache_path=cache_path)
+        names = ("test_ok.py", "test_broken.py", "test_plain.py")
+        active = []
+        overlaps = []
+
+        def collect(cmd, **kwargs):
+            active.append(cmd)
+            overlaps.append(len(active))
+            time.sleep(0.05)
+            active.pop()
+            return MagicMock(returncode=0)
+
+        with patch("swarm_attack.testing.collection.subprocess.run", side_effect=collect):
+            threads = [
+                threading.Thread(target=checker.check, args=([repo / "tests" / name],))
+                for name in names
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert max(overlaps) == 1
+        assert len(json.loads(cache_path.read_text())["files"]) == 3
@@ -0,0 +1,221 @@
+"""
+Tests for buffered EventPersistence writes and EventBus flushing.
+
+Tests verify:
+- Buffered appends are batched and written on flush/close
+- Queries see buffered events (read-your-writes)
+- Full queues and the flush interval trigger background writes
+- Day rollover switches to the new file in order
+- Failed background flushes are logged
+- get_event_bus() buffers according to the events config
+"""
+
+import json
+import logging
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import swarm_attack.events.bus as bus_module
+from swarm_attack.config import EventsConfig
+from swarm_attack.events.bus import EventBus, get_event_bus
+from swarm_attack.events.persistence import BufferedEventWriter, EventPersistence
+from swarm_attack.events.types import EventType, SwarmEvent
+
+
+def _read_lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestBufferedEventWriter:
+    """Tests for the BufferedEventWriter."""
+
+    def test_rejects_unknown_durability(self):
+        """Unknown durability modes raise ValueError."""
+        with pytest.raises(ValueError):
+            BufferedEventWriter(durability="sometimes")
+
+    def test_lines_written_on_flush(self, tmp_path):
+        """Queued lines are written in order on flush."""
+        writer = BufferedEventWriter(flush_interval=60)
+        path = tmp_path / "events.jsonl"
+        try:
+            writer.write(path, "a\n")
+            writer.write(path, "b\n")
+            writer.flush()
+            assert path.read_text() == "a\nb\n"
+        finally:
+            writer.close()
+
+    def test_batch_is_single_write(self, tmp_path):
+        """A batch for one file is coalesced into a single write call."""
+        writer = BufferedEventWriter(flush_interval=60)
+        path = tmp_path / "events.jsonl"
+        try:
+            for i in range(10):
+                writer.write(path, f"{i}\n")
+            handle = writer._get_handle(path)
+            with patch.object(handle, "write", wraps=handle.write) as spy:
+                writer.flush()
+            assert spy.call_count == 1
+        finally:
+            writer.close()
+
+    def test_full_queue_triggers_background_flush(self, tmp_path):
+        """Reaching max_pending wakes the background thread."""
+        writer = BufferedEventWriter(max_pending=3, flush_interval=60)
+        path = tmp_path / "events.jsonl"
+        try:
+            for i in range(3):
+                writer.write(path, f"{i}\n")
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline and not (
+                path.exists() and path.read_text() == "0\n1\n2\n"
+            ):
+                time.sleep(0.01)
+            assert path.read_text() == "0\n1\n2\n"
+        finally:
+            writer.close()
+
+    def test_interval_triggers_background_flush(self, tmp_path):
+        """Lines are written after flush_interval without an explicit flush."""
+        writer = BufferedEventWriter(max_pending=1000, flush_interval=0.05)
+        path = tmp_path / "events.jsonl"
+        try:
+            writer.write(path, "x\n")
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline and not path.exists():
+                time.sleep(0.01)
+            assert path.read_text() == "x\n"
+        finally:
+            writer.close()
+
+    def test_failed_background_flush_is_logged(self, tmp_path, caplog):
+        """A batch that can't be written is reported, not silently dropped."""
+        writer = BufferedEventWriter(max_pending=1000, flush_interval=0.05)
+        path = tmp_path / "missing" / "events.jsonl"
+        try:
+            with caplog.at_level(logging.WARNING, logger="swarm_attack.events.persistence"):
+                writer.write(path, "x\n")
+                deadline = time.monotonic() + 5
+                while time.monotonic() < deadline and not caplog.records:
+                    time.sleep(0.01)
+            assert "Failed to write buffered events" in caplog.text
+        finally:
+            writer.close()
+
+    def test_rollover_switches_files_in_order(self, tmp_path):
+        """Lines for a new day go to the new file; the handle follows."""
+        writer = BufferedEventWriter(flush_interval=60)
+        day1 = tmp_path / "events-2000-01-01.jsonl"
+        day2 = tmp_path / "events-2000-01-02.jsonl"
+        try:
+            writer.write(day1, "a\n")
+            writer.write(day2, "b\n")
+            writer.write(day2, "c\n")
+            writer.flush()
+            assert day1.read_text() == "a\n"
+            assert day2.read_text() == "b\nc\n"
+            assert writer._handle_path == day2
+        finally:
+            writer.close()
+
+    def test_close_flushes_and_later_writes_go_direct(self, tmp_path):
+        """close() flushes; writes after close are appended synchronously."""
+        writer = BufferedEventWriter(flush_interval=60)
+        path = tmp_path / "events.jsonl"
+        writer.write(path, "a\n")
+        writer.close()
+        assert path.read_text() == "a\n"
+
+        writer.write(path, "b\n")
+        assert path.read_text() == "a\nb\n"
+
+    def test_fsync_durability(self, tmp_path):
+        """durability='fsync' fsyncs each batch."""
+        writer = BufferedEventWriter(flush_interval=60, durability="fsync")
+        path = tmp_path / "events.jsonl"
+        try:
+            writer.write(path, "a\n")
+            with patch("swarm_attack.events.persistence.os.fsync") as mock_fsync:
+                writer.flush()
+            mock_fsync.assert_called_once()
+        finally:
+            writer.close()
+
+
+class TestBufferedPersistence:
+    """Tests for EventPersistence and EventBus in buffered mode."""
+
+    def test_query_sees_buffered_events(self, tmp_path):
+        """Queries flush pending events first."""
+        persistence = EventPersistence(
+            tmp_path / ".swarm", buffered=True, flush_interval=60
+        )
+        try:
+            persistence.append(SwarmEvent(event_type=EventType.BUG_FIXED, feature_id="a"))
+            results = persistence.query(feature_id="a")
+            assert len(results) == 1
+        finally:
+            persistence.close()
+
+    def test_bus_flush_persists_events(self, tmp_path):
+        """EventBus.flush writes buffered events for other readers."""
+        bus = EventBus(tmp_path / ".swarm", persist=True, buffered=True)
+        try:
+            bus.emit(SwarmEvent(event_type=EventType.BUG_FIXED, feature_id="test"))
+            bus.flush()
+
+            reader = EventPersistence(tmp_path / ".swarm")
+            log_path = reader._get_log_path()
+            assert [e["feature_id"] for e in _read_lines(log_path)] == ["test"]
+        finally:
+            bus.close()
+
+    def test_unbuffered_flush_and_close_are_noops(self, tmp_path):
+        """flush/close are safe on unbuffered persistence."""
+        persistence = EventPersistence(tmp_path / ".swarm")
+        persistence.append(SwarmEvent(feature_id="a"))
+        persistence.flush()
+        persistence.close()
+        assert len(persistence.query()) == 1
+
+
+class TestDefaultBusConfig:
+    """Tests for get_event_bus() and the events config section."""
+
+    @pytest.fixture(autouse=True)
+    def reset_bus(self):
+        bus_module._default_bus = None
+        yield
+        if bus_module._default_bus is not None:
+            bus_module._default_bus.close()
+        bus_module._default_bus = None
+
+    def test_buffered_by_config(self, tmp_path):
+        """A config with events.buffered persists through the batch writer."""
+        config = MagicMock()
+        config.events = EventsConfig(flush_interval_seconds=60, durability="fsync")
+
+        bus = get_event_bus(tmp_path / ".swarm", config=config)
+
+        writer = bus._persistence._writer
+        assert writer is not None
+        assert writer._flush_interval == 60
+        assert writer._fsync is True
+
+    def test_buffering_disabled(self, tmp_path):
+        """events.buffered=False keeps synchronous appends."""
+        config = MagicMock()
+        config.events = EventsConfig(buffered=False)
+
+        bus = get_event_bus(tmp_path / ".swarm", config=config)
+
+        assert bus._persistence._writer is None
+
+    def test_without_config_stays_synchronous(self, tmp_path):
+        """Callers without a real events section get the synchronous bus."""
+        bus = get_event_bus(tmp_path / ".swarm", config=MagicMock())
+
+        assert bus._persistence._writer is None
@@ -0,0 +1,153 @@
+"""
+Tests for EventLogger read paths.
+
+Tests verify:
+- Limited queries read backwards from EOF and return newest last
+- Issue timelines use a persisted, incrementally extended offset index
+- follow() yields appended events and survives log replacement
+"""
+
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from swarm_attack.event_logger import EventLogger, IssueIndex
+
+
+@pytest.fixture
+def config(tmp_path):
+    config = MagicMock()
+    config.swarm_path = tmp_path / ".swarm"
+    return config
+
+
+@pytest.fixture
+def logger(config):
+    return EventLogger(config)
+
+
+def fill(logger, count=50):
+    for i in range(count):
+        logger.log("feat", "step", {"issue": i % 5 + 1, "n": i})
+
+
+class TestTailReads:
+    """Limited reads scan backwards."""
+
+    def test_recent_events(self, logger, monkeypatch):
+        fill(logger)
+        monkeypatch.setattr("swarm_attack.event_logger.TAIL_BLOCK_SIZE", 64)
+
+        events = logger.get_recent_events("feat", count=3)
+
+        assert [e["n"] for e in events] == [47, 48, 49]
+
+    def test_filters_with_limit(self, logger):
+        fill(logger)
+        logger.log("feat", "done", {"issue": 2})
+
+        assert [e["event"] for e in logger.get_events("feat", event_type="done", limit=5)] == ["done"]
+
+    def test_partial_and_corrupt_lines(self, logger, config):
+        fill(logger, 3)
+        with open(config.swarm_path / "events" / "feat.jsonl", "a") as f:
+            f.write("not json\n")
+            f.write('{"event": "half')
+
+        assert [e["n"] for e in logger.get_events("feat", limit=10)] == [0, 1, 2]
+
+    def test_unlimited_reads_everything(self, logger):
+        fill(logger, 10)
+        assert len(logger.get_events("feat")) == 10
+
+    def test_missing_log(self, logger):
+        assert logger.get_recent_events("nope") == []
+
+
+class TestIssueIndex:
+    """Issue timelines seek through an offset index."""
+
+    def test_timeline(self, logger):
+        fill(logger)
+
+        timeline = logger.get_issue_timeline("feat", 3)
+
+        assert [e["n"] for e in timeline] == list(range(2, 50, 5))
+
+    def test_sidecar_persisted_and_extended(self, logger, config):
+        fill(logger, 10)
+        logger.get_issue_timeline("feat", 1)
+        sidecar = config.swarm_path / "events" / "feat.issues.idx"
+        first = IssueIndex.from_dict(json.loads(sidecar.read_text()))
+
+        logger.log("feat", "step", {"issue": 1, "n": 99})
+        fresh = EventLogger(config)
+
+        assert [e["n"] for e in fresh.get_issue_timeline("feat", 1)] == [0, 5, 99]
+        second = IssueIndex.from_dict(json.loads(sidecar.read_text()))
+        assert second.issues["1"][:2] == first.issues["1"]
+
+    def test_rewritten_log_reindexed(self, logger, config):
+        fill(logger, 10)
+        logger.get_issue_timeline("feat", 1)
+
+        (config.swarm_path / "events" / "feat.jsonl").write_text(
+            json.dumps({"event": "x", "issue": 1, "n": 7}) + "\n"
+        )
+
+        assert [e["n"] for e in logger.get_issue_timeline("feat", 1)] == [7]
+
+    def test_issue_and_limit(self, logger):
+        fill(logger)
+        assert [e["n"] for e in logger.get_events("feat", issue_number=2, limit=2)] == [41, 46]
+
+
+class TestFollow:
+    """follow() tails the log."""
+
+    def test_yields_new_events(self, logger):
+        fill(logger, 3)
+        stop = threading.Event()
+        seen = []
+
+        def consume():
+            for event in logger.follow("feat", poll_interval=0.01, stop=stop):
+                seen.append(event["n"])
+                if len(seen) == 2:
+                    stop.set()
+
+        thread = threading.Thread(target=consume)
+        thread.start()
+        threading.Event().wait(0.05)
+        logger.log("feat", "step", {"n": 100})
+        logger.log("feat", "step", {"n": 101})
+        thread.join(timeout=5)
+
+        assert seen == [100, 101]
+
+    def test_from_start_and_idle_timeout(self, logger):
+        fill(logger, 3)
+
+        events = list(logger.follow("feat", from_start=True, poll_interval=0.01, idle_timeout=0.05))
+
+        assert [e["n"] for e in events] == [0, 1, 2]
+
+    def test_truncated_log_followed_from_start(self, logger, config):
+        fill(logger, 3)
+        path = config.swarm_path / "events" / "feat.jsonl"
+        seen = []
+
+        def consume():
+            for event in logger.follow("feat", poll_interval=0.01, idle_timeout=1):
+                seen.append(event["n"])
+                return
+
+        thread = threading.Thread(target=consume)
+        thread.start()
+        threading.Event().wait(0.05)
+        path.write_text(json.dumps({"n": 1}) + "\n")
+        thread.join(timeout=5)
+
+        assert seen == [1]
@@ -0,0 +1,205 @@
+"""
+Tests for EventPersistence segment indexes and reverse iteration.
+
+Tests verify:
+- Sidecar indexes record offsets by feature_id/event_type and timestamp bounds
+- Indexes catch up incrementally on appended lines
+- Queries skip segments ruled out by ``since``
+- iter_reverse and get_recent return newest events first
+"""
+
+import json
+from datetime import datetime, timedelta
+
+from swarm_attack.events.persistence import EventPersistence, SegmentIndex
+from swarm_attack.events.types import EventType, SwarmEvent
+
+
+def _write_segment(events_dir, date_str, events):
+    """Write events directly to a dated segment file."""
+    path = events_dir / f"events-{date_str}.jsonl"
+    with path.open("a") as f:
+        for event in events:
+            f.write(json.dumps(event.to_dict()) + "\n")
+    return path
+
+
+class TestSegmentIndex:
+    """Tests for sidecar index maintenance."""
+
+    def test_index_written_on_query(self, tmp_path):
+        """Querying creates a sidecar index next to the segment."""
+        persistence = EventPersistence(tmp_path / ".swarm")
+        persistence.append(SwarmEvent(event_type=EventType.SPEC_APPROVED, feature_id="a"))
+        persistence.append(SwarmEvent(event_type=EventType.BUG_FIXED, feature_id="b"))
+
+        persistence.query()
+
+        log_path = persistence._get_log_path()
+        data = json.loads(log_path.with_suffix(".idx").read_text())
+        assert len(data["lines"]) == 2
+        assert set(data["features"]) == {"a", "b"}
+        assert set(data["event_types"]) == {"spec.approved", "bug.fixed"}
+        assert data["size"] == log_path.stat().st_size
+
+    def test_index_catches_up_on_new_lines(self, tmp_path):
+        """Events appended after indexing are found by later queries."""
+        persistence = EventPersistence(tmp_path / ".swarm")
+        persistence.append(SwarmEvent(event_type=EventType.SPEC_APPROVED, feature_id="a"))
+        assert len(persistence.query(feature_id="a")) == 1
+
+        persistence.append(SwarmEvent(event_type=EventType.BUG_FIXED, feature_id="a"))
+
+        assert len(persistence.query(feature_id="a")) == 2
+        index = persistence.get_segment_index(persistence._get_log_path())
+        assert len(index.features["a"]) == 2
+
+    def test_sidecar_reused_by_new_instance(self, tmp_path):
+        """A fresh instance loads the sidecar instead of rescanning."""
+        persistence = EventPersistence(tmp_path / ".swarm")
+        persistence.append(SwarmEvent(event_type=EventType.SPEC_APPROVED, feature_id="a"))
+        persistence.query()
+
+        other = EventPersistence(tmp_path / ".swarm")
+        log_path = other._get_log_path()
+        index = other._read_index(log_path)
+        assert index is not None
+        assert index.size == log_path.stat().st_size
+        assert len(other.query(feature_id="a")) == 1
+
+    def test_partial_trailing_line_not_indexed(self, tmp_path):
+        """A line without a trailing newline waits for the next catch-up."""
+        persistence = EventPersistence(tmp_path / ".swarm")
+        persistence.append(SwarmEvent(event_type=EventType.SPEC_APPROVED, feature_id="a"))
+        log_path = persistence._get_log_path()
+        partial = json.dumps(SwarmEvent(feature_id="b").to_dict())
+        with log_path.open("a") as f:
+            f.write(partial[:10])
+
+        assert len(persistence.query()) == 1
+
+        with log_path.open("a") as f:
+            f.write(partial[10:] + "\n")
+
+        assert len(persistence.query(feature_id="b")) == 1
+
+    def test_rewritten_segment_is_reindexed(self, tmp_path):
+        """A segment replaced by a smaller file is reindexed from scratch."""
+        persistence = EventPersistence(tmp_path / ".swarm")
+        for i in range(3):
+            persistence.append(SwarmEvent(event_type=EventType.SPEC_APPROVED, feature_id="a"))
+        persistence.query()
+
+        log_path = persistence._get_log_path()
+        log_path.write_text(json.dumps(SwarmEvent(feature_id="z").to_dict()) + "\n")
+
+        results = persistence.query()
+        assert [e.feature_id for e in results] == ["z"]
+
+    def test_candidates_intersect_feature_and_type(self):
+        """Feature and type filters intersect offset sets."""
+        index = SegmentIndex(
+            lines=[0, 10, 20],
+            features={"a": [0, 20], "b": [10]},
+            event_types={"spec.approved": [0, 10], "bug.fixed": [20]},
+        )
+
+        assert index.candidates("a", [EventType.SPEC_APPROVED]) == [0]
+        assert index.candidates("a", None) == [0, 20]
+        assert index.candidates(None, [EventType.BUG_FIXED]) == [20]
+        assert index.candidates("missing", None) == []
+
+
+class TestIndexedQueries:
+    """Tests for query behaviour across segments."""
+
+    def test_since_skips_old_segments(self, tmp_path):
+        """Segments entirely before ``since`` are not read."""
+        persistence = EventPersistence(tmp_path / ".swarm")
+        events_dir = tmp_path / ".swarm" / "events"
+        old_ts = (datetime.now() - timedelta(days=10)).isoformat()
+        old_path = _write_segment(events_dir, "2000-01-01", [
+            SwarmEvent(event_type=EventType.SPEC_APPROVED, feature_id="a", timestamp=old_ts)
+        ])
+        persistence.append(SwarmEvent(event_type=EventType.SPEC_APPROVED, feature_id="a"))
+
+        # Index the old segment once, then make sure it is never reopened
+        persistence.query()
+        read_paths = []
+        original = persistence._iter_segment
+
+        def spy(log_path, *args, **kwargs):
+            read_paths.append(log_path)
+            return original(log_path, *args, **kwargs)
+
+        persistence._iter_segment = spy
+        results = persistence.query(since=datetime.now() - timedelta(hours=1))
+
+        assert len(results) == 1
+        assert old_path not in read_paths
+
+    def test_query_orders_days_newest_first(self, tmp_path):
+        """Days are newest first, lines within a day in write order."""
+        persistence = EventPersistence(tmp_path / ".swarm")
+        events_dir = tmp_path / ".swarm" / "events"
+        _write_segment(events_dir, "2000-01-01", [
+            SwarmEvent(feature_id="old-1"), SwarmEvent(feature_id="old-2"),
+        ])
+        _write_segment(events_dir, "2000-01-02", [
+            SwarmEvent(feature_id="new-1"), SwarmEvent(feature_id="new-2"),
+        ])
+
+        results = persistence.query()
+
+        assert [e.feature_id for e in results] == ["new-1", "new-2", "old-1", "old-2"]
+
+    def test_corrupt_line_is_skipped(self, tmp_path):
+        """Undecodable lines don't break queries."""
+        persistence = EventPersistence(tmp_path / ".swarm")
+        persistence.append(SwarmEvent(feature_id="a"))
+        with persistence._get_log_path().open("a") as f:
+            f.write("{not json\n")
+        persistence.append(SwarmEvent(feature_id="a"))
+
+        assert len(persistence.query(feature_id="a")) == 2
+
+
+class TestReverseIteration:
+    """Tests for newest-first iteration."""
+
+    def test_iter_reverse_newest_first(self, tmp_path):
+        """iter_reverse yields the latest events first across days."""
+        persistence = EventPersistence(tmp_path / ".swarm")
+        events_dir = tmp_path / ".swarm" / "events"
+        _write_segment(events_dir, "2000-01-01", [
+            SwarmEvent(feature_id="old-1"), SwarmEvent(feature_id="old-2"),
+        ])
+        _write_segment(events_dir, "2000-01-02", [
+            SwarmEvent(feature_id="new-1"), SwarmEvent(feature_id="new-2"),
+        ])
+
+        ids = [e.feature_id for e in persistence.iter_reverse()]
+
+        assert ids == ["new-2", "new-1", "old-2", "old-1"]
+
+    def test_iter_reverse_is_lazy(self, tmp_path):
+        """Taking one event doesn't touch older segments."""
+        persistence = EventPersistence(tmp_path / ".swarm")
+        events_dir = tmp_path / ".swarm" / "events"
+        _write_segment(events_dir, "2000-01-01", [SwarmEvent(feature_id="old")])
+        _write_segment(events_dir, "2000-01-02", [SwarmEvent(feature_id="new")])
+
+        first = next(persistence.iter_reverse())
+
+        assert first.feature_id == "new"
+        assert not (events_dir / "events-2000-01-01.idx").exists()
+
+    def test_get_recent_returns_latest(self, tmp_path):
+        """get_recent returns the most recent events up to the limit."""
+        persistence = EventPersistence(tmp_path / ".swarm")
+        for i in range(5):
+            persistence.append(SwarmEvent(feature_id=f"f{i}"))
+
+        results = persistence.get_recent(minutes=5, limit=2)
+
+        assert [e.feature_id for e in results] == ["f4", "f3"]
@@ -0,0 +1,260 @@
+"""
+Tests for the LLM response cache.
+
+Tests verify:
+- Keys change with any invocation parameter
+- TTL expiry and LRU eviction by total size
+- ClaudeCliRunner and CodexCliRunner serve repeats from the cache
+- Only opted-in agents get a cache, and only when enabled in config
+"""
+
+import json
+import os
+import stat
+import sys
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from swarm_attack.codex_client import CodexCliRunner
+from swarm_attack.config import LLMCacheConfig
+from swarm_attack.llm_cache import LLMResponseCache, get_response_cache
+from swarm_attack.llm_clients import ClaudeCliRunner, ClaudeInvocationError
+
+FAKE_CLAUDE = """#!{python}
+import json, os, sys
+counter = os.environ["FAKE_CLAUDE_COUNTER"]
+with open(counter, "a") as f:
+    f.write("x")
+if os.environ.get("FAKE_CLAUDE_FAIL"):
+    sys.exit(1)
+print(json.dumps({{
+    "type": "result", "subtype": "success", "result": "answer:" + sys.argv[-1],
+    "total_cost_usd": 0.25, "num_turns": 1, "duration_ms": 40, "session_id": "s1",
+}}))
+"""
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temp directory."""
+    return LLMResponseCache(tmp_path / "cache" / "llm")
+
+
+@pytest.fixture
+def counter(tmp_path, monkeypatch):
+    """File the fake CLI appends to once per invocation."""
+    path = tmp_path / "calls"
+    path.write_text("")
+    monkeypatch.setenv("FAKE_CLAUDE_COUNTER", str(path))
+    return path
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Create a mock config pointing at a fake Claude CLI."""
+    fake = tmp_path / "fake-claude"
+    fake.write_text(FAKE_CLAUDE.format(python=sys.executable))
+    fake.chmod(fake.stat().st_mode | stat.S_IEXEC)
+
+    config = MagicMock()
+    config.repo_root = str(tmp_path)
+    config.swarm_path = tmp_path / ".swarm"
+    config.claude.binary = str(fake)
+    config.claude.max_turns = 3
+    config.claude.timeout_seconds = 30
+    config.llm_cache = LLMCacheConfig(enabled=True)
+    return config
+
+
+class TestLLMResponseCache:
+    """Tests for LLMResponseCache storage behaviour."""
+
+    def test_key_depends_on_every_part(self):
+        """Changing any parameter changes the key."""
+        base = dict(prompt="p", allowed_tools=["Read"], max_turns=1, binary="claude")
+        key = LLMResponseCache.make_key(**base)
+
+        assert key == LLMResponseCache.make_key(**dict(reversed(list(base.items()))))
+        for name, value in [("prompt", "q"), ("allowed_tools", []), ("max_turns", 2), ("binary", "c2")]:
+            assert LLMResponseCache.make_key(**{**base, name: value}) != key
+
+    def test_round_trip(self, cache):
+        """Stored payloads are returned on get."""
+        cache.put("ab" * 32, {"text": "hi"})
+
+        assert cache.get("ab" * 32) == {"text": "hi"}
+        assert cache.get("cd" * 32) is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_ttl_expiry(self, tmp_path):
+        """Entries older than the TTL are misses and are removed."""
+        cache = LLMResponseCache(tmp_path / "c", ttl_seconds=0)
+        cache.put("ab" * 32, {"text": "hi"})
+        time.sleep(0.01)
+
+        assert cache.get("ab" * 32) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction(self, tmp_path):
+        """The least recently used entries are evicted past max_bytes."""
+        cache = LLMResponseCache(tmp_path / "c")
+        cache.put("aa" * 32, {"text": "x" * 100})
+        entry_size = cache.stats()["bytes"]
+        cache.max_bytes = entry_size * 2 + entry_size // 2  # room for two entries
+
+        cache.put("bb" * 32, {"text": "x" * 100})
+        past = time.time() - 100
+        os.utime(cache._entry_path("aa" * 32), (past, past))
+        os.utime(cache._entry_path("bb" * 32), (past - 10, past - 10))
+        cache.get("aa" * 32)  # touch: aa is now most recent
+        cache.put("cc" * 32, {"text": "x" * 100})
+
+        assert cache.get("bb" * 32) is None
+        assert cache.get("aa" * 32) is not None
+        assert cache.get("cc" * 32) is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_corrupt_entry_is_miss(self, cache):
+        """Unreadable entries are treated as misses."""
+        path = cache._entry_path("ab" * 32)
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+
+        assert cache.get("ab" * 32) is None
+
+    def test_clear(self, cache):
+        """clear() removes all entries."""
+        cache.put("aa" * 32, {})
+        cache.put("bb" * 32, {})
+
+        assert cache.clear() == 2
+        assert cache.stats()["entries"] == 0
+
+
+class TestGetResponseCache:
+    """Tests for building the cache from config."""
+
+    def test_disabled_by_default(self, config):
+        """No cache unless llm_cache.enabled is set."""
+        config.llm_cache = LLMCacheConfig()
+        assert get_response_cache(config) is None
+
+    def test_missing_section(self, config):
+        """Configs without an llm_cache section get no cache."""
+        config.llm_cache = MagicMock()
+        assert get_response_cache(config) is None
+
+    def test_enabled(self, config, tmp_path):
+        """Enabled config builds a cache under .swarm/cache/llm."""
+        cache = get_response_cache(config)
+        assert cache.cache_dir == tmp_path / ".swarm" / "cache" / "llm"
+        assert cache.ttl_seconds == 168 * 3600
+
+
+class TestClaudeRunnerCache:
+    """Tests for ClaudeCliRunner with a response cache."""
+
+    def test_repeat_served_from_cache(self, config, cache, counter):
+        """Identical invocations run the CLI once; hits report zero cost."""
+        runner = ClaudeCliRunner(config=config, response_cache=cache)
+
+        first = runner.run("hello", allowed_tools=[], max_turns=1)
+        second = runner.run("hello", allowed_tools=[], max_turns=1)
+
+        assert counter.read_text() == "x"
+        assert second.text == first.text == "answer:hello"
+        assert first.total_cost_usd == 0.25
+        assert second.total_cost_usd == 0.0
+
+    def test_different_params_miss(self, config, cache, counter):
+        """Changing tools or turns invokes the CLI again."""
+        runner = ClaudeCliRunner(config=config, response_cache=cache)
+
+        runner.run("hello", allowed_tools=[], max_turns=1)
+        runner.run("hello", allowed_tools=["Read"], max_turns=1)
+        runner.run("hello", allowed_tools=[], max_turns=2)
+
+        assert counter.read_text() == "xxx"
+
+    def test_failures_not_cached(self, config, cache, counter, monkeypatch):
+        """Failed invocations are not stored."""
+        runner = ClaudeCliRunner(config=config, response_cache=cache)
+        monkeypatch.setenv("FAKE_CLAUDE_FAIL", "1")
+
+        with pytest.raises(ClaudeInvocationError):
+            runner.run("hello")
+
+        assert cache.stats()["entries"] == 0
+
+    def test_no_cache_by_default(self, config, counter):
+        """Without a cache every call reaches the CLI."""
+        runner = ClaudeCliRunner(config=config)
+
+        runner.run("hello")
+        runner.run("hello")
+
+        assert counter.read_text() == "xx"
+
+
+class TestCodexRunnerCache:
+    """Tests for CodexCliRunner with a response cache."""
+
+    def _proc(self):
+        proc = MagicMock()
+        proc.returncode = 0
+        proc.stdout = json.dumps({"type": "turn.completed", "last_message": "review"})
+        proc.stderr = ""
+        return proc
+
+    def test_read_only_runs_cached(self, config, cache, monkeypatch):
+        """Read-only runs are served from the cache on repeat."""
+        run = MagicMock(return_value=self._proc())
+        monkeypatch.setattr("swarm_attack.codex_client.subprocess.run", run)
+        checkpoint = MagicMock()
+        runner = CodexCliRunner(
+            config=config, response_cache=cache, checkpoint_callback=checkpoint
+        )
+
+        first = runner.run("critique")
+        second = runner.run("critique")
+
+        assert run.call_count == 1
+        assert checkpoint.call_count == 1
+        assert second.text == first.text
+
+    def test_writable_sandbox_not_cached(self, config, cache, monkeypatch):
+        """Runs that may modify the workspace always execute."""
+        run = MagicMock(return_value=self._proc())
+        monkeypatch.setattr("swarm_attack.codex_client.subprocess.run", run)
+        runner = CodexCliRunner(config=config, response_cache=cache)
+
+        runner.run("fix it", sandbox_mode="workspace-write")
+        runner.run("fix it", sandbox_mode="workspace-write")
+
+        assert run.call_count == 2
+
+
+class TestAgentOptIn:
+    """Tests for per-agent cache opt-in."""
+
+    def test_opted_in_agents(self, config):
+        """Read-only agents get a cache; the coder does not."""
+        from swarm_attack.agents.coder import CoderAgent
+        from swarm_attack.agents.complexity_gate import ComplexityGateAgent
+        from swarm_attack.agents.issue_validator import IssueValidatorAgent
+        from swarm_attack.agents.spec_critic import SpecCriticAgent
+
+        assert ComplexityGateAgent(config).llm.response_cache is not None
+        assert SpecCriticAgent(config).codex.response_cache is not None
+        assert IssueValidatorAgent(config).codex.response_cache is not None
+        assert CoderAgent(config).llm.response_cache is None
+
+    def test_disabled_config(self, config):
+        """Opted-in agents get no cache when the config disables it."""
+        from swarm_attack.agents.complexity_gate import ComplexityGateAgent
+
+        config.llm_cache = LLMCacheConfig(enabled=False)
+        assert ComplexityGateAgent(config).llm.response_cache is None
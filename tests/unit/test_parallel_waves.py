@@ -0,0 +1,356 @@
+"""
+Tests for parallel wave execution of independent issues.
+
+Tests verify:
+- DependencyGraph.get_waves() layers issues so no wave has internal deps
+- SessionManager creates, merges and removes per-issue git worktrees,
+  aborting conflicting merges
+- Orchestrator.run_parallel_waves() runs a wave concurrently, respects
+  issue locks and recomputes waves as issues complete
+- Issue sessions write and commit their test files inside the worktree
+- Baseline checks find and run regression tests inside the worktree, not
+  the main checkout other workers merge into
+- VerifierAgent resolves test paths inside the issue worktree
+"""
+
+import subprocess
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from swarm_attack.agents.base import AgentResult
+from swarm_attack.agents.verifier import VerifierAgent
+from swarm_attack.config import GitConfig
+from swarm_attack.models import FeaturePhase, RunState, TaskRef, TaskStage
+from swarm_attack.orchestrator import IssueSessionResult, Orchestrator
+from swarm_attack.planning.dependency_graph import DependencyGraph
+from swarm_attack.session_manager import SessionManager
+
+
+def git(repo, *args):
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def commit_file(repo, name, content, message):
+    (repo / name).write_text(content)
+    git(repo, "add", name)
+    git(repo, "commit", "-q", "-m", message)
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Create a mock config for a repo at tmp_path/repo."""
+    config = MagicMock()
+    config.repo_root = str(tmp_path / "repo")
+    config.swarm_path = tmp_path / "repo" / ".swarm"
+    config.git = GitConfig(max_parallel_issues=2)
+    config.sessions.stale_timeout_minutes = 30
+    config.tests.timeout_seconds = 60
+    return config
+
+
+@pytest.fixture
+def repo(config):
+    """Create a git repo with main and feature/feat branches."""
+    repo = config.swarm_path.parent
+    repo.mkdir()
+    git(repo, "init", "-q", "-b", "main")
+    git(repo, "config", "user.email", "test@example.com")
+    git(repo, "config", "user.name", "Test")
+    commit_file(repo, "shared.txt", "base\n", "initial")
+    git(repo, "checkout", "-q", "-b", "feature/feat")
+    return repo
+
+
+@pytest.fixture
+def session_manager(config, repo):
+    return SessionManager(config, state_store=MagicMock())
+
+
+class TestGetWaves:
+    """Tests for DependencyGraph.get_waves()."""
+
+    def test_layers(self):
+        """Issues are grouped by dependency depth."""
+        graph = DependencyGraph()
+        graph.add_issue(1, [])
+        graph.add_issue(2, [])
+        graph.add_issue(3, [1])
+        graph.add_issue(4, [1, 2])
+        graph.add_issue(5, [3, 4])
+
+        assert graph.get_waves() == [[1, 2], [3, 4], [5]]
+
+    def test_completed_issues_satisfy_deps(self):
+        """Completed issues are excluded and unblock their dependents."""
+        graph = DependencyGraph()
+        graph.add_issue(1, [])
+        graph.add_issue(2, [1])
+        graph.add_issue(3, [2])
+
+        assert graph.get_waves(completed={1}) == [[2], [3]]
+
+    def test_unresolvable_deps_excluded(self):
+        """Issues depending on unknown issues or cycles never get a wave."""
+        graph = DependencyGraph()
+        graph.add_issue(1, [])
+        graph.add_issue(2, [99])
+        graph.add_issue(3, [4])
+        graph.add_issue(4, [3])
+
+        assert graph.get_waves() == [[1]]
+
+
+class TestIssueWorktrees:
+    """Tests for SessionManager worktree management."""
+
+    def test_create_worktree(self, session_manager, repo):
+        """Worktrees branch from the feature branch and stay out of git status."""
+        path = session_manager.create_issue_worktree("feat", 3)
+
+        assert path == str(repo.resolve() / ".swarm" / "worktrees" / "feat" / "issue-3")
+        assert git(path, "rev-parse", "--abbrev-ref", "HEAD") == "feature/feat-issue-3"
+        assert (repo / "shared.txt").read_text() == "base\n"
+        assert git(repo, "status", "--porcelain") == ""
+
+    def test_merge_back(self, session_manager, repo):
+        """Work committed in a worktree lands on the feature branch."""
+        path = Path(session_manager.create_issue_worktree("feat", 3))
+        commit_file(path, "new.txt", "x\n", "issue 3")
+
+        assert session_manager.merge_issue_branch("feat", 3) == []
+        assert (repo / "new.txt").read_text() == "x\n"
+
+        session_manager.remove_issue_worktree("feat", 3)
+        assert not path.exists()
+        assert git(repo, "branch", "--list", "feature/feat-issue-3") == ""
+
+    def test_conflict_aborted(self, session_manager, repo):
+        """A conflicting merge reports the files and leaves the feature branch intact."""
+        path = Path(session_manager.create_issue_worktree("feat", 3))
+        commit_file(path, "shared.txt", "from issue\n", "issue 3")
+        commit_file(repo, "shared.txt", "from feature\n", "other issue")
+        head = git(repo, "rev-parse", "HEAD")
+
+        assert session_manager.merge_issue_branch("feat", 3) == ["shared.txt"]
+        assert git(repo, "rev-parse", "HEAD") == head
+        assert git(repo, "status", "--porcelain") == ""
+
+    def test_recreate_over_leftover(self, session_manager):
+        """A worktree left by an interrupted run is replaced."""
+        first = session_manager.create_issue_worktree("feat", 3)
+        second = session_manager.create_issue_worktree("feat", 3)
+
+        assert first == second
+        assert git(second, "status", "--porcelain") == ""
+
+
+@pytest.fixture
+def state():
+    return RunState(
+        feature_id="feat",
+        phase=FeaturePhase.IMPLEMENTING,
+        tasks=[
+            TaskRef(issue_number=1, stage=TaskStage.READY, title="a"),
+            TaskRef(issue_number=2, stage=TaskStage.READY, title="b"),
+            TaskRef(issue_number=3, stage=TaskStage.BACKLOG, title="c", dependencies=[1, 2]),
+            TaskRef(issue_number=4, stage=TaskStage.BLOCKED, title="d"),
+            TaskRef(issue_number=5, stage=TaskStage.BACKLOG, title="e", dependencies=[4]),
+        ],
+    )
+
+
+@pytest.fixture
+def orchestrator(config, repo, state):
+    """Create an orchestrator with a shared in-memory state."""
+    state_store = MagicMock()
+    state_store.load.return_value = state
+    return Orchestrator(
+        config,
+        state_store=state_store,
+        memory_store=MagicMock(),
+        coder=MagicMock(),
+        verifier=MagicMock(),
+    )
+
+
+def finish(state, issue_number, stage=TaskStage.DONE):
+    for task in state.tasks:
+        if task.issue_number == issue_number:
+            task.stage = stage
+
+
+def result(issue_number, status="success"):
+    return IssueSessionResult(
+        status=status,
+        issue_number=issue_number,
+        session_id="",
+        tests_written=0,
+        tests_passed=0,
+        tests_failed=0,
+        commits=[],
+        cost_usd=0.0,
+        retries=0,
+    )
+
+
+class TestRunParallelWaves:
+    """Tests for Orchestrator.run_parallel_waves()."""
+
+    def test_ready_waves(self, orchestrator):
+        """Blocked issues and their dependents are not planned."""
+        assert orchestrator.get_ready_waves("feat") == [[1, 2], [3]]
+
+    def test_wave_runs_concurrently(self, orchestrator, state, monkeypatch):
+        """Issues in a wave overlap; the next wave starts after they finish."""
+        barrier = threading.Barrier(2, timeout=5)
+        order = []
+
+        def run(feature_id, issue_number):
+            if issue_number in (1, 2):
+                barrier.wait()  # times out unless both run at once
+            order.append(issue_number)
+            finish(state, issue_number)
+            return result(issue_number)
+
+        monkeypatch.setattr(orchestrator, "_run_issue_in_worktree", run)
+        orchestrator._session_manager = MagicMock()
+
+        results = orchestrator.run_parallel_waves("feat")
+
+        assert sorted(order[:2]) == [1, 2]
+        assert order[2:] == [3]
+        assert [r.issue_number for r in results][2:] == [3]
+
+    def test_stops_without_progress(self, orchestrator, state, monkeypatch):
+        """A wave with no successes ends the run instead of retrying forever."""
+        def run(feature_id, issue_number):
+            return result(issue_number, status="failed")
+
+        monkeypatch.setattr(orchestrator, "_run_issue_in_worktree", run)
+        orchestrator._session_manager = MagicMock()
+
+        results = orchestrator.run_parallel_waves("feat")
+
+        assert sorted(r.issue_number for r in results) == [1, 2]
+
+    def test_claimed_issue_skipped(self, orchestrator, session_manager, monkeypatch):
+        """Issues already claimed by another process are not run."""
+        orchestrator._session_manager = session_manager
+        session_manager.claim_issue("feat", 1)
+        run_session = MagicMock()
+        monkeypatch.setattr(Orchestrator, "run_issue_session", run_session)
+
+        outcome = orchestrator._run_issue_in_worktree("feat", 1)
+
+        assert outcome.status == "failed"
+        assert "already claimed" in outcome.error
+        run_session.assert_not_called()
+
+    def test_worktree_session(self, orchestrator, session_manager, repo, monkeypatch):
+        """Each issue runs on a private worker in its own worktree, then cleans up."""
+        orchestrator._session_manager = session_manager
+        seen = {}
+
+        def run_session(self, feature_id, issue_number, worktree_path=None, lock_held=False):
+            seen.update(worktree=worktree_path, lock_held=lock_held, coder=self._coder)
+            return result(issue_number)
+
+        monkeypatch.setattr(Orchestrator, "run_issue_session", run_session)
+
+        outcome = orchestrator._run_issue_in_worktree("feat", 1)
+
+        assert outcome.status == "success"
+        assert seen["worktree"].endswith("issue-1")
+        assert seen["lock_held"] is True
+        assert seen["coder"] is not orchestrator._coder
+        assert not repo.joinpath(".swarm", "worktrees", "feat", "issue-1").exists()
+        assert session_manager.claim_issue("feat", 1)  # lock was released
+
+    def test_test_file_written_in_worktree(
+        self, orchestrator, session_manager, config, repo, monkeypatch
+    ):
+        """The coder's test file lands in the issue worktree and is committed there."""
+        orchestrator._session_manager = session_manager
+        config.sessions.max_implementation_retries = 0
+        for method in ("start_session", "checkpoint", "add_commit", "end_session"):
+            monkeypatch.setattr(session_manager, method, MagicMock())
+        monkeypatch.setattr(orchestrator, "_is_already_implemented", lambda *a: False)
+        monkeypatch.setattr(
+            "swarm_attack.orchestrator.SessionInitializer",
+            lambda *a: MagicMock(**{"initialize_session.return_value.ready": True}),
+        )
+        seen = {}
+
+        def write_tests(context):
+            seen.update(context)
+            path = Path(context["test_path"])
+            path.parent.mkdir(parents=True)
+            path.write_text("def test_issue():\n    pass\n")
+            return AgentResult.success_result(output={}, cost_usd=0.0)
+
+        orchestrator._coder.run.side_effect = write_tests
+        orchestrator._verifier.run.return_value = AgentResult.success_result(
+            output={"tests_passed": 1, "tests_failed": 0}, cost_usd=0.0
+        )
+
+        outcome = orchestrator._run_issue_in_worktree("feat", 1)
+
+        worktree = Path(seen["worktree_path"])
+        assert outcome.status == "success", outcome.error
+        assert Path(seen["test_path"]) == \
+            worktree / "tests" / "generated" / "feat" / "test_issue_1.py"
+        assert git(repo, "show", "--name-only", "--format=", outcome.commits[0]) == \
+            "tests/generated/feat/test_issue_1.py"
+
+
+    def test_baseline_runs_in_worktree(self, orchestrator, state, tmp_path, monkeypatch):
+        """Regression files are found, collected and run in the issue worktree."""
+        finish(state, 1)
+        worktree = tmp_path / "wt"
+        test_file = worktree / "tests" / "generated" / "feat" / "test_issue_1.py"
+        test_file.parent.mkdir(parents=True)
+        test_file.write_text("def test_ok():\n    pass\n")
+        roots = []
+
+        def checker(root, **kwargs):
+            roots.append(root)
+            return MagicMock(**{"check.side_effect": lambda files: {f: True for f in files}})
+
+        monkeypatch.setattr("swarm_attack.orchestrator.CollectabilityChecker", checker)
+
+        orchestrator._run_baseline_check("feat", 2, worktree_path=str(worktree))
+
+        assert roots == [worktree]
+        assert orchestrator._verifier._run_pytest.call_args.kwargs == {
+            "test_files": [test_file],
+            "cwd": worktree,
+        }
+
+
+class TestVerifierWorktree:
+    """Tests for VerifierAgent path resolution in worktrees."""
+
+    def test_paths_mapped_into_worktree(self, config, repo, tmp_path):
+        """Default test paths and regression files resolve inside the worktree."""
+        verifier = VerifierAgent(config)
+        worktree = tmp_path / "wt"
+
+        assert verifier._get_default_test_path("feat", 2, worktree) == \
+            worktree / "tests" / "generated" / "feat" / "test_issue_2.py"
+        assert verifier._in_worktree(repo.resolve() / "tests" / "t.py", worktree) == \
+            worktree / "tests" / "t.py"
+        assert verifier._in_worktree(tmp_path / "elsewhere.py", worktree) == \
+            tmp_path / "elsewhere.py"
+
+    def test_worktree_paths_kept(self, config, repo):
+        """Paths already in a worktree under the repo root are not mapped again."""
+        verifier = VerifierAgent(config)
+        worktree = repo.resolve() / ".swarm" / "worktrees" / "feat" / "issue-1"
+        test_file = worktree / "tests" / "t.py"
+
+        assert verifier._in_worktree(test_file, worktree) == test_file
@@ -0,0 +1,170 @@
+"""
+Tests for structured pytest results read from JUnit XML reports.
+
+Tests verify:
+- Per-test outcome, duration, nodeid and failure excerpt are reported
+- Summaries and failures match the verifier's text-parser schema
+- VerifierAgent uses the structured report for its own runs
+- Text parsing is still used for output without a report
+- (exit_code, output) tuples from a patched _run_pytest are still accepted
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from swarm_attack.agents.verifier import VerifierAgent
+from swarm_attack.testing.pytest_results import parse_junit_xml, run_pytest
+
+SAMPLE_TESTS = """\
+import pytest
+
+
+class TestMath:
+    def test_add(self):
+        assert 1 + 1 == 2
+
+    def test_sub(self):
+        value = 1
+        assert value - 1 == 5
+
+
+def test_raises():
+    raise ValueError("boom")
+
+
+@pytest.mark.skip(reason="later")
+def test_skipped():
+    pass
+"""
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "test_sample.py").write_text(SAMPLE_TESTS)
+    return tmp_path
+
+
+@pytest.fixture
+def mock_config(repo):
+    config = MagicMock()
+    config.repo_root = repo
+    config.tests = MagicMock()
+    config.tests.timeout_seconds = 60
+    return config
+
+
+class TestRunPytest:
+    """Structured reports from real pytest runs."""
+
+    def test_per_test_outcomes(self, repo):
+        report = run_pytest(["pytest", "tests/test_sample.py"], cwd=repo, timeout=60)
+
+        assert report.structured is True
+        assert report.exit_code == 1
+        outcomes = {case.nodeid: case.outcome for case in report.cases}
+        assert outcomes == {
+            "tests/test_sample.py::TestMath::test_add": "passed",
+            "tests/test_sample.py::TestMath::test_sub": "failed",
+            "tests/test_sample.py::test_raises": "failed",
+            "tests/test_sample.py::test_skipped": "skipped",
+        }
+        assert all(case.duration_seconds >= 0 for case in report.cases)
+
+    def test_summary_matches_text_schema(self, repo):
+        report = run_pytest(["pytest", "tests/test_sample.py"], cwd=repo, timeout=60)
+
+        summary = report.summary()
+
+        assert summary["tests_passed"] == 1
+        assert summary["tests_failed"] == 2
+        assert summary["tests_run"] == 3
+        assert summary["skipped"] == 1
+        assert summary["errors"] == 0
+
+    def test_failures_carry_location_and_excerpt(self, repo):
+        report = run_pytest(["pytest", "tests/test_sample.py"], cwd=repo, timeout=60)
+
+        failures = {f["test"]: f for f in report.failures()}
+
+        assert failures["test_sub"]["class"] == "TestMath"
+        assert failures["test_sub"]["file"] == "tests/test_sample.py"
+        assert failures["test_sub"]["line"] == 10
+        assert failures["test_sub"]["error"].startswith("assert")
+        assert failures["test_raises"]["class"] is None
+        assert failures["test_raises"]["error"] == "ValueError: boom"
+        assert "raise ValueError" in failures["test_raises"]["excerpt"]
+
+    def test_collection_error_reported_as_error(self, repo):
+        (repo / "tests" / "test_broken.py").write_text("import not_a_module\n")
+
+        report = run_pytest(["pytest", "tests/test_broken.py"], cwd=repo, timeout=60)
+
+        summary = report.summary()
+        assert summary["errors"] == 1
+        assert summary["tests_run"] == 0
+
+    def test_missing_report_is_unstructured(self, tmp_path):
+        assert parse_junit_xml(tmp_path / "missing.xml") is None
+
+
+class TestVerifierStructuredResults:
+    """VerifierAgent reads its own runs from the structured report."""
+
+    def test_run_uses_structured_report(self, mock_config, repo):
+        verifier = VerifierAgent(config=mock_config)
+
+        report = verifier._run_pytest(repo / "tests" / "test_sample.py")
+        parsed = verifier._parse_pytest_output(report.output, report)
+        failures = verifier._parse_pytest_failures(report.output, report)
+
+        assert report.exit_code == 1
+        assert parsed["tests_failed"] == 2
+        assert {f["nodeid"] for f in failures} == {
+            "tests/test_sample.py::TestMath::test_sub",
+            "tests/test_sample.py::test_raises",
+        }
+
+    def test_output_without_report_falls_back_to_text(self, mock_config):
+        verifier = VerifierAgent(config=mock_config)
+
+        parsed = verifier._parse_pytest_output("===== 4 passed in 0.10s =====")
+
+        assert parsed["tests_passed"] == 4
+
+    def test_tuple_results_still_accepted(self, mock_config, tmp_path):
+        verifier = VerifierAgent(config=mock_config)
+        test_path = tmp_path / "test_issue_1.py"
+        test_path.write_text("")
+
+        output = "FAILED test_issue_1.py::test_a - AssertionError"
+
+        with patch.object(verifier, "_run_pytest", return_value=(1, output)):
+            result = verifier.run({
+                "feature_id": "feat",
+                "issue_number": 1,
+                "test_path": str(test_path),
+                "check_regressions": False,
+            })
+
+        assert result.success is False
+        assert result.output["failures"][0]["test"] == "test_a"
+        assert "slowest_tests" not in result.output
+
+    def test_result_includes_slowest_tests(self, mock_config, repo):
+        (repo / "tests" / "generated" / "feat").mkdir(parents=True)
+        test_path = repo / "tests" / "generated" / "feat" / "test_issue_1.py"
+        test_path.write_text("def test_one():\n    pass\n")
+        verifier = VerifierAgent(config=mock_config)
+
+        result = verifier.run({
+            "feature_id": "feat",
+            "issue_number": 1,
+            "check_regressions": False,
+        })
+
+        assert result.success is True
+        assert result.output["slowest_tests"][0]["nodeid"].endswith("test_issue_1.py::test_one")
@@ -0,0 +1,180 @@
+"""
+Tests for the pytest result cache.
+
+Tests verify:
+- The working-tree hash tracks uncommitted and untracked changes, ignores
+  .swarm/ and gitignored files, and writes neither the real index nor
+  any objects
+- Reports round-trip through the cache and old entries are evicted
+- VerifierAgent serves identical runs from the cache and re-runs after edits
+- The cache is only built when enabled in config
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from swarm_attack.agents.verifier import VerifierAgent
+from swarm_attack.config import PytestCacheConfig
+from swarm_attack.testing.pytest_results import PytestCase, PytestReport
+from swarm_attack.testing.result_cache import (
+    PytestResultCache,
+    get_result_cache,
+    working_tree_hash,
+)
+
+
+def git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """A git repository with one committed test file."""
+    root = tmp_path / "repo"
+    (root / "tests").mkdir(parents=True)
+    (root / "tests" / "test_one.py").write_text("def test_one():\n    assert True\n")
+    git(root, "init", "-q")
+    git(root, "add", "-A")
+    git(root, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "init")
+    return root
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> PytestResultCache:
+    return PytestResultCache(tmp_path / "cache")
+
+
+class TestWorkingTreeHash:
+    """Tree hashes follow the files pytest would see."""
+
+    def test_stable_without_changes(self, repo):
+        assert working_tree_hash(repo) == working_tree_hash(repo)
+
+    def test_uncommitted_edit_changes_hash(self, repo):
+        before = working_tree_hash(repo)
+        (repo / "tests" / "test_one.py").write_text("def test_one():\n    assert False\n")
+        assert working_tree_hash(repo) != before
+
+    def test_untracked_file_changes_hash(self, repo):
+        before = working_tree_hash(repo)
+        (repo / "helper.py").write_text("X = 1\n")
+        assert working_tree_hash(repo) != before
+
+    def test_swarm_dir_ignored(self, repo):
+        before = working_tree_hash(repo)
+        (repo / ".swarm").mkdir()
+        (repo / ".swarm" / "state.json").write_text("{}")
+        assert working_tree_hash(repo) == before
+
+    def test_reverted_edit_restores_hash(self, repo):
+        test_file = repo / "tests" / "test_one.py"
+        original = test_file.read_text()
+        before = working_tree_hash(repo)
+        test_file.write_text("def test_one():\n    assert False\n")
+        test_file.write_text(original)
+        assert working_tree_hash(repo) == before
+
+    def test_gitignored_files_not_hashed(self, repo):
+        (repo / ".gitignore").write_text(".env\n")
+        before = working_tree_hash(repo)
+        (repo / ".env").write_text("TOKEN=x\n")
+        assert working_tree_hash(repo) == before
+
+    def test_no_objects_written(self, repo):
+        (repo / "helper.py").write_text("X = 1\n")
+        (repo / "tests" / "test_one.py").write_text("def test_one():\n    pass\n")
+        before = git(repo, "count-objects", "-v")
+        working_tree_hash(repo)
+        assert git(repo, "count-objects", "-v") == before
+
+    def test_real_index_untouched(self, repo):
+        (repo / "helper.py").write_text("X = 1\n")
+        working_tree_hash(repo)
+        assert git(repo, "status", "--porcelain") == "?? helper.py\n"
+
+    def test_not_a_repo(self, tmp_path):
+        plain = tmp_path / "plain"
+        plain.mkdir()
+        assert working_tree_hash(plain) is None
+
+
+class TestPytestResultCache:
+    """Storage, keys and eviction."""
+
+    def test_round_trip(self, cache):
+        report = PytestReport(
+            exit_code=1,
+            output="out",
+            cases=[PytestCase(nodeid="t.py::test_a", outcome="failed", duration_seconds=0.5)],
+            duration_seconds=0.5,
+            structured=True,
+        )
+        cache.put("ab" * 32, report)
+
+        assert cache.get("ab" * 32) == report
+        assert cache.get("cd" * 32) is None
+
+    def test_key_changes_with_tree(self, cache, repo):
+        cmd = ["pytest", "tests/test_one.py"]
+        before = cache.make_key(cmd, repo)
+        assert cache.make_key(cmd, repo) == before
+        assert cache.make_key(["pytest", "tests"], repo) != before
+
+        (repo / "tests" / "test_one.py").write_text("def test_one():\n    pass\n")
+
+        assert cache.make_key(cmd, repo) != before
+
+    def test_eviction(self, tmp_path):
+        cache = PytestResultCache(tmp_path / "cache", max_entries=2)
+        for i in range(3):
+            cache.put(f"{i:064x}", PytestReport(exit_code=0, output=str(i)))
+
+        assert len(list((tmp_path / "cache").glob("*/*.json"))) == 2
+
+    def test_get_result_cache_respects_config(self, tmp_path):
+        config = MagicMock()
+        config.swarm_path = tmp_path / ".swarm"
+        config.test_cache = PytestCacheConfig(enabled=False)
+        assert get_result_cache(config) is None
+
+        config.test_cache = PytestCacheConfig(max_entries=5)
+        cache = get_result_cache(config)
+        assert cache.cache_dir == tmp_path / ".swarm" / "cache" / "test_results"
+        assert cache.max_entries == 5
+
+
+class TestVerifierUsesCache:
+    """Identical runs are served from the cache."""
+
+    @pytest.fixture
+    def verifier(self, repo, cache):
+        config = MagicMock()
+        config.repo_root = repo
+        config.tests.timeout_seconds = 60
+        return VerifierAgent(config=config, result_cache=cache)
+
+    def test_identical_run_is_cached(self, verifier, repo):
+        test_file = repo / "tests" / "test_one.py"
+        first = verifier._run_pytest(test_file)
+
+        with patch("swarm_attack.agents.verifier.run_pytest") as run:
+            second = verifier._run_pytest(test_file)
+
+        run.assert_not_called()
+        assert second == first
+        assert verifier._parse_pytest_output(second.output, second)["tests_passed"] == 1
+
+    def test_edit_invalidates(self, verifier, repo):
+        test_file = repo / "tests" / "test_one.py"
+        verifier._run_pytest(test_file)
+
+        test_file.write_text("def test_one():\n    assert False\n")
+        report = verifier._run_pytest(test_file)
+
+        assert report.exit_code == 1
+        assert verifier._parse_pytest_output(report.output, report)["tests_failed"] == 1
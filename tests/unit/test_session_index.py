@@ -0,0 +1,201 @@
+"""
+Tests for the StateStore per-feature session index.
+
+Tests verify:
+- save_session records status and timestamps in the index
+- get_latest_session/get_active_session only load the sessions they need
+- Missing, corrupted or stale indexes are rebuilt from the session files
+"""
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from swarm_attack.models import SessionState
+from swarm_attack.state_store import StateStore
+
+
+@pytest.fixture
+def mock_config(tmp_path):
+    """Create a mock config for StateStore."""
+    config = MagicMock()
+    config.state_path = tmp_path / ".swarm" / "state"
+    config.sessions_path = tmp_path / ".swarm" / "sessions"
+    config.repo_root = str(tmp_path)
+    config.sessions = MagicMock()
+    config.sessions.stale_timeout_minutes = 60
+    return config
+
+
+@pytest.fixture
+def state_store(mock_config):
+    """Create a StateStore instance for testing."""
+    return StateStore(mock_config)
+
+
+def _iso(minutes_ago: int) -> str:
+    ts = datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)
+    return ts.isoformat().replace("+00:00", "Z")
+
+
+def _session(session_id: str, minutes_ago: int, status: str = "complete") -> SessionState:
+    return SessionState(
+        session_id=session_id,
+        feature_id="test-feature",
+        issue_number=1,
+        started_at=_iso(minutes_ago),
+        status=status,
+    )
+
+
+def _index_path(mock_config):
+    return mock_config.sessions_path / ".test-feature.index"
+
+
+def _bump_dir_mtime(mock_config):
+    """Force a distinct directory mtime, independent of clock granularity."""
+    session_dir = mock_config.sessions_path / "test-feature"
+    st = os.stat(session_dir)
+    os.utime(session_dir, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+class TestSessionIndexMaintenance:
+    """Tests for index updates in save_session."""
+
+    def test_save_session_writes_index_entry(self, state_store, mock_config):
+        """Saving a session records it in the index."""
+        session = _session("sess_a", 10, status="active")
+        state_store.save_session(session)
+
+        data = json.loads(_index_path(mock_config).read_text())
+        assert data["sessions"]["sess_a"] == {
+            "status": "active",
+            "started_at": session.started_at,
+            "ended_at": None,
+        }
+
+    def test_index_is_not_listed_as_session(self, state_store):
+        """The index file never shows up in list_sessions."""
+        state_store.save_session(_session("sess_a", 10))
+        assert state_store.list_sessions("test-feature") == ["sess_a"]
+
+    def test_status_change_updates_index(self, state_store, mock_config):
+        """Re-saving a session updates its index entry."""
+        session = _session("sess_a", 10, status="active")
+        state_store.save_session(session)
+        session.status = "complete"
+        session.ended_at = _iso(0)
+        state_store.save_session(session)
+
+        data = json.loads(_index_path(mock_config).read_text())
+        assert data["sessions"]["sess_a"]["status"] == "complete"
+        assert data["sessions"]["sess_a"]["ended_at"] == session.ended_at
+
+
+class TestSessionIndexLookups:
+    """Tests for index-backed session lookups."""
+
+    def test_get_latest_session_loads_one_file(self, state_store):
+        """get_latest_session loads only the winning session."""
+        for i in range(5):
+            state_store.save_session(_session(f"sess_{i}", 50 - i))
+
+        with patch.object(
+            state_store, "load_session", wraps=state_store.load_session
+        ) as spy:
+            latest = state_store.get_latest_session("test-feature")
+
+        assert latest.session_id == "sess_4"
+        assert spy.call_count == 1
+
+    def test_get_active_session_skips_inactive(self, state_store):
+        """get_active_session only loads sessions indexed as active."""
+        for i in range(4):
+            state_store.save_session(_session(f"sess_{i}", 10))
+        state_store.save_session(_session("sess_z", 5, status="active"))
+
+        with patch.object(
+            state_store, "load_session", wraps=state_store.load_session
+        ) as spy:
+            active = state_store.get_active_session("test-feature")
+
+        assert active.session_id == "sess_z"
+        assert spy.call_count == 1
+
+    def test_stale_active_session_is_abandoned(self, state_store):
+        """Stale sessions are still auto-abandoned and leave the index."""
+        state_store.save_session(_session("sess_old", 120, status="active"))
+
+        assert state_store.get_active_session("test-feature") is None
+        assert state_store.load_session("test-feature", "sess_old").status == "abandoned"
+        # Second call doesn't even need to load the abandoned session
+        with patch.object(state_store, "load_session") as spy:
+            assert state_store.get_active_session("test-feature") is None
+            spy.assert_not_called()
+
+    def test_null_started_at(self, state_store):
+        """Sessions indexed without a start time sort before any dated one."""
+        undated = _session("sess_a", 0)
+        undated.started_at = None
+        state_store.save_session(undated)
+        state_store.save_session(_session("sess_b", 10))
+
+        assert state_store.get_latest_session("test-feature").session_id == "sess_b"
+
+    def test_no_sessions(self, state_store):
+        """Features without sessions return None and create no index."""
+        assert state_store.get_latest_session("missing") is None
+        assert state_store.get_active_session("missing") is None
+
+
+class TestSessionIndexRebuild:
+    """Tests for rebuild-from-disk fallback."""
+
+    def test_missing_index_is_rebuilt(self, state_store, mock_config):
+        """Sessions written before the index existed are found."""
+        state_store.save_session(_session("sess_a", 20))
+        state_store.save_session(_session("sess_b", 10))
+        _index_path(mock_config).unlink()
+
+        assert state_store.get_latest_session("test-feature").session_id == "sess_b"
+        assert _index_path(mock_config).exists()
+
+    def test_corrupted_index_is_rebuilt(self, state_store, mock_config):
+        """An unreadable index falls back to a rebuild."""
+        state_store.save_session(_session("sess_a", 20, status="active"))
+        _index_path(mock_config).write_text("{not json")
+
+        assert state_store.get_active_session("test-feature").session_id == "sess_a"
+
+    def test_out_of_band_session_file_triggers_rebuild(self, state_store, mock_config):
+        """A session file written without save_session is picked up."""
+        state_store.save_session(_session("sess_a", 20))
+
+        extra = _session("sess_b", 5, status="active")
+        path = mock_config.sessions_path / "test-feature" / "sess_b.json"
+        path.write_text(json.dumps(extra.to_dict()))
+        _bump_dir_mtime(mock_config)
+
+        assert state_store.get_latest_session("test-feature").session_id == "sess_b"
+        assert state_store.get_active_session("test-feature").session_id == "sess_b"
+
+    def test_deleted_session_file_triggers_rebuild(self, state_store, mock_config):
+        """An index entry whose file vanished is dropped on lookup."""
+        state_store.save_session(_session("sess_a", 20))
+        state_store.save_session(_session("sess_b", 10))
+        (mock_config.sessions_path / "test-feature" / "sess_b.json").unlink()
+
+        assert state_store.get_latest_session("test-feature").session_id == "sess_a"
+
+    def test_rebuild_session_index(self, state_store):
+        """rebuild_session_index returns entries for every readable session."""
+        state_store.save_session(_session("sess_a", 20))
+        state_store.save_session(_session("sess_b", 10, status="active"))
+
+        index = state_store.rebuild_session_index("test-feature")
+
+        assert set(index) == {"sess_a", "sess_b"}
+        assert index["sess_b"]["status"] == "active"
@@ -0,0 +1,161 @@
+"""
+Tests for the StateStore in-process load cache.
+
+Tests verify:
+- Repeated loads of an unchanged file are served from cache
+- Cached states are copies, so caller mutations do not leak
+- save/delete and out-of-band writes invalidate the cache
+- Signing key changes bypass the cache
+"""
+
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from swarm_attack.state_store import StateStore, StateCorruptionError
+from swarm_attack.models import RunState, FeaturePhase, TaskRef, TaskStage
+
+
+@pytest.fixture
+def mock_config(tmp_path):
+    """Create a mock config for StateStore."""
+    config = MagicMock()
+    config.state_path = tmp_path / ".swarm" / "state"
+    config.sessions_path = tmp_path / ".swarm" / "sessions"
+    config.repo_root = str(tmp_path)
+    config.sessions = MagicMock()
+    config.sessions.stale_timeout_minutes = 60
+    return config
+
+
+@pytest.fixture
+def state_store(mock_config):
+    """Create a StateStore instance for testing."""
+    return StateStore(mock_config)
+
+
+def _make_state(feature_id: str = "test-feature") -> RunState:
+    return RunState(
+        feature_id=feature_id,
+        phase=FeaturePhase.READY_TO_IMPLEMENT,
+        tasks=[TaskRef(issue_number=1, stage=TaskStage.READY, title="First")],
+    )
+
+
+class TestLoadCache:
+    """Tests for read-through caching in load()."""
+
+    def test_second_load_is_cache_hit(self, state_store):
+        """Loading an unchanged file twice hits the cache."""
+        state_store.save(_make_state())
+
+        first = state_store.load("test-feature")
+        second = state_store.load("test-feature")
+
+        assert first is not None and second is not None
+        assert first.to_dict() == second.to_dict()
+        stats = state_store.cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+        assert stats["entries"] == 1
+
+    def test_cache_hit_skips_file_read(self, state_store):
+        """A cache hit does not re-read the state file."""
+        state_store.save(_make_state())
+        state_store.load("test-feature")
+
+        with patch("swarm_attack.state_store.read_file") as mock_read:
+            assert state_store.load("test-feature") is not None
+            mock_read.assert_not_called()
+
+    def test_loaded_state_is_a_copy(self, state_store):
+        """Mutating a loaded state does not affect later loads."""
+        state_store.save(_make_state())
+
+        first = state_store.load("test-feature")
+        first.tasks[0].stage = TaskStage.DONE
+        first.phase = FeaturePhase.COMPLETE
+
+        second = state_store.load("test-feature")
+        assert second.tasks[0].stage == TaskStage.READY
+        assert second.phase == FeaturePhase.READY_TO_IMPLEMENT
+
+    def test_save_invalidates_cache(self, state_store):
+        """Saving a feature refreshes what load returns."""
+        state_store.save(_make_state())
+        state = state_store.load("test-feature")
+
+        state.update_phase(FeaturePhase.COMPLETE)
+        state_store.save(state)
+
+        assert state_store.load("test-feature").phase == FeaturePhase.COMPLETE
+        assert state_store.cache_stats()["invalidations"] >= 1
+
+    def test_delete_invalidates_cache(self, state_store):
+        """Deleted features are not served from cache."""
+        state_store.save(_make_state())
+        state_store.load("test-feature")
+
+        assert state_store.delete("test-feature") is True
+        assert state_store.load("test-feature") is None
+        assert state_store.cache_stats()["entries"] == 0
+
+    def test_out_of_band_write_is_detected(self, state_store, mock_config):
+        """Another store writing the file invalidates this store's entry."""
+        state_store.save(_make_state())
+        state_store.load("test-feature")
+
+        other = StateStore(mock_config)
+        state = other.load("test-feature")
+        state.update_phase(FeaturePhase.COMPLETE)
+        other.save(state)
+
+        assert state_store.load("test-feature").phase == FeaturePhase.COMPLETE
+
+    def test_tampered_file_still_raises(self, state_store, mock_config):
+        """Tampering after a cached load is caught by signature verification."""
+        state_store.save(_make_state())
+        state_store.load("test-feature")
+
+        state_path = mock_config.state_path / "test-feature.json"
+        data = json.loads(state_path.read_text())
+        data["feature_id"] = "TAMPERED"
+        state_path.write_text(json.dumps(data))
+
+        with pytest.raises(StateCorruptionError):
+            state_store.load("test-feature")
+
+    def test_signing_key_change_bypasses_cache(self, state_store):
+        """A cached state is not served under a different signing key."""
+        with patch.dict(os.environ, {"SWARM_STATE_KEY": "key-one"}):
+            state_store.save(_make_state())
+            assert state_store.load("test-feature") is not None
+
+        with patch.dict(os.environ, {"SWARM_STATE_KEY": "key-two"}):
+            with pytest.raises(StateCorruptionError):
+                state_store.load("test-feature")
+
+    def test_cache_can_be_disabled(self, mock_config):
+        """enable_cache=False always reads from disk."""
+        store = StateStore(mock_config, enable_cache=False)
+        store.save(_make_state())
+        store.load("test-feature")
+        store.load("test-feature")
+
+        stats = store.cache_stats()
+        assert stats["enabled"] is False
+        assert stats["hits"] == 0
+        assert stats["entries"] == 0
+
+    def test_invalidate_cache_all(self, state_store):
+        """invalidate_cache() with no argument clears every entry."""
+        state_store.save(_make_state("feature-a"))
+        state_store.save(_make_state("feature-b"))
+        state_store.load("feature-a")
+        state_store.load("feature-b")
+
+        state_store.invalidate_cache()
+
+        assert state_store.cache_stats()["entries"] == 0
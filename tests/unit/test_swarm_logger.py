@@ -0,0 +1,323 @@
+"""
+Tests for SwarmLogger's buffered, rotating writer.
+
+Tests verify:
+- Buffered entries reach disk on flush, interval and close
+- Loggers of the same feature share one writer
+- Segments rotate by size and are gzip-archived
+- Previous days' logs are archived and retention is applied
+- read_logs/get_log_files read compressed segments transparently
+- query() spans days, iterates newest first and uses segment indexes
+- The admin logs command searches across days
+"""
+
+import gzip
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from typer.testing import CliRunner
+
+from swarm_attack.cli.admin import app as admin_app
+from swarm_attack.config import LoggingConfig
+from swarm_attack.logger import (
+    LogSegmentIndex,
+    RotatingLogWriter,
+    SwarmLogger,
+    clear_logger_cache,
+    close_log_writers,
+)
+
+
+def days_ago(n):
+    return (datetime.now(timezone.utc) - timedelta(days=n)).strftime("%Y-%m-%d")
+
+
+@pytest.fixture(autouse=True)
+def _close_writers():
+    yield
+    close_log_writers()
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Create a mock config with a logs directory and logging settings."""
+    config = MagicMock()
+    config.logs_path = tmp_path / "logs"
+    config.logging = LoggingConfig(flush_interval_seconds=60)
+    return config
+
+
+def active_lines(config):
+    path = config.logs_path / f"feat-{days_ago(0)}.jsonl"
+    return path.read_text().splitlines() if path.exists() else []
+
+
+class TestBufferedWrites:
+    """Entries are batched and flushed."""
+
+    def test_buffered_until_flush(self, config):
+        logger = SwarmLogger("feat", config)
+        logger.info("one")
+        logger.info("two")
+
+        assert active_lines(config) == []
+
+        logger.flush()
+        assert [json.loads(l)["event_type"] for l in active_lines(config)] == ["one", "two"]
+
+    def test_full_queue_flushes(self, config):
+        config.logging = LoggingConfig(flush_interval_seconds=60, max_pending_lines=3)
+        logger = SwarmLogger("feat", config)
+        for i in range(3):
+            logger.info("e", {"i": i})
+
+        deadline = time.time() + 5
+        while len(active_lines(config)) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(active_lines(config)) == 3
+
+    def test_unbuffered_writes_immediately(self, config):
+        config.logging = LoggingConfig(buffered=False)
+        SwarmLogger("feat", config).info("now")
+
+        assert len(active_lines(config)) == 1
+
+    def test_close_flushes(self, config):
+        SwarmLogger("feat", config).info("bye")
+
+        clear_logger_cache()
+
+        assert len(active_lines(config)) == 1
+
+    def test_shared_writer(self, config):
+        """Loggers for one feature share a writer and preserve order."""
+        first = SwarmLogger("feat", config)
+        second = SwarmLogger("feat", config)
+        first.info("a")
+        second.info("b")
+        first.info("c")
+
+        assert first._get_writer() is second._get_writer()
+        assert [e["event_type"] for e in second.read_logs()] == ["a", "b", "c"]
+
+    def test_read_logs_sees_pending_entries(self, config):
+        logger = SwarmLogger("feat", config)
+        logger.info("pending")
+
+        assert [e["event_type"] for e in logger.read_logs()] == ["pending"]
+
+
+class TestRotation:
+    """Size rotation and archives."""
+
+    def test_rotates_and_compresses(self, config):
+        config.logging = LoggingConfig(buffered=False, max_file_mb=0.001)
+        logger = SwarmLogger("feat", config)
+        for i in range(40):
+            logger.info("e", {"i": i, "pad": "x" * 50})
+
+        files = logger.get_log_files()
+        assert len(files) > 2
+        assert all(f.name.endswith(".jsonl.gz") for f in files[1:])
+        assert all(f.stat().st_size < 1024 for f in files if f.suffix == ".jsonl")
+        assert [e["data"]["i"] for e in logger.read_logs()] == list(range(40))
+
+    def test_uncompressed_archives(self, config):
+        config.logging = LoggingConfig(buffered=False, max_file_mb=0.001, compress_archives=False)
+        logger = SwarmLogger("feat", config)
+        for i in range(40):
+            logger.info("e", {"pad": "x" * 50})
+
+        assert not any(f.suffix == ".gz" for f in logger.get_log_files())
+        assert len(logger.read_logs()) == 40
+
+    def test_rotation_never_overwrites(self, tmp_path):
+        """A sequence number taken by another process is skipped."""
+        writer = RotatingLogWriter(tmp_path, "feat", LoggingConfig(compress_archives=False))
+        date = days_ago(0)
+        (tmp_path / f"feat-{date}.jsonl").write_text("new\n")
+        taken = tmp_path / f"feat-{date}.001.jsonl"
+        taken.write_text("old\n")
+        writer._next_sequence = MagicMock(side_effect=[1, 2])
+
+        rotated = writer._rotate(tmp_path / f"feat-{date}.jsonl", date)
+
+        assert rotated.name == f"feat-{date}.002.jsonl"
+        assert taken.read_text() == "old\n"
+        writer.close()
+
+
+class TestArchiving:
+    """Previous days' logs and retention."""
+
+    def test_previous_days_archived_on_open(self, config):
+        config.logs_path.mkdir()
+        old = config.logs_path / f"feat-{days_ago(1)}.jsonl"
+        old.write_text(json.dumps({"event_type": "old"}) + "\n")
+
+        logger = SwarmLogger("feat", config)
+        logger.info("new")
+        logger.flush()
+
+        assert not old.exists()
+        archived = config.logs_path / f"feat-{days_ago(1)}.001.jsonl.gz"
+        assert gzip.open(archived, "rt").read().strip() == json.dumps({"event_type": "old"})
+        assert [e["event_type"] for e in logger.read_logs(date=days_ago(1))] == ["old"]
+
+    def test_retention(self, config):
+        config.logging = LoggingConfig(buffered=False, retention_days=7)
+        config.logs_path.mkdir()
+        expired = config.logs_path / f"feat-{days_ago(30)}.001.jsonl.gz"
+        kept = config.logs_path / f"feat-{days_ago(3)}.001.jsonl.gz"
+        for path in (expired, kept):
+            with gzip.open(path, "wt") as f:
+                f.write("{}\n")
+
+        SwarmLogger("feat", config).info("new")
+
+        assert not expired.exists()
+        assert kept.exists()
+
+
+class TestGetLogFiles:
+    """Segment listing."""
+
+    def test_order_and_prefix_isolation(self, config):
+        """Newest first; another feature sharing a prefix is excluded."""
+        config.logs_path.mkdir()
+        names = [
+            f"feat-{days_ago(1)}.001.jsonl.gz",
+            f"feat-{days_ago(1)}.jsonl",
+            f"feat-{days_ago(0)}.002.jsonl.gz",
+            f"feat-{days_ago(0)}.010.jsonl.gz",
+            f"feat-{days_ago(0)}.jsonl",
+            f"feat-extra-{days_ago(0)}.jsonl",
+        ]
+        for name in names:
+            (config.logs_path / name).write_text("")
+
+        files = [f.name for f in SwarmLogger("feat", config).get_log_files()]
+
+        assert files == [
+            f"feat-{days_ago(0)}.jsonl",
+            f"feat-{days_ago(0)}.010.jsonl.gz",
+            f"feat-{days_ago(0)}.002.jsonl.gz",
+            f"feat-{days_ago(1)}.jsonl",
+            f"feat-{days_ago(1)}.001.jsonl.gz",
+        ]
+
+
+def write_day(config, date, entries, compress=False):
+    """Write entries as a day's log segment."""
+    config.logs_path.mkdir(exist_ok=True)
+    text = "".join(json.dumps(e) + "\n" for e in entries)
+    if compress:
+        with gzip.open(config.logs_path / f"feat-{date}.001.jsonl.gz", "wt") as f:
+            f.write(text)
+    else:
+        (config.logs_path / f"feat-{date}.jsonl").write_text(text)
+
+
+def entry(event_type, session=None, level="info", n=0):
+    e = {"event_type": event_type, "level": level, "data": {"n": n}}
+    if session:
+        e["session_id"] = session
+    return e
+
+
+@pytest.fixture
+def history(config):
+    """Three days of logs; a session spans midnight; the oldest day is archived."""
+    write_day(config, days_ago(2), [entry("start", n=0), entry("error", level="error", n=1)], compress=True)
+    write_day(config, days_ago(1), [entry("start", "s1", n=2), entry("step", "s1", n=3)])
+    write_day(config, days_ago(0), [entry("step", "s1", n=4), entry("done", "s1", n=5), entry("step", n=6)])
+    return config
+
+
+def numbers(entries):
+    return [e["data"]["n"] for e in entries]
+
+
+class TestQuery:
+    """Cross-day queries."""
+
+    def test_session_across_midnight(self, history):
+        logger = SwarmLogger("feat", history)
+        assert numbers(logger.query(session_id="s1")) == [2, 3, 4, 5]
+
+    def test_newest_first(self, history):
+        logger = SwarmLogger("feat", history)
+        assert numbers(logger.query(newest_first=True)) == [6, 5, 4, 3, 2, 1, 0]
+        assert numbers(logger.query(event_type="step", newest_first=True, limit=2)) == [6, 4]
+
+    def test_date_range(self, history):
+        logger = SwarmLogger("feat", history)
+        assert numbers(logger.query(since=days_ago(2), until=days_ago(1))) == [0, 1, 2, 3]
+        assert numbers(logger.query(since=days_ago(1), event_type="start")) == [2]
+
+    def test_compressed_segment_filters(self, history):
+        logger = SwarmLogger("feat", history)
+        assert numbers(logger.query(level="error")) == [1]
+
+    def test_read_logs_is_single_day(self, history):
+        logger = SwarmLogger("feat", history)
+        assert numbers(logger.read_logs(date=days_ago(1))) == [2, 3]
+
+    def test_index_sidecars(self, history):
+        """Indexes are persisted and reused by new loggers."""
+        SwarmLogger("feat", history).query()
+        active = history.logs_path / f"feat-{days_ago(0)}.jsonl"
+        sidecar = history.logs_path / f"feat-{days_ago(0)}.jsonl.idx"
+
+        index = LogSegmentIndex.from_dict(json.loads(sidecar.read_text()))
+        assert index.size == active.stat().st_size
+        assert len(index.sessions["s1"]) == 2
+
+        # An unchanged segment is served from its sidecar without rescanning
+        fresh = SwarmLogger("feat", history)
+        fresh._catch_up = MagicMock(side_effect=AssertionError("should reuse sidecar"))
+        assert numbers(fresh.query(session_id="s1", since=days_ago(0))) == [4, 5]
+
+    def test_appends_indexed_incrementally(self, history):
+        logger = SwarmLogger("feat", history)
+        assert numbers(logger.query(session_id="s2")) == []
+
+        logger.log("later")
+        with logger.session_context("s2"):
+            logger.info("inside")
+
+        assert [e["event_type"] for e in logger.query(session_id="s2")] == [
+            "session_start", "inside", "session_end",
+        ]
+
+    def test_replaced_segment_reindexed(self, history):
+        logger = SwarmLogger("feat", history)
+        logger.query()
+
+        write_day(history, days_ago(1), [entry("other", "s9", n=9)])
+
+        assert numbers(logger.query(session_id="s9")) == [9]
+
+
+class TestLogsCommand:
+    """swarm-attack admin logs."""
+
+    def test_search(self, history, monkeypatch):
+        monkeypatch.setattr("swarm_attack.cli.admin.get_config_or_default", lambda: history)
+
+        result = CliRunner().invoke(
+            admin_app, ["logs", "feat", "--session", "s1", "--oldest-first", "--json"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert [json.loads(line)["data"]["n"] for line in result.output.splitlines()] == [2, 3, 4, 5]
+
+    def test_bad_date(self, history, monkeypatch):
+        monkeypatch.setattr("swarm_attack.cli.admin.get_config_or_default", lambda: history)
+
+        result = CliRunner().invoke(admin_app, ["logs", "feat", "--since", "yesterday"])
+
+        assert result.exit_code == 1
@@ -0,0 +1,203 @@
+"""
+Tests for coverage-based test impact selection.
+
+Tests verify:
+- Only tests whose covered files changed are selected
+- Unmapped and changed test files always run
+- Every Nth check is a full run
+- Per-test coverage is recorded from passing pytest-cov runs
+- VerifierAgent narrows targeted regression runs with the map, records
+  coverage on the issue's own test run and instruments only unmapped
+  regression files
+- A pytest without pytest-cov turns selection off instead of failing
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from swarm_attack.agents.verifier import VerifierAgent
+from swarm_attack.testing.pytest_results import PytestReport
+from swarm_attack.testing.impact import (
+    CoverageImpactMap,
+    changed_files,
+    coverage_available,
+)
+
+needs_coverage = pytest.mark.skipif(
+    not coverage_available(), reason="pytest-cov not installed"
+)
+
+
+def git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def impact(tmp_path: Path) -> CoverageImpactMap:
+    return CoverageImpactMap(tmp_path / "impact.json", full_run_every=10)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """A committed repo with two modules, each exercised by one test file."""
+    root = tmp_path / "repo"
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "__init__.py").write_text("")
+    (root / "pkg" / "a.py").write_text("def f():\n    return 1\n")
+    (root / "pkg" / "b.py").write_text("def g():\n    return 2\n")
+    (root / "tests").mkdir()
+    (root / "tests" / "test_a.py").write_text("from pkg.a import f\n\ndef test_f():\n    assert f() == 1\n")
+    (root / "tests" / "test_b.py").write_text("from pkg.b import g\n\ndef test_g():\n    assert g() == 2\n")
+    (root / "tests" / "test_issue.py").write_text("def test_issue():\n    pass\n")
+    git(root, "init", "-q")
+    git(root, "add", "-A")
+    git(root, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "init")
+    return root
+
+
+class TestSelection:
+    """Choosing affected tests from recorded coverage."""
+
+    def test_selects_tests_covering_changed_files(self, impact):
+        impact.record({"tests/test_a.py": {"pkg/a.py"}, "tests/test_b.py": {"pkg/b.py"}})
+
+        selection = impact.select(["tests/test_a.py", "tests/test_b.py"], {"pkg/a.py"})
+
+        assert selection.selected == ["tests/test_a.py"]
+        assert selection.skipped == ["tests/test_b.py"]
+        assert selection.full_run is False
+
+    def test_unmapped_and_changed_tests_always_run(self, impact):
+        impact.record({"tests/test_a.py": {"pkg/a.py"}})
+
+        selection = impact.select(["tests/test_a.py", "tests/test_new.py"], {"tests/test_a.py"})
+
+        assert selection.selected == ["tests/test_a.py", "tests/test_new.py"]
+        assert selection.unmapped == ["tests/test_new.py"]
+
+    def test_periodic_full_run(self, tmp_path):
+        impact = CoverageImpactMap(tmp_path / "impact.json", full_run_every=3)
+        impact.record({"tests/test_a.py": {"pkg/a.py"}})
+
+        runs = [impact.select(["tests/test_a.py"], set()).full_run for _ in range(6)]
+
+        assert runs == [False, False, True, False, False, True]
+
+    def test_unknown_changes_run_everything(self, impact):
+        impact.record({"tests/test_a.py": {"pkg/a.py"}})
+
+        selection = impact.select(["tests/test_a.py"], None)
+
+        assert selection.selected == ["tests/test_a.py"]
+        assert selection.full_run is True
+
+    def test_changed_files_from_git(self, repo):
+        (repo / "pkg" / "a.py").write_text("def f():\n    return 1  # edited\n")
+        (repo / "pkg" / "c.py").write_text("")
+        (repo / ".swarm").mkdir()
+        (repo / ".swarm" / "state.json").write_text("{}")
+
+        assert changed_files(repo) == {"pkg/a.py", "pkg/c.py"}
+
+
+@needs_coverage
+class TestVerifierImpactSelection:
+    """Targeted regression runs use and maintain the map."""
+
+    @pytest.fixture
+    def verifier(self, repo, impact):
+        config = MagicMock()
+        config.repo_root = repo
+        config.tests.timeout_seconds = 60
+        return VerifierAgent(config=config, impact_map=impact)
+
+    def run_issue(self, verifier, repo):
+        return verifier.run({
+            "feature_id": "feat",
+            "issue_number": 1,
+            "test_path": str(repo / "tests" / "test_issue.py"),
+            "regression_test_files": [
+                str(repo / "tests" / "test_a.py"),
+                str(repo / "tests" / "test_b.py"),
+            ],
+        })
+
+    def test_first_run_records_coverage(self, verifier, repo, impact):
+        result = self.run_issue(verifier, repo)
+
+        assert result.success is True
+        assert result.output["regression_check"]["tests_run"] == 2
+        assert "pkg/a.py" in impact.covered_files("tests/test_a.py")
+        assert "pkg/b.py" not in impact.covered_files("tests/test_a.py")
+
+    def test_only_affected_tests_run(self, verifier, repo):
+        self.run_issue(verifier, repo)
+        (repo / "pkg" / "b.py").write_text("def g():\n    return 2  # edited\n")
+
+        result = self.run_issue(verifier, repo)
+
+        check = result.output["regression_check"]
+        assert check["tests_run"] == 1
+        assert check["impact"]["skipped"] == 1
+
+    def test_unaffected_change_skips_regression(self, verifier, repo):
+        self.run_issue(verifier, repo)
+        (repo / "README.md").write_text("docs\n")
+
+        result = self.run_issue(verifier, repo)
+
+        assert result.success is True
+        assert result.output["regression_check"]["skipped"] is True
+
+    def test_issue_run_records_coverage(self, verifier, repo, impact):
+        self.run_issue(verifier, repo)
+
+        assert impact.covered_files("tests/test_issue.py") is not None
+
+    def test_mapped_files_not_instrumented(self, verifier, repo):
+        self.run_issue(verifier, repo)
+        (repo / "pkg" / "a.py").write_text("def f():\n    return 1  # edited\n")
+        (repo / "pkg" / "b.py").write_text("def g():\n    return 2  # edited\n")
+        calls = []
+        run_pytest = verifier._run_pytest
+
+        def spy(*args, **kwargs):
+            calls.append(kwargs)
+            return run_pytest(*args, **kwargs)
+
+        verifier._run_pytest = spy
+        result = self.run_issue(verifier, repo)
+
+        regression = [c for c in calls if c.get("test_files")]
+        assert result.output["regression_check"]["tests_run"] == 2
+        assert len(regression) == 1
+        assert "coverage_file" not in regression[0]
+
+
+class TestMissingPytestCov:
+    """Coverage options rejected by the pytest that runs the tests."""
+
+    def test_rerun_without_coverage(self, tmp_path, impact):
+        config = MagicMock()
+        config.repo_root = tmp_path
+        config.tests.timeout_seconds = 60
+        verifier = VerifierAgent(config=config, impact_map=impact)
+        rejected = PytestReport(
+            exit_code=4,
+            output="pytest: error: unrecognized arguments: --cov=. --cov-context=test",
+        )
+        passed = PytestReport(exit_code=0, output="1 passed")
+
+        with patch(
+            "swarm_attack.agents.verifier.run_pytest", side_effect=[rejected, passed]
+        ) as run:
+            report = verifier._run_pytest(
+                tmp_path / "test_x.py", coverage_file=tmp_path / ".coverage"
+            )
+
+        assert report is passed
+        assert not any(arg.startswith("--cov") for arg in run.call_args[0][0])
+        assert verifier._impact_map is None
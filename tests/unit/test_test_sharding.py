@@ -0,0 +1,166 @@
+"""
+Tests for sharded, parallel pytest execution.
+
+Tests verify:
+- Shards are balanced by historical per-file durations
+- Shard reports merge into one report with the right exit code and totals
+- The built-in executor runs shards concurrently and learns durations
+- pytest-xdist is used when available, with built-in shards as the
+  fallback when the pytest on PATH rejects its options
+- VerifierAgent results keep their schema when runs are sharded
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from swarm_attack.agents.verifier import VerifierAgent
+from swarm_attack.testing.pytest_results import PytestCase, PytestReport, run_pytest
+from swarm_attack.testing.sharding import (
+    FileDurationStore,
+    ShardedPytestExecutor,
+    merge_reports,
+    plan_shards,
+)
+
+
+def report(exit_code: int, *outcomes: str) -> PytestReport:
+    cases = [
+        PytestCase(nodeid=f"t.py::test_{i}", outcome=o, duration_seconds=0.1, file="t.py")
+        for i, o in enumerate(outcomes)
+    ]
+    return PytestReport(exit_code=exit_code, output="out", cases=cases, structured=True)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    for i in range(6):
+        (tests / f"test_{i}.py").write_text(f"def test_{i}():\n    assert {i} != 3\n")
+    return tmp_path
+
+
+class TestPlanShards:
+    """Balancing files across workers."""
+
+    def test_balances_by_duration(self):
+        durations = {"a": 10.0, "b": 6.0, "c": 4.0, "d": 1.0}
+
+        shards = plan_shards(["a", "b", "c", "d"], durations, 2)
+
+        assert sorted(sum(durations[f] for f in s) for s in shards) == [10.0, 11.0]
+
+    def test_unknown_files_get_median(self):
+        shards = plan_shards(["a", "b", "new"], {"a": 9.0, "b": 1.0}, 2)
+
+        assert sorted(map(sorted, shards)) == [["a"], ["b", "new"]]
+
+    def test_never_more_shards_than_files(self):
+        assert len(plan_shards(["a", "b"], {}, 8)) == 2
+
+
+class TestMergeReports:
+    """Combining shard results."""
+
+    def test_totals_and_summary_line(self):
+        merged = merge_reports([report(0, "passed", "passed"), report(1, "passed", "failed")], 1.5)
+
+        assert merged.exit_code == 1
+        assert merged.summary()["tests_passed"] == 3
+        assert merged.summary()["tests_failed"] == 1
+        assert merged.output.endswith("1 failed, 3 passed in 1.50s ==========")
+
+    def test_collection_error_outranks_failures(self):
+        assert merge_reports([report(1, "failed"), report(2)], 1.0).exit_code == 2
+
+    def test_empty_shard_does_not_fail_run(self):
+        assert merge_reports([report(0, "passed"), report(5)], 1.0).exit_code == 0
+        assert merge_reports([report(5), report(5)], 1.0).exit_code == 5
+
+
+class TestExecutor:
+    """Running shards."""
+
+    def test_builtin_shards_run_concurrently(self, repo, tmp_path):
+        durations = FileDurationStore(tmp_path / "durations.json")
+        executor = ShardedPytestExecutor(3, durations=durations, use_xdist=False)
+        files = sorted(str(f) for f in (repo / "tests").glob("test_*.py"))
+
+        with patch("swarm_attack.testing.sharding.run_pytest", wraps=run_pytest) as run:
+            merged = executor.run(["-q"], files, repo, 60)
+
+        assert run.call_count == 3
+        assert merged.exit_code == 1
+        assert merged.summary()["tests_passed"] == 5
+        assert [f["test"] for f in merged.failures()] == ["test_3"]
+        assert set(durations.load()) == {f"tests/test_{i}.py" for i in range(6)}
+
+    def test_full_suite_collects_files(self, repo):
+        executor = ShardedPytestExecutor(2, use_xdist=False)
+
+        merged = executor.run(["-q"], None, repo, 60)
+
+        assert merged.summary()["tests_run"] == 6
+
+    def test_uses_xdist_when_available(self, repo):
+        executor = ShardedPytestExecutor(4, use_xdist=True)
+
+        with patch("swarm_attack.testing.sharding.run_pytest") as run:
+            run.return_value = report(0, "passed")
+            executor.run(["-v"], ["tests/test_0.py"], repo, 60)
+
+        cmd = run.call_args[0][0]
+        assert cmd[:5] == ["pytest", "-v", "-n", "4", "--dist"]
+
+    def test_falls_back_when_xdist_rejected(self, repo):
+        executor = ShardedPytestExecutor(3, use_xdist=True)
+        files = sorted(str(f) for f in (repo / "tests").glob("test_*.py"))
+        rejected = PytestReport(
+            exit_code=4,
+            output="pytest: error: unrecognized arguments: -n --dist loadfile",
+        )
+        results = iter([rejected])
+
+        def fake_run(cmd, *args, **kwargs):
+            return next(results, None) or run_pytest(cmd, *args, **kwargs)
+
+        with patch("swarm_attack.testing.sharding.run_pytest", side_effect=fake_run) as run:
+            merged = executor.run(["-q"], files, repo, 60)
+            executor.run(["-q"], files, repo, 60)
+
+        assert merged.summary()["tests_passed"] == 5
+        assert executor.use_xdist is False
+        assert run.call_count == 1 + 3 + 3
+        assert all("-n" not in call[0][0] for call in run.call_args_list[1:])
+
+    def test_small_runs_not_sharded(self):
+        executor = ShardedPytestExecutor(8, min_files=4, use_xdist=False)
+
+        assert executor.should_shard(["a", "b"]) is False
+        assert executor.should_shard(["a", "b", "c", "d"]) is True
+        assert executor.should_shard(None) is True
+        assert ShardedPytestExecutor(1).should_shard(None) is False
+
+
+class TestVerifierSharding:
+    """Sharded regression runs keep the verifier's result schema."""
+
+    def test_regression_run_sharded(self, repo):
+        config = MagicMock()
+        config.repo_root = repo
+        config.tests.timeout_seconds = 60
+        executor = ShardedPytestExecutor(3, min_files=2, use_xdist=False)
+        verifier = VerifierAgent(config=config, sharded_executor=executor)
+        files = sorted((repo / "tests").glob("test_*.py"))
+
+        with patch.object(executor, "run", wraps=executor.run) as run:
+            report = verifier._run_pytest(test_files=files)
+
+        run.assert_called_once()
+        parsed = verifier._parse_pytest_output(report.output, report)
+        assert report.exit_code == 1
+        assert parsed["tests_passed"] == 5
+        assert parsed["tests_failed"] == 1
+        assert verifier._parse_pytest_failures(report.output, report)[0]["test"] == "test_3"